@@ -0,0 +1,755 @@
+"""
+============================================================================
+FILE: ann_index.py
+LOCATION: api/ann_index.py
+============================================================================
+
+PURPOSE:
+    Optional in-process approximate nearest-neighbour (ANN) index per module
+    over Chunk embeddings, stored as memory-mapped numpy files.
+
+ROLE IN PROJECT:
+    Search accelerator for the hybrid search vector stage
+    (api/search_service.py). Neo4j vector index queries are the slowest
+    search step and scale only with the database; this index answers
+    module-scoped nearest-neighbour queries inside the API process instead
+    of calling db.index.vector.queryNodes. Enabled with ANN_INDEX_ENABLED.
+
+    Structure: an inverted-file (IVF) index. Vectors are L2-normalized
+    float32, clustered with spherical k-means into ~sqrt(N) lists and stored
+    sorted by list, so a query scores the centroids, probes the nprobe
+    nearest lists and reads only those contiguous row ranges. All arrays are
+    .npy files opened with mmap_mode="r", so API workers on the same host
+    share the page cache instead of each holding a copy.
+
+    Incremental maintenance (KG store path):
+    - Added vectors go into small append-only delta segments that are
+      searched exactly
+    - Removed ids become tombstones in the manifest
+    - Once deltas/tombstones pass ANN_COMPACT_RATIO of the base, the module
+      is retrained and rewritten as a new base
+    Every mutation writes new files and then atomically replaces
+    manifest.json; readers notice the new manifest and remap. A module
+    without an index (or whose update failed) is rebuilt from Neo4j on the
+    next write and served by Neo4j until then.
+
+    On-disk layout:
+        <ANN_INDEX_DIR>/<module_id>/<kind>/manifest.json
+        <ANN_INDEX_DIR>/<module_id>/<kind>/base-<gen>/{centroids,offsets,vectors}.npy, ids.json
+        <ANN_INDEX_DIR>/<module_id>/<kind>/seg-<gen>/vectors.npy, ids.json
+
+KEY COMPONENTS:
+    - AnnIndexStore: Per-module index files (build, add, remove, search)
+    - train_ivf: Spherical k-means list assignment
+    - exact_search: Brute-force reference used by tests and the benchmark
+    - fetch_module_embeddings: Reads a module's embeddings from Neo4j
+    - update_module_index / remove_from_module_index: KG store path hooks
+    - get_ann_index: Process-wide store, or None when disabled
+
+DEPENDENCIES:
+    - External: numpy
+    - Internal: None
+
+USAGE:
+    from api.ann_index import get_ann_index
+
+    store = get_ann_index()  # None unless ANN_INDEX_ENABLED=true
+    hits = store.search(["m1"], "chunk", query_embedding, k=10)
+
+    # Recall@10 against exact search:
+    python tools/bench_ann_index.py --rows 100000
+============================================================================
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are serialized per process only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+ANN_INDEX_ENABLED = os.getenv("ANN_INDEX_ENABLED", "false").lower() == "true"
+# Resolved once so API and Celery workers share the index regardless of cwd
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ANN_INDEX_DIR = os.path.abspath(
+    os.getenv("ANN_INDEX_DIR", os.path.join(_PROJECT_ROOT, "ann_index"))
+)
+
+# Lists probed per query; recall/latency trade-off (see the benchmark)
+ANN_NPROBE = int(os.getenv("ANN_NPROBE", "8"))
+
+# Below this many rows the base is a single list (exact search)
+ANN_MIN_TRAIN_ROWS = 1024
+
+# Rewrite the base when deltas or tombstones exceed this fraction of it
+ANN_COMPACT_RATIO = 0.2
+ANN_COMPACT_MIN_ROWS = 1024
+ANN_MAX_SEGMENTS = 16
+
+ANN_KMEANS_ITERATIONS = 10
+ANN_TRAIN_SAMPLE = 50_000
+ANN_SEED = 42
+
+# Only chunk vectors are searched (hybrid search vector stage)
+INDEX_KINDS = ("chunk",)
+
+_MANIFEST = "manifest.json"
+
+Hit = Tuple[str, float]
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+MODULE_EMBEDDINGS_QUERIES = {
+    "chunk": """
+        MATCH (n:Chunk)
+        WHERE n.module_id = $module_id AND n.embedding IS NOT NULL
+        RETURN n.id as id, n.embedding as embedding
+    """,
+}
+
+
+# ============================================================================
+# VECTOR HELPERS
+# ============================================================================
+
+
+def normalize_rows(vectors: Any) -> np.ndarray:
+    """Float32 copy of vectors with unit L2 norm per row (zero rows stay zero)."""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def to_similarity(cosine: np.ndarray) -> np.ndarray:
+    """Map cosine to Neo4j's vector index score range, (1 + cos) / 2."""
+    return (1.0 + cosine) / 2.0
+
+
+def exact_search(vectors: np.ndarray, query: np.ndarray, k: int) -> np.ndarray:
+    """
+    Brute-force top-k row positions by cosine similarity.
+
+    Args:
+        vectors: Normalized (N, D) matrix
+        query: Normalized (D,) vector
+        k: Number of results
+
+    Returns:
+        Row positions, best first
+    """
+    scores = vectors @ query
+    k = min(k, len(scores))
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+def train_ivf(
+    vectors: np.ndarray,
+    nlist: int,
+    iterations: int = ANN_KMEANS_ITERATIONS,
+    seed: int = ANN_SEED,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Spherical k-means over normalized vectors.
+
+    Trains on a sample of at most ANN_TRAIN_SAMPLE rows, then assigns every
+    row to its nearest centroid in batches.
+
+    Args:
+        vectors: Normalized (N, D) float32 matrix
+        nlist: Number of lists (clusters)
+        iterations: k-means iterations
+        seed: Random seed (initial centroids and sample)
+
+    Returns:
+        (centroids (nlist, D), assignments (N,))
+    """
+    rng = np.random.default_rng(seed)
+    rows = len(vectors)
+    nlist = max(1, min(nlist, rows))
+    if rows > ANN_TRAIN_SAMPLE:
+        sample = vectors[np.sort(rng.choice(rows, ANN_TRAIN_SAMPLE, replace=False))]
+    else:
+        sample = vectors
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+
+    for _ in range(iterations if nlist > 1 else 0):
+        assign = np.argmax(sample @ centroids.T, axis=1)
+        order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=nlist)
+        occupied = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[occupied]
+        sums = np.add.reduceat(sample[order], starts, axis=0)
+        centroids[occupied] = normalize_rows(sums)
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            centroids[empty] = sample[rng.choice(len(sample), len(empty), replace=False)]
+
+    assignments = np.empty(rows, dtype=np.int64)
+    for start in range(0, rows, 8192):
+        block = vectors[start:start + 8192]
+        assignments[start:start + 8192] = np.argmax(block @ centroids.T, axis=1)
+    return centroids.astype(np.float32), assignments
+
+
+def _default_nlist(rows: int) -> int:
+    return 1 if rows < ANN_MIN_TRAIN_ROWS else int(np.sqrt(rows))
+
+
+# ============================================================================
+# FILE HELPERS
+# ============================================================================
+
+
+def _safe_name(value: str) -> str:
+    """Filesystem-safe directory name for a module id."""
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in value) or "_"
+
+
+def _read_json(path: str) -> Any:
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _write_json(path: str, data: Any) -> None:
+    """Write JSON atomically (temp file + os.replace)."""
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle)
+    os.replace(tmp_path, path)
+
+
+def _write_part(directory: str, name: str, arrays: Dict[str, np.ndarray], ids: List[str]) -> None:
+    """Write an immutable base/segment directory, renamed into place when complete."""
+    final = os.path.join(directory, name)
+    tmp = f"{final}.tmp.{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    for array_name, array in arrays.items():
+        np.save(os.path.join(tmp, f"{array_name}.npy"), array)
+    _write_json(os.path.join(tmp, "ids.json"), ids)
+    shutil.rmtree(final, ignore_errors=True)
+    os.rename(tmp, final)
+
+
+# ============================================================================
+# INDEX READER
+# ============================================================================
+
+
+class _IndexReader:
+    """Memory-mapped view of one module index at one manifest generation."""
+
+    def __init__(self, directory: str, manifest: Dict[str, Any]):
+        self.manifest = manifest
+        self.deleted: Dict[str, int] = manifest.get("deleted", {})
+        self.base_generation = manifest.get("base_generation", 0)
+
+        self.centroids = self.offsets = self.vectors = None
+        self.ids: List[str] = []
+        base = manifest.get("base")
+        if base:
+            path = os.path.join(directory, base)
+            self.centroids = np.load(os.path.join(path, "centroids.npy"), mmap_mode="r")
+            self.offsets = np.load(os.path.join(path, "offsets.npy"), mmap_mode="r")
+            self.vectors = np.load(os.path.join(path, "vectors.npy"), mmap_mode="r")
+            self.ids = _read_json(os.path.join(path, "ids.json"))
+
+        self.segments: List[Tuple[np.ndarray, List[str], int]] = []
+        for segment in manifest.get("segments", []):
+            path = os.path.join(directory, segment["name"])
+            self.segments.append((
+                np.load(os.path.join(path, "vectors.npy"), mmap_mode="r"),
+                _read_json(os.path.join(path, "ids.json")),
+                segment["generation"],
+            ))
+
+    def _live(self, entry_id: str, generation: int) -> bool:
+        return generation >= self.deleted.get(entry_id, -1)
+
+    def search(self, query: np.ndarray, k: int, nprobe: int) -> List[Hit]:
+        """Top-k live entries as (id, similarity), best first."""
+        scores: List[np.ndarray] = []
+        sources: List[Tuple[List[str], np.ndarray, int]] = []
+
+        if self.vectors is not None and len(self.ids):
+            nlist = len(self.centroids)
+            probe = np.argsort(-(self.centroids @ query))[:max(1, min(nprobe, nlist))]
+            for list_id in probe:
+                start, end = int(self.offsets[list_id]), int(self.offsets[list_id + 1])
+                if end > start:
+                    scores.append(self.vectors[start:end] @ query)
+                    sources.append((self.ids, np.arange(start, end), self.base_generation))
+
+        for vectors, ids, generation in self.segments:
+            if len(ids):
+                scores.append(vectors @ query)
+                sources.append((ids, np.arange(len(ids)), generation))
+
+        if not scores:
+            return []
+
+        all_scores = np.concatenate(scores)
+        owner = np.concatenate([np.full(len(s), i) for i, s in enumerate(scores)])
+        position = np.concatenate([src[1] for src in sources])
+
+        # Tombstoned rows can occupy the top; over-select enough to skip them
+        wanted = min(len(all_scores), k + len(self.deleted))
+        top = np.argpartition(-all_scores, wanted - 1)[:wanted]
+        top = top[np.argsort(-all_scores[top], kind="stable")]
+
+        hits: List[Hit] = []
+        seen = set()
+        for row in top:
+            ids, _, generation = sources[owner[row]]
+            entry_id = ids[position[row]]
+            if entry_id in seen or not self._live(entry_id, generation):
+                continue
+            seen.add(entry_id)
+            hits.append((entry_id, float(to_similarity(all_scores[row]))))
+            if len(hits) == k:
+                break
+        return hits
+
+    def live_rows(self) -> Tuple[List[str], np.ndarray]:
+        """All live (id, vector) rows, newest copy per id."""
+        latest: Dict[str, Tuple[np.ndarray, int]] = {}
+        parts = [(self.vectors, self.ids, self.base_generation)] if self.ids else []
+        parts += self.segments
+        for vectors, ids, generation in parts:
+            for row, entry_id in enumerate(ids):
+                if self._live(entry_id, generation):
+                    latest[entry_id] = (vectors, row)
+        ids = list(latest)
+        if not ids:
+            return [], np.empty((0, self.manifest.get("dim", 0)), dtype=np.float32)
+        return ids, np.stack([np.asarray(v[row]) for v, row in latest.values()])
+
+
+# ============================================================================
+# INDEX STORE
+# ============================================================================
+
+
+class AnnIndexStore:
+    """
+    Memory-mapped IVF indexes, one per (module, kind).
+
+    Safe for many reader processes and concurrent writers: writers hold an
+    exclusive file lock per index and publish by replacing manifest.json.
+
+    Example:
+        store = AnnIndexStore("/var/lib/aura/ann")
+        store.build("m1", "chunk", ids, vectors)
+        store.add("m1", "chunk", ["c9"], [embedding])
+        hits = store.search(["m1"], "chunk", query, k=10)
+    """
+
+    def __init__(self, root: str = ANN_INDEX_DIR, nprobe: int = ANN_NPROBE):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding one subdirectory per module
+            nprobe: IVF lists probed per query
+        """
+        self.root = root
+        self.nprobe = nprobe
+        self._readers: Dict[Tuple[str, str], Tuple[Tuple[int, int], _IndexReader]] = {}
+        self._write_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Paths and manifests
+    # ------------------------------------------------------------------
+
+    def _directory(self, module_id: str, kind: str) -> str:
+        if kind not in INDEX_KINDS:
+            raise ValueError(f"Unknown ANN index kind: {kind}")
+        return os.path.join(self.root, _safe_name(module_id), kind)
+
+    def _load_manifest(self, directory: str) -> Optional[Dict[str, Any]]:
+        try:
+            return _read_json(os.path.join(directory, _MANIFEST))
+        except FileNotFoundError:
+            return None
+
+    @contextmanager
+    def _locked(self, directory: str) -> Iterator[None]:
+        """Exclusive writer lock for one index (threads and processes)."""
+        os.makedirs(directory, exist_ok=True)
+        with self._write_lock, open(os.path.join(directory, ".lock"), "a") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _publish(self, directory: str, manifest: Dict[str, Any]) -> None:
+        """Replace the manifest and remove parts it no longer references."""
+        _write_json(os.path.join(directory, _MANIFEST), manifest)
+        referenced = {manifest.get("base")} | {s["name"] for s in manifest["segments"]}
+        for name in os.listdir(directory):
+            if name.startswith(("base-", "seg-")) and name not in referenced:
+                # Open mmaps keep unlinked files alive on POSIX; elsewhere the
+                # directory is retried on the next publish
+                shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+
+    def has_index(self, module_id: str, kind: str) -> bool:
+        """Whether a published index exists for the module."""
+        return os.path.exists(os.path.join(self._directory(module_id, kind), _MANIFEST))
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _write_base(
+        self, directory: str, generation: int, ids: List[str], vectors: np.ndarray
+    ) -> Dict[str, Any]:
+        """Train and write a base at `generation`; returns the new manifest."""
+        name = f"base-{generation:08d}"
+        dim = int(vectors.shape[1]) if vectors.ndim == 2 else 0
+        if ids:
+            centroids, assignments = train_ivf(vectors, _default_nlist(len(ids)))
+            order = np.argsort(assignments, kind="stable")
+            counts = np.bincount(assignments, minlength=len(centroids))
+            offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+            _write_part(
+                directory,
+                name,
+                {
+                    "centroids": centroids,
+                    "offsets": offsets,
+                    "vectors": np.ascontiguousarray(vectors[order], dtype=np.float32),
+                },
+                [ids[i] for i in order],
+            )
+        return {
+            "generation": generation,
+            "dim": dim,
+            "base": name if ids else None,
+            "base_generation": generation,
+            "base_rows": len(ids),
+            "segments": [],
+            "deleted": {},
+        }
+
+    def build(self, module_id: str, kind: str, ids: Sequence[str], vectors: Any) -> int:
+        """
+        Replace the module index with a freshly trained one.
+
+        Args:
+            module_id: Module ID
+            kind: Index kind (one of INDEX_KINDS)
+            ids: Node ids, parallel to vectors
+            vectors: (N, D) embeddings (normalized here)
+
+        Returns:
+            Number of indexed rows
+        """
+        directory = self._directory(module_id, kind)
+        unique = dict(zip(ids, range(len(ids))))  # last copy of a repeated id wins
+        matrix = normalize_rows(vectors) if len(ids) else np.empty((0, 0), np.float32)
+        rows = list(unique.values())
+        with self._locked(directory):
+            previous = self._load_manifest(directory) or {"generation": 0}
+            manifest = self._write_base(
+                directory, previous["generation"] + 1, list(unique), matrix[rows]
+            )
+            self._publish(directory, manifest)
+        logger.info(f"Built ANN {kind} index for {module_id}: {len(rows)} rows")
+        return len(rows)
+
+    def add(self, module_id: str, kind: str, ids: Sequence[str], vectors: Any) -> bool:
+        """
+        Add or replace vectors in an existing index as a delta segment.
+
+        Args:
+            module_id: Module ID
+            kind: Index kind (one of INDEX_KINDS)
+            ids: Node ids, parallel to vectors
+            vectors: (N, D) embeddings
+
+        Returns:
+            False if the module has no index yet (caller should build one)
+
+        Raises:
+            ValueError: If the vector dimension does not match the index
+        """
+        if not ids:
+            return True
+        directory = self._directory(module_id, kind)
+        unique = dict(zip(ids, range(len(ids))))
+        matrix = normalize_rows(vectors)[list(unique.values())]
+        with self._locked(directory):
+            manifest = self._load_manifest(directory)
+            if manifest is None:
+                return False
+            if manifest["dim"] and matrix.shape[1] != manifest["dim"]:
+                raise ValueError(
+                    f"Embedding dimension {matrix.shape[1]} != index dimension {manifest['dim']}"
+                )
+            generation = manifest["generation"] + 1
+            name = f"seg-{generation:08d}"
+            _write_part(directory, name, {"vectors": matrix}, list(unique))
+            manifest["generation"] = generation
+            manifest["dim"] = int(matrix.shape[1])
+            manifest["segments"].append(
+                {"name": name, "generation": generation, "rows": len(unique)}
+            )
+            for entry_id in unique:
+                manifest["deleted"][entry_id] = generation
+            self._publish(directory, self._maybe_compact(directory, manifest))
+        return True
+
+    def remove(self, module_id: str, kind: str, ids: Sequence[str]) -> None:
+        """
+        Tombstone ids in the module index (no-op without an index).
+
+        Args:
+            module_id: Module ID
+            kind: Index kind (one of INDEX_KINDS)
+            ids: Node ids to remove
+        """
+        if not ids:
+            return
+        directory = self._directory(module_id, kind)
+        if not self.has_index(module_id, kind):
+            return
+        with self._locked(directory):
+            manifest = self._load_manifest(directory)
+            if manifest is None:
+                return
+            manifest["generation"] += 1
+            for entry_id in ids:
+                manifest["deleted"][entry_id] = manifest["generation"]
+            self._publish(directory, self._maybe_compact(directory, manifest))
+
+    def drop(self, module_id: str, kind: str) -> None:
+        """Delete the module index; searches fall back to Neo4j until rebuilt."""
+        directory = self._directory(module_id, kind)
+        with self._locked(directory):
+            try:
+                os.remove(os.path.join(directory, _MANIFEST))
+            except FileNotFoundError:
+                pass
+        self._readers.pop((module_id, kind), None)
+
+    def _maybe_compact(self, directory: str, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """Rewrite deltas and tombstones into a new base once they are large."""
+        delta_rows = sum(segment["rows"] for segment in manifest["segments"])
+        threshold = max(ANN_COMPACT_MIN_ROWS, ANN_COMPACT_RATIO * manifest["base_rows"])
+        if (
+            delta_rows <= threshold
+            and len(manifest["deleted"]) <= threshold
+            and len(manifest["segments"]) <= ANN_MAX_SEGMENTS
+        ):
+            return manifest
+        ids, vectors = _IndexReader(directory, manifest).live_rows()
+        compacted = self._write_base(directory, manifest["generation"] + 1, ids, vectors)
+        compacted["dim"] = compacted["dim"] or manifest["dim"]
+        logger.info(
+            f"Compacted ANN index {directory}: {manifest['base_rows']} base + "
+            f"{delta_rows} delta rows -> {len(ids)}"
+        )
+        return compacted
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _reader(self, module_id: str, kind: str) -> Optional[_IndexReader]:
+        """Reader for the current manifest, remapped when it changes."""
+        directory = self._directory(module_id, kind)
+        try:
+            stat = os.stat(os.path.join(directory, _MANIFEST))
+        except FileNotFoundError:
+            self._readers.pop((module_id, kind), None)
+            return None
+        stamp = (stat.st_ino, stat.st_mtime_ns)
+        cached = self._readers.get((module_id, kind))
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        manifest = self._load_manifest(directory)
+        if manifest is None:
+            return None
+        reader = _IndexReader(directory, manifest)
+        self._readers[(module_id, kind)] = (stamp, reader)
+        return reader
+
+    def search(
+        self,
+        module_ids: Sequence[str],
+        kind: str,
+        query: Sequence[float],
+        k: int,
+        nprobe: Optional[int] = None,
+    ) -> Optional[List[Hit]]:
+        """
+        Approximate top-k across modules.
+
+        Scores use the Neo4j vector index scale, (1 + cosine) / 2, so hits
+        fuse identically with db.index.vector.queryNodes results.
+
+        Args:
+            module_ids: Modules to search
+            kind: Index kind (one of INDEX_KINDS)
+            query: Query embedding
+            k: Number of results
+            nprobe: Lists probed per module (default: store setting)
+
+        Returns:
+            (id, score) best first, or None if any module has no index
+        """
+        vector = normalize_rows(query)[0]
+        hits: List[Hit] = []
+        for module_id in module_ids:
+            try:
+                reader = self._reader(module_id, kind)
+            except (OSError, ValueError) as e:
+                # Lost a race with compaction removing old parts; retry once
+                logger.debug(f"ANN index reload for {module_id} failed: {e}")
+                self._readers.pop((module_id, kind), None)
+                reader = self._reader(module_id, kind)
+            if reader is None:
+                return None
+            if reader.manifest["dim"] and reader.manifest["dim"] != len(vector):
+                return None
+            hits.extend(reader.search(vector, k, nprobe or self.nprobe))
+        hits.sort(key=lambda hit: hit[1], reverse=True)
+        return hits[:k]
+
+
+# ============================================================================
+# KG STORE PATH HOOKS
+# ============================================================================
+
+
+def fetch_module_embeddings(driver, module_id: str, kind: str) -> Tuple[List[str], np.ndarray]:
+    """
+    Read all embeddings of one kind for a module from Neo4j.
+
+    Args:
+        driver: Sync Neo4j driver
+        module_id: Module ID
+        kind: Index kind (one of INDEX_KINDS)
+
+    Returns:
+        (ids, (N, D) float32 matrix)
+    """
+    ids: List[str] = []
+    rows: List[np.ndarray] = []
+    with driver.session() as session:
+        for record in session.run(MODULE_EMBEDDINGS_QUERIES[kind], module_id=module_id):
+            ids.append(record["id"])
+            rows.append(np.asarray(record["embedding"], dtype=np.float32))
+    if not rows:
+        return [], np.empty((0, 0), dtype=np.float32)
+    return ids, np.stack(rows)
+
+
+def update_module_index(
+    driver,
+    module_id: str,
+    kind: str,
+    ids: Sequence[str],
+    vectors: Sequence[Sequence[float]],
+    store: Optional[AnnIndexStore] = None,
+) -> None:
+    """
+    Add freshly stored embeddings to a module index.
+
+    A module without an index is built from Neo4j (which already contains
+    the new rows). Failures drop the index so search falls back to Neo4j
+    rather than serving a stale index; the next write rebuilds it.
+
+    Args:
+        driver: Sync Neo4j driver
+        module_id: Module ID
+        kind: Index kind (one of INDEX_KINDS)
+        ids: Node ids that were written
+        vectors: Their embeddings
+        store: Index store (default: get_ann_index())
+    """
+    store = store or get_ann_index()
+    if store is None:
+        return
+    try:
+        pairs = [(i, v) for i, v in zip(ids, vectors) if v is not None and len(v)]
+        if store.add(module_id, kind, [i for i, _ in pairs], [v for _, v in pairs]):
+            return
+        if driver is not None:
+            store.build(module_id, kind, *fetch_module_embeddings(driver, module_id, kind))
+    except Exception as e:
+        logger.warning(f"ANN {kind} index update failed for {module_id}, dropping it: {e}")
+        try:
+            store.drop(module_id, kind)
+        except OSError as drop_error:
+            logger.error(f"Failed to drop ANN index for {module_id}: {drop_error}")
+
+
+def remove_from_module_index(
+    module_id: str,
+    kind: str,
+    ids: Sequence[str],
+    store: Optional[AnnIndexStore] = None,
+) -> None:
+    """
+    Tombstone deleted nodes in a module index.
+
+    Args:
+        module_id: Module ID
+        kind: Index kind (one of INDEX_KINDS)
+        ids: Deleted node ids
+        store: Index store (default: get_ann_index())
+    """
+    store = store or get_ann_index()
+    if store is None or not ids:
+        return
+    try:
+        store.remove(module_id, kind, ids)
+    except Exception as e:
+        logger.warning(f"ANN {kind} index removal failed for {module_id}, dropping it: {e}")
+        try:
+            store.drop(module_id, kind)
+        except OSError as drop_error:
+            logger.error(f"Failed to drop ANN index for {module_id}: {drop_error}")
+
+
+_ann_index: Optional[AnnIndexStore] = None
+
+
+def get_ann_index() -> Optional[AnnIndexStore]:
+    """Process-wide index store, or None if ANN_INDEX_ENABLED is off."""
+    global _ann_index
+    if not ANN_INDEX_ENABLED:
+        return None
+    if _ann_index is None:
+        _ann_index = AnnIndexStore()
+    return _ann_index
@@ -22,7 +22,10 @@ KEY COMPONENTS:
     - set: Store JSON-serializable values with TTL
     - get: Retrieve cached values
     - delete: Remove cached entries
+    - set_if_absent / incr: Atomic primitives for counters and version stamps
     - redis_client: Singleton instance for application-wide use
+    - CacheStats / get_cache_stats: Per-process hit/miss counters by cache
+      and tier, reported by GET /api/v1/search/cache/stats
 
 DEPENDENCIES:
     - External: redis (Redis client library), json, logging, os
@@ -47,7 +50,8 @@ from __future__ import annotations
 import json
 import logging
 import os
-from typing import Any, List, Optional
+import threading
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -263,6 +267,50 @@ class RedisClient:
             logger.debug(f"Cache keys lookup failed for {pattern}: {e}")
             return []
 
+    def set_if_absent(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        Set a value only if the key does not exist (SET NX).
+
+        Args:
+            key: Cache key
+            value: Value to cache (will be JSON-encoded)
+            ttl: Optional time-to-live in seconds (None = no expiry)
+
+        Returns:
+            True if the value was written, False if the key existed or on error
+        """
+        client = self._get_client()
+        if client is None:
+            return False
+
+        try:
+            serialized = json.dumps(value, default=str)
+            return bool(client.set(key, serialized, ex=ttl, nx=True))  # type: ignore[union-attr]
+        except Exception as e:
+            logger.debug(f"Cache set_if_absent failed for {key}: {e}")
+            return False
+
+    def incr(self, key: str, amount: int = 1) -> Optional[int]:
+        """
+        Atomically increment an integer counter.
+
+        Args:
+            key: Cache key holding an integer
+            amount: Increment step
+
+        Returns:
+            New counter value, or None if unavailable
+        """
+        client = self._get_client()
+        if client is None:
+            return None
+
+        try:
+            return int(client.incrby(key, amount))  # type: ignore[union-attr]
+        except Exception as e:
+            logger.debug(f"Cache incr failed for {key}: {e}")
+            return None
+
     def exists(self, key: str) -> bool:
         """
         Check if a key exists in cache.
@@ -288,3 +336,62 @@ class RedisClient:
 # ============================================================================
 
 redis_client = RedisClient()
+
+
+# ============================================================================
+# CACHE METRICS
+# ============================================================================
+
+
+class CacheStats:
+    """
+    Thread-safe hit/miss counters for one logical cache.
+
+    Hits are counted per tier (e.g. "memory", "redis") so multi-tier caches
+    show where requests are served from.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses = 0
+
+    def hit(self, tier: str = "redis") -> None:
+        """Record a hit served from `tier`."""
+        with self._lock:
+            self._hits[tier] = self._hits.get(tier, 0) + 1
+
+    def miss(self) -> None:
+        """Record a miss (value computed from scratch)."""
+        with self._lock:
+            self._misses += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters and overall hit rate."""
+        with self._lock:
+            hits = dict(self._hits)
+            misses = self._misses
+        total = sum(hits.values()) + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "requests": total,
+            "hit_rate": round(sum(hits.values()) / total, 4) if total else 0.0,
+        }
+
+
+_cache_stats: Dict[str, CacheStats] = {}
+
+
+def get_cache_stats(name: str) -> CacheStats:
+    """Get (creating on first use) the process-wide counters for a cache."""
+    stats = _cache_stats.get(name)
+    if stats is None:
+        stats = _cache_stats.setdefault(name, CacheStats(name))
+    return stats
+
+
+def all_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every registered cache's counters."""
+    return {name: stats.snapshot() for name, stats in sorted(_cache_stats.items())}
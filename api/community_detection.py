@@ -0,0 +1,552 @@
+"""
+============================================================================
+FILE: community_detection.py
+LOCATION: api/community_detection.py
+============================================================================
+
+PURPOSE:
+    Offline community detection and centrality scoring for a module's entity
+    graph, persisted on the entity nodes as `community_id` and `centrality`.
+
+ROLE IN PROJECT:
+    Clustering a module graph per request is too expensive for the
+    level-of-detail views (api/graph_lod.py), trends and summaries. This job
+    pulls the module's entity adjacency once, runs weighted label propagation
+    and PageRank in-process on a CSR adjacency (NumPy only, no GDS plugin),
+    and writes the results back in batches. Readers then group by the stored
+    `community_id` instead of recomputing clusters.
+    - Runs from a Celery task after documents are stored (debounced)
+    - Skips modules whose graph version has not changed since the last run
+    - Warm-starts from the stored communities so ids stay stable across runs
+      and only changed nodes are rewritten
+    - Does not bump the module graph version; views that show communities
+      key their caches on get_community_stamp instead
+
+KEY COMPONENTS:
+    - CommunityDetector: Fetch, detect, write back and record the run
+    - build_adjacency: Symmetric weighted CSR adjacency from an edge list
+    - label_propagation: Weighted semi-synchronous label propagation
+    - pagerank: Weighted PageRank power iteration
+    - assign_community_ids: Map labels onto stable community ids
+    - get_community_stamp: When a module's assignments last changed
+
+DEPENDENCIES:
+    - External: numpy, neo4j
+    - Internal: api/graph_cache.py, api/cache.py
+
+USAGE:
+    from api.community_detection import CommunityDetector
+
+    detector = CommunityDetector(neo4j_driver)
+    summary = detector.detect("module_123")
+============================================================================
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from api.graph_cache import get_module_version
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+CACHE_PREFIX_COMMUNITY_RUN = "graph:community"
+COMMUNITY_RUN_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Entity rows per write-back transaction
+COMMUNITY_WRITE_BATCH_SIZE = 1000
+
+LPA_MAX_ITERATIONS = 30
+LPA_SEED = 42
+
+PAGERANK_DAMPING = 0.85
+PAGERANK_MAX_ITERATIONS = 100
+PAGERANK_TOLERANCE = 1e-8
+
+# Centrality changes smaller than this are not written back
+CENTRALITY_WRITE_EPSILON = 1e-3
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+_MODULE_ENTITIES_QUERY = """
+MATCH (e:Entity {module_id: $module_id})
+WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+RETURN e.id as id, e.community_id as community_id, e.centrality as centrality
+"""
+
+# Directed match so each stored relationship is returned once; the adjacency
+# is symmetrised in memory
+_MODULE_EDGES_QUERY = """
+MATCH (a:Entity {module_id: $module_id})-[r]->(b:Entity {module_id: $module_id})
+WHERE a <> b
+  AND (a:Topic OR a:Concept OR a:Methodology OR a:Finding)
+  AND (b:Topic OR b:Concept OR b:Methodology OR b:Finding)
+RETURN a.id as source, b.id as target, coalesce(r.confidence, 1.0) as weight
+"""
+
+_WRITE_COMMUNITIES_QUERY = """
+UNWIND $rows AS row
+MATCH (e:Entity {id: row.id})
+WHERE e.module_id = $module_id
+SET e.community_id = row.community_id,
+    e.centrality = row.centrality
+"""
+
+
+# ============================================================================
+# SPARSE GRAPH ALGORITHMS
+# ============================================================================
+
+
+class Adjacency(NamedTuple):
+    """Symmetric weighted adjacency in CSR form."""
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+
+    @property
+    def size(self) -> int:
+        return len(self.indptr) - 1
+
+    def rows(self) -> np.ndarray:
+        """Row index of every stored entry (COO row array)."""
+        return np.repeat(np.arange(self.size), np.diff(self.indptr))
+
+
+def build_adjacency(
+    size: int, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray
+) -> Adjacency:
+    """
+    Build a symmetric CSR adjacency, summing parallel edges.
+
+    Args:
+        size: Number of nodes
+        sources: Source node indices
+        targets: Target node indices
+        weights: Edge weights
+
+    Returns:
+        Adjacency without self loops
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+
+    keep = sources != targets
+    rows = np.concatenate([sources[keep], targets[keep]])
+    cols = np.concatenate([targets[keep], sources[keep]])
+    data = np.concatenate([weights[keep], weights[keep]])
+
+    # Sort by (row, col) and merge duplicates
+    keys, inverse = np.unique(rows * size + cols, return_inverse=True)
+    data = np.bincount(inverse, weights=data, minlength=len(keys))
+    rows, cols = keys // size, keys % size
+
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=size), out=indptr[1:])
+    return Adjacency(indptr, cols, data)
+
+
+def label_propagation(
+    adjacency: Adjacency,
+    initial_labels: Optional[np.ndarray] = None,
+    max_iterations: int = LPA_MAX_ITERATIONS,
+    seed: int = LPA_SEED,
+) -> np.ndarray:
+    """
+    Weighted label propagation.
+
+    Each round every node scores the labels of its neighbours by edge weight;
+    a random half of the nodes adopt their best label (updating all nodes at
+    once oscillates on bipartite structures). A node keeps its current label
+    on ties, so a warm start from stored communities converges in a few
+    rounds and leaves unchanged regions alone.
+
+    Args:
+        adjacency: Symmetric weighted adjacency
+        initial_labels: Starting label per node (values in [0, size));
+            defaults to one label per node
+        max_iterations: Round cap
+        seed: Random seed (results are deterministic for a given seed)
+
+    Returns:
+        Label per node
+    """
+    size = adjacency.size
+    labels = (
+        np.arange(size, dtype=np.int64)
+        if initial_labels is None
+        else np.asarray(initial_labels, dtype=np.int64).copy()
+    )
+    if size == 0 or len(adjacency.indices) == 0:
+        return labels
+
+    rng = np.random.default_rng(seed)
+    rows = adjacency.rows()
+    # Breaks exact ties between rival labels; far below any real weight
+    jitter_scale = 1e-9 * float(adjacency.weights.min())
+
+    for _ in range(max_iterations):
+        keys, inverse = np.unique(
+            rows * size + labels[adjacency.indices], return_inverse=True
+        )
+        scores = np.bincount(inverse, weights=adjacency.weights)
+        nodes, candidates = keys // size, keys % size
+
+        scores = scores + rng.random(len(scores)) * jitter_scale
+        scores[candidates == labels[nodes]] += 2 * jitter_scale
+
+        order = np.lexsort((-scores, nodes))
+        nodes, candidates = nodes[order], candidates[order]
+        first = np.concatenate([[True], nodes[1:] != nodes[:-1]])
+        best_nodes, best_labels = nodes[first], candidates[first]
+
+        changed = best_labels != labels[best_nodes]
+        if not changed.any():
+            break
+
+        update = changed & (rng.random(len(best_nodes)) < 0.5)
+        labels[best_nodes[update]] = best_labels[update]
+
+    return labels
+
+
+def pagerank(
+    adjacency: Adjacency,
+    damping: float = PAGERANK_DAMPING,
+    max_iterations: int = PAGERANK_MAX_ITERATIONS,
+    tolerance: float = PAGERANK_TOLERANCE,
+) -> np.ndarray:
+    """
+    Weighted PageRank by power iteration.
+
+    Args:
+        adjacency: Symmetric weighted adjacency
+        damping: Damping factor
+        max_iterations: Iteration cap
+        tolerance: L1 convergence threshold
+
+    Returns:
+        Score per node, summing to 1
+    """
+    size = adjacency.size
+    if size == 0:
+        return np.zeros(0)
+
+    rows = adjacency.rows()
+    strength = np.bincount(rows, weights=adjacency.weights, minlength=size)
+    dangling = strength == 0
+    inverse_strength = np.divide(
+        1.0, strength, out=np.zeros(size), where=~dangling
+    )
+
+    scores = np.full(size, 1.0 / size)
+    for _ in range(max_iterations):
+        flow = (scores * inverse_strength)[rows] * adjacency.weights
+        updated = np.bincount(adjacency.indices, weights=flow, minlength=size)
+        updated = damping * (updated + scores[dangling].sum() / size)
+        updated += (1.0 - damping) / size
+        delta = np.abs(updated - scores).sum()
+        scores = updated
+        if delta < tolerance:
+            break
+    return scores
+
+
+def assign_community_ids(
+    labels: np.ndarray, previous: Sequence[Optional[int]]
+) -> List[int]:
+    """
+    Map propagation labels onto community ids, reusing stored ids.
+
+    Communities are visited largest first; each takes the most common stored
+    id among its members if no larger community claimed it, otherwise a fresh
+    id. Unchanged communities therefore keep their ids across runs.
+
+    Args:
+        labels: Label per node
+        previous: Stored community id per node (None if unassigned)
+
+    Returns:
+        Community id per node
+    """
+    members: Dict[int, List[int]] = {}
+    for node, label in enumerate(labels.tolist()):
+        members.setdefault(label, []).append(node)
+
+    used = set()
+    next_id = max((p for p in previous if p is not None), default=-1) + 1
+    result = [0] * len(labels)
+
+    for nodes in sorted(members.values(), key=lambda group: (-len(group), group[0])):
+        counts = Counter(previous[n] for n in nodes if previous[n] is not None)
+        community_id = next(
+            (cid for cid, _ in counts.most_common() if cid not in used), None
+        )
+        if community_id is None:
+            community_id = next_id
+            next_id += 1
+        used.add(community_id)
+        for node in nodes:
+            result[node] = community_id
+    return result
+
+
+def _warm_start_labels(previous: Sequence[Optional[int]]) -> np.ndarray:
+    """Initial labels: stored communities share a label, new nodes get their own."""
+    representative: Dict[int, int] = {}
+    labels = np.arange(len(previous), dtype=np.int64)
+    for node, community_id in enumerate(previous):
+        if community_id is not None:
+            labels[node] = representative.setdefault(community_id, node)
+    return labels
+
+
+# ============================================================================
+# CACHE CLIENT
+# ============================================================================
+
+
+def _get_cache():
+    """Get the shared Redis cache client, or None if unavailable."""
+    try:
+        from api.cache import redis_client
+    except ImportError:
+        try:
+            from cache import redis_client  # type: ignore[import-not-found]
+        except ImportError:
+            logger.debug("Cache not available")
+            return None
+    return redis_client
+
+
+def _run_key(module_id: str) -> str:
+    return f"{CACHE_PREFIX_COMMUNITY_RUN}:{module_id}"
+
+
+def _load_run(module_id: str) -> Optional[Dict[str, Any]]:
+    cache = _get_cache()
+    if cache is None:
+        return None
+    try:
+        state = cache.get(_run_key(module_id))
+        return state if isinstance(state, dict) else None
+    except Exception as e:
+        logger.debug(f"Community run lookup failed for {module_id}: {e}")
+        return None
+
+
+def get_community_stamp(module_id: str) -> Optional[float]:
+    """
+    Get when the module's stored community assignments last changed.
+
+    Writing community_id/centrality only touches properties read by the
+    level-of-detail views, so detection does not bump the module graph
+    version (which would also drop search, snapshot and summary caches).
+    Those views add this stamp to their cache options instead.
+
+    Args:
+        module_id: Module identifier
+
+    Returns:
+        Epoch seconds of the last run that changed assignments, or None if
+        no such run is recorded
+    """
+    last = _load_run(module_id)
+    return last.get("assignments_updated_at") if last else None
+
+
+# ============================================================================
+# DETECTOR
+# ============================================================================
+
+
+class CommunityDetector:
+    """Computes and persists entity communities and centrality per module."""
+
+    def __init__(self, driver, batch_size: int = COMMUNITY_WRITE_BATCH_SIZE):
+        """
+        Initialize the detector.
+
+        Args:
+            driver: Neo4j (sync) driver instance
+            batch_size: Entity rows per write-back transaction
+        """
+        self.driver = driver
+        self.batch_size = batch_size
+
+    # ------------------------------------------------------------------
+    # Run bookkeeping
+    # ------------------------------------------------------------------
+
+    def last_run(self, module_id: str) -> Optional[Dict[str, Any]]:
+        """Get the recorded summary of the module's last completed run."""
+        return _load_run(module_id)
+
+    def _record_run(self, module_id: str, summary: Dict[str, Any]) -> None:
+        cache = _get_cache()
+        if cache is None:
+            return
+        try:
+            cache.set(_run_key(module_id), summary, ttl=COMMUNITY_RUN_TTL_SECONDS)
+        except Exception as e:
+            logger.debug(f"Community run record failed for {module_id}: {e}")
+
+    # ------------------------------------------------------------------
+    # Neo4j I/O
+    # ------------------------------------------------------------------
+
+    def _fetch(
+        self, module_id: str
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        with self.driver.session() as session:
+            entities = [
+                dict(r)
+                for r in session.run(_MODULE_ENTITIES_QUERY, module_id=module_id)
+            ]
+            edges = [
+                dict(r) for r in session.run(_MODULE_EDGES_QUERY, module_id=module_id)
+            ]
+        return entities, edges
+
+    def _write(self, module_id: str, rows: List[Dict[str, Any]]) -> None:
+        with self.driver.session() as session:
+            for start in range(0, len(rows), self.batch_size):
+                session.run(
+                    _WRITE_COMMUNITIES_QUERY,
+                    rows=rows[start:start + self.batch_size],
+                    module_id=module_id,
+                )
+
+    # ------------------------------------------------------------------
+    # Detection
+    # ------------------------------------------------------------------
+
+    def compute(
+        self, entities: List[Dict[str, Any]], edges: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute community ids and centrality for a module's entities.
+
+        Args:
+            entities: Rows with id and the stored community_id
+            edges: Rows with source, target and weight entity ids
+
+        Returns:
+            Row per entity with id, community_id and centrality (PageRank
+            scaled so the most central entity in the module scores 1.0)
+        """
+        ids = [entity["id"] for entity in entities]
+        index = {entity_id: i for i, entity_id in enumerate(ids)}
+        previous = [
+            int(entity["community_id"])
+            if entity.get("community_id") is not None
+            else None
+            for entity in entities
+        ]
+
+        known = [
+            edge for edge in edges
+            if edge["source"] in index and edge["target"] in index
+        ]
+        adjacency = build_adjacency(
+            len(ids),
+            np.array([index[e["source"]] for e in known], dtype=np.int64),
+            np.array([index[e["target"]] for e in known], dtype=np.int64),
+            np.array([float(e["weight"]) for e in known], dtype=np.float64),
+        )
+
+        labels = label_propagation(adjacency, _warm_start_labels(previous))
+        communities = assign_community_ids(labels, previous)
+
+        scores = pagerank(adjacency)
+        if len(scores) and scores.max() > 0:
+            scores = scores / scores.max()
+
+        return [
+            {
+                "id": entity_id,
+                "community_id": communities[i],
+                "centrality": round(float(scores[i]), 6),
+            }
+            for i, entity_id in enumerate(ids)
+        ]
+
+    def detect(self, module_id: str, force: bool = False) -> Dict[str, Any]:
+        """
+        Detect communities for a module and persist changed assignments.
+
+        Args:
+            module_id: Module identifier
+            force: Recompute even if the module version is unchanged
+
+        Returns:
+            Run summary with status "skipped" or "completed"
+        """
+        start_time = time.time()
+        version = get_module_version(module_id)
+
+        last = self.last_run(module_id)
+        if (
+            not force
+            and version is not None
+            and last is not None
+            and last.get("version") == version
+        ):
+            logger.debug(f"Communities for {module_id} are current (v{version})")
+            return {"status": "skipped", "module_id": module_id, "version": version}
+
+        entities, edges = self._fetch(module_id)
+        stored = {
+            entity["id"]: (entity.get("community_id"), entity.get("centrality"))
+            for entity in entities
+        }
+        rows = self.compute(entities, edges)
+
+        changed = [
+            row for row in rows
+            if stored[row["id"]][0] != row["community_id"]
+            or stored[row["id"]][1] is None
+            or abs(stored[row["id"]][1] - row["centrality"]) > CENTRALITY_WRITE_EPSILON
+        ]
+        if changed:
+            self._write(module_id, changed)
+
+        # Recording the version read before fetching means a document that
+        # landed while we were computing triggers the next run
+        summary = {
+            "status": "completed",
+            "module_id": module_id,
+            "version": version,
+            "entity_count": len(rows),
+            "edge_count": len(edges),
+            "community_count": len({row["community_id"] for row in rows}),
+            "updated_count": len(changed),
+            "assignments_updated_at": (
+                time.time() if changed else (last or {}).get("assignments_updated_at")
+            ),
+            "duration_seconds": round(time.time() - start_time, 3),
+        }
+        if version is not None:
+            self._record_run(module_id, summary)
+
+        logger.info(
+            f"Communities for {module_id}: {summary['community_count']} communities "
+            f"over {summary['entity_count']} entities, "
+            f"{summary['updated_count']} updated in {summary['duration_seconds']}s"
+        )
+        return summary
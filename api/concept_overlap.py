@@ -0,0 +1,191 @@
+"""
+============================================================================
+FILE: concept_overlap.py
+LOCATION: api/concept_overlap.py
+============================================================================
+
+PURPOSE:
+    Vectorized concept overlap between many modules: pairwise Jaccard
+    similarity plus shared, unique and bridging concepts, computed from
+    (module, concept) membership pairs with numpy.
+
+ROLE IN PROJECT:
+    Backs TrendAnalyzer.get_cross_module_overlap (services/trend_analyzer.py).
+    The previous implementation built a Python set per module, tested every
+    concept against every module and compared all module pairs with set
+    unions, which forced a 10-module cap.
+
+    Membership is kept in coordinate form over an interned concept
+    vocabulary (one int per normalized name). Per-concept and per-module
+    counts are bincounts. Only concepts found in two or more modules can
+    contribute to an intersection, so the pairwise intersection counts are
+    one matrix product over those columns alone:
+
+        intersection = S @ S.T         (S: modules x shared concepts)
+        union        = |A| + |B| - intersection
+
+    Unique concepts never enter the product, which keeps it small even when
+    each module has thousands of concepts of its own.
+
+KEY COMPONENTS:
+    - CONCEPT_MEMBERSHIP_QUERY: Distinct (module, concept) pairs from rollups
+    - SHARED_DEFINITIONS_QUERY: Per-module definitions of shared concepts
+    - ConceptOverlap: Result of compute_concept_overlap
+    - compute_concept_overlap: Jaccard matrix and concept classification
+
+DEPENDENCIES:
+    - External: numpy
+    - Internal: None (reads ConceptRollup nodes from api/concept_rollups.py)
+
+USAGE:
+    from api.concept_overlap import compute_concept_overlap
+
+    overlap = compute_concept_overlap(module_ids, membership_rows)
+    overlap.jaccard  # modules x modules list of floats
+============================================================================
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Enough for every module of a department in one request
+MAX_MODULES_FOR_OVERLAP = 250
+
+# A shared concept is bridging if it appears in at least this share of the
+# analyzed modules
+BRIDGING_MODULE_FRACTION = 0.5
+
+
+# ============================================================================
+# CYPHER QUERIES
+# ============================================================================
+
+# One row per distinct (module, concept), served by the rollup module index
+CONCEPT_MEMBERSHIP_QUERY = """
+MATCH (r:ConceptRollup)
+WHERE r.module_id IN $module_ids
+RETURN r.module_id as module_id, r.name_normalized as name_normalized,
+       collect(r.name)[0] as name, collect(r.entity_type)[0] as type
+"""
+
+SHARED_DEFINITIONS_QUERY = """
+UNWIND $names as name_normalized
+MATCH (e:Entity {name_normalized: name_normalized})
+WHERE e.module_id IN $module_ids AND (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+AND e.definition IS NOT NULL
+RETURN name_normalized, e.module_id as module_id,
+       collect(e.definition)[0] as definition
+"""
+
+
+# ============================================================================
+# OVERLAP
+# ============================================================================
+
+
+@dataclass
+class ConceptOverlap:
+    """
+    Overlap of concept sets across modules.
+
+    Concepts are identified by normalized name; modules are listed in the
+    order they were passed in.
+    """
+
+    jaccard: List[List[float]] = field(default_factory=list)
+    shared: List[Tuple[str, List[str]]] = field(default_factory=list)
+    unique: Dict[str, List[str]] = field(default_factory=dict)
+    bridging: List[str] = field(default_factory=list)
+
+
+def compute_concept_overlap(
+    module_ids: List[str],
+    rows: Iterable[Dict[str, Any]],
+    bridging_fraction: float = BRIDGING_MODULE_FRACTION,
+) -> ConceptOverlap:
+    """
+    Jaccard matrix and shared / unique / bridging concepts.
+
+    Args:
+        module_ids: Modules to compare (matrix order)
+        rows: Membership records with module_id and name_normalized;
+            duplicates and unknown modules are ignored
+        bridging_fraction: Share of modules a bridging concept must reach
+
+    Returns:
+        ConceptOverlap; shared concepts are ordered by module count, then name
+    """
+    module_index = {module_id: i for i, module_id in enumerate(module_ids)}
+    vocabulary: Dict[str, int] = {}
+    module_coords: List[int] = []
+    concept_coords: List[int] = []
+    for row in rows:
+        i = module_index.get(row["module_id"])
+        name = row["name_normalized"]
+        if i is None or name is None:
+            continue
+        module_coords.append(i)
+        concept_coords.append(vocabulary.setdefault(name, len(vocabulary)))
+
+    n_modules, n_concepts = len(module_ids), len(vocabulary)
+    names = np.empty(n_concepts, dtype=object)
+    names[list(vocabulary.values())] = list(vocabulary.keys())
+
+    # Deduplicate (module, concept) pairs; sorted by concept, then module
+    pairs = np.unique(
+        np.asarray(concept_coords, dtype=np.int64) * max(n_modules, 1)
+        + np.asarray(module_coords, dtype=np.int64)
+    )
+    concepts, modules = np.divmod(pairs, max(n_modules, 1))
+
+    concept_counts = np.bincount(concepts, minlength=n_concepts)
+    module_sizes = np.bincount(modules, minlength=n_modules).astype(np.float64)
+
+    # Intersections come only from concepts present in 2+ modules
+    shared_mask = concept_counts >= 2
+    shared_column = np.cumsum(shared_mask) - 1
+    in_shared = shared_mask[concepts]
+    membership = np.zeros((n_modules, int(shared_mask.sum())), dtype=np.float32)
+    membership[modules[in_shared], shared_column[concepts[in_shared]]] = 1.0
+    intersection = (membership @ membership.T).astype(np.float64)
+
+    union = module_sizes[:, None] + module_sizes[None, :] - intersection
+    jaccard = np.divide(
+        intersection, union, out=np.zeros_like(intersection), where=union > 0
+    )
+    np.fill_diagonal(jaccard, 1.0)
+
+    # Shared concepts with their modules, most widely shared first
+    shared_concepts = np.flatnonzero(shared_mask)
+    shared_counts = concept_counts[shared_concepts]
+    member_names = np.asarray(module_ids, dtype=object)[modules[in_shared]]
+    members = np.split(member_names, np.cumsum(shared_counts)[:-1])
+    order = np.lexsort((names[shared_concepts].astype(str), -shared_counts))
+    shared = [(names[shared_concepts[k]], members[k].tolist()) for k in order.tolist()]
+
+    bridging_threshold = max(2, int(n_modules * bridging_fraction))
+    bridging = [name for name, in_modules in shared if len(in_modules) >= bridging_threshold]
+
+    unique: Dict[str, List[str]] = {module_id: [] for module_id in module_ids}
+    single = concept_counts[concepts] == 1
+    for i, j in zip(modules[single].tolist(), concepts[single].tolist()):
+        unique[module_ids[i]].append(names[j])
+
+    return ConceptOverlap(
+        jaccard=[[round(value, 4) for value in row] for row in jaccard.tolist()],
+        shared=shared,
+        unique=unique,
+        bridging=bridging,
+    )
@@ -0,0 +1,355 @@
+"""
+============================================================================
+FILE: concept_rollups.py
+LOCATION: api/concept_rollups.py
+============================================================================
+
+PURPOSE:
+    Materialized concept frequency rollups: one ConceptRollup node per
+    (normalized concept name, entity type, module, day) holding the number
+    of entities created, plus the Cypher that trend analysis runs on them.
+
+ROLE IN PROJECT:
+    TrendAnalyzer (services/trend_analyzer.py) used to scan and group every
+    entity node on each cache miss. Trend queries now read a few rollup
+    rows per concept instead. Entity.name_normalized, stamped by the entity
+    writers, serves concept evolution lookups through the
+    entity_name_normalized index instead of toLower(e.name) over every
+    entity.
+
+    Rollups are maintained incrementally:
+    - The KG store path (api/kg_processor.py) flags entities it creates
+      with rollup_pending; increment_concept_rollups adds them to their
+      rollups (count = count + n) and clears the flag
+    - Orphan cleanup (api/graph_manager.py) subtracts the entities it
+      deletes and drops rollups that reach zero
+
+    A module refresh recomputes that module's rollups from its entities in
+    one statement (index seek on Entity.module_id). It backs the bulk
+    rebuild, and rebuild_concept_rollups runs it for every module
+    (migration 008 and the Celery batch task) to repair any drift.
+
+    Rollups are day-granular: trend ranges are applied to whole days.
+
+KEY COMPONENTS:
+    - normalize_concept_name: Python twin of the Cypher normalization
+    - day_bounds: Inclusive start / exclusive end days for a datetime range
+    - increment_concept_rollups: Add newly stored entities to their rollups
+    - rollup_decrements: Rollup counts to subtract for deleted entities
+    - refresh_module_concept_rollups: Recompute one module's rollups
+    - rebuild_concept_rollups: Recompute all modules' rollups
+    - CONCEPT_*_QUERY: Rollup reads used by TrendAnalyzer
+
+DEPENDENCIES:
+    - External: neo4j (sync driver)
+    - Internal: None
+
+USAGE:
+    from api.concept_rollups import increment_concept_rollups
+
+    increment_concept_rollups(neo4j_driver, entity_ids)  # after a store
+============================================================================
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# MAINTENANCE QUERIES
+# ============================================================================
+
+# Normalization shared by the Cypher below and normalize_concept_name
+CYPHER_NORMALIZED_NAME = "toLower(trim(e.name))"
+
+# Entities of `e` counted by the rollups, and the rollup each one falls in.
+# Name, module, type label and created_at are all fixed when an entity is
+# created (its id hashes name and module), so an entity never changes rollup
+CYPHER_ROLLUP_ENTITY = (
+    "(e:Topic OR e:Concept OR e:Methodology OR e:Finding) "
+    "AND e.module_id IS NOT NULL AND e.name IS NOT NULL AND e.created_at IS NOT NULL"
+)
+CYPHER_ENTITY_TYPE = "[l IN labels(e) WHERE l <> 'Entity'][0]"
+CYPHER_ENTITY_DAY = "date(substring(toString(e.created_at), 0, 10))"
+CYPHER_ROLLUP_KEY = (
+    f"e.module_id + '|' + {CYPHER_NORMALIZED_NAME} + '|' + "
+    f"COALESCE({CYPHER_ENTITY_TYPE}, '') + '|' + toString({CYPHER_ENTITY_DAY})"
+)
+
+# Replaces a module's rollups with counts recomputed from its entities.
+# Also consumes pending increments, which the recount already includes
+CONCEPT_ROLLUP_REFRESH_QUERY = f"""
+OPTIONAL MATCH (old:ConceptRollup {{module_id: $module_id}})
+DETACH DELETE old
+WITH count(*) as _deleted
+OPTIONAL MATCH (pending:Entity {{module_id: $module_id}})
+WHERE pending.rollup_pending
+REMOVE pending.rollup_pending
+WITH count(*) as _cleared
+MATCH (e:Entity)
+WHERE e.module_id = $module_id AND {CYPHER_ROLLUP_ENTITY}
+SET e.name_normalized = {CYPHER_NORMALIZED_NAME}
+WITH {CYPHER_ROLLUP_KEY} as key,
+     e.name_normalized as name_normalized,
+     {CYPHER_ENTITY_TYPE} as entity_type,
+     {CYPHER_ENTITY_DAY} as day,
+     count(*) as count,
+     min(toString(e.created_at)) as first_seen,
+     collect(e.name)[0] as name
+CREATE (:ConceptRollup {{
+    key: key,
+    module_id: $module_id,
+    name_normalized: name_normalized,
+    name: name,
+    entity_type: entity_type,
+    day: day,
+    count: count,
+    first_seen: first_seen
+}})
+RETURN count(*) as rollups
+"""
+
+# Adds entities created by a store to their rollups. The entity writers set
+# rollup_pending on create; removing it here counts each entity exactly once
+# however often it is re-stored, and MERGE on the unique key lets concurrent
+# stores into the same rollup serialize instead of colliding
+CONCEPT_ROLLUP_INCREMENT_QUERY = f"""
+UNWIND $entity_ids as entity_id
+MATCH (e:Entity {{id: entity_id}})
+WHERE e.rollup_pending
+REMOVE e.rollup_pending
+WITH e
+WHERE {CYPHER_ROLLUP_ENTITY}
+WITH {CYPHER_ROLLUP_KEY} as key,
+     e.module_id as module_id,
+     {CYPHER_NORMALIZED_NAME} as name_normalized,
+     {CYPHER_ENTITY_TYPE} as entity_type,
+     {CYPHER_ENTITY_DAY} as day,
+     count(*) as count,
+     min(toString(e.created_at)) as first_seen,
+     collect(e.name)[0] as name
+MERGE (r:ConceptRollup {{key: key}})
+ON CREATE SET r.module_id = module_id, r.name_normalized = name_normalized,
+              r.name = name, r.entity_type = entity_type, r.day = day,
+              r.count = 0, r.first_seen = first_seen
+SET r.count = r.count + count,
+    r.first_seen = CASE WHEN first_seen < r.first_seen THEN first_seen ELSE r.first_seen END
+RETURN count(r) as rollups
+"""
+
+# Removes deleted entities from their rollups; $rollups is
+# [{key, count}] from rollup_decrements
+CONCEPT_ROLLUP_DECREMENT_QUERY = """
+UNWIND $rollups as row
+MATCH (r:ConceptRollup {key: row.key})
+SET r.count = r.count - row.count
+WITH r
+WHERE r.count <= 0
+DELETE r
+"""
+
+ENTITY_MODULES_QUERY = """
+MATCH (e:Entity)
+WHERE e.module_id IS NOT NULL
+RETURN DISTINCT e.module_id as module_id
+"""
+
+
+# ============================================================================
+# TREND QUERIES
+# ============================================================================
+
+CONCEPT_FREQUENCY_QUERY = """
+MATCH (r:ConceptRollup)
+WHERE ($module_ids IS NULL OR r.module_id IN $module_ids)
+  AND ($entity_types IS NULL OR r.entity_type IN $entity_types)
+WITH r.name_normalized as name_normalized, r.entity_type as type,
+     sum(r.count) as count,
+     collect(DISTINCT r.module_id) as modules,
+     collect(r.name)[0] as name
+RETURN name, type, count, modules
+ORDER BY count DESC
+LIMIT $limit
+"""
+
+CONCEPT_TRENDING_QUERY = """
+MATCH (r:ConceptRollup)
+WHERE r.day >= date($previous_start) AND r.day < date($current_end)
+WITH r.name_normalized as name_normalized, r.entity_type as type,
+     sum(CASE WHEN r.day >= date($current_start) THEN r.count ELSE 0 END) as current_count,
+     sum(CASE WHEN r.day < date($current_start) THEN r.count ELSE 0 END) as previous_count,
+     collect(DISTINCT CASE WHEN r.day >= date($current_start) THEN r.module_id END) as modules,
+     min(CASE WHEN r.day >= date($current_start) THEN r.first_seen END) as first_seen,
+     collect(r.name)[0] as name
+WHERE current_count > 0 AND previous_count > 0
+WITH name, type, current_count, previous_count, modules, first_seen,
+     toFloat(current_count - previous_count) / previous_count as growth_rate
+WHERE growth_rate >= $min_growth_rate
+RETURN name, type, current_count, previous_count, growth_rate, modules, first_seen
+ORDER BY growth_rate DESC
+LIMIT $limit
+"""
+
+# A concept is emerging if no rollup of that name (in any module) predates
+# the cutoff day
+CONCEPT_EMERGING_QUERY = """
+MATCH (r:ConceptRollup)
+WHERE r.day >= date($since)
+  AND ($module_ids IS NULL OR r.module_id IN $module_ids)
+WITH r.name_normalized as name_normalized, r.entity_type as type,
+     min(r.first_seen) as first_seen,
+     sum(r.count) as mention_count,
+     collect(r) as rows
+WHERE NOT EXISTS {
+    MATCH (older:ConceptRollup {name_normalized: name_normalized})
+    WHERE older.day < date($since)
+}
+WITH name_normalized, type, first_seen, mention_count,
+     [row IN rows WHERE row.first_seen = first_seen][0] as earliest
+RETURN earliest.name as name, name_normalized, type, first_seen,
+       earliest.module_id as module_id, mention_count
+ORDER BY first_seen DESC
+LIMIT $limit
+"""
+
+# Related concepts for a page of emerging concepts, in one round trip
+CONCEPT_RELATED_QUERY = """
+UNWIND $names as name_normalized
+MATCH (e:Entity {name_normalized: name_normalized})-[]-(related:Entity)
+WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding) AND (related:Topic OR related:Concept OR related:Methodology OR related:Finding)
+WITH name_normalized, collect(DISTINCT related.name)[..5] as related_concepts
+RETURN name_normalized, related_concepts
+"""
+
+CONCEPT_EVOLUTION_QUERY = """
+MATCH (e:Entity)
+WHERE e.name_normalized = $name_normalized
+AND (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+AND e.created_at >= $start AND e.created_at < $end
+RETURN e.created_at as created_at, e.module_id as module_id,
+       e.definition as definition, e.document_id as document_id
+ORDER BY e.created_at
+"""
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+def normalize_concept_name(name: str) -> str:
+    """Normalize a concept name exactly like CYPHER_NORMALIZED_NAME."""
+    return name.strip().lower()
+
+
+def day_bounds(start: datetime, end: datetime) -> Tuple[str, str]:
+    """
+    Whole-day bounds covering [start, end).
+
+    Returns:
+        (first day, day after the last day) as ISO dates
+    """
+    last = end.date() if end.time() == time(0) else end.date() + timedelta(days=1)
+    return start.date().isoformat(), last.isoformat()
+
+
+def refresh_module_concept_rollups(driver, module_id: Optional[str]) -> int:
+    """
+    Recompute a module's concept rollups from its entities.
+
+    Failures are logged and swallowed: stale rollups only affect trend
+    reports, never the write that triggered the refresh.
+
+    Args:
+        driver: Sync Neo4j driver
+        module_id: Module whose entities changed (ignored if empty)
+
+    Returns:
+        Number of rollup nodes written
+    """
+    if not module_id or driver is None:
+        return 0
+    try:
+        with driver.session() as session:
+            record = session.run(
+                CONCEPT_ROLLUP_REFRESH_QUERY, {"module_id": module_id}
+            ).single()
+        rollups = record["rollups"] if record else 0
+        logger.debug(f"Refreshed {rollups} concept rollups for {module_id}")
+        return rollups
+    except Exception as e:
+        logger.warning(f"Concept rollup refresh failed for {module_id}: {e}")
+        return 0
+
+
+def increment_concept_rollups(driver, entity_ids: List[str]) -> int:
+    """
+    Add newly created entities to their concept rollups.
+
+    Only entities still flagged rollup_pending are counted, so passing every
+    entity a store touched is safe. Failures are logged and swallowed like
+    refresh_module_concept_rollups; the flags stay set and the next module
+    refresh counts those entities.
+
+    Args:
+        driver: Sync Neo4j driver
+        entity_ids: IDs of the entities the store wrote
+
+    Returns:
+        Number of rollup nodes updated
+    """
+    if not entity_ids or driver is None:
+        return 0
+    try:
+        with driver.session() as session:
+            record = session.run(
+                CONCEPT_ROLLUP_INCREMENT_QUERY, {"entity_ids": list(entity_ids)}
+            ).single()
+        rollups = record["rollups"] if record else 0
+        logger.debug(f"Incremented {rollups} concept rollups")
+        return rollups
+    except Exception as e:
+        logger.warning(f"Concept rollup increment failed: {e}")
+        return 0
+
+
+def rollup_decrements(deleted: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Per-rollup counts to subtract for deleted entities.
+
+    Args:
+        deleted: Deleted entity rows; rollup_key is None for entities that
+            were never counted
+
+    Returns:
+        [{key, count}] rows for CONCEPT_ROLLUP_DECREMENT_QUERY
+    """
+    counts: Dict[str, int] = {}
+    for entity in deleted:
+        key = entity.get("rollup_key")
+        if key:
+            counts[key] = counts.get(key, 0) + 1
+    return [{"key": key, "count": count} for key, count in counts.items()]
+
+
+def rebuild_concept_rollups(driver) -> Dict[str, Any]:
+    """
+    Recompute the concept rollups of every module.
+
+    Args:
+        driver: Sync Neo4j driver
+
+    Returns:
+        Summary with modules refreshed and rollups written
+    """
+    with driver.session() as session:
+        module_ids = [record["module_id"] for record in session.run(ENTITY_MODULES_QUERY)]
+
+    rollups = sum(refresh_module_concept_rollups(driver, m) for m in module_ids)
+    logger.info(f"Rebuilt {rollups} concept rollups across {len(module_ids)} modules")
+    return {"modules": len(module_ids), "rollups": rollups}
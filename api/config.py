@@ -93,6 +93,11 @@ os.environ["REDIS_URL"] = REDIS_URL
 
 # Celery Configuration
 CELERY_RESULT_EXPIRES = int(os.getenv("CELERY_RESULT_EXPIRES", "3600"))
+# Delay before recomputing a module's communities after a document is stored;
+# documents landing within the window share one run
+COMMUNITY_DETECTION_DELAY = int(os.getenv("COMMUNITY_DETECTION_DELAY", "300"))
+# Seconds between scheduled feedback retention runs (celery beat)
+FEEDBACK_RETENTION_INTERVAL = int(os.getenv("FEEDBACK_RETENTION_INTERVAL", "86400"))
 
 # Mock Database Configuration
 USE_REAL_FIREBASE = os.getenv("USE_REAL_FIREBASE", "false").lower() == "true"
@@ -16,13 +16,17 @@ ROLE IN PROJECT:
     - Tracks answer quality ratings
     - Provides analytics for identifying low-quality content
     - Links feedback to knowledge graph entities via relationships
+    - Maintains per-(module, day, feedback type) FeedbackRollup counters so
+      dashboard stats for whole-day ranges never scan Feedback nodes
 
 KEY COMPONENTS:
     - FeedbackManager: Main service class for feedback operations
     - submit_result_feedback: Store feedback on search result relevance
     - submit_answer_feedback: Store feedback on generated answers
     - record_implicit_feedback: Track user interactions
-    - get_feedback_stats: Aggregate feedback analytics
+    - get_feedback_stats: Aggregate feedback analytics (rollups or one scan)
+    - rebuild_rollups: Recompute FeedbackRollup counters from Feedback nodes
+    - delete_old_feedback: Throttled, batched retention with dry-run mode
     - get_low_quality_results: Identify poorly-rated content
 
 DEPENDENCIES:
@@ -42,10 +46,13 @@ USAGE:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import time as clock
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from neo4j import Driver
 
@@ -66,6 +73,158 @@ from api.schemas.feedback import (
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# RETENTION CONFIGURATION
+# ============================================================================
+
+FEEDBACK_RETENTION_DAYS = int(os.getenv("FEEDBACK_RETENTION_DAYS", "90"))
+
+# Feedback nodes deleted per transaction; small enough that each batch holds
+# locks for milliseconds and never builds a large transaction state
+FEEDBACK_RETENTION_BATCH_SIZE = int(os.getenv("FEEDBACK_RETENTION_BATCH_SIZE", "1000"))
+
+# Fraction of wall time spent deleting; after each batch the loop sleeps long
+# enough to keep to it, so slow batches (a busy database) back off further
+FEEDBACK_RETENTION_DUTY_CYCLE = float(os.getenv("FEEDBACK_RETENTION_DUTY_CYCLE", "0.25"))
+FEEDBACK_RETENTION_MIN_PAUSE = 0.05
+
+FEEDBACK_EXPIRED_COUNT_QUERY = """
+MATCH (f:Feedback)
+WHERE f.timestamp < datetime($cutoff)
+RETURN count(f) as expired
+"""
+
+FEEDBACK_EXPIRED_DELETE_QUERY = """
+MATCH (f:Feedback)
+WHERE f.timestamp < datetime($cutoff)
+WITH f LIMIT $batch_size
+DETACH DELETE f
+RETURN count(*) as deleted
+"""
+
+
+# ============================================================================
+# ROLLUP QUERIES
+# ============================================================================
+
+# Rollup scope counting every feedback entry once; entries are also counted
+# once under each module they are tagged with
+ALL_MODULES = "*"
+
+# Dashboard module breakdown size
+TOP_MODULES_LIMIT = 20
+
+# Value averaged into average_relevance_score for each feedback entry
+STATS_RELEVANCE_EXPR = """COALESCE(f.relevance_score,
+    CASE WHEN f.helpful THEN 1.0
+         WHEN f.helpful = false THEN 0.0
+         ELSE 0.5 END)"""
+
+FEEDBACK_ROLLUP_UPDATE_QUERY = """
+UNWIND $scopes as scope
+MERGE (r:FeedbackRollup {key: scope + '|' + $day + '|' + $feedback_type})
+ON CREATE SET r.module_id = scope,
+              r.day = date($day),
+              r.feedback_type = $feedback_type,
+              r.count = 0,
+              r.positive_count = 0,
+              r.relevance_sum = 0.0
+SET r.count = r.count + 1,
+    r.positive_count = r.positive_count + $positive,
+    r.relevance_sum = r.relevance_sum + $relevance
+"""
+
+FEEDBACK_ROLLUP_STATS_QUERY = """
+MATCH (r:FeedbackRollup)
+WHERE ($module_id IS NULL OR r.module_id = $module_id)
+  AND ($start_day IS NULL OR r.day >= date($start_day))
+  AND ($end_day IS NULL OR r.day < date($end_day))
+RETURN r.module_id as module_id,
+       r.feedback_type as feedback_type,
+       sum(r.count) as count,
+       sum(r.positive_count) as positive_count,
+       sum(r.relevance_sum) as relevance_sum
+"""
+
+FEEDBACK_ROLLUP_CLEAR_QUERY = """
+MATCH (r:FeedbackRollup)
+WITH r LIMIT $batch_size
+DETACH DELETE r
+RETURN count(*) as deleted
+"""
+
+FEEDBACK_ROLLUP_REBUILD_QUERY = f"""
+MATCH (f:Feedback)
+WHERE f.timestamp IS NOT NULL
+WITH f, toString(date(f.timestamp)) as day, COALESCE(f.feedback_type, 'unknown') as feedback_type
+UNWIND ['{ALL_MODULES}'] + COALESCE(f.module_ids, []) as scope
+WITH scope, day, feedback_type,
+     count(*) as count,
+     sum(CASE WHEN f.is_positive THEN 1 ELSE 0 END) as positive_count,
+     sum({STATS_RELEVANCE_EXPR}) as relevance_sum
+CREATE (:FeedbackRollup {{
+    key: scope + '|' + day + '|' + feedback_type,
+    module_id: scope,
+    day: date(day),
+    feedback_type: feedback_type,
+    count: count,
+    positive_count: positive_count,
+    relevance_sum: relevance_sum
+}})
+RETURN count(*) as rollups
+"""
+
+
+def _day_aligned(value: datetime) -> bool:
+    return value.time() == time(0)
+
+
+def _empty_stats() -> FeedbackStats:
+    return FeedbackStats(
+        total_feedback_count=0,
+        positive_feedback_ratio=0.0,
+        average_relevance_score=0.0,
+        feedback_by_type={},
+        feedback_by_module={},
+    )
+
+
+def _stats_from_groups(
+    groups: Iterable[Dict[str, Any]],
+    feedback_by_module: Dict[str, int],
+    time_range: Optional[Tuple[datetime, datetime]],
+) -> FeedbackStats:
+    """
+    Combine per-feedback-type partial aggregates into FeedbackStats.
+
+    Args:
+        groups: Rows with feedback_type, count, positive_count, relevance_sum
+        feedback_by_module: Counts per module
+        time_range: Requested range, echoed into the result
+    """
+    total = positives = 0
+    relevance_sum = 0.0
+    feedback_by_type: Dict[str, int] = {}
+    for group in groups:
+        count = group["count"] or 0
+        total += count
+        positives += group["positive_count"] or 0
+        relevance_sum += group["relevance_sum"] or 0.0
+        feedback_type = group["feedback_type"]
+        feedback_by_type[feedback_type] = feedback_by_type.get(feedback_type, 0) + count
+
+    top_modules = sorted(feedback_by_module.items(), key=lambda item: item[1], reverse=True)
+    return FeedbackStats(
+        total_feedback_count=total,
+        positive_feedback_ratio=positives / total if total else 0.0,
+        average_relevance_score=relevance_sum / total if total else 0.0,
+        feedback_by_type=feedback_by_type,
+        feedback_by_module=dict(top_modules[:TOP_MODULES_LIMIT]),
+        time_range_start=time_range[0] if time_range else None,
+        time_range_end=time_range[1] if time_range else None,
+    )
+
+
 # ============================================================================
 # FEEDBACK MANAGER
 # ============================================================================
@@ -108,6 +267,66 @@ class FeedbackManager:
         """
         self._driver = driver
 
+    # ========================================================================
+    # ROLLUPS
+    # ========================================================================
+
+    def _update_rollups(
+        self,
+        session,
+        timestamp: datetime,
+        feedback_type: str,
+        module_ids: Optional[List[str]],
+        is_positive: bool,
+        relevance: float,
+    ) -> None:
+        """
+        Count one feedback entry into its FeedbackRollup buckets.
+
+        Runs in the submitting session; a failure is logged and does not
+        fail the submission (rebuild_rollups restores exact counts).
+        """
+        try:
+            session.run(
+                FEEDBACK_ROLLUP_UPDATE_QUERY,
+                {
+                    "scopes": [ALL_MODULES] + sorted(set(module_ids or [])),
+                    "day": timestamp.date().isoformat(),
+                    "feedback_type": feedback_type,
+                    "positive": 1 if is_positive else 0,
+                    "relevance": relevance,
+                },
+            ).consume()
+        except Exception as e:
+            logger.warning(f"Failed to update feedback rollups: {e}")
+
+    def rebuild_rollups(self, batch_size: int = 10000) -> int:
+        """
+        Recompute every FeedbackRollup from the stored Feedback nodes.
+
+        Used to backfill rollups (migration 006) or repair drift. Submissions
+        made while it runs may be missed; run it when feedback writes are
+        quiet.
+
+        Args:
+            batch_size: Rollup nodes deleted per transaction while clearing
+
+        Returns:
+            Number of rollup nodes created
+        """
+        with self._driver.session() as session:
+            while True:
+                record = session.run(
+                    FEEDBACK_ROLLUP_CLEAR_QUERY, {"batch_size": batch_size}
+                ).single()
+                if not record or not record["deleted"]:
+                    break
+            record = session.run(FEEDBACK_ROLLUP_REBUILD_QUERY).single()
+            rollups = record["rollups"] if record else 0
+
+        logger.info(f"Rebuilt {rollups} feedback rollups")
+        return rollups
+
     # ========================================================================
     # FEEDBACK SUBMISSION
     # ========================================================================
@@ -176,6 +395,15 @@ class FeedbackManager:
                 )
                 result.single()
 
+                self._update_rollups(
+                    session,
+                    feedback.timestamp,
+                    feedback.feedback_type.value,
+                    feedback.module_ids,
+                    feedback.relevance_score >= 0.5,
+                    feedback.relevance_score,
+                )
+
                 # Try to link to the result node if it exists
                 session.run(
                     """
@@ -262,6 +490,15 @@ class FeedbackManager:
                 )
                 result.single()
 
+                self._update_rollups(
+                    session,
+                    feedback.timestamp,
+                    feedback.feedback_type.value,
+                    feedback.module_ids,
+                    feedback.helpful,
+                    1.0 if feedback.helpful else 0.0,
+                )
+
             logger.debug(f"Stored answer feedback: {feedback_id}")
             return feedback_id
 
@@ -333,6 +570,15 @@ class FeedbackManager:
                 )
                 result.single()
 
+                self._update_rollups(
+                    session,
+                    feedback.timestamp,
+                    feedback.feedback_type.value,
+                    None,
+                    is_positive,
+                    0.5,
+                )
+
                 # Try to link to the result node
                 session.run(
                     """
@@ -398,13 +644,20 @@ class FeedbackManager:
         self,
         module_id: Optional[str] = None,
         time_range: Optional[Tuple[datetime, datetime]] = None,
+        use_rollups: bool = True,
     ) -> FeedbackStats:
         """
         Get aggregated feedback statistics.
 
+        Whole-day ranges (both ends at midnight, end exclusive) and the
+        all-time view are answered from FeedbackRollup counters, touching
+        one node per (module, day, type). Other ranges, or use_rollups=False,
+        aggregate the Feedback nodes in a single scan.
+
         Args:
             module_id: Optional module ID to filter stats.
             time_range: Optional (start, end) datetime tuple.
+            use_rollups: Allow answering from rollup counters.
 
         Returns:
             FeedbackStats with aggregated metrics.
@@ -412,101 +665,105 @@ class FeedbackManager:
         logger.info(f"Calculating feedback stats: module_id={module_id}")
 
         try:
-            with self._driver.session() as session:
-                # Build WHERE clause
-                conditions = ["TRUE"]
-                params: Dict[str, Any] = {}
+            if use_rollups and (
+                time_range is None or all(_day_aligned(t) for t in time_range)
+            ):
+                return self._feedback_stats_from_rollups(module_id, time_range)
+            return self._feedback_stats_from_scan(module_id, time_range)
 
-                if module_id:
-                    conditions.append("$module_id IN f.module_ids")
-                    params["module_id"] = module_id
-
-                if time_range:
-                    conditions.append("f.timestamp >= datetime($start)")
-                    conditions.append("f.timestamp <= datetime($end)")
-                    params["start"] = time_range[0].isoformat()
-                    params["end"] = time_range[1].isoformat()
+        except Exception as e:
+            logger.error(f"Failed to calculate feedback stats: {e}")
+            return _empty_stats()
 
-                where_clause = " AND ".join(conditions)
+    def _feedback_stats_from_rollups(
+        self,
+        module_id: Optional[str],
+        time_range: Optional[Tuple[datetime, datetime]],
+    ) -> FeedbackStats:
+        """
+        Stats from FeedbackRollup counters (whole days only).
 
-                # Get total counts and averages
-                stats_result = session.run(  # type: ignore[arg-type]
-                    f"""
-                    MATCH (f:Feedback)
-                    WHERE {where_clause}
-                    RETURN
-                        count(f) as total,
-                        avg(CASE WHEN f.is_positive THEN 1.0 ELSE 0.0 END) as positive_ratio,
-                        avg(COALESCE(f.relevance_score,
-                            CASE WHEN f.helpful THEN 1.0
-                                 WHEN f.helpful = false THEN 0.0
-                                 ELSE 0.5 END)) as avg_relevance
-                    """,
-                    params,
+        With a module filter, feedback_by_module holds only that module;
+        co-tagged modules are not tracked per scope.
+        """
+        with self._driver.session() as session:
+            records = [
+                record.data()
+                for record in session.run(
+                    FEEDBACK_ROLLUP_STATS_QUERY,
+                    {
+                        "module_id": module_id,
+                        "start_day": time_range[0].date().isoformat() if time_range else None,
+                        "end_day": time_range[1].date().isoformat() if time_range else None,
+                    },
                 )
-                stats = stats_result.single()
-
-                if stats is None:
-                    return FeedbackStats(
-                        total_feedback_count=0,
-                        positive_feedback_ratio=0.0,
-                        average_relevance_score=0.0,
-                        feedback_by_type={},
-                        feedback_by_module={},
-                    )
+            ]
+
+        scope = module_id or ALL_MODULES
+        feedback_by_module: Dict[str, int] = {}
+        for record in records:
+            if record["module_id"] != ALL_MODULES:
+                feedback_by_module[record["module_id"]] = (
+                    feedback_by_module.get(record["module_id"], 0) + (record["count"] or 0)
+                )
+        return _stats_from_groups(
+            (record for record in records if record["module_id"] == scope),
+            feedback_by_module,
+            time_range,
+        )
+
+    def _feedback_stats_from_scan(
+        self,
+        module_id: Optional[str],
+        time_range: Optional[Tuple[datetime, datetime]],
+    ) -> FeedbackStats:
+        """
+        Stats from one pass over the matching Feedback nodes.
 
-                total = stats["total"] or 0
-                positive_ratio = stats["positive_ratio"] or 0.0
-                avg_relevance = stats["avg_relevance"] or 0.0
+        Totals, per-type and per-module counts are all derived from partial
+        aggregates grouped by (feedback type, module list), which stay few
+        however many nodes match.
+        """
+        conditions = ["TRUE"]
+        params: Dict[str, Any] = {}
 
-                # Get counts by feedback type
-                type_result = session.run(  # type: ignore[arg-type]
-                    f"""
-                    MATCH (f:Feedback)
-                    WHERE {where_clause}
-                    RETURN f.feedback_type as type, count(f) as count
-                    """,
-                    params,
-                )
-                feedback_by_type = {
-                    record["type"]: record["count"] for record in type_result
-                }
+        if module_id:
+            conditions.append("$module_id IN f.module_ids")
+            params["module_id"] = module_id
+
+        if time_range:
+            conditions.append("f.timestamp >= datetime($start)")
+            conditions.append("f.timestamp <= datetime($end)")
+            params["start"] = time_range[0].isoformat()
+            params["end"] = time_range[1].isoformat()
 
-                # Get counts by module
-                module_result = session.run(  # type: ignore[arg-type]
+        where_clause = " AND ".join(conditions)
+
+        with self._driver.session() as session:
+            groups = [
+                record.data()
+                for record in session.run(  # type: ignore[arg-type]
                     f"""
                     MATCH (f:Feedback)
                     WHERE {where_clause}
-                    UNWIND f.module_ids as module
-                    RETURN module, count(f) as count
-                    ORDER BY count DESC
-                    LIMIT 20
+                    WITH f.feedback_type as feedback_type,
+                         COALESCE(f.module_ids, []) as module_ids,
+                         CASE WHEN f.is_positive THEN 1 ELSE 0 END as positive,
+                         {STATS_RELEVANCE_EXPR} as relevance
+                    RETURN feedback_type, module_ids,
+                           count(*) as count,
+                           sum(positive) as positive_count,
+                           sum(relevance) as relevance_sum
                     """,
                     params,
                 )
-                feedback_by_module = {
-                    record["module"]: record["count"] for record in module_result
-                }
-
-            return FeedbackStats(
-                total_feedback_count=total,
-                positive_feedback_ratio=positive_ratio,
-                average_relevance_score=avg_relevance,
-                feedback_by_type=feedback_by_type,
-                feedback_by_module=feedback_by_module,
-                time_range_start=time_range[0] if time_range else None,
-                time_range_end=time_range[1] if time_range else None,
-            )
+            ]
 
-        except Exception as e:
-            logger.error(f"Failed to calculate feedback stats: {e}")
-            return FeedbackStats(
-                total_feedback_count=0,
-                positive_feedback_ratio=0.0,
-                average_relevance_score=0.0,
-                feedback_by_type={},
-                feedback_by_module={},
-            )
+        feedback_by_module: Dict[str, int] = {}
+        for group in groups:
+            for module in group["module_ids"]:
+                feedback_by_module[module] = feedback_by_module.get(module, 0) + group["count"]
+        return _stats_from_groups(groups, feedback_by_module, time_range)
 
     async def get_low_quality_results(
         self,
@@ -576,36 +833,92 @@ class FeedbackManager:
     # UTILITY METHODS
     # ========================================================================
 
-    async def delete_old_feedback(self, days: int = 90) -> int:
+    async def delete_old_feedback(
+        self,
+        days: int = FEEDBACK_RETENTION_DAYS,
+        batch_size: int = FEEDBACK_RETENTION_BATCH_SIZE,
+        dry_run: bool = False,
+        duty_cycle: float = FEEDBACK_RETENTION_DUTY_CYCLE,
+        max_batches: Optional[int] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
         """
-        Delete feedback older than specified days.
+        Delete feedback older than specified days, in throttled batches.
+
+        Each batch is its own small transaction against a cutoff fixed at the
+        start, followed by a pause sized to keep deletion to duty_cycle of
+        wall time, so ingestion writes interleave freely. FeedbackRollup
+        counters are kept: daily aggregates outlive the raw feedback.
 
         Args:
             days: Number of days to keep feedback (default 90).
+            batch_size: Feedback nodes deleted per transaction.
+            dry_run: Only count the expired feedback.
+            duty_cycle: Target fraction of time spent deleting (0-1].
+            max_batches: Stop after this many batches (None: until done).
+            progress_callback: Called with the running report after each batch.
 
         Returns:
-            Number of deleted feedback entries.
+            Report with expired (dry run) or deleted counts, batches,
+            elapsed_s and rows_per_second.
         """
-        logger.info(f"Deleting feedback older than {days} days")
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+        report: Dict[str, Any] = {
+            "cutoff": cutoff,
+            "dry_run": dry_run,
+            "deleted": 0,
+            "batches": 0,
+            "elapsed_s": 0.0,
+            "rows_per_second": 0.0,
+        }
+        logger.info(f"Deleting feedback older than {days} days (cutoff {cutoff})")
 
         try:
-            with self._driver.session() as session:
-                result = session.run(
-                    """
-                    MATCH (f:Feedback)
-                    WHERE f.timestamp < datetime() - duration({days: $days})
-                    WITH f LIMIT 1000
-                    DETACH DELETE f
-                    RETURN count(*) as deleted
-                    """,
-                    {"days": days},
-                )
-                record = result.single()
+            if dry_run:
+                with self._driver.session() as session:
+                    record = session.run(
+                        FEEDBACK_EXPIRED_COUNT_QUERY, {"cutoff": cutoff}
+                    ).single()
+                report["expired"] = record["expired"] if record else 0
+                logger.info(f"Dry run: {report['expired']} feedback entries expired")
+                return report
+
+            start = clock.monotonic()
+            while max_batches is None or report["batches"] < max_batches:
+                batch_start = clock.monotonic()
+                with self._driver.session() as session:
+                    record = session.run(
+                        FEEDBACK_EXPIRED_DELETE_QUERY,
+                        {"cutoff": cutoff, "batch_size": batch_size},
+                    ).single()
                 deleted = record["deleted"] if record else 0
+                batch_s = clock.monotonic() - batch_start
+
+                report["deleted"] += deleted
+                report["batches"] += 1
+                report["elapsed_s"] = round(clock.monotonic() - start, 3)
+                report["rows_per_second"] = round(
+                    report["deleted"] / report["elapsed_s"], 1
+                ) if report["elapsed_s"] else 0.0
+                logger.debug(
+                    f"Feedback retention batch {report['batches']}: {deleted} deleted "
+                    f"({report['deleted']} total, {report['rows_per_second']}/s)"
+                )
+                if progress_callback:
+                    progress_callback(dict(report))
+                if deleted < batch_size:
+                    break
+
+                pause = batch_s * (1.0 / max(duty_cycle, 0.01) - 1.0)
+                await asyncio.sleep(max(pause, FEEDBACK_RETENTION_MIN_PAUSE))
 
-            logger.info(f"Deleted {deleted} old feedback entries")
-            return deleted
+            logger.info(
+                f"Deleted {report['deleted']} old feedback entries in "
+                f"{report['batches']} batches ({report['rows_per_second']}/s)"
+            )
+            return report
 
         except Exception as e:
             logger.error(f"Failed to delete old feedback: {e}")
-            return 0
+            report["error"] = str(e)
+            return report
@@ -0,0 +1,315 @@
+"""
+============================================================================
+FILE: feedback_quality.py
+LOCATION: api/feedback_quality.py
+============================================================================
+
+PURPOSE:
+    Precomputed per-result quality scores from user feedback, and the
+    reranking stage that blends them into hybrid search results.
+
+ROLE IN PROJECT:
+    FeedbackManager (api/feedback_manager.py) stores every rating, click and
+    dwell signal as a Feedback node, but aggregates only on demand. A
+    periodic Celery task (api/tasks) rolls all result feedback up into one
+    compact {result_id: quality} table in Redis. Search workers keep an
+    in-process copy that is re-read at most once a minute, in the
+    background, so reranking costs a dict lookup per candidate and no
+    database or Redis reads per query.
+
+    Quality is a Bayesian average of feedback values (explicit relevance
+    scores, implicit clicks/dwell weighted lower) shrunk towards a neutral
+    0.5, so a single rating cannot swing a result. Results without feedback
+    keep their fused score unchanged.
+
+KEY COMPONENTS:
+    - quality_score: Smoothed quality from weighted feedback totals
+    - rollup_feedback_quality: Aggregate feedback and publish the table
+    - FeedbackQualityTable: Process-local, periodically refreshed copy
+    - rerank_with_quality: Blend quality into fused search candidates
+    - get_feedback_quality_table: Shared table instance
+
+DEPENDENCIES:
+    - External: neo4j (sync driver, rollup only)
+    - Internal: api/cache.py
+
+USAGE:
+    from api.feedback_quality import rollup_feedback_quality
+
+    summary = rollup_feedback_quality(neo4j_driver)   # periodic task
+
+    table = get_feedback_quality_table()
+    reranked = rerank_with_quality(fused, table.scores())
+============================================================================
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+CACHE_PREFIX_FEEDBACK_QUALITY = "feedback:quality"
+FEEDBACK_QUALITY_TABLE_KEY = f"{CACHE_PREFIX_FEEDBACK_QUALITY}:table"
+
+# Rollup runs every FEEDBACK_ROLLUP_INTERVAL seconds; the table outlives a
+# few missed runs before search falls back to unranked results
+FEEDBACK_ROLLUP_INTERVAL = int(os.getenv("FEEDBACK_ROLLUP_INTERVAL", "900"))
+FEEDBACK_QUALITY_TTL = FEEDBACK_ROLLUP_INTERVAL * 8
+
+# How long a search worker trusts its local copy before re-reading Redis
+FEEDBACK_QUALITY_MAX_AGE_SECONDS = 60
+
+# Strength of the blend: quality 1.0 scales a fused score by (1 + weight),
+# quality 0.0 by (1 - weight)
+FEEDBACK_RERANK_WEIGHT = float(os.getenv("FEEDBACK_RERANK_WEIGHT", "0.2"))
+
+# Bayesian prior: results start at NEUTRAL_QUALITY backed by PRIOR_WEIGHT
+# pseudo-ratings
+NEUTRAL_QUALITY = 0.5
+PRIOR_WEIGHT = 5.0
+
+# Implicit signals (clicks, dwell time) count less than explicit ratings
+IMPLICIT_FEEDBACK_WEIGHT = 0.3
+
+# Scores this close to neutral are left out of the table
+MIN_QUALITY_DEVIATION = 0.01
+
+
+# ============================================================================
+# CYPHER QUERIES
+# ============================================================================
+
+# One pass over result feedback; answer feedback has no result_id
+FEEDBACK_ROLLUP_QUERY = """
+MATCH (f:Feedback)
+WHERE f.result_id IS NOT NULL
+WITH f.result_id as result_id,
+     CASE WHEN f.relevance_score IS NOT NULL THEN 1.0
+          ELSE $implicit_weight END as weight,
+     COALESCE(f.relevance_score,
+              CASE WHEN f.is_positive THEN 1.0 ELSE 0.0 END) as value
+RETURN result_id,
+       sum(weight * value) as weighted_sum,
+       sum(weight) as total_weight,
+       count(*) as feedback_count
+"""
+
+
+# ============================================================================
+# CACHE CLIENT
+# ============================================================================
+
+
+def _get_cache():
+    """Get the shared Redis cache client, or None if unavailable."""
+    try:
+        from api.cache import redis_client
+    except ImportError:
+        try:
+            from cache import redis_client  # type: ignore[import-not-found]
+        except ImportError:
+            logger.debug("Cache not available")
+            return None
+    return redis_client
+
+
+# ============================================================================
+# ROLLUP
+# ============================================================================
+
+
+def quality_score(weighted_sum: float, total_weight: float) -> float:
+    """
+    Smoothed quality of a result.
+
+    Args:
+        weighted_sum: Sum of weight * value over the result's feedback
+        total_weight: Sum of weights
+
+    Returns:
+        Quality in [0, 1]; NEUTRAL_QUALITY with no feedback
+    """
+    return (weighted_sum + NEUTRAL_QUALITY * PRIOR_WEIGHT) / (total_weight + PRIOR_WEIGHT)
+
+
+def build_quality_scores(rows: Sequence[Dict[str, Any]]) -> Dict[str, float]:
+    """
+    Quality table from FEEDBACK_ROLLUP_QUERY rows.
+
+    Args:
+        rows: Records with result_id, weighted_sum and total_weight
+
+    Returns:
+        {result_id: quality} for results that differ from neutral
+    """
+    scores: Dict[str, float] = {}
+    for row in rows:
+        quality = quality_score(row["weighted_sum"] or 0.0, row["total_weight"] or 0.0)
+        if abs(quality - NEUTRAL_QUALITY) >= MIN_QUALITY_DEVIATION:
+            scores[row["result_id"]] = round(quality, 4)
+    return scores
+
+
+def rollup_feedback_quality(driver) -> Dict[str, Any]:
+    """
+    Recompute the quality table from all result feedback and publish it.
+
+    Args:
+        driver: Sync Neo4j driver
+
+    Returns:
+        Run summary (results scored, feedback rows, elapsed time)
+    """
+    start = time.perf_counter()
+    with driver.session() as session:
+        rows = [
+            record.data()
+            for record in session.run(
+                FEEDBACK_ROLLUP_QUERY, {"implicit_weight": IMPLICIT_FEEDBACK_WEIGHT}
+            )
+        ]
+
+    scores = build_quality_scores(rows)
+    generated_at = datetime.now(timezone.utc).isoformat()
+    cache = _get_cache()
+    published = False
+    if cache is not None:
+        try:
+            published = bool(cache.set(
+                FEEDBACK_QUALITY_TABLE_KEY,
+                {"generated_at": generated_at, "scores": scores},
+                ttl=FEEDBACK_QUALITY_TTL,
+            ))
+        except Exception as e:
+            logger.warning(f"Failed to publish feedback quality table: {e}")
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(
+        f"Feedback rollup: {len(scores)} scored of {len(rows)} rated results "
+        f"in {elapsed_ms:.1f}ms"
+    )
+    return {
+        "results_rated": len(rows),
+        "results_scored": len(scores),
+        "feedback_count": sum(row["feedback_count"] or 0 for row in rows),
+        "published": published,
+        "generated_at": generated_at,
+        "elapsed_ms": round(elapsed_ms, 2),
+    }
+
+
+# ============================================================================
+# SEARCH-SIDE TABLE
+# ============================================================================
+
+
+class FeedbackQualityTable:
+    """
+    Process-local copy of the published quality table.
+
+    scores() re-reads Redis at most every max_age seconds; in between it is
+    a plain dict, so reranking never waits on the network. On an event loop
+    a stale table keeps serving while refresh() reloads it in a worker
+    thread; outside one (Celery, scripts) the reload runs inline.
+    """
+
+    def __init__(self, max_age: float = FEEDBACK_QUALITY_MAX_AGE_SECONDS):
+        self.max_age = max_age
+        self._scores: Dict[str, float] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refreshing: Optional[asyncio.Task] = None
+
+    def scores(self) -> Dict[str, float]:
+        """Current {result_id: quality} table (empty if none published)."""
+        if self._is_fresh():
+            return self._scores
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            with self._lock:
+                if not self._is_fresh():
+                    self._scores, self._loaded_at = self._load(), time.monotonic()
+            return self._scores
+        task = self._refreshing
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._refreshing = loop.create_task(self.refresh())
+        return self._scores
+
+    async def refresh(self) -> Dict[str, float]:
+        """Reload the table from Redis without blocking the event loop."""
+        scores = await asyncio.to_thread(self._load)
+        self._scores, self._loaded_at = scores, time.monotonic()
+        return scores
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.max_age
+        )
+
+    def _load(self) -> Dict[str, float]:
+        cache = _get_cache()
+        if cache is None:
+            return self._scores
+        try:
+            data = cache.get(FEEDBACK_QUALITY_TABLE_KEY)
+        except Exception as e:
+            logger.debug(f"Feedback quality table read failed: {e}")
+            return self._scores
+        if not isinstance(data, dict):
+            return {}
+        return data.get("scores") or {}
+
+
+def rerank_with_quality(
+    fused: List[Tuple[str, float, Optional[float], Optional[float]]],
+    scores: Dict[str, float],
+    weight: float = FEEDBACK_RERANK_WEIGHT,
+) -> List[Tuple[str, float, Optional[float], Optional[float]]]:
+    """
+    Blend feedback quality into fused search candidates.
+
+    Each score is scaled by 1 + weight * (2 * quality - 1); results without
+    feedback are unchanged. The sort is stable, so ties keep fusion order.
+
+    Args:
+        fused: (id, score, vector_score, fulltext_score) sorted by score
+        scores: Quality table
+        weight: Blend strength in [0, 1]
+
+    Returns:
+        Candidates re-sorted by adjusted score
+    """
+    if not scores or weight <= 0:
+        return fused
+    adjusted = [
+        (item[0], item[1] * (1.0 + weight * (2.0 * scores[item[0]] - 1.0)), *item[2:])
+        if item[0] in scores else item
+        for item in fused
+    ]
+    adjusted.sort(key=lambda item: item[1], reverse=True)
+    return adjusted
+
+
+_quality_table: Optional[FeedbackQualityTable] = None
+
+
+def get_feedback_quality_table() -> FeedbackQualityTable:
+    """Get the shared process-local quality table."""
+    global _quality_table
+    if _quality_table is None:
+        _quality_table = FeedbackQualityTable()
+    return _quality_table
@@ -0,0 +1,252 @@
+"""
+============================================================================
+FILE: graph_cache.py
+LOCATION: api/graph_cache.py
+============================================================================
+
+PURPOSE:
+    Per-module graph version counters and a version-stamped response cache
+    for module graph reads.
+
+ROLE IN PROJECT:
+    Module graphs only change when a document is processed or deleted. The
+    KG store/delete paths bump a per-module version counter, and graph read
+    endpoints cache their responses under (module, version, options). A bump
+    makes every older entry unreachable in O(1) without scanning keys; stale
+    entries simply age out via TTL. The same key doubles as the HTTP ETag.
+
+KEY COMPONENTS:
+    - get_module_version / get_module_versions: Current version stamps
+    - bump_module_version / bump_module_versions: Invalidate a module's reads
+    - response_cache_key: (scope, module, version, options) cache key
+    - get_cached_response / set_cached_response: Redis-backed response cache
+    - etag_for / etag_matches: ETag generation and If-None-Match checking
+
+DEPENDENCIES:
+    - External: None
+    - Internal: api/cache.py
+
+USAGE:
+    from api.graph_cache import bump_module_version, get_module_version
+
+    bump_module_version("module_123")          # after storing a document
+    version = get_module_version("module_123")  # in a read endpoint
+============================================================================
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+CACHE_PREFIX_GRAPH_VERSION = "graph:version"
+CACHE_PREFIX_GRAPH_RESPONSE = "graph:resp"
+GRAPH_RESPONSE_TTL_SECONDS = 24 * 60 * 60
+
+
+# ============================================================================
+# CACHE CLIENT
+# ============================================================================
+
+
+def _get_cache():
+    """Get the shared Redis cache client, or None if unavailable."""
+    try:
+        from api.cache import redis_client
+    except ImportError:
+        try:
+            from cache import redis_client  # type: ignore[import-not-found]
+        except ImportError:
+            logger.debug("Cache not available")
+            return None
+    return redis_client
+
+
+def _version_key(module_id: str) -> str:
+    return f"{CACHE_PREFIX_GRAPH_VERSION}:{module_id}"
+
+
+def _seed_version(cache, module_id: str) -> None:
+    """
+    Initialise a missing counter from the clock.
+
+    Seeding with milliseconds rather than 0 means a counter that was evicted
+    or lost never rolls back onto a version whose responses are still cached.
+    """
+    cache.set_if_absent(_version_key(module_id), int(time.time() * 1000))
+
+
+# ============================================================================
+# VERSION COUNTERS
+# ============================================================================
+
+
+def get_module_version(module_id: str) -> Optional[int]:
+    """
+    Get the current graph version of a module.
+
+    Args:
+        module_id: Module identifier
+
+    Returns:
+        Version stamp, or None if the cache is unavailable (callers then skip
+        caching entirely)
+    """
+    cache = _get_cache()
+    if cache is None:
+        return None
+    try:
+        version = cache.get(_version_key(module_id))
+        if version is None:
+            _seed_version(cache, module_id)
+            version = cache.get(_version_key(module_id))
+        return int(version) if version is not None else None
+    except Exception as e:
+        logger.debug(f"Graph version lookup failed for {module_id}: {e}")
+        return None
+
+
+def get_module_versions(module_ids: Iterable[str]) -> Optional[str]:
+    """
+    Get a combined version stamp for a set of modules.
+
+    Args:
+        module_ids: Module identifiers
+
+    Returns:
+        Order-independent stamp such as "m1=12,m2=7", or None if any version
+        is unavailable
+    """
+    parts: List[str] = []
+    for module_id in sorted(set(module_ids)):
+        version = get_module_version(module_id)
+        if version is None:
+            return None
+        parts.append(f"{module_id}={version}")
+    return ",".join(parts)
+
+
+def bump_module_version(module_id: Optional[str]) -> Optional[int]:
+    """
+    Invalidate every cached graph read for a module.
+
+    Args:
+        module_id: Module identifier (ignored if empty)
+
+    Returns:
+        New version, or None if the cache is unavailable
+    """
+    if not module_id:
+        return None
+    cache = _get_cache()
+    if cache is None:
+        return None
+    try:
+        _seed_version(cache, module_id)
+        version = cache.incr(_version_key(module_id))
+        logger.debug(f"Graph version of {module_id} bumped to {version}")
+        return version
+    except Exception as e:
+        logger.warning(f"Graph version bump failed for {module_id}: {e}")
+        return None
+
+
+def bump_module_versions(module_ids: Iterable[Optional[str]]) -> None:
+    """Bump the graph version of each distinct module in module_ids."""
+    for module_id in {m for m in module_ids if m}:
+        bump_module_version(module_id)
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+
+def response_cache_key(
+    scope: str, module_id: str, version: Any, options: Dict[str, Any]
+) -> str:
+    """
+    Build the cache key for a versioned graph response.
+
+    Args:
+        scope: Endpoint or view name (e.g. "preview", "stats")
+        module_id: Module identifier
+        version: Module version stamp
+        options: Request options that affect the response
+
+    Returns:
+        Cache key
+    """
+    options_json = json.dumps(options, sort_keys=True, default=str)
+    options_hash = hashlib.sha256(options_json.encode("utf-8")).hexdigest()[:16]
+    return f"{CACHE_PREFIX_GRAPH_RESPONSE}:{scope}:{module_id}:{version}:{options_hash}"
+
+
+def get_cached_response(key: str) -> Optional[Dict[str, Any]]:
+    """Retrieve a cached graph response if available."""
+    cache = _get_cache()
+    if cache is None:
+        return None
+    try:
+        data = cache.get(key)
+        return data if isinstance(data, dict) else None
+    except Exception as e:
+        logger.debug(f"Graph response cache get failed: {e}")
+        return None
+
+
+def set_cached_response(
+    key: str, data: Dict[str, Any], ttl: int = GRAPH_RESPONSE_TTL_SECONDS
+) -> bool:
+    """Store a graph response in the cache."""
+    cache = _get_cache()
+    if cache is None:
+        return False
+    try:
+        return cache.set(key, data, ttl=ttl)
+    except Exception as e:
+        logger.debug(f"Graph response cache set failed: {e}")
+        return False
+
+
+# ============================================================================
+# ETAGS
+# ============================================================================
+
+
+def etag_for(key: str) -> str:
+    """Weak ETag for a versioned response key."""
+    return f'W/"{hashlib.sha256(key.encode("utf-8")).hexdigest()[:20]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current ETag
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return _opaque(etag) in {_opaque(tag) for tag in if_none_match.split(",")}
@@ -0,0 +1,518 @@
+"""
+============================================================================
+FILE: graph_lod.py
+LOCATION: api/graph_lod.py
+============================================================================
+
+PURPOSE:
+    Level-of-detail views of a module knowledge graph with bounded payloads:
+    a cluster overview, on-demand cluster expansion, and cursor-paginated
+    flat entity listings.
+
+ROLE IN PROJECT:
+    Large modules cannot be shipped to the browser in one response, and a
+    plain LIMIT returns an arbitrary, unstable subset. The overview collapses
+    entities into cluster supernodes (by precomputed community, or by entity
+    type) joined by aggregate edges; clients expand one cluster at a time, and
+    flat listings page through entities with stable keyset cursors ordered by
+    id or degree. Every response is bounded by LOD_MAX_CLUSTERS and the page
+    size regardless of module size.
+
+KEY COMPONENTS:
+    - ClusterGrouping / EntityOrder: Grouping and ordering options
+    - encode_cursor / decode_cursor: Opaque keyset cursors
+    - ModuleGraphLOD: Overview, cluster expansion and entity paging queries
+
+DEPENDENCIES:
+    - External: None
+    - Internal: api/graph_manager.py (run_query), api/schemas/graph_preview.py
+
+USAGE:
+    lod = ModuleGraphLOD(create_graph_manager())
+    overview = await lod.get_overview("module_123")
+    page = await lod.expand_cluster("module_123", overview.nodes[0].id)
+    listing = await lod.list_entities("module_123", order_by=EntityOrder.DEGREE)
+============================================================================
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import logging
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from api.schemas.graph_preview import (
+    ClusterExpansionResponse,
+    EntityPageResponse,
+    GraphEdge,
+    GraphNode,
+    GraphOverviewResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Cluster supernodes returned by the overview (largest first)
+LOD_MAX_CLUSTERS = 50
+
+# Default and maximum entities per expansion / listing page
+LOD_PAGE_SIZE = 100
+LOD_MAX_PAGE_SIZE = 500
+
+# Edge type used for aggregated links to a collapsed cluster
+CLUSTER_LINK_TYPE = "CLUSTER_LINK"
+
+CLUSTER_NODE_TYPE = "Cluster"
+
+_TYPE_EXPR = "[l IN labels({var}) WHERE l <> 'Entity'][0]"
+
+# Concept-typed entities only; Definition/Citation nodes are not graph nodes here
+_CONCEPT_EXPR = "({var}:Topic OR {var}:Concept OR {var}:Methodology OR {var}:Finding)"
+_CONCEPT_DEGREE = "COUNT { (e)--(n:Entity) WHERE " + _CONCEPT_EXPR.format(var="n") + " }"
+
+
+class ClusterGrouping(str, Enum):
+    """How entities are grouped into overview clusters."""
+
+    COMMUNITY = "community"
+    TYPE = "type"
+
+
+class EntityOrder(str, Enum):
+    """Stable orderings for paginated entity listings."""
+
+    ID = "id"
+    DEGREE = "degree"
+
+
+# ============================================================================
+# CURSORS
+# ============================================================================
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """Encode keyset values as an opaque URL-safe cursor."""
+    raw = json.dumps(values, sort_keys=True, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor, or None for the first page
+
+    Returns:
+        Keyset values, or None for the first page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(values, dict) or not isinstance(values.get("id"), str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return values
+
+
+# ============================================================================
+# CYPHER BUILDERS
+# ============================================================================
+
+
+def cluster_key_expr(var: str, grouping: ClusterGrouping) -> str:
+    """
+    Cypher expression giving the cluster id of an entity.
+
+    Community grouping falls back to the entity type for entities that have
+    not been assigned a community yet.
+    """
+    type_key = "'type:' + " + _TYPE_EXPR.format(var=var)
+    if grouping == ClusterGrouping.TYPE:
+        return type_key
+    return (
+        f"CASE WHEN {var}.community_id IS NULL THEN {type_key} "
+        f"ELSE 'community:' + toString({var}.community_id) END"
+    )
+
+
+def _overview_query(grouping: ClusterGrouping) -> str:
+    cluster = cluster_key_expr("e", grouping)
+    entity_type = _TYPE_EXPR.format(var="e")
+    return f"""
+    MATCH (e:Entity {{module_id: $module_id}})
+    WHERE {_CONCEPT_EXPR.format(var="e")}
+    WITH e, {cluster} as cluster, {entity_type} as type
+    ORDER BY coalesce(e.centrality, 0.0) DESC, e.id
+    WITH cluster, type, count(e) as members, collect(e.name)[..3] as names
+    ORDER BY members DESC
+    WITH cluster, sum(members) as size,
+         collect({{type: type, count: members}}) as type_counts,
+         collect(names)[0] as top_names
+    RETURN cluster, size, type_counts, top_names
+    ORDER BY size DESC, cluster
+    LIMIT $max_clusters
+    """
+
+
+def _cluster_edges_query(grouping: ClusterGrouping) -> str:
+    return f"""
+    MATCH (a:Entity {{module_id: $module_id}})-[r]->(b:Entity {{module_id: $module_id}})
+    WHERE {_CONCEPT_EXPR.format(var="a")} AND {_CONCEPT_EXPR.format(var="b")}
+    WITH {cluster_key_expr("a", grouping)} as source,
+         {cluster_key_expr("b", grouping)} as target, r
+    WHERE source <> target AND source IN $clusters AND target IN $clusters
+    RETURN source, target, count(r) as count,
+           sum(coalesce(r.confidence, 1.0)) as weight
+    """
+
+
+def _page_query(order_by: EntityOrder, cluster_condition: str, after: bool) -> str:
+    """Keyset page of entities ordered by id, or by degree then id."""
+    conditions = [_CONCEPT_EXPR.format(var="e")]
+    if cluster_condition:
+        conditions.append(cluster_condition)
+
+    if order_by == EntityOrder.DEGREE:
+        keyset = (
+            "WHERE degree < $after_degree "
+            "OR (degree = $after_degree AND e.id > $after_id)"
+            if after
+            else ""
+        )
+        return f"""
+        MATCH (e:Entity {{module_id: $module_id}})
+        WHERE {" AND ".join(conditions)}
+        WITH e, {_CONCEPT_DEGREE} as degree
+        {keyset}
+        WITH e, degree
+        ORDER BY degree DESC, e.id
+        LIMIT $limit
+        RETURN e.id as id, e.name as name, {_TYPE_EXPR.format(var="e")} as type,
+               e.definition as definition, e.community_id as community_id,
+               degree
+        """
+
+    if after:
+        conditions.append("e.id > $after_id")
+    return f"""
+    MATCH (e:Entity {{module_id: $module_id}})
+    WHERE {" AND ".join(conditions)}
+    WITH e
+    ORDER BY e.id
+    LIMIT $limit
+    RETURN e.id as id, e.name as name, {_TYPE_EXPR.format(var="e")} as type,
+           e.definition as definition, e.community_id as community_id,
+           {_CONCEPT_DEGREE} as degree
+    """
+
+
+def _expansion_edges_query(grouping: ClusterGrouping) -> str:
+    """
+    Edges touching one page of a cluster.
+
+    Edges between page members are returned as-is; edges to entities in
+    other clusters are collapsed onto that cluster's supernode. Edges to
+    unloaded members of the same cluster are left for the pages that load them.
+    """
+    return f"""
+    MATCH (a:Entity)-[r]-(b:Entity {{module_id: $module_id}})
+    WHERE a.id IN $ids
+      AND {_CONCEPT_EXPR.format(var="a")}
+      AND {_CONCEPT_EXPR.format(var="b")}
+    WITH a, r, b, {cluster_key_expr("b", grouping)} as b_cluster
+    WHERE b.id IN $ids OR b_cluster <> $cluster
+    WITH DISTINCT r, a, b,
+         CASE WHEN b.id IN $ids THEN b.id ELSE b_cluster END as other,
+         CASE WHEN b.id IN $ids THEN type(r) ELSE '{CLUSTER_LINK_TYPE}' END as rel_type
+    WITH r, rel_type,
+         CASE WHEN startNode(r) = a THEN a.id ELSE other END as source,
+         CASE WHEN startNode(r) = a THEN other ELSE a.id END as target
+    WITH DISTINCT r, rel_type, source, target
+    RETURN source, target, rel_type, count(r) as count,
+           sum(coalesce(r.confidence, 1.0)) as weight
+    """
+
+
+def _clamp_limit(limit: int) -> int:
+    return max(1, min(int(limit), LOD_MAX_PAGE_SIZE))
+
+
+def _cluster_label(cluster_id: str, top_names: List[str]) -> str:
+    kind, _, value = cluster_id.partition(":")
+    if kind == "type":
+        return value
+    return ", ".join(top_names) if top_names else cluster_id
+
+
+# ============================================================================
+# LEVEL-OF-DETAIL SERVICE
+# ============================================================================
+
+
+class ModuleGraphLOD:
+    """
+    Bounded, level-of-detail reads of a module's entity graph.
+
+    Attributes:
+        graph_manager: GraphManager (sync or async) providing run_query
+    """
+
+    def __init__(self, graph_manager):
+        """
+        Initialize with a graph manager.
+
+        Args:
+            graph_manager: GraphManager or AsyncGraphManager instance
+        """
+        self.graph_manager = graph_manager
+
+    async def get_overview(
+        self,
+        module_id: str,
+        grouping: ClusterGrouping = ClusterGrouping.COMMUNITY,
+        max_clusters: int = LOD_MAX_CLUSTERS,
+    ) -> GraphOverviewResponse:
+        """
+        Top-level view: one supernode per cluster with aggregate edges.
+
+        Args:
+            module_id: Module identifier
+            grouping: Group by precomputed community or by entity type
+            max_clusters: Maximum supernodes returned (largest first)
+
+        Returns:
+            GraphOverviewResponse with cluster nodes and weighted edges
+        """
+        records = await self.graph_manager.run_query(
+            _overview_query(grouping),
+            {"module_id": module_id, "max_clusters": max_clusters + 1},
+        )
+        truncated = len(records) > max_clusters
+        records = records[:max_clusters]
+
+        nodes = [
+            GraphNode(
+                id=record["cluster"],
+                label=_cluster_label(record["cluster"], record.get("top_names") or []),
+                name=record["cluster"],
+                type=CLUSTER_NODE_TYPE,
+                properties={
+                    "size": record["size"],
+                    "type_counts": {
+                        tc["type"]: tc["count"] for tc in record.get("type_counts") or []
+                    },
+                    "top_members": record.get("top_names") or [],
+                },
+            )
+            for record in records
+        ]
+
+        edges: List[GraphEdge] = []
+        if len(nodes) > 1:
+            edge_records = await self.graph_manager.run_query(
+                _cluster_edges_query(grouping),
+                {"module_id": module_id, "clusters": [n.id for n in nodes]},
+            )
+            edges = [
+                GraphEdge(
+                    id=f"{record['source']}_{record['target']}",
+                    source=record["source"],
+                    target=record["target"],
+                    type=CLUSTER_LINK_TYPE,
+                    properties={"count": record["count"], "weight": record["weight"]},
+                )
+                for record in edge_records
+            ]
+
+        return GraphOverviewResponse(
+            nodes=nodes,
+            edges=edges,
+            node_count=len(nodes),
+            edge_count=len(edges),
+            module_id=module_id,
+            grouping=grouping.value,
+            entity_count=sum(r["size"] for r in records),
+            truncated=truncated,
+        )
+
+    async def expand_cluster(
+        self,
+        module_id: str,
+        cluster_id: str,
+        grouping: ClusterGrouping = ClusterGrouping.COMMUNITY,
+        order_by: EntityOrder = EntityOrder.DEGREE,
+        limit: int = LOD_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> ClusterExpansionResponse:
+        """
+        Expand one cluster into a page of its member entities.
+
+        Args:
+            module_id: Module identifier
+            cluster_id: Supernode id from get_overview
+            grouping: Grouping used by the overview
+            order_by: Member ordering (degree shows hubs first)
+            limit: Members per page
+            cursor: Cursor from the previous page
+
+        Returns:
+            ClusterExpansionResponse with member nodes, their edges (links to
+            other clusters collapsed onto supernodes) and next_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        cluster_condition = f"{cluster_key_expr('e', grouping)} = $cluster"
+        items, next_cursor = await self._page(
+            module_id, order_by, limit, cursor, cluster_condition, {"cluster": cluster_id}
+        )
+        nodes = [self._entity_node(item) for item in items]
+
+        edges: List[GraphEdge] = []
+        if items:
+            edge_records = await self.graph_manager.run_query(
+                _expansion_edges_query(grouping),
+                {
+                    "module_id": module_id,
+                    "ids": [item["id"] for item in items],
+                    "cluster": cluster_id,
+                },
+            )
+            page_ids = {item["id"] for item in items}
+            linked_clusters = set()
+            for index, record in enumerate(edge_records):
+                if record["rel_type"] == CLUSTER_LINK_TYPE:
+                    linked_clusters.update(
+                        end
+                        for end in (record["source"], record["target"])
+                        if end not in page_ids
+                    )
+                edges.append(
+                    GraphEdge(
+                        id=f"{record['source']}_{record['target']}_{index}",
+                        source=record["source"],
+                        target=record["target"],
+                        type=record["rel_type"],
+                        properties={
+                            "count": record["count"],
+                            "weight": record["weight"],
+                        },
+                    )
+                )
+            nodes.extend(
+                GraphNode(
+                    id=cluster,
+                    label=_cluster_label(cluster, []),
+                    name=cluster,
+                    type=CLUSTER_NODE_TYPE,
+                    properties={"collapsed": True},
+                )
+                for cluster in sorted(linked_clusters)
+            )
+
+        return ClusterExpansionResponse(
+            nodes=nodes,
+            edges=edges,
+            node_count=len(nodes),
+            edge_count=len(edges),
+            module_id=module_id,
+            cluster_id=cluster_id,
+            next_cursor=next_cursor,
+        )
+
+    async def list_entities(
+        self,
+        module_id: str,
+        order_by: EntityOrder = EntityOrder.ID,
+        limit: int = LOD_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> EntityPageResponse:
+        """
+        Flat, cursor-paginated listing of a module's entities.
+
+        Args:
+            module_id: Module identifier
+            order_by: Stable ordering (id, or degree then id)
+            limit: Entities per page
+            cursor: Cursor from the previous page
+
+        Returns:
+            EntityPageResponse with one page of entities and next_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        items, next_cursor = await self._page(module_id, order_by, limit, cursor, "", {})
+        return EntityPageResponse(
+            items=[self._entity_node(item) for item in items],
+            count=len(items),
+            module_id=module_id,
+            order_by=order_by.value,
+            next_cursor=next_cursor,
+        )
+
+    async def _page(
+        self,
+        module_id: str,
+        order_by: EntityOrder,
+        limit: int,
+        cursor: Optional[str],
+        cluster_condition: str,
+        extra_params: Dict[str, Any],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch one keyset page; returns (rows, next cursor or None)."""
+        after = decode_cursor(cursor)
+        if after is not None and after.get("order") != order_by.value:
+            raise ValueError("Cursor was issued for a different ordering")
+
+        limit = _clamp_limit(limit)
+        params: Dict[str, Any] = {
+            "module_id": module_id,
+            "limit": limit + 1,
+            **extra_params,
+        }
+        if after is not None:
+            params["after_id"] = after["id"]
+            params["after_degree"] = after.get("degree", 0)
+
+        rows = await self.graph_manager.run_query(
+            _page_query(order_by, cluster_condition, after is not None), params
+        )
+        if len(rows) <= limit:
+            return rows, None
+
+        rows = rows[:limit]
+        last = rows[-1]
+        values: Dict[str, Any] = {"order": order_by.value, "id": last["id"]}
+        if order_by == EntityOrder.DEGREE:
+            values["degree"] = last["degree"]
+        return rows, encode_cursor(values)
+
+    @staticmethod
+    def _entity_node(item: Dict[str, Any]) -> GraphNode:
+        return GraphNode(
+            id=item["id"],
+            label=item.get("name") or item["id"],
+            name=item.get("name") or "",
+            type=item.get("type") or "Entity",
+            properties={
+                "definition": item.get("definition"),
+                "community_id": item.get("community_id"),
+                "degree": item.get("degree"),
+            },
+        )
+
@@ -13,7 +13,8 @@ ROLE IN PROJECT:
     extraction, neighbor retrieval, and document deletion with orphan cleanup.
 
 KEY COMPONENTS:
-    - GraphManager: Main class for all Neo4j graph operations
+    - GraphManager: Main class for all Neo4j graph operations (sync driver)
+    - AsyncGraphManager: Same API on the neo4j AsyncDriver
     - GraphContext: Container for expanded graph context from entity traversal
     - Subgraph: Extracted subgraph for visualization or analysis
     - weight_path: Utility to score entity paths by relationship type and distance
@@ -21,7 +22,8 @@ KEY COMPONENTS:
 
 DEPENDENCIES:
     - External: neo4j, pydantic
-    - Internal: api/neo4j_config.py
+    - Internal: api/neo4j_config.py, api/graph_cache.py, api/graph_snapshot.py,
+      api/ann_index.py, api/concept_rollups.py
 
 USAGE:
     from api.graph_manager import GraphManager
@@ -30,6 +32,9 @@ USAGE:
     graph_mgr = GraphManager(neo4j_driver)
     neighbors = await graph_mgr.get_entity_neighbors("entity_123")
     subgraph = await graph_mgr.get_subgraph(["e1", "e2"], depth=2)
+
+    # Sync or async driver chosen by NEO4J_USE_ASYNC_DRIVER
+    graph_mgr = create_graph_manager()
 ============================================================================
 """
 from __future__ import annotations
@@ -41,6 +46,20 @@ from typing import List, Dict, Any, Optional, Literal
 
 from pydantic import BaseModel, Field
 
+from api.ann_index import remove_from_module_index
+from api.concept_rollups import (
+    CONCEPT_ROLLUP_DECREMENT_QUERY,
+    CYPHER_ROLLUP_ENTITY,
+    CYPHER_ROLLUP_KEY,
+    rollup_decrements,
+)
+from api.graph_cache import bump_module_version
+from api.graph_snapshot import (
+    GraphSnapshotCache,
+    ModuleGraphSnapshot,
+    get_snapshot_cache,
+)
+
 
 # ============================================================================
 # LOGGING
@@ -161,6 +180,211 @@ class Subgraph(BaseModel):
     edge_count: int = Field(default=0, description="Number of edges in subgraph")
 
 
+# ============================================================================
+# CYPHER QUERIES
+# ============================================================================
+# Shared by the sync (GraphManager) and async (AsyncGraphManager) paths so
+# both drivers always execute identical Cypher.
+# Entities are matched through the common :Entity label (migration 004), so
+# id lookups hit one constraint index; the type is the remaining label.
+# :Entity also covers Definition and Citation nodes, so queries that serve
+# concepts keep the Topic/Concept/Methodology/Finding filter.
+
+ENTITY_BY_ID_QUERY = """
+MATCH (e:Entity {id: $entity_id})
+WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+RETURN e.id as id, e.name as name,
+       [l IN labels(e) WHERE l <> 'Entity'][0] as entity_type,
+       e.definition as definition, e.module_id as module_id,
+       e.confidence as confidence, e.mention_count as mention_count
+LIMIT 1
+"""
+
+ENTITIES_BY_NAME_QUERY = """
+MATCH (e:Entity)
+WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+AND toLower(e.name) CONTAINS toLower($name)
+{module_filter}
+RETURN e.id as id, e.name as name,
+       [l IN labels(e) WHERE l <> 'Entity'][0] as entity_type,
+       e.definition as definition, e.module_id as module_id,
+       e.confidence as confidence, e.mention_count as mention_count
+ORDER BY e.mention_count DESC
+LIMIT 20
+"""
+
+ENTITY_NEIGHBORS_QUERY = """
+MATCH (start:Entity {id: $entity_id})
+WHERE (start:Topic OR start:Concept OR start:Methodology OR start:Finding)
+MATCH {match_pattern}
+WHERE neighbor:Entity AND (neighbor:Topic OR neighbor:Concept OR neighbor:Methodology OR neighbor:Finding)
+RETURN neighbor.id as id, neighbor.name as name,
+       [l IN labels(neighbor) WHERE l <> 'Entity'][0] as entity_type,
+       neighbor.definition as definition, neighbor.module_id as module_id,
+       type(r) as relationship_type, r.confidence as rel_confidence,
+       startNode(r).id = start.id as is_outgoing
+ORDER BY r.confidence DESC
+LIMIT $limit
+"""
+
+PATHS_BETWEEN_QUERY = """
+MATCH (source:Entity {id: $source_id})
+MATCH (target:Entity {id: $target_id})
+WHERE (source:Topic OR source:Concept OR source:Methodology OR source:Finding)
+AND (target:Topic OR target:Concept OR target:Methodology OR target:Finding)
+MATCH path = shortestPath((source)-[*1..$max_hops]-(target))
+UNWIND relationships(path) as rel
+RETURN source.name as source_name, target.name as target_name,
+       type(rel) as relationship_type, rel.confidence as confidence,
+       length(path) as hops
+"""
+
+SUBGRAPH_QUERY = """
+MATCH (start:Entity)
+WHERE start.id IN $entity_ids
+AND (start:Topic OR start:Concept OR start:Methodology OR start:Finding)
+CALL {{
+    WITH start
+    MATCH path = (start)-[*1..$depth]-(related)
+    WHERE related:Entity AND (related:Topic OR related:Concept OR related:Methodology OR related:Finding)
+    {module_filter}
+    RETURN path
+    LIMIT 100
+}}
+WITH path
+UNWIND nodes(path) as node
+UNWIND relationships(path) as rel
+WITH COLLECT(DISTINCT node) as all_nodes, COLLECT(DISTINCT rel) as all_rels
+RETURN
+    [n IN all_nodes | {{
+        id: n.id,
+        name: n.name,
+        type: [l IN labels(n) WHERE l <> 'Entity'][0],
+        definition: n.definition,
+        module_id: n.module_id
+    }}] as nodes,
+    [r IN all_rels | {{
+        source: startNode(r).id,
+        target: endNode(r).id,
+        type: type(r),
+        confidence: r.confidence
+    }}] as edges
+"""
+
+DOCUMENT_EXISTS_QUERY = """
+MATCH (d:Document {id: $doc_id})
+RETURN d.id as id, d.module_id as module_id
+"""
+
+DOCUMENT_ENTITIES_QUERY = """
+MATCH (d:Document {id: $doc_id})-[:HAS_CHUNK|HAS_PARENT_CHUNK]->(c)
+MATCH (c)-[:CONTAINS_ENTITY]->(e:Entity)
+WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+RETURN DISTINCT e.id as entity_id
+"""
+
+DELETE_PARENT_CHUNKS_QUERY = """
+MATCH (d:Document {id: $doc_id})-[:HAS_PARENT_CHUNK]->(p:ParentChunk)
+DETACH DELETE p
+"""
+
+DELETE_CHUNKS_QUERY = """
+MATCH (d:Document {id: $doc_id})-[:HAS_CHUNK]->(c:Chunk)
+WITH c, c.id as chunk_id
+DETACH DELETE c
+RETURN chunk_id
+"""
+
+DELETE_DOCUMENT_QUERY = """
+MATCH (d:Document {id: $doc_id})
+DETACH DELETE d
+"""
+
+# rollup_key is the concept rollup the entity was counted in (None if it
+# was never counted), so cleanup can decrement it
+ORPHAN_CLEANUP_QUERY = f"""
+MATCH (e:Entity)
+WHERE e.id IN $entity_ids
+AND (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+AND NOT (e)<-[:ADDRESSES_TOPIC|MENTIONS_CONCEPT|SUPPORTS|USES_METHODOLOGY]-(:Document)
+AND NOT (e)<-[:CONTAINS_ENTITY]-(:Chunk)
+WITH e, e.id as deleted_id, e.module_id as module_id,
+     CASE WHEN {CYPHER_ROLLUP_ENTITY} AND e.rollup_pending IS NULL
+          THEN {CYPHER_ROLLUP_KEY} END as rollup_key
+DETACH DELETE e
+RETURN count(deleted_id) as deleted_count,
+       collect({{id: deleted_id, module_id: module_id, rollup_key: rollup_key}}) as deleted
+"""
+
+EXPAND_ONE_HOP_QUERY = """
+MATCH (start:Entity)-[r]->(related:Entity)
+WHERE start.id IN $entity_ids
+AND (start:Topic OR start:Concept OR start:Methodology OR start:Finding)
+AND (related:Topic OR related:Concept OR related:Methodology OR related:Finding)
+{module_filter}
+RETURN start.id as source_id, start.name as source, related.name as target,
+       related.id as target_id, related.definition as definition,
+       [l IN labels(related) WHERE l <> 'Entity'][0] as entity_type,
+       related.module_id as module_id,
+       type(r) as relationship_type, r.confidence as confidence,
+       1 as hops
+ORDER BY r.confidence DESC
+LIMIT $limit
+"""
+
+EXPAND_TWO_HOP_QUERY = """
+// 1-hop results
+MATCH (start:Entity)-[r1]->(hop1:Entity)
+WHERE start.id IN $entity_ids
+AND (start:Topic OR start:Concept OR start:Methodology OR start:Finding)
+AND (hop1:Topic OR hop1:Concept OR hop1:Methodology OR hop1:Finding)
+{hop1_filter}
+WITH start, hop1, r1, 1 as hops
+RETURN start.id as source_id, start.name as source, hop1.name as target,
+       hop1.id as target_id, hop1.definition as definition,
+       [l IN labels(hop1) WHERE l <> 'Entity'][0] as entity_type,
+       hop1.module_id as module_id,
+       type(r1) as relationship_type, r1.confidence as confidence,
+       hops
+
+UNION ALL
+
+// 2-hop results
+MATCH (start:Entity)-[r1]->(hop1:Entity)-[r2]->(hop2:Entity)
+WHERE start.id IN $entity_ids
+AND (start:Topic OR start:Concept OR start:Methodology OR start:Finding)
+AND (hop1:Topic OR hop1:Concept OR hop1:Methodology OR hop1:Finding)
+AND (hop2:Topic OR hop2:Concept OR hop2:Methodology OR hop2:Finding)
+AND NOT hop2.id IN $entity_ids
+{hop2_filter}
+WITH start, hop2, r2, 2 as hops
+RETURN start.id as source_id, start.name as source, hop2.name as target,
+       hop2.id as target_id, hop2.definition as definition,
+       [l IN labels(hop2) WHERE l <> 'Entity'][0] as entity_type,
+       hop2.module_id as module_id,
+       type(r2) as relationship_type, r2.confidence as confidence,
+       hops
+ORDER BY hops ASC, confidence DESC
+LIMIT $limit
+"""
+
+MODULE_FILTER = "AND ({var}.module_id IN $module_ids OR {var}.module_id IS NULL)"
+RELATIONSHIP_FILTER = "AND type({var}) IN $relationship_types"
+
+
+def _entity_from_record(record: Dict[str, Any]) -> Entity:
+    """Build an Entity model from an entity projection row."""
+    return Entity(
+        id=record["id"],
+        name=record["name"],
+        entity_type=record["entity_type"],
+        definition=record.get("definition"),
+        module_id=record.get("module_id"),
+        confidence=record.get("confidence"),
+        mention_count=record.get("mention_count"),
+    )
+
+
 # ============================================================================
 # GRAPH MANAGER CLASS
 # ============================================================================
@@ -177,6 +401,14 @@ class GraphManager:
     - Path finding between entities
     - Entity lookup by ID or name
 
+    All Cypher goes through run_query(); this class runs it on the sync
+    driver in a worker thread, AsyncGraphManager on the async driver.
+
+    With a snapshot cache attached, traversals scoped to a single module are
+    answered from an in-memory CSR snapshot of that module's entity graph
+    (api/graph_snapshot.py) and only fall back to Cypher when the query
+    leaves the snapshot.
+
     Example:
         from api.graph_manager import GraphManager
         from api.neo4j_config import neo4j_driver
@@ -190,15 +422,66 @@ class GraphManager:
         subgraph = await graph_mgr.get_subgraph(["e1", "e2", "e3"], depth=2)
     """
 
-    def __init__(self, neo4j_driver):
+    def __init__(
+        self,
+        neo4j_driver,
+        snapshot_cache: Optional[GraphSnapshotCache] = None,
+    ):
         """
         Initialize GraphManager with Neo4j driver.
 
         Args:
             neo4j_driver: Active Neo4j driver instance
+            snapshot_cache: Optional in-memory module graph snapshots
         """
         self.driver = neo4j_driver
-        logger.info("GraphManager initialized")
+        self.snapshot_cache = snapshot_cache
+        logger.info(f"{type(self).__name__} initialized")
+
+    async def _module_snapshot(
+        self, module_id: Optional[str], entity_ids: List[str]
+    ) -> Optional[ModuleGraphSnapshot]:
+        """
+        Get the module snapshot if it can answer a query about entity_ids.
+
+        Args:
+            module_id: Module the query is scoped to (None disables snapshots)
+            entity_ids: Entities the traversal starts from
+
+        Returns:
+            Snapshot containing every entity in entity_ids, or None
+        """
+        if self.snapshot_cache is None or not module_id or not entity_ids:
+            return None
+        snapshot = await self.snapshot_cache.get(module_id, self)
+        if snapshot is None or not all(snapshot.contains(e) for e in entity_ids):
+            return None
+        return snapshot
+
+    async def run_query(
+        self,
+        cypher: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a Cypher query and return all records as dicts.
+
+        The sync driver blocks, so the session runs in a worker thread.
+
+        Args:
+            cypher: Cypher query text
+            params: Query parameters
+
+        Returns:
+            List of record dictionaries
+        """
+
+        def _sync():
+            with self.driver.session() as session:
+                result = session.run(cypher, params or {})
+                return [record.data() for record in result]
+
+        return await asyncio.to_thread(_sync)
 
     async def get_entity_by_id(self, entity_id: str) -> Optional[Entity]:
         """
@@ -213,40 +496,10 @@ class GraphManager:
             Entity object if found, None otherwise
         """
         try:
-            cypher = """
-            CALL {
-                MATCH (e:Topic {id: $entity_id}) RETURN e
-                UNION
-                MATCH (e:Concept {id: $entity_id}) RETURN e
-                UNION
-                MATCH (e:Methodology {id: $entity_id}) RETURN e
-                UNION
-                MATCH (e:Finding {id: $entity_id}) RETURN e
-            }
-            WITH e
-            RETURN e.id as id, e.name as name, labels(e)[0] as entity_type,
-                   e.definition as definition, e.module_id as module_id,
-                   e.confidence as confidence, e.mention_count as mention_count
-            LIMIT 1
-            """
-
-            def _sync():
-                with self.driver.session() as session:
-                    result = session.run(cypher, {"entity_id": entity_id})
-                    record = result.single()
-                    if record:
-                        return Entity(
-                            id=record["id"],
-                            name=record["name"],
-                            entity_type=record["entity_type"],
-                            definition=record.get("definition"),
-                            module_id=record.get("module_id"),
-                            confidence=record.get("confidence"),
-                            mention_count=record.get("mention_count"),
-                        )
-                return None
-
-            return await asyncio.to_thread(_sync)
+            records = await self.run_query(
+                ENTITY_BY_ID_QUERY, {"entity_id": entity_id}
+            )
+            return _entity_from_record(records[0]) if records else None
 
         except Exception as e:
             logger.warning(f"Failed to get entity by ID {entity_id}: {e}")
@@ -268,84 +521,15 @@ class GraphManager:
             List of matching Entity objects
         """
         try:
+            params: Dict[str, Any] = {"name": name}
+            module_filter = ""
             if module_id:
-                cypher = """
-                CALL {
-                    MATCH (e:Topic)
-                    WHERE toLower(e.name) CONTAINS toLower($name)
-                    AND e.module_id = $module_id
-                    RETURN e
-                    UNION
-                    MATCH (e:Concept)
-                    WHERE toLower(e.name) CONTAINS toLower($name)
-                    AND e.module_id = $module_id
-                    RETURN e
-                    UNION
-                    MATCH (e:Methodology)
-                    WHERE toLower(e.name) CONTAINS toLower($name)
-                    AND e.module_id = $module_id
-                    RETURN e
-                    UNION
-                    MATCH (e:Finding)
-                    WHERE toLower(e.name) CONTAINS toLower($name)
-                    AND e.module_id = $module_id
-                    RETURN e
-                }
-                WITH e
-                RETURN e.id as id, e.name as name, labels(e)[0] as entity_type,
-                       e.definition as definition, e.module_id as module_id,
-                       e.confidence as confidence, e.mention_count as mention_count
-                ORDER BY e.mention_count DESC
-                LIMIT 20
-                """
-                params = {"name": name, "module_id": module_id}
-            else:
-                cypher = """
-                CALL {
-                    MATCH (e:Topic)
-                    WHERE toLower(e.name) CONTAINS toLower($name)
-                    RETURN e
-                    UNION
-                    MATCH (e:Concept)
-                    WHERE toLower(e.name) CONTAINS toLower($name)
-                    RETURN e
-                    UNION
-                    MATCH (e:Methodology)
-                    WHERE toLower(e.name) CONTAINS toLower($name)
-                    RETURN e
-                    UNION
-                    MATCH (e:Finding)
-                    WHERE toLower(e.name) CONTAINS toLower($name)
-                    RETURN e
-                }
-                WITH e
-                RETURN e.id as id, e.name as name, labels(e)[0] as entity_type,
-                       e.definition as definition, e.module_id as module_id,
-                       e.confidence as confidence, e.mention_count as mention_count
-                ORDER BY e.mention_count DESC
-                LIMIT 20
-                """
-                params = {"name": name}
-
-            def _sync():
-                entities = []
-                with self.driver.session() as session:
-                    result = session.run(cypher, params)
-                    for record in result:
-                        entities.append(
-                            Entity(
-                                id=record["id"],
-                                name=record["name"],
-                                entity_type=record["entity_type"],
-                                definition=record.get("definition"),
-                                module_id=record.get("module_id"),
-                                confidence=record.get("confidence"),
-                                mention_count=record.get("mention_count"),
-                            )
-                        )
-                return entities
-
-            entities = await asyncio.to_thread(_sync)
+                module_filter = "AND e.module_id = $module_id"
+                params["module_id"] = module_id
+
+            cypher = ENTITIES_BY_NAME_QUERY.format(module_filter=module_filter)
+            records = await self.run_query(cypher, params)
+            entities = [_entity_from_record(record) for record in records]
             logger.debug(f"Found {len(entities)} entities matching '{name}'")
             return entities
 
@@ -359,6 +543,7 @@ class GraphManager:
         relationship_types: Optional[List[str]] = None,
         direction: Literal["outgoing", "incoming", "both"] = "both",
         limit: int = MAX_NEIGHBORS,
+        module_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get immediate neighbors (1-hop) of an entity.
@@ -368,61 +553,49 @@ class GraphManager:
             relationship_types: Filter by specific relationship types (default: all)
             direction: Relationship direction - outgoing, incoming, or both
             limit: Maximum number of neighbors to return
+            module_id: Module the entity belongs to (enables the snapshot path)
 
         Returns:
             List of neighbor dictionaries with entity info and relationship details
         """
         try:
             rel_types = relationship_types or ALL_RELATIONSHIP_TYPES
-            rel_pattern = "|".join(rel_types)
-
-            if direction == "outgoing":
-                match_pattern = f"(start)-[r:{rel_pattern}]->(neighbor)"
-            elif direction == "incoming":
-                match_pattern = f"(start)<-[r:{rel_pattern}]-(neighbor)"
-            else:  # both
-                match_pattern = f"(start)-[r:{rel_pattern}]-(neighbor)"
-
-            cypher = f"""
-            MATCH (start)
-            WHERE (start:Topic OR start:Concept OR start:Methodology OR start:Finding)
-            AND start.id = $entity_id
-            MATCH {match_pattern}
-            WHERE neighbor:Topic OR neighbor:Concept OR neighbor:Methodology OR neighbor:Finding
-            RETURN neighbor.id as id, neighbor.name as name, labels(neighbor)[0] as entity_type,
-                   neighbor.definition as definition, neighbor.module_id as module_id,
-                   type(r) as relationship_type, r.confidence as rel_confidence,
-                   startNode(r).id = start.id as is_outgoing
-            ORDER BY r.confidence DESC
-            LIMIT $limit
-            """
-
-            def _sync():
-                neighbors = []
-                with self.driver.session() as session:
-                    result = session.run(cypher, {"entity_id": entity_id, "limit": limit})
-                    for record in result:
-                        rel_type = record["relationship_type"]
-                        neighbors.append(
-                            {
-                                "id": record["id"],
-                                "name": record["name"],
-                                "entity_type": record["entity_type"],
-                                "definition": record.get("definition"),
-                                "module_id": record.get("module_id"),
-                                "relationship_type": rel_type,
-                                "relationship_confidence": record.get(
-                                    "rel_confidence", 1.0
-                                ),
-                                "relationship_weight": RELATIONSHIP_WEIGHTS.get(
-                                    rel_type, 0.4
-                                ),
-                                "is_outgoing": record.get("is_outgoing", True),
-                            }
-                        )
-                return neighbors
-
-            neighbors = await asyncio.to_thread(_sync)
+
+            snapshot = await self._module_snapshot(module_id, [entity_id])
+            if snapshot is not None:
+                records = snapshot.neighbors(entity_id, rel_types, direction, limit)
+            else:
+                rel_pattern = "|".join(rel_types)
+
+                if direction == "outgoing":
+                    match_pattern = f"(start)-[r:{rel_pattern}]->(neighbor)"
+                elif direction == "incoming":
+                    match_pattern = f"(start)<-[r:{rel_pattern}]-(neighbor)"
+                else:  # both
+                    match_pattern = f"(start)-[r:{rel_pattern}]-(neighbor)"
+
+                cypher = ENTITY_NEIGHBORS_QUERY.format(match_pattern=match_pattern)
+                records = await self.run_query(
+                    cypher, {"entity_id": entity_id, "limit": limit}
+                )
+
+            neighbors = []
+            for record in records:
+                rel_type = record["relationship_type"]
+                neighbors.append(
+                    {
+                        "id": record["id"],
+                        "name": record["name"],
+                        "entity_type": record["entity_type"],
+                        "definition": record.get("definition"),
+                        "module_id": record.get("module_id"),
+                        "relationship_type": rel_type,
+                        "relationship_confidence": record.get("rel_confidence", 1.0),
+                        "relationship_weight": RELATIONSHIP_WEIGHTS.get(rel_type, 0.4),
+                        "is_outgoing": record.get("is_outgoing", True),
+                    }
+                )
+
             logger.debug(f"Found {len(neighbors)} neighbors for entity {entity_id}")
             return neighbors
 
@@ -435,6 +608,7 @@ class GraphManager:
         source_id: str,
         target_id: str,
         max_hops: int = 3,
+        module_id: Optional[str] = None,
     ) -> List[EntityPath]:
         """
         Find all paths between two entities up to max_hops length.
@@ -443,6 +617,8 @@ class GraphManager:
             source_id: Starting entity ID
             target_id: Target entity ID
             max_hops: Maximum path length (default: 3)
+            module_id: Module both entities belong to; the path is first
+                searched in that module's snapshot, then in Neo4j
 
         Returns:
             List of EntityPath objects representing paths between entities
@@ -450,42 +626,45 @@ class GraphManager:
         try:
             max_hops = min(max_hops, MAX_HOP_DEPTH)
 
-            cypher = """
-            MATCH path = shortestPath((source)-[*1..$max_hops]-(target))
-            WHERE (source:Topic OR source:Concept OR source:Methodology OR source:Finding)
-            AND (target:Topic OR target:Concept OR target:Methodology OR target:Finding)
-            AND source.id = $source_id
-            AND target.id = $target_id
-            UNWIND relationships(path) as rel
-            RETURN source.name as source_name, target.name as target_name,
-                   type(rel) as relationship_type, rel.confidence as confidence,
-                   length(path) as hops
-            """
-
-            def _sync():
-                paths = []
-                with self.driver.session() as session:
-                    result = session.run(
-                        cypher,
-                        {
-                            "source_id": source_id,
-                            "target_id": target_id,
-                            "max_hops": max_hops,
-                        },
+            snapshot = await self._module_snapshot(module_id, [source_id, target_id])
+            steps = (
+                snapshot.shortest_path(source_id, target_id, max_hops)
+                if snapshot is not None
+                else None
+            )
+            if steps:
+                source_name = snapshot.names[snapshot.index[source_id]]
+                target_name = snapshot.names[snapshot.index[target_id]]
+                return [
+                    EntityPath(
+                        source_entity=source_name,
+                        target_entity=target_name,
+                        relationship_type=step["relationship_type"],
+                        confidence=step["confidence"] or 1.0,
+                        hops=len(steps),
                     )
-                    for record in result:
-                        paths.append(
-                            EntityPath(
-                                source_entity=record["source_name"],
-                                target_entity=record["target_name"],
-                                relationship_type=record["relationship_type"],
-                                confidence=record.get("confidence", 1.0) or 1.0,
-                                hops=record["hops"],
-                            )
-                        )
-                return paths
-
-            paths = await asyncio.to_thread(_sync)
+                    for step in steps
+                ]
+
+            records = await self.run_query(
+                PATHS_BETWEEN_QUERY,
+                {
+                    "source_id": source_id,
+                    "target_id": target_id,
+                    "max_hops": max_hops,
+                },
+            )
+            paths = [
+                EntityPath(
+                    source_entity=record["source_name"],
+                    target_entity=record["target_name"],
+                    relationship_type=record["relationship_type"],
+                    confidence=record.get("confidence", 1.0) or 1.0,
+                    hops=record["hops"],
+                )
+                for record in records
+            ]
+
             logger.debug(
                 f"Found {len(paths)} paths between {source_id} and {target_id}"
             )
@@ -512,7 +691,8 @@ class GraphManager:
         Args:
             entity_ids: Seed entity IDs to expand from
             depth: Number of hops to expand (default: 2)
-            module_ids: Optional module IDs to filter by
+            module_ids: Optional module IDs to filter by (a single module
+                enables the snapshot path)
 
         Returns:
             Subgraph object containing nodes and edges
@@ -523,61 +703,37 @@ class GraphManager:
         try:
             depth = min(depth, MAX_HOP_DEPTH)
 
+            if module_ids and len(module_ids) == 1:
+                snapshot = await self._module_snapshot(module_ids[0], entity_ids)
+                if snapshot is not None:
+                    nodes, edges = snapshot.subgraph(entity_ids, depth, set(module_ids))
+                    return Subgraph(
+                        nodes=nodes,
+                        edges=edges,
+                        node_count=len(nodes),
+                        edge_count=len(edges),
+                    )
+
             module_filter = ""
             params: Dict[str, Any] = {"entity_ids": entity_ids, "depth": depth}
 
             if module_ids:
-                module_filter = "AND (related.module_id IN $module_ids OR related.module_id IS NULL)"
+                module_filter = MODULE_FILTER.format(var="related")
                 params["module_ids"] = module_ids
 
-            cypher = f"""
-            MATCH (start)
-            WHERE (start:Topic OR start:Concept OR start:Methodology OR start:Finding)
-            AND start.id IN $entity_ids
-            CALL {{
-                WITH start
-                MATCH path = (start)-[*1..$depth]-(related)
-                WHERE (related:Topic OR related:Concept OR related:Methodology OR related:Finding)
-                {module_filter}
-                RETURN path
-                LIMIT 100
-            }}
-            WITH path
-            UNWIND nodes(path) as node
-            UNWIND relationships(path) as rel
-            WITH COLLECT(DISTINCT node) as all_nodes, COLLECT(DISTINCT rel) as all_rels
-            RETURN
-                [n IN all_nodes | {{
-                    id: n.id,
-                    name: n.name,
-                    type: labels(n)[0],
-                    definition: n.definition,
-                    module_id: n.module_id
-                }}] as nodes,
-                [r IN all_rels | {{
-                    source: startNode(r).id,
-                    target: endNode(r).id,
-                    type: type(r),
-                    confidence: r.confidence
-                }}] as edges
-            """
-
-            def _sync():
-                with self.driver.session() as session:
-                    result = session.run(cypher, params)
-                    record = result.single()
-                    if record:
-                        nodes = record["nodes"] or []
-                        edges = record["edges"] or []
-                        return Subgraph(
-                            nodes=nodes,
-                            edges=edges,
-                            node_count=len(nodes),
-                            edge_count=len(edges),
-                        )
-                return Subgraph(nodes=[], edges=[], node_count=0, edge_count=0)
-
-            return await asyncio.to_thread(_sync)
+            cypher = SUBGRAPH_QUERY.format(module_filter=module_filter)
+            records = await self.run_query(cypher, params)
+
+            if records:
+                nodes = records[0]["nodes"] or []
+                edges = records[0]["edges"] or []
+                return Subgraph(
+                    nodes=nodes,
+                    edges=edges,
+                    node_count=len(nodes),
+                    edge_count=len(edges),
+                )
+            return Subgraph(nodes=[], edges=[], node_count=0, edge_count=0)
 
         except Exception as e:
             logger.warning(f"Failed to extract subgraph: {e}")
@@ -604,83 +760,55 @@ class GraphManager:
             - success: True if deletion was successful, False otherwise
             - connected_entity_ids: List of entity IDs that were connected to this doc
         """
-        def _sync():
-            connected_entity_ids: List[str] = []
+        connected_entity_ids: List[str] = []
+        params = {"doc_id": doc_id}
 
-            try:
-                # Step 1: Check document exists
-                check_query = """
-                MATCH (d:Document {id: $doc_id})
-                RETURN d.id as id
-                """
-                with self.driver.session() as session:
-                    result = session.run(check_query, {"doc_id": doc_id})
-                    record = result.single()
-
-                    if not record:
-                        logger.warning(f"Document {doc_id} not found in Neo4j")
-                        return True, []
-
-                logger.info(f"Starting deletion of document {doc_id}")
-
-                # Step 2: Collect entity IDs connected to this document's chunks
-                collect_entities_query = """
-                MATCH (d:Document {id: $doc_id})-[:HAS_CHUNK|HAS_PARENT_CHUNK]->(c)
-                MATCH (c)-[:CONTAINS_ENTITY]->(e)
-                WHERE e:Topic OR e:Concept OR e:Methodology OR e:Finding
-                RETURN DISTINCT e.id as entity_id
-                """
-                with self.driver.session() as session:
-                    result = session.run(collect_entities_query, {"doc_id": doc_id})
-                    for record in result:
-                        if record["entity_id"]:
-                            connected_entity_ids.append(record["entity_id"])
-                logger.debug(
-                    f"Collected {len(connected_entity_ids)} entity IDs for document {doc_id}"
-                )
+        try:
+            # Step 1: Check document exists
+            existing = await self.run_query(DOCUMENT_EXISTS_QUERY, params)
+            if not existing:
+                logger.warning(f"Document {doc_id} not found in Neo4j")
+                return True, []
+            module_id = existing[0].get("module_id")
+
+            logger.info(f"Starting deletion of document {doc_id}")
+
+            # Step 2: Collect entity IDs connected to this document's chunks
+            for record in await self.run_query(DOCUMENT_ENTITIES_QUERY, params):
+                if record["entity_id"]:
+                    connected_entity_ids.append(record["entity_id"])
+            logger.debug(
+                f"Collected {len(connected_entity_ids)} entity IDs for document {doc_id}"
+            )
 
-                # Step 3: Delete all parent chunks linked to this document
-                delete_parent_chunks_query = """
-                MATCH (d:Document {id: $doc_id})-[:HAS_PARENT_CHUNK]->(p:ParentChunk)
-                DETACH DELETE p
-                """
-                with self.driver.session() as session:
-                    session.run(delete_parent_chunks_query, {"doc_id": doc_id})
-                logger.debug(f"Deleted parent chunks for document {doc_id}")
-
-                # Step 4: Delete all child/regular chunks linked to this document
-                delete_chunks_query = """
-                MATCH (d:Document {id: $doc_id})-[:HAS_CHUNK]->(c:Chunk)
-                DETACH DELETE c
-                """
-                with self.driver.session() as session:
-                    result = session.run(delete_chunks_query, {"doc_id": doc_id})
-                    try:
-                        for row in result.data():
-                            entity_ids = row.get("connected_entity_ids", [])
-                            if entity_ids:
-                                connected_entity_ids.extend(entity_ids)
-                    except Exception:
-                        pass
-                logger.debug(f"Deleted chunks for document {doc_id}")
-
-                # Step 5: Delete the document node itself
-                delete_doc_query = """
-                MATCH (d:Document {id: $doc_id})
-                DETACH DELETE d
-                """
-                with self.driver.session() as session:
-                    session.run(delete_doc_query, {"doc_id": doc_id})
-                logger.debug(f"Deleted Document node {doc_id}")
-
-                logger.info(f"Successfully completed deletion of document {doc_id}")
-                return True, connected_entity_ids
+            # Step 3: Delete all parent chunks linked to this document
+            await self.run_query(DELETE_PARENT_CHUNKS_QUERY, params)
+            logger.debug(f"Deleted parent chunks for document {doc_id}")
+
+            # Step 4: Delete all child/regular chunks linked to this document
+            deleted_chunks = await self.run_query(DELETE_CHUNKS_QUERY, params)
+            logger.debug(f"Deleted chunks for document {doc_id}")
+
+            # Step 5: Delete the document node itself
+            await self.run_query(DELETE_DOCUMENT_QUERY, params)
+            logger.debug(f"Deleted Document node {doc_id}")
+
+            # Step 6: Invalidate cached graph reads and ANN index rows for the module
+            bump_module_version(module_id)
+            if module_id and deleted_chunks:
+                await asyncio.to_thread(
+                    remove_from_module_index,
+                    module_id,
+                    "chunk",
+                    [r["chunk_id"] for r in deleted_chunks],
+                )
 
-            except Exception as e:
-                logger.error(f"Failed to delete document {doc_id}: {e}")
-                return False, connected_entity_ids
+            logger.info(f"Successfully completed deletion of document {doc_id}")
+            return True, connected_entity_ids
 
-        return await asyncio.to_thread(_sync)
+        except Exception as e:
+            logger.error(f"Failed to delete document {doc_id}: {e}")
+            return False, connected_entity_ids
 
     async def cleanup_orphaned_entities(self, entity_ids: List[str]) -> int:
         """
@@ -699,33 +827,100 @@ class GraphManager:
         if not entity_ids:
             return 0
 
-        def _sync():
+        try:
+            records = await self.run_query(
+                ORPHAN_CLEANUP_QUERY, {"entity_ids": entity_ids}
+            )
+            deleted_count = records[0]["deleted_count"] if records else 0
+            deleted = (records[0].get("deleted") or []) if records else []
+        except Exception as e:
+            logger.error(f"Failed to cleanup orphaned entities: {e}")
+            deleted_count = 0
+            deleted = []
+
+        decrements = rollup_decrements(deleted)
+        if decrements:
             try:
-                cleanup_query = """
-                MATCH (e)
-                WHERE e.id IN $entity_ids
-                AND (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
-                AND NOT (e)<-[:ADDRESSES_TOPIC|MENTIONS_CONCEPT|SUPPORTS|USES_METHODOLOGY]-(:Document)
-                AND NOT (e)<-[:CONTAINS_ENTITY]-(:Chunk)
-                WITH e, e.id as deleted_id
-                DETACH DELETE e
-                RETURN count(deleted_id) as deleted_count
-                """
-                with self.driver.session() as session:
-                    result = session.run(cleanup_query, {"entity_ids": entity_ids})
-                    record = result.single()
-                    return record["deleted_count"] if record else 0
+                await self.run_query(CONCEPT_ROLLUP_DECREMENT_QUERY, {"rollups": decrements})
             except Exception as e:
-                logger.error(f"Failed to cleanup orphaned entities: {e}")
-                return 0
+                logger.warning(f"Concept rollup decrement failed: {e}")
+
+        # Cached graph reads of these modules still list the deleted entities
+        for module_id in {e["module_id"] for e in deleted if e.get("module_id")}:
+            bump_module_version(module_id)
 
-        deleted_count = await asyncio.to_thread(_sync)
         logger.info(
             f"Orphan cleanup: checked {len(entity_ids)} entities, "
             f"deleted {deleted_count} orphans"
         )
         return deleted_count
 
+    async def expand_entities(
+        self,
+        entity_ids: List[str],
+        hop_depth: int = DEFAULT_HOP_DEPTH,
+        module_ids: Optional[List[str]] = None,
+        limit: int = MAX_EXPANDED_ENTITIES,
+        relationship_types: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Outgoing 1-2 hop paths from many seed entities in one traversal.
+
+        Served from the module snapshot when scoped to a single loaded
+        module, otherwise by one Cypher query for all seeds.
+
+        Args:
+            entity_ids: Seed entity IDs
+            hop_depth: Maximum traversal depth (paths longer than 2 are not followed)
+            module_ids: Optional module IDs to filter intermediate/target entities
+            limit: Maximum rows, ordered by hops then confidence
+            relationship_types: Optional relationship types to follow
+
+        Returns:
+            Rows with source_id, source, target, target_id, definition,
+            entity_type, module_id, relationship_type, confidence and hops
+        """
+        if not entity_ids:
+            return []
+
+        hop_depth = min(hop_depth, MAX_HOP_DEPTH)
+        params: Dict[str, Any] = {
+            "entity_ids": entity_ids,
+            "limit": limit,
+        }
+        if module_ids:
+            params["module_ids"] = module_ids
+        if relationship_types:
+            params["relationship_types"] = relationship_types
+
+        def filters(node_var: str, *rel_vars: str) -> str:
+            clauses = [MODULE_FILTER.format(var=node_var)] if module_ids else []
+            if relationship_types:
+                clauses += [RELATIONSHIP_FILTER.format(var=v) for v in rel_vars]
+            return " ".join(clauses)
+
+        if module_ids and len(module_ids) == 1:
+            snapshot = await self._module_snapshot(module_ids[0], entity_ids)
+            if snapshot is not None:
+                # Same 1- or 2-hop outgoing expansion as the Cypher below
+                return snapshot.expand(
+                    entity_ids, min(hop_depth, 2), set(module_ids), limit,
+                    relationship_types,
+                )
+
+        if hop_depth == 1:
+            return await self.run_query(
+                EXPAND_ONE_HOP_QUERY.format(module_filter=filters("related", "r")),
+                params,
+            )
+        return await self.run_query(
+            EXPAND_TWO_HOP_QUERY.format(
+                hop1_filter=filters("hop1", "r1"),
+                hop2_filter=filters("hop2", "r1", "r2"),
+            ),
+            params,
+        )
+
     async def expand_graph_context(
         self,
         entity_ids: List[str],
@@ -762,120 +957,55 @@ class GraphManager:
             )
 
         try:
-            hop_depth = min(hop_depth, MAX_HOP_DEPTH)
+            records = await self.expand_entities(
+                entity_ids, hop_depth, module_ids, max_entities
+            )
 
-            module_filter = ""
-            params: Dict[str, Any] = {
-                "entity_ids": entity_ids,
-                "limit": max_entities,
-            }
+            expanded_entities: List[Dict[str, Any]] = []
+            paths: List[EntityPath] = []
+            seen_ids: set = set()
+            max_depth = 0
+
+            for record in records:
+                target_id = record["target_id"]
+
+                hops = record["hops"]
+                if hops > max_depth:
+                    max_depth = hops
+
+                rel_type = record["relationship_type"]
+                paths.append(
+                    EntityPath(
+                        source_entity=record["source"],
+                        target_entity=record["target"],
+                        relationship_type=rel_type,
+                        confidence=record.get("confidence", 1.0) or 1.0,
+                        hops=hops,
+                    )
+                )
 
-            if module_ids:
-                module_filter = "AND (related.module_id IN $module_ids OR related.module_id IS NULL)"
-                params["module_ids"] = module_ids
+                if target_id not in seen_ids:
+                    seen_ids.add(target_id)
+                    rel_weight = RELATIONSHIP_WEIGHTS.get(rel_type, 0.4)
+                    hop_decay = 1.0 / hops
+                    confidence = record.get("confidence", 1.0) or 1.0
+                    relevance = rel_weight * hop_decay * confidence
 
-            if hop_depth == 1:
-                cypher = f"""
-                MATCH (start)-[r]->(related)
-                WHERE (start:Topic OR start:Concept OR start:Methodology OR start:Finding)
-                AND start.id IN $entity_ids
-                AND (related:Topic OR related:Concept OR related:Methodology OR related:Finding)
-                {module_filter}
-                RETURN start.name as source, related.name as target,
-                       related.id as target_id, related.definition as definition,
-                       labels(related)[0] as entity_type, related.module_id as module_id,
-                       type(r) as relationship_type, r.confidence as confidence,
-                       1 as hops
-                ORDER BY r.confidence DESC
-                LIMIT $limit
-                """
-            else:
-                cypher = f"""
-                // 1-hop results
-                MATCH (start)-[r1]->(hop1)
-                WHERE (start:Topic OR start:Concept OR start:Methodology OR start:Finding)
-                AND start.id IN $entity_ids
-                AND (hop1:Topic OR hop1:Concept OR hop1:Methodology OR hop1:Finding)
-                {module_filter.replace("related", "hop1")}
-                WITH start, hop1, r1, 1 as hops
-                RETURN start.name as source, hop1.name as target,
-                       hop1.id as target_id, hop1.definition as definition,
-                       labels(hop1)[0] as entity_type, hop1.module_id as module_id,
-                       type(r1) as relationship_type, r1.confidence as confidence,
-                       hops
-
-                UNION ALL
-
-                // 2-hop results
-                MATCH (start)-[r1]->(hop1)-[r2]->(hop2)
-                WHERE (start:Topic OR start:Concept OR start:Methodology OR start:Finding)
-                AND start.id IN $entity_ids
-                AND (hop1:Topic OR hop1:Concept OR hop1:Methodology OR hop1:Finding)
-                AND (hop2:Topic OR hop2:Concept OR hop2:Methodology OR hop2:Finding)
-                AND NOT hop2.id IN $entity_ids
-                {module_filter.replace("related", "hop2")}
-                WITH start, hop2, r2, 2 as hops
-                RETURN start.name as source, hop2.name as target,
-                       hop2.id as target_id, hop2.definition as definition,
-                       labels(hop2)[0] as entity_type, hop2.module_id as module_id,
-                       type(r2) as relationship_type, r2.confidence as confidence,
-                       hops
-                ORDER BY hops ASC, confidence DESC
-                LIMIT $limit
-                """
-
-            def _sync():
-                expanded_entities: List[Dict[str, Any]] = []
-                paths: List[EntityPath] = []
-                seen_ids: set = set()
-                max_depth = 0
-
-                with self.driver.session() as session:
-                    result = session.run(cypher, params)
-                    for record in result:
-                        target_id = record["target_id"]
-
-                        hops = record["hops"]
-                        if hops > max_depth:
-                            max_depth = hops
-
-                        rel_type = record["relationship_type"]
-                        paths.append(
-                            EntityPath(
-                                source_entity=record["source"],
-                                target_entity=record["target"],
-                                relationship_type=rel_type,
-                                confidence=record.get("confidence", 1.0) or 1.0,
-                                hops=hops,
-                            )
-                        )
-
-                        if target_id not in seen_ids:
-                            seen_ids.add(target_id)
-                            rel_weight = RELATIONSHIP_WEIGHTS.get(rel_type, 0.4)
-                            hop_decay = 1.0 / hops
-                            confidence = record.get("confidence", 1.0) or 1.0
-                            relevance = rel_weight * hop_decay * confidence
-
-                            expanded_entities.append(
-                                {
-                                    "id": target_id,
-                                    "name": record["target"],
-                                    "entity_type": record["entity_type"],
-                                    "definition": record.get("definition"),
-                                    "module_id": record.get("module_id"),
-                                    "relationship_type": rel_type,
-                                    "hops": hops,
-                                    "relevance_score": round(relevance, 4),
-                                }
-                            )
-
-                expanded_entities.sort(key=lambda x: x["relevance_score"], reverse=True)
-                expanded_entities = expanded_entities[:max_entities]
-
-                return expanded_entities, paths, max_depth
-
-            expanded_entities, paths, max_depth = await asyncio.to_thread(_sync)
+                    expanded_entities.append(
+                        {
+                            "id": target_id,
+                            "name": record["target"],
+                            "entity_type": record["entity_type"],
+                            "definition": record.get("definition"),
+                            "module_id": record.get("module_id"),
+                            "relationship_type": rel_type,
+                            "hops": hops,
+                            "relevance_score": round(relevance, 4),
+                        }
+                    )
+
+            expanded_entities.sort(key=lambda x: x["relevance_score"], reverse=True)
+            expanded_entities = expanded_entities[:max_entities]
 
             elapsed_ms = (time.time() - start_time) * 1000
 
@@ -906,6 +1036,42 @@ class GraphManager:
             )
 
 
+class AsyncGraphManager(GraphManager):
+    """
+    GraphManager backed by the neo4j AsyncDriver.
+
+    Queries run as coroutines on the event loop with the async driver's own
+    connection pool, so concurrent graph requests wait on sockets instead of
+    each pinning a thread from the default executor. Every public method and
+    Cypher query is inherited from GraphManager; only run_query differs.
+
+    Example:
+        from api.graph_manager import create_graph_manager
+
+        graph_mgr = create_graph_manager(use_async=True)
+        context = await graph_mgr.expand_graph_context(["entity_123"])
+    """
+
+    async def run_query(
+        self,
+        cypher: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a Cypher query on the async driver.
+
+        Args:
+            cypher: Cypher query text
+            params: Query parameters
+
+        Returns:
+            List of record dictionaries
+        """
+        async with self.driver.session() as session:
+            result = await session.run(cypher, params or {})
+            return [record.data() async for record in result]
+
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
@@ -930,19 +1096,47 @@ def weight_path(path: EntityPath) -> float:
     return rel_weight * hop_decay * confidence
 
 
-def create_graph_manager(neo4j_driver=None) -> GraphManager:
+def create_graph_manager(
+    neo4j_driver=None,
+    use_async: Optional[bool] = None,
+) -> GraphManager:
     """
-    Factory function to create GraphManager with default Neo4j driver.
+    Factory function to create a GraphManager for the configured driver.
+
+    Passing an AsyncDriver always yields an AsyncGraphManager. Otherwise
+    use_async (default: NEO4J_USE_ASYNC_DRIVER) selects the shared async
+    driver, falling back to the given (or global) sync driver if the async
+    driver cannot be created. The shared snapshot cache is attached when
+    GRAPH_SNAPSHOT_ENABLED is set.
 
     Args:
-        neo4j_driver: Optional Neo4j driver (uses global if not provided)
+        neo4j_driver: Optional Neo4j driver, sync or async (uses global if not provided)
+        use_async: Prefer the async driver path
 
     Returns:
-        Configured GraphManager instance
+        Configured GraphManager or AsyncGraphManager instance
     """
+    from neo4j import AsyncDriver
+
+    snapshot_cache = get_snapshot_cache()
+
+    if isinstance(neo4j_driver, AsyncDriver):
+        return AsyncGraphManager(neo4j_driver, snapshot_cache)
+
+    from api.neo4j_config import NEO4J_USE_ASYNC_DRIVER, get_async_neo4j_driver
+
+    if use_async is None:
+        use_async = NEO4J_USE_ASYNC_DRIVER
+
+    if use_async:
+        async_driver = get_async_neo4j_driver()
+        if async_driver is not None:
+            return AsyncGraphManager(async_driver, snapshot_cache)
+        logger.warning("Async Neo4j driver unavailable, using sync driver")
+
     if neo4j_driver is None:
         from api.neo4j_config import neo4j_driver as default_driver
 
         neo4j_driver = default_driver
 
-    return GraphManager(neo4j_driver)
+    return GraphManager(neo4j_driver, snapshot_cache)
@@ -0,0 +1,617 @@
+"""
+============================================================================
+FILE: graph_snapshot.py
+LOCATION: api/graph_snapshot.py
+============================================================================
+
+PURPOSE:
+    In-process, array-backed CSR snapshots of per-module entity graphs that
+    answer neighbor, k-hop, subgraph and shortest-path queries without a
+    Neo4j round trip.
+
+ROLE IN PROJECT:
+    GraphManager's traversal methods send variable-length pattern matches to
+    Neo4j per request, which adds 50-300 ms to every RAG context expansion.
+    When snapshots are enabled, GraphManager loads a module's entity graph
+    once into NumPy arrays and serves module-scoped traversals from memory,
+    falling back to Cypher when a query leaves the snapshot.
+    - Snapshots are keyed by the module graph version (api/graph_cache.py)
+      and rebuilt on the first read after a version bump
+    - The cache is bounded by total array bytes with LRU eviction across
+      modules
+    - A snapshot holds the module's entities plus their direct neighbours in
+      other modules ("boundary" nodes), so 1-hop results are complete
+
+KEY COMPONENTS:
+    - ModuleGraphSnapshot: CSR arrays and the traversal algorithms
+    - GraphSnapshotCache: Version-checked, memory-bounded LRU of snapshots
+    - get_snapshot_cache: Process-wide cache (None unless enabled)
+
+DEPENDENCIES:
+    - External: numpy
+    - Internal: api/graph_cache.py
+
+USAGE:
+    from api.graph_manager import create_graph_manager
+
+    # GRAPH_SNAPSHOT_ENABLED=true attaches the shared cache
+    graph_mgr = create_graph_manager()
+    context = await graph_mgr.expand_graph_context(["e1"], module_ids=["m1"])
+============================================================================
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from api.graph_cache import get_module_version
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+GRAPH_SNAPSHOT_ENABLED = os.getenv("GRAPH_SNAPSHOT_ENABLED", "false").lower() == "true"
+GRAPH_SNAPSHOT_MAX_BYTES = int(os.getenv("GRAPH_SNAPSHOT_MAX_MB", "256")) * 1024 * 1024
+
+# Paths per seed in a subgraph, as the LIMIT in GraphManager's SUBGRAPH_QUERY
+SUBGRAPH_PATHS_PER_SEED = 100
+
+# Longest shortest path a snapshot can answer exactly. The Cypher path search
+# may also pass through Chunk/Document nodes, which snapshots do not hold;
+# such a detour takes at least 2 hops, so longer entity paths may not be
+# shortest and are left to Neo4j.
+SNAPSHOT_EXACT_PATH_HOPS = 2
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+# Module entities plus their direct neighbours in other modules
+SNAPSHOT_ENTITIES_QUERY = """
+MATCH (e:Entity {module_id: $module_id})
+WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+RETURN e.id as id, e.name as name,
+       [l IN labels(e) WHERE l <> 'Entity'][0] as entity_type,
+       e.definition as definition, e.module_id as module_id
+UNION
+MATCH (m:Entity {module_id: $module_id})--(e:Entity)
+WHERE (m:Topic OR m:Concept OR m:Methodology OR m:Finding)
+AND (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+AND (e.module_id IS NULL OR e.module_id <> $module_id)
+RETURN e.id as id, e.name as name,
+       [l IN labels(e) WHERE l <> 'Entity'][0] as entity_type,
+       e.definition as definition, e.module_id as module_id
+"""
+
+# Every relationship touching the module, each returned once
+SNAPSHOT_EDGES_QUERY = """
+MATCH (a:Entity {module_id: $module_id})-[r]->(b:Entity)
+WHERE (a:Topic OR a:Concept OR a:Methodology OR a:Finding)
+AND (b:Topic OR b:Concept OR b:Methodology OR b:Finding)
+RETURN a.id as source, b.id as target, type(r) as type,
+       r.confidence as confidence
+UNION ALL
+MATCH (a:Entity)-[r]->(b:Entity {module_id: $module_id})
+WHERE (a:Topic OR a:Concept OR a:Methodology OR a:Finding)
+AND (b:Topic OR b:Concept OR b:Methodology OR b:Finding)
+AND (a.module_id IS NULL OR a.module_id <> $module_id)
+RETURN a.id as source, b.id as target, type(r) as type,
+       r.confidence as confidence
+"""
+
+
+# ============================================================================
+# SNAPSHOT
+# ============================================================================
+
+
+def _string_bytes(values: Iterable[Optional[str]]) -> int:
+    return sum(sys.getsizeof(v) for v in values if v is not None)
+
+
+class ModuleGraphSnapshot:
+    """
+    Immutable CSR snapshot of one module's entity graph.
+
+    Each stored relationship appears twice in the CSR arrays, once under each
+    endpoint, with `outgoing` recording whether the row node is the start
+    node and `edge_ids` identifying the relationship. Confidence is NaN where
+    the relationship has none.
+
+    Traversals mirror GraphManager's Cypher, including Neo4j placing null
+    confidences first in descending order.
+    """
+
+    def __init__(
+        self,
+        module_id: str,
+        version: Optional[int],
+        entities: List[Dict[str, Any]],
+        edges: List[Dict[str, Any]],
+    ):
+        """
+        Build the snapshot from entity and edge projection rows.
+
+        Args:
+            module_id: Module identifier
+            version: Module graph version the rows were read at
+            entities: Rows with id, name, entity_type, definition, module_id
+            edges: Rows with source, target, type, confidence
+        """
+        self.module_id = module_id
+        self.version = version
+
+        self.ids: List[str] = [e["id"] for e in entities]
+        self.index: Dict[str, int] = {eid: i for i, eid in enumerate(self.ids)}
+        self.names: List[str] = [e.get("name") for e in entities]
+        self.definitions: List[Optional[str]] = [e.get("definition") for e in entities]
+        self.module_ids: List[Optional[str]] = [e.get("module_id") for e in entities]
+        self.type_names, types = np.unique(
+            np.array([e.get("entity_type") or "" for e in entities], dtype=object),
+            return_inverse=True,
+        )
+        self.types = types.astype(np.int16)
+        self.in_module = np.array([m == module_id for m in self.module_ids], dtype=bool)
+
+        edges = [e for e in edges if e["source"] in self.index and e["target"] in self.index]
+        sources = np.array([self.index[e["source"]] for e in edges], dtype=np.int64)
+        targets = np.array([self.index[e["target"]] for e in edges], dtype=np.int64)
+        self.relationship_types, rel_types = np.unique(
+            np.array([e["type"] for e in edges], dtype=object), return_inverse=True
+        )
+        confidences = np.array(
+            [np.nan if e.get("confidence") is None else e["confidence"] for e in edges],
+            dtype=np.float32,
+        )
+
+        rows = np.concatenate([sources, targets])
+        order = np.argsort(rows, kind="stable")
+        self.indptr = np.zeros(len(self.ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(self.ids)), out=self.indptr[1:])
+        self.indices = np.concatenate([targets, sources])[order]
+        self.edge_types = np.concatenate([rel_types, rel_types]).astype(np.int16)[order]
+        self.confidences = np.concatenate([confidences, confidences])[order]
+        self.outgoing = np.concatenate(
+            [np.ones(len(edges), dtype=bool), np.zeros(len(edges), dtype=bool)]
+        )[order]
+        self.edge_ids = np.tile(np.arange(len(edges), dtype=np.int64), 2)[order]
+        self.edge_count = len(edges)
+
+        self.nbytes = (
+            sum(
+                a.nbytes for a in (
+                    self.types, self.in_module, self.indptr, self.indices,
+                    self.edge_types, self.confidences, self.outgoing, self.edge_ids,
+                )
+            )
+            + _string_bytes(self.ids)
+            + _string_bytes(self.names)
+            + _string_bytes(self.definitions)
+            + 100 * len(self.ids)  # list slots and dict entries
+        )
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def contains(self, entity_id: str) -> bool:
+        """True if the entity belongs to the snapshot's module."""
+        i = self.index.get(entity_id)
+        return i is not None and bool(self.in_module[i])
+
+    def _confidence(self, slot: int) -> Optional[float]:
+        value = self.confidences[slot]
+        return None if np.isnan(value) else float(value)
+
+    def _sort_confidence(self, slot: int) -> float:
+        """Descending sort key matching Neo4j, where null sorts above any value."""
+        value = self.confidences[slot]
+        return float("inf") if np.isnan(value) else float(value)
+
+    def _relationship_type(self, slot: int) -> str:
+        return str(self.relationship_types[self.edge_types[slot]])
+
+    def _entity_type(self, node: int) -> str:
+        return str(self.type_names[self.types[node]]) or None
+
+    def _type_mask(self, relationship_types: Optional[Sequence[str]]) -> Optional[np.ndarray]:
+        """Boolean mask over relationship type codes, or None for all types."""
+        if relationship_types is None:
+            return None
+        return np.isin(self.relationship_types, list(relationship_types))
+
+    def _slots(
+        self,
+        node: int,
+        type_mask: Optional[np.ndarray] = None,
+        direction: str = "both",
+    ) -> np.ndarray:
+        """CSR slots of the node's relationships passing the filters."""
+        slots = np.arange(self.indptr[node], self.indptr[node + 1])
+        if type_mask is not None:
+            slots = slots[type_mask[self.edge_types[slots]]]
+        if direction == "outgoing":
+            slots = slots[self.outgoing[slots]]
+        elif direction == "incoming":
+            slots = slots[~self.outgoing[slots]]
+        return slots
+
+    def _allowed(self, node: int, module_ids: Optional[Set[str]]) -> bool:
+        if module_ids is None:
+            return True
+        module_id = self.module_ids[node]
+        return module_id is None or module_id in module_ids
+
+    # ------------------------------------------------------------------
+    # Traversals
+    # ------------------------------------------------------------------
+
+    def neighbors(
+        self,
+        entity_id: str,
+        relationship_types: Optional[Sequence[str]] = None,
+        direction: str = "both",
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        1-hop neighbours of an entity, strongest relationships first.
+
+        Args:
+            entity_id: Entity ID
+            relationship_types: Relationship types to follow (default: all)
+            direction: "outgoing", "incoming" or "both"
+            limit: Maximum neighbours
+
+        Returns:
+            Rows shaped like GraphManager's neighbor query projection
+        """
+        node = self.index[entity_id]
+        slots = self._slots(node, self._type_mask(relationship_types), direction)
+        # NaN (null) confidences sort first, as in ORDER BY r.confidence DESC
+        slots = slots[np.argsort(-np.nan_to_num(self.confidences[slots], nan=np.inf),
+                                 kind="stable")][:limit]
+
+        return [
+            {
+                "id": self.ids[n],
+                "name": self.names[n],
+                "entity_type": self._entity_type(n),
+                "definition": self.definitions[n],
+                "module_id": self.module_ids[n],
+                "relationship_type": self._relationship_type(slot),
+                "rel_confidence": self._confidence(slot),
+                "is_outgoing": bool(self.outgoing[slot]),
+            }
+            for slot, n in zip(slots.tolist(), self.indices[slots].tolist())
+        ]
+
+    def expand(
+        self,
+        entity_ids: Sequence[str],
+        hop_depth: int,
+        module_ids: Optional[Set[str]] = None,
+        limit: int = 20,
+        relationship_types: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Outgoing multi-hop expansion from seed entities.
+
+        Mirrors the expansion Cypher: one row per path start-...->target of
+        length 1..hop_depth following outgoing relationships, with every
+        target entity inside module_ids (or unassigned), targets beyond the
+        first hop excluded if they are seeds, ordered by hops then confidence
+        of the last relationship (nulls first). As in the 2-hop Cypher,
+        intermediate entities are not module-filtered; the snapshot only holds
+        their relationships that touch its module.
+
+        Args:
+            entity_ids: Seed entity IDs
+            hop_depth: Maximum path length
+            module_ids: Allowed module IDs (None allows all)
+            limit: Maximum rows
+            relationship_types: Relationship types to follow (None allows all)
+
+        Returns:
+            Rows with source_id, source, target, target_id, definition,
+            entity_type, module_id, relationship_type, confidence and hops
+        """
+        seeds = [self.index[e] for e in entity_ids if e in self.index]
+        seed_set = set(seeds)
+        type_mask = self._type_mask(relationship_types)
+        records: List[Tuple[int, float, Dict[str, Any]]] = []
+
+        # Frontier of (seed, node) pairs; one entry per distinct path
+        frontier: List[Tuple[int, int]] = [(s, s) for s in seeds]
+        for hops in range(1, hop_depth + 1):
+            next_frontier: List[Tuple[int, int]] = []
+            for seed, node in frontier:
+                for slot in self._slots(node, type_mask, direction="outgoing").tolist():
+                    target = int(self.indices[slot])
+                    if hops > 1 and target in seed_set:
+                        continue
+                    next_frontier.append((seed, target))
+                    if not self._allowed(target, module_ids):
+                        continue
+                    confidence = self._confidence(slot)
+                    records.append((
+                        hops,
+                        self._sort_confidence(slot),
+                        {
+                            "source_id": self.ids[seed],
+                            "source": self.names[seed],
+                            "target": self.names[target],
+                            "target_id": self.ids[target],
+                            "definition": self.definitions[target],
+                            "entity_type": self._entity_type(target),
+                            "module_id": self.module_ids[target],
+                            "relationship_type": self._relationship_type(slot),
+                            "confidence": confidence,
+                            "hops": hops,
+                        },
+                    ))
+            frontier = next_frontier
+
+        records.sort(key=lambda r: (r[0], -r[1]))
+        return [record for _, _, record in records[:limit]]
+
+    def _paths(
+        self, node: int, depth: int, used: frozenset
+    ) -> Iterator[Tuple[int, Tuple[Tuple[int, int], ...]]]:
+        """
+        Undirected paths of 1..depth hops from node, depth first.
+
+        Like Cypher variable-length patterns, a path never reuses a
+        relationship (nodes may repeat).
+
+        Yields:
+            (end node, ((from node, slot), ...) along the path)
+        """
+        start, end = self.indptr[node], self.indptr[node + 1]
+        for slot, other in zip(range(start, end), self.indices[start:end].tolist()):
+            edge_id = int(self.edge_ids[slot])
+            if edge_id in used:
+                continue
+            step = ((node, slot),)
+            yield other, step
+            if depth > 1:
+                for path_end, rest in self._paths(other, depth - 1, used | {edge_id}):
+                    yield path_end, step + rest
+
+    def subgraph(
+        self,
+        entity_ids: Sequence[str],
+        depth: int,
+        module_ids: Optional[Set[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Nodes and relationships on paths of 1..depth hops from the seeds.
+
+        Mirrors the subgraph Cypher: only a path's end node is checked
+        against module_ids, and each seed contributes at most
+        SUBGRAPH_PATHS_PER_SEED paths. When a seed has more, which paths are
+        kept follows CSR order here and Neo4j's (unspecified) order there.
+
+        Args:
+            entity_ids: Seed entity IDs
+            depth: Maximum hops
+            module_ids: Allowed module IDs for path end nodes (None allows all)
+
+        Returns:
+            (nodes, edges) shaped like the subgraph Cypher projection
+        """
+        reached: Dict[int, None] = {}
+        slots: Dict[int, Tuple[int, int]] = {}
+        for seed in (self.index[e] for e in entity_ids if e in self.index):
+            paths = (
+                steps for end, steps in self._paths(seed, depth, frozenset())
+                if self._allowed(end, module_ids)
+            )
+            for steps in islice(paths, SUBGRAPH_PATHS_PER_SEED):
+                reached.setdefault(seed)
+                for node, slot in steps:
+                    reached.setdefault(int(self.indices[slot]))
+                    slots.setdefault(int(self.edge_ids[slot]), (node, slot))
+
+        nodes = [
+            {
+                "id": self.ids[n],
+                "name": self.names[n],
+                "type": self._entity_type(n),
+                "definition": self.definitions[n],
+                "module_id": self.module_ids[n],
+            }
+            for n in reached
+        ]
+        edges = []
+        for node, slot in slots.values():
+            other = int(self.indices[slot])
+            source, target = (node, other) if self.outgoing[slot] else (other, node)
+            edges.append({
+                "source": self.ids[source],
+                "target": self.ids[target],
+                "type": self._relationship_type(slot),
+                "confidence": self._confidence(slot),
+            })
+        return nodes, edges
+
+    def shortest_path(
+        self, source_id: str, target_id: str, max_hops: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        One shortest undirected path between two entities.
+
+        Only paths of up to SNAPSHOT_EXACT_PATH_HOPS are answered; a longer
+        entity path could be beaten by a detour through Chunk or Document
+        nodes, which the Cypher path search also follows.
+
+        Args:
+            source_id: Start entity ID
+            target_id: End entity ID
+            max_hops: Maximum path length
+
+        Returns:
+            One row per relationship along the path (relationship_type,
+            confidence), or None if the snapshot cannot answer exactly (the
+            caller then asks Neo4j)
+        """
+        source, target = self.index.get(source_id), self.index.get(target_id)
+        if source is None or target is None or source == target:
+            return None
+        max_hops = min(max_hops, SNAPSHOT_EXACT_PATH_HOPS)
+
+        parent_slot = {source: -1}
+        queue = deque([(source, 0)])
+        while queue:
+            node, level = queue.popleft()
+            if level == max_hops:
+                continue
+            start, end = self.indptr[node], self.indptr[node + 1]
+            for slot, other in zip(range(start, end), self.indices[start:end].tolist()):
+                if other in parent_slot:
+                    continue
+                parent_slot[other] = slot
+                if other == target:
+                    queue.clear()
+                    break
+                queue.append((other, level + 1))
+
+        if target not in parent_slot:
+            return None
+
+        # Walk back from the target; the CSR row of each slot is its parent
+        path: List[int] = []
+        node = target
+        while node != source:
+            slot = parent_slot[node]
+            path.append(slot)
+            node = int(np.searchsorted(self.indptr, slot, side="right") - 1)
+        path.reverse()
+
+        return [
+            {
+                "relationship_type": self._relationship_type(slot),
+                "confidence": self._confidence(slot),
+            }
+            for slot in path
+        ]
+
+
+# ============================================================================
+# SNAPSHOT CACHE
+# ============================================================================
+
+
+class GraphSnapshotCache:
+    """
+    Memory-bounded LRU of module snapshots, validated against module versions.
+
+    A snapshot is served only while its version matches the module's current
+    graph version; without version tracking (cache unavailable) snapshots
+    are never used, since staleness could not be detected.
+    """
+
+    def __init__(self, max_bytes: int = GRAPH_SNAPSHOT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Approximate memory budget across all snapshots
+        """
+        self.max_bytes = max_bytes
+        self._snapshots: "OrderedDict[str, ModuleGraphSnapshot]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def _insert(self, snapshot: ModuleGraphSnapshot) -> None:
+        self._discard(snapshot.module_id)
+        if snapshot.nbytes > self.max_bytes:
+            logger.info(
+                f"Graph snapshot of {snapshot.module_id} ({snapshot.nbytes} bytes) "
+                f"exceeds the {self.max_bytes} byte budget; not cached"
+            )
+            return
+        self._snapshots[snapshot.module_id] = snapshot
+        self.total_bytes += snapshot.nbytes
+        while self.total_bytes > self.max_bytes:
+            evicted_id, _ = next(iter(self._snapshots.items()))
+            self._discard(evicted_id)
+            logger.debug(f"Evicted graph snapshot of {evicted_id}")
+
+    def _discard(self, module_id: str) -> None:
+        snapshot = self._snapshots.pop(module_id, None)
+        if snapshot is not None:
+            self.total_bytes -= snapshot.nbytes
+
+    async def get(self, module_id: str, graph_manager) -> Optional[ModuleGraphSnapshot]:
+        """
+        Get the current snapshot of a module, building it if stale or missing.
+
+        Concurrent callers for the same module share a single build.
+
+        Args:
+            module_id: Module identifier
+            graph_manager: GraphManager whose run_query loads the snapshot
+
+        Returns:
+            Snapshot, or None if versions are unavailable or loading failed
+        """
+        version = get_module_version(module_id)
+        if version is None:
+            return None
+
+        snapshot = self._snapshots.get(module_id)
+        if snapshot is not None and snapshot.version == version:
+            self._snapshots.move_to_end(module_id)
+            return snapshot
+
+        lock = self._locks.setdefault(module_id, asyncio.Lock())
+        async with lock:
+            snapshot = self._snapshots.get(module_id)
+            if snapshot is not None and snapshot.version == version:
+                self._snapshots.move_to_end(module_id)
+                return snapshot
+
+            try:
+                params = {"module_id": module_id}
+                entities = await graph_manager.run_query(SNAPSHOT_ENTITIES_QUERY, params)
+                edges = await graph_manager.run_query(SNAPSHOT_EDGES_QUERY, params)
+                snapshot = ModuleGraphSnapshot(module_id, version, entities, edges)
+            except Exception as e:
+                logger.warning(f"Failed to build graph snapshot of {module_id}: {e}")
+                return None
+
+            self._insert(snapshot)
+            logger.info(
+                f"Built graph snapshot of {module_id} v{version}: "
+                f"{len(snapshot.ids)} entities, {snapshot.edge_count} relationships, "
+                f"{snapshot.nbytes} bytes"
+            )
+            return snapshot
+
+
+_snapshot_cache: Optional[GraphSnapshotCache] = None
+
+
+def get_snapshot_cache() -> Optional[GraphSnapshotCache]:
+    """Process-wide snapshot cache, or None if GRAPH_SNAPSHOT_ENABLED is off."""
+    global _snapshot_cache
+    if not GRAPH_SNAPSHOT_ENABLED:
+        return None
+    if _snapshot_cache is None:
+        _snapshot_cache = GraphSnapshotCache()
+    return _snapshot_cache
@@ -17,11 +17,17 @@ KEY COMPONENTS:
     - LayoutType: Enum of available layout algorithms (force-directed, hierarchical, radial, circular)
     - ExportFormat: Enum of export formats (JSON, GraphML, GEXF, CSV)
     - GraphOptions: Filtering and layout options for graph generation
+    - node_projection: Cypher map projection returning display properties only
+    - force_directed_layout: Vectorized spring-electric layout (Barnes-Hut for
+      large graphs) with a pure-Python fallback
+    - LayoutCache: LRU + Redis cache of layouts used for reuse and warm starts
+    - GraphVisualizer.stream_export: Paged, constant-memory GraphML/GEXF/CSV export
     - get_graph_visualizer: FastAPI dependency injection helper
 
 DEPENDENCIES:
-    - External: pydantic, fastapi
-    - Internal: api/graph_manager.py, api/neo4j_config.py
+    - External: pydantic, fastapi, numpy (optional, for layouts)
+    - Internal: api/graph_manager.py, api/neo4j_config.py, api/cache.py,
+      api/graph_cache.py
 
 USAGE:
     visualizer = GraphVisualizer(graph_manager)
@@ -32,17 +38,28 @@ USAGE:
 
 from __future__ import annotations
 
-import io
+import asyncio
+import hashlib
 import json
 import math
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from enum import Enum
-from typing import List, Dict, Any, Optional, Tuple, Set
-from xml.etree import ElementTree as ET
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple, Set
+from xml.sax.saxutils import escape, quoteattr
 
 from pydantic import BaseModel, Field
 
+from api.graph_cache import (
+    get_cached_response,
+    get_module_version,
+    response_cache_key,
+    set_cached_response,
+)
+
 
 # ============================================================================
 # LOGGING
@@ -103,6 +120,27 @@ RELATIONSHIP_COLORS: Dict[str, str] = {
 }
 
 
+# Entities rendered by get_module_graph (most mentioned first). Larger modules
+# are browsed through the level-of-detail API (api/graph_lod.py) instead.
+MODULE_GRAPH_MAX_ENTITIES = 200
+
+# Entities fetched per Neo4j round trip by the streaming export
+EXPORT_PAGE_SIZE = 1000
+
+# Layout cache: computed positions keyed by graph content, layout and size
+CACHE_PREFIX_LAYOUT = "graph:layout"
+LAYOUT_CACHE_TTL_SECONDS = 24 * 60 * 60
+LAYOUT_CACHE_MAX_ENTRIES = 256
+
+# Display properties projected for each node kind. Anything else (notably the
+# 768-float embedding and raw chunk text) stays in Neo4j unless the caller
+# opts in via GraphOptions.node_properties.
+MODULE_DISPLAY_PROPERTIES: List[str] = ["description"]
+DOCUMENT_DISPLAY_PROPERTIES: List[str] = ["module_id", "chunk_count", "updated_at"]
+CHUNK_DISPLAY_PROPERTIES: List[str] = ["index", "token_count", "chunk_labels"]
+ENTITY_DISPLAY_PROPERTIES: List[str] = ["definition", "confidence", "mention_count"]
+
+
 # ============================================================================
 # ENUMS
 # ============================================================================
@@ -161,6 +199,10 @@ class GraphOptions(BaseModel):
     group_by: Optional[str] = Field(
         None, description="Grouping attribute: 'type', 'module', 'document'"
     )
+    node_properties: Optional[List[str]] = Field(
+        None,
+        description="Extra node properties to return on top of the display set",
+    )
 
 
 class VisualizationNode(BaseModel):
@@ -200,6 +242,11 @@ class GraphMetadata(BaseModel):
     relationship_type_counts: Dict[str, int] = Field(default_factory=dict)
     generated_at: datetime = Field(default_factory=datetime.utcnow)
     options_used: Optional[GraphOptions] = None
+    layout_cache_hit: bool = False
+    layout_warm_started: bool = False
+    layout_time_ms: float = 0.0
+    layout_cache_hit_rate: Optional[float] = None
+    truncated: bool = False
 
     class Config:
         json_encoders = {datetime: lambda v: v.isoformat()}
@@ -218,59 +265,187 @@ class VisualizationGraph(BaseModel):
 
 
 # ============================================================================
-# LAYOUT ALGORITHMS
+# PROPERTY PROJECTION
 # ============================================================================
 
 
-def force_directed_layout(
-    nodes: List[VisualizationNode],
-    edges: List[VisualizationEdge],
-    width: float = 1000,
-    height: float = 800,
-    iterations: int = 100,
-) -> List[VisualizationNode]:
+def resolve_property_fields(
+    defaults: List[str], extra: Optional[List[str]] = None
+) -> List[str]:
     """
-    Apply force-directed layout to nodes.
+    Merge a default display property list with an opt-in field list.
 
-    Uses simple spring-electric model:
-    - Nodes repel each other (Coulomb's law)
-    - Edges attract connected nodes (spring force)
+    Args:
+        defaults: Display properties always returned for the node kind
+        extra: Additional property names requested by the caller
+
+    Returns:
+        Ordered, de-duplicated list of property names
     """
-    if not nodes:
-        return nodes
+    fields = list(defaults)
+    for name in extra or []:
+        if name and name not in fields:
+            fields.append(name)
+    return fields
+
+
+def node_projection(var: str, fields_param: str) -> str:
+    """
+    Build a Cypher map projection returning only display data for a node.
+
+    Property values are looked up dynamically from the $fields_param list,
+    so the query text stays constant and field names are never interpolated.
+
+    Args:
+        var: Cypher variable bound to the node
+        fields_param: Name of the query parameter holding property names
+
+    Returns:
+        Cypher map expression with id, name, labels and props
+    """
+    return (
+        f"{{id: {var}.id, name: coalesce({var}.name, {var}.title), "
+        f"labels: labels({var}), props: [k IN ${fields_param} | {var}[k]]}}"
+    )
+
+
+def _projected_properties(fields: List[str], row: Dict[str, Any]) -> Dict[str, Any]:
+    """Zip projected property values back onto their names, dropping nulls."""
+    return {
+        name: value
+        for name, value in zip(fields, row.get("props") or [])
+        if value is not None
+    }
 
-    MAX_FORCE_DIRECTED_NODES = 500
-    if len(nodes) > MAX_FORCE_DIRECTED_NODES:
-        logger.warning(
-            f"Force-directed layout requested for {len(nodes)} nodes "
-            f"(max recommended: {MAX_FORCE_DIRECTED_NODES}). "
-            f"Consider using circular layout for better performance."
-        )
 
-    # Initialize positions in a circle
+def _projected_type(row: Dict[str, Any], default: str) -> str:
+    """Pick the display type from a projected node's labels."""
+    labels = row.get("labels") or []
+    for label in labels:
+        if label in ENTITY_COLORS:
+            return label
+    return labels[0] if labels else default
+
+
+# ============================================================================
+# LAYOUT ALGORITHMS
+# ============================================================================
+
+
+# Force simulation parameters (shared by all force-directed implementations)
+FORCE_REPULSION = 8000.0
+FORCE_ATTRACTION = 0.03
+FORCE_DAMPING = 0.9
+
+# Per-step displacement cap as a fraction of the canvas, cooled every step.
+# Small graphs never reach it; large graphs would otherwise fling nodes
+# from wall to wall and never settle.
+LAYOUT_INITIAL_TEMPERATURE = 0.1
+LAYOUT_COOLING = 0.9
+
+# Stop iterating once no node moves more than this many pixels in a step
+LAYOUT_CONVERGENCE_TOLERANCE = 0.5
+
+# Graphs at or above this size use the Barnes-Hut approximation
+BARNES_HUT_MIN_NODES = 400
+
+# Target average number of nodes per Barnes-Hut quadtree leaf
+BARNES_HUT_LEAF_SIZE = 4.0
+
+# Seed for the symmetry-breaking jitter so layouts are reproducible
+DEFAULT_LAYOUT_SEED = 42
+
+# Warm-started relayouts begin cool and run far fewer steps
+LAYOUT_WARM_TEMPERATURE = 0.005
+WARM_START_ITERATIONS = 20
+
+# Fraction of nodes that must keep a cached position to warm-start
+WARM_START_MIN_OVERLAP = 0.5
+
+
+def _initial_circle_positions(
+    count: int, width: float, height: float
+) -> List[Tuple[float, float]]:
+    """Place count nodes evenly on a circle centred in the canvas."""
     center_x = width / 2
     center_y = height / 2
     radius = min(width, height) * 0.35
-
-    positions: Dict[str, Tuple[float, float]] = {}
-    for i, node in enumerate(nodes):
-        angle = (2 * math.pi * i) / len(nodes)
-        positions[node.id] = (
-            center_x + radius * math.cos(angle),
-            center_y + radius * math.sin(angle),
+    return [
+        (
+            center_x + radius * math.cos((2 * math.pi * i) / count),
+            center_y + radius * math.sin((2 * math.pi * i) / count),
         )
+        for i in range(count)
+    ]
+
+
+def _seed_positions(
+    nodes: List[VisualizationNode],
+    edges: List[VisualizationEdge],
+    width: float,
+    height: float,
+    initial_positions: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> List[Tuple[float, float]]:
+    """
+    Starting positions for a force-directed run.
 
-    # Build adjacency for edge lookup
-    edge_map: Dict[str, Set[str]] = {n.id: set() for n in nodes}
+    Without initial positions every node starts on a circle. When warm
+    starting, surviving nodes keep their previous position and new nodes
+    start at the centroid of their already-placed neighbours (or on the
+    circle if they have none).
+    """
+    circle = _initial_circle_positions(len(nodes), width, height)
+    if not initial_positions:
+        return circle
+
+    sums: Dict[str, List[float]] = {}
     for edge in edges:
-        if edge.source in edge_map and edge.target in edge_map:
-            edge_map[edge.source].add(edge.target)
-            edge_map[edge.target].add(edge.source)
+        for node_id, other_id in ((edge.source, edge.target), (edge.target, edge.source)):
+            other = initial_positions.get(other_id)
+            if other is not None and node_id not in initial_positions:
+                acc = sums.setdefault(node_id, [0.0, 0.0, 0.0])
+                acc[0] += other[0]
+                acc[1] += other[1]
+                acc[2] += 1
+
+    seeded = []
+    for node, fallback in zip(nodes, circle):
+        if node.id in initial_positions:
+            x, y = initial_positions[node.id]
+            seeded.append((float(x), float(y)))
+        elif node.id in sums:
+            acc = sums[node.id]
+            seeded.append((acc[0] / acc[2], acc[1] / acc[2]))
+        else:
+            seeded.append(fallback)
+    return seeded
 
-    # Force simulation parameters
-    repulsion = 8000
-    attraction = 0.03
-    damping = 0.9
+
+def _force_directed_layout_python(
+    nodes: List[VisualizationNode],
+    edges: List[VisualizationEdge],
+    width: float,
+    height: float,
+    iterations: int,
+    initial_positions: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> List[VisualizationNode]:
+    """Pure-Python spring-electric layout, used when numpy is unavailable."""
+    if len(nodes) > BARNES_HUT_MIN_NODES:
+        logger.warning(
+            f"Force-directed layout requested for {len(nodes)} nodes without "
+            f"numpy (max recommended: {BARNES_HUT_MIN_NODES}). "
+            f"Consider using circular layout for better performance."
+        )
+
+    positions: Dict[str, Tuple[float, float]] = dict(
+        zip(
+            (n.id for n in nodes),
+            _seed_positions(nodes, edges, width, height, initial_positions),
+        )
+    )
+    temperature = min(width, height) * (
+        LAYOUT_WARM_TEMPERATURE if initial_positions else LAYOUT_INITIAL_TEMPERATURE
+    )
 
     for _ in range(iterations):
         forces: Dict[str, Tuple[float, float]] = {n.id: (0.0, 0.0) for n in nodes}
@@ -285,7 +460,7 @@ def force_directed_layout(
                 dy = pos_a[1] - pos_b[1]
                 dist = math.sqrt(dx * dx + dy * dy) or 0.1
 
-                force = repulsion / (dist * dist)
+                force = FORCE_REPULSION / (dist * dist)
                 fx = (dx / dist) * force
                 fy = (dy / dist) * force
 
@@ -310,7 +485,7 @@ def force_directed_layout(
             dy = pos_b[1] - pos_a[1]
             dist = math.sqrt(dx * dx + dy * dy) or 0.1
 
-            force = dist * attraction * edge.weight
+            force = dist * FORCE_ATTRACTION * edge.weight
             fx = (dx / dist) * force
             fy = (dy / dist) * force
 
@@ -323,29 +498,280 @@ def force_directed_layout(
                 forces[edge.target][1] - fy,
             )
 
-        # Apply forces with damping
+        # Apply forces with damping, capped by the current temperature
+        max_step = 0.0
         for node in nodes:
             pos = positions[node.id]
-            force = forces[node.id]
-
-            new_x = pos[0] + force[0] * damping
-            new_y = pos[1] + force[1] * damping
+            step_x = forces[node.id][0] * FORCE_DAMPING
+            step_y = forces[node.id][1] * FORCE_DAMPING
+            length = math.sqrt(step_x * step_x + step_y * step_y)
+            if length > temperature:
+                step_x *= temperature / length
+                step_y *= temperature / length
 
             # Keep within bounds
-            new_x = max(50, min(width - 50, new_x))
-            new_y = max(50, min(height - 50, new_y))
+            new_x = max(50, min(width - 50, pos[0] + step_x))
+            new_y = max(50, min(height - 50, pos[1] + step_y))
 
+            max_step = max(max_step, abs(new_x - pos[0]), abs(new_y - pos[1]))
             positions[node.id] = (new_x, new_y)
 
+        temperature *= LAYOUT_COOLING
+        if max_step < LAYOUT_CONVERGENCE_TOLERANCE:
+            break
+
     # Apply positions to nodes
     for node in nodes:
-        pos = positions[node.id]
-        node.x = pos[0]
-        node.y = pos[1]
+        node.x, node.y = positions[node.id]
+
+    return nodes
+
+
+def _exact_repulsion(np, pos):
+    """All-pairs Coulomb repulsion, O(n^2) but fully vectorized."""
+    delta_x = pos[:, 0][:, None] - pos[:, 0][None, :]
+    delta_y = pos[:, 1][:, None] - pos[:, 1][None, :]
+    dist2 = np.maximum(delta_x * delta_x + delta_y * delta_y, 0.01)
+    scale = FORCE_REPULSION / (dist2 * np.sqrt(dist2))
+    return np.stack(
+        [(delta_x * scale).sum(axis=1), (delta_y * scale).sum(axis=1)], axis=1
+    )
+
+
+def _barnes_hut_offsets(np):
+    """
+    Relative cell offsets of the Barnes-Hut interaction list, per parity.
+
+    A cell's interaction list is the children of its parent's 3x3
+    neighbourhood that are not adjacent to the cell itself. Relative to the
+    cell that set depends only on whether its x/y index is even or odd, so
+    it is tabulated once as a (4, 27) pair of offset arrays.
+    """
+    off_x, off_y = [], []
+    for parity_x in (0, 1):
+        for parity_y in (0, 1):
+            pairs = [
+                (dx - parity_x, dy - parity_y)
+                for dx in range(-2, 4)
+                for dy in range(-2, 4)
+                if abs(dx - parity_x) > 1 or abs(dy - parity_y) > 1
+            ]
+            off_x.append([p[0] for p in pairs])
+            off_y.append([p[1] for p in pairs])
+    return np.array(off_x), np.array(off_y)
+
+
+def _barnes_hut_repulsion(np, pos):
+    """
+    Approximate repulsion with a level-wise Barnes-Hut quadtree.
+
+    The bounding square is split into a complete quadtree whose leaves hold
+    a handful of nodes on average. At every level a node interacts with the
+    mass and centre of mass of the cells that are well separated from it
+    (children of its parent's neighbours that are not its own neighbours),
+    and only leaf-level neighbours are summed exactly. Every pair is counted
+    exactly once, and each level is a few flat array operations instead of
+    a pointer-chasing tree walk.
+    """
+    n = len(pos)
+    depth = max(2, int(math.ceil(math.log(max(n / BARNES_HUT_LEAF_SIZE, 1.0), 4))))
+    grid = 1 << depth
+
+    x = np.ascontiguousarray(pos[:, 0])
+    y = np.ascontiguousarray(pos[:, 1])
+    origin_x = x.min()
+    origin_y = y.min()
+    extent = float(max(x.max() - origin_x, y.max() - origin_y)) or 1.0
+    leaf_x = np.minimum((x - origin_x) / extent * grid, grid - 1).astype(np.int64)
+    leaf_y = np.minimum((y - origin_y) / extent * grid, grid - 1).astype(np.int64)
+
+    force_x = np.zeros(n)
+    force_y = np.zeros(n)
+
+    def accumulate(node, source_x, source_y, mass):
+        delta_x = x[node] - source_x
+        delta_y = y[node] - source_y
+        dist2 = np.maximum(delta_x * delta_x + delta_y * delta_y, 0.01)
+        scale = FORCE_REPULSION * mass / (dist2 * np.sqrt(dist2))
+        force_x[:] += np.bincount(node, weights=delta_x * scale, minlength=n)
+        force_y[:] += np.bincount(node, weights=delta_y * scale, minlength=n)
+
+    rel_x, rel_y = _barnes_hut_offsets(np)
+
+    # Far field: well-separated cells at each level, largest first
+    for level in range(2, depth + 1):
+        size = 1 << level
+        cx = leaf_x >> (depth - level)
+        cy = leaf_y >> (depth - level)
+        flat = cx * size + cy
+
+        mass = np.bincount(flat, minlength=size * size).astype(float)
+        occupied = np.maximum(mass, 1.0)
+        com_x = np.bincount(flat, weights=x, minlength=size * size) / occupied
+        com_y = np.bincount(flat, weights=y, minlength=size * size) / occupied
+
+        parity = (cx & 1) * 2 + (cy & 1)
+        tx = cx[:, None] + rel_x[parity]
+        ty = cy[:, None] + rel_y[parity]
+        node, slot = np.nonzero((tx >= 0) & (tx < size) & (ty >= 0) & (ty < size))
+        target = tx[node, slot] * size + ty[node, slot]
+        weight = mass[target]
+        keep = weight > 0
+
+        accumulate(node[keep], com_x[target[keep]], com_y[target[keep]], weight[keep])
+
+    # Near field: exact interactions with nodes in the 3x3 leaf neighbourhood,
+    # expanded into an explicit (i, j) pair list so cost tracks real pairs
+    flat = leaf_x * grid + leaf_y
+    order = np.argsort(flat, kind="stable")
+    counts = np.bincount(flat, minlength=grid * grid)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    pair_i, pair_j = [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            nx = leaf_x + dx
+            ny = leaf_y + dy
+            inside = np.flatnonzero((nx >= 0) & (nx < grid) & (ny >= 0) & (ny < grid))
+            neighbour_cell = nx[inside] * grid + ny[inside]
+            reps = counts[neighbour_cell]
+            total = int(reps.sum())
+            if not total:
+                continue
+            first = np.repeat(starts[neighbour_cell], reps)
+            within = np.arange(total) - np.repeat(np.cumsum(reps) - reps, reps)
+            pair_i.append(np.repeat(inside, reps))
+            pair_j.append(order[first + within])
+
+    node = np.concatenate(pair_i)
+    other = np.concatenate(pair_j)
+    keep = node != other
+    accumulate(node[keep], x[other[keep]], y[other[keep]], 1.0)
+
+    return np.stack([force_x, force_y], axis=1)
+
+
+def _force_directed_layout_numpy(
+    np,
+    nodes: List[VisualizationNode],
+    edges: List[VisualizationEdge],
+    width: float,
+    height: float,
+    iterations: int,
+    seed: int,
+    initial_positions: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> List[VisualizationNode]:
+    """Vectorized spring-electric layout with Barnes-Hut for large graphs."""
+    index = {node.id: i for i, node in enumerate(nodes)}
+    pos = np.array(_seed_positions(nodes, edges, width, height, initial_positions))
+
+    # Tiny seeded jitter breaks symmetry without changing the overall shape
+    rng = np.random.default_rng(seed)
+    pos += rng.uniform(-0.5, 0.5, size=pos.shape)
+
+    edge_pairs = [
+        (index[e.source], index[e.target], e.weight)
+        for e in edges
+        if e.source in index and e.target in index
+    ]
+    if edge_pairs:
+        src, dst, weights = (np.array(col) for col in zip(*edge_pairs))
+        src = src.astype(np.int64)
+        dst = dst.astype(np.int64)
+    else:
+        src = dst = np.zeros(0, dtype=np.int64)
+        weights = np.zeros(0)
+
+    repulsion = (
+        _barnes_hut_repulsion if len(nodes) >= BARNES_HUT_MIN_NODES else _exact_repulsion
+    )
+
+    temperature = min(width, height) * (
+        LAYOUT_WARM_TEMPERATURE if initial_positions else LAYOUT_INITIAL_TEMPERATURE
+    )
+
+    for _ in range(iterations):
+        forces = repulsion(np, pos)
+
+        # Attraction along edges (spring force proportional to distance)
+        pull = (pos[dst] - pos[src]) * (FORCE_ATTRACTION * weights)[:, None]
+        np.add.at(forces, src, pull)
+        np.add.at(forces, dst, -pull)
+
+        step = forces * FORCE_DAMPING
+        length = np.sqrt((step * step).sum(axis=1))
+        step *= np.minimum(1.0, temperature / np.maximum(length, 1e-9))[:, None]
+        temperature *= LAYOUT_COOLING
+
+        new_pos = pos + step
+        np.clip(new_pos[:, 0], 50, width - 50, out=new_pos[:, 0])
+        np.clip(new_pos[:, 1], 50, height - 50, out=new_pos[:, 1])
+
+        max_step = float(np.abs(new_pos - pos).max())
+        pos = new_pos
+        if max_step < LAYOUT_CONVERGENCE_TOLERANCE:
+            break
+
+    for node, (x, y) in zip(nodes, pos.tolist()):
+        node.x = x
+        node.y = y
 
     return nodes
 
 
+def force_directed_layout(
+    nodes: List[VisualizationNode],
+    edges: List[VisualizationEdge],
+    width: float = 1000,
+    height: float = 800,
+    iterations: int = 100,
+    seed: int = DEFAULT_LAYOUT_SEED,
+    initial_positions: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> List[VisualizationNode]:
+    """
+    Apply force-directed layout to nodes.
+
+    Uses simple spring-electric model:
+    - Nodes repel each other (Coulomb's law)
+    - Edges attract connected nodes (spring force)
+
+    With numpy available the simulation is vectorized, and graphs of
+    BARNES_HUT_MIN_NODES or more use a Barnes-Hut quadtree approximation
+    for repulsion. Per-step movement is capped by a cooling temperature and
+    iteration stops early once no node moves more than
+    LAYOUT_CONVERGENCE_TOLERANCE pixels.
+
+    Passing initial_positions warm-starts the simulation from a previous
+    layout: known nodes keep their positions, new nodes start next to their
+    neighbours, and the temperature starts low so the layout only settles.
+
+    Args:
+        nodes: Nodes to position
+        edges: Edges between nodes
+        width: Canvas width
+        height: Canvas height
+        iterations: Maximum number of simulation steps
+        seed: Seed for the symmetry-breaking jitter
+        initial_positions: Optional previous positions keyed by node id
+
+    Returns:
+        Nodes with x/y positions applied
+    """
+    if not nodes:
+        return nodes
+
+    try:
+        import numpy as np
+    except ImportError:
+        return _force_directed_layout_python(
+            nodes, edges, width, height, iterations, initial_positions
+        )
+
+    return _force_directed_layout_numpy(
+        np, nodes, edges, width, height, iterations, seed, initial_positions
+    )
+
+
 def hierarchical_layout(
     nodes: List[VisualizationNode],
     edges: List[VisualizationEdge],
@@ -505,6 +931,353 @@ def circular_layout(
     return nodes
 
 
+# ============================================================================
+# EXPORT QUERIES
+# ============================================================================
+
+# Keyset-paginated entity page for the streaming export
+EXPORT_NODES_QUERY = """
+MATCH (e:Entity)
+WHERE e.module_id IN $module_ids
+AND (e:Topic OR e:Concept OR e:Methodology OR e:Finding OR e:Definition)
+AND e.id > $after
+WITH e
+ORDER BY e.id
+LIMIT $limit
+RETURN {id: e.id, name: e.name, labels: labels(e)} as node
+"""
+
+# Outgoing relationships of one keyset page of source entities. Sources with
+# no relationships still return a row so the cursor always advances.
+EXPORT_EDGES_QUERY = """
+MATCH (e1:Entity)
+WHERE e1.module_id IN $module_ids
+AND (e1:Topic OR e1:Concept OR e1:Methodology OR e1:Finding OR e1:Definition)
+AND e1.id > $after
+WITH e1
+ORDER BY e1.id
+LIMIT $limit
+OPTIONAL MATCH (e1)-[r]->(e2:Entity)
+WHERE e2.module_id IN $module_ids
+AND (e2:Topic OR e2:Concept OR e2:Methodology OR e2:Finding OR e2:Definition)
+WITH e1, collect(DISTINCT {
+    target: e2.id,
+    type: type(r),
+    weight: coalesce(r.confidence, r.weight, 1.0)
+}) as relationships
+ORDER BY e1.id
+RETURN e1.id as source, relationships
+"""
+
+
+# ============================================================================
+# EXPORT SERIALIZERS
+# ============================================================================
+
+
+class _GraphMLWriter:
+    """Incremental GraphML serializer emitting one fragment per element."""
+
+    media_type = "application/graphml+xml"
+    extension = "graphml"
+
+    NODE_KEYS = [
+        ("label", "string"),
+        ("type", "string"),
+        ("color", "string"),
+        ("size", "double"),
+        ("x", "double"),
+        ("y", "double"),
+    ]
+    EDGE_KEYS = [("type", "string"), ("weight", "double"), ("color", "string")]
+
+    def header(self) -> str:
+        keys = "".join(
+            f'<key id="{key}" for="node" attr.name="{key}" attr.type="{atype}"/>\n'
+            for key, atype in self.NODE_KEYS
+        ) + "".join(
+            f'<key id="e_{key}" for="edge" attr.name="{key}" attr.type="{atype}"/>\n'
+            for key, atype in self.EDGE_KEYS
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+            f"{keys}"
+            '<graph id="G" edgedefault="directed">\n'
+        )
+
+    def node(self, node: VisualizationNode) -> str:
+        data = "".join(
+            f'<data key="{key}">{escape(value)}</data>'
+            for key, value in [
+                ("label", node.label),
+                ("type", node.type),
+                ("color", node.color or ""),
+                ("size", str(node.size)),
+                ("x", str(node.x or 0)),
+                ("y", str(node.y or 0)),
+            ]
+        )
+        return f"<node id={quoteattr(node.id)}>{data}</node>\n"
+
+    def edges_start(self) -> str:
+        return ""
+
+    def edge(self, edge: VisualizationEdge) -> str:
+        data = "".join(
+            f'<data key="{key}">{escape(value)}</data>'
+            for key, value in [
+                ("e_type", edge.type),
+                ("e_weight", str(edge.weight)),
+                ("e_color", edge.color or ""),
+            ]
+        )
+        return (
+            f"<edge id={quoteattr(edge.id)} source={quoteattr(edge.source)} "
+            f"target={quoteattr(edge.target)}>{data}</edge>\n"
+        )
+
+    def footer(self) -> str:
+        return "</graph>\n</graphml>\n"
+
+
+class _GEXFWriter:
+    """Incremental GEXF (Gephi) serializer emitting one fragment per element."""
+
+    media_type = "application/gexf+xml"
+    extension = "gexf"
+
+    def header(self) -> str:
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<gexf xmlns="http://www.gexf.net/1.3" '
+            'xmlns:viz="http://www.gexf.net/1.3/viz" version="1.3">\n'
+            "<meta><creator>AURA Platform</creator></meta>\n"
+            '<graph mode="static" defaultedgetype="directed">\n'
+            '<attributes class="node">'
+            '<attribute id="0" title="type" type="string"/>'
+            '<attribute id="1" title="color" type="string"/>'
+            "</attributes>\n"
+            "<nodes>\n"
+        )
+
+    def node(self, node: VisualizationNode) -> str:
+        attvalues = "".join(
+            f'<attvalue for="{i}" value={quoteattr(value)}/>'
+            for i, value in enumerate([node.type, node.color or ""])
+        )
+        position = (
+            f'<viz:position x="{node.x}" y="{node.y}"/>'
+            if node.x is not None and node.y is not None
+            else ""
+        )
+        return (
+            f"<node id={quoteattr(node.id)} label={quoteattr(node.label)}>"
+            f"<attvalues>{attvalues}</attvalues>{position}</node>\n"
+        )
+
+    def edges_start(self) -> str:
+        return "</nodes>\n<edges>\n"
+
+    def edge(self, edge: VisualizationEdge) -> str:
+        return (
+            f"<edge id={quoteattr(edge.id)} source={quoteattr(edge.source)} "
+            f"target={quoteattr(edge.target)} label={quoteattr(edge.type)} "
+            f'weight="{edge.weight}"/>\n'
+        )
+
+    def footer(self) -> str:
+        return "</edges>\n</graph>\n</gexf>\n"
+
+
+class _CSVWriter:
+    """Incremental CSV serializer (nodes and edges in separate sections)."""
+
+    media_type = "text/csv"
+    extension = "csv"
+
+    @staticmethod
+    def _esc(val: str) -> str:
+        """Escape double quotes in CSV values."""
+        return val.replace('"', '""')
+
+    def header(self) -> str:
+        return "# NODES\nid,label,type,color,size,x,y\n"
+
+    def node(self, node: VisualizationNode) -> str:
+        esc = self._esc
+        return (
+            f'"{esc(node.id)}","{esc(node.label)}","{esc(node.type)}",'
+            f'"{esc(node.color or "")}",{node.size},{node.x or 0},{node.y or 0}\n'
+        )
+
+    def edges_start(self) -> str:
+        return "\n# EDGES\nsource,target,type,weight,color\n"
+
+    def edge(self, edge: VisualizationEdge) -> str:
+        esc = self._esc
+        return (
+            f'"{esc(edge.source)}","{esc(edge.target)}","{esc(edge.type)}",'
+            f'{edge.weight},"{esc(edge.color or "")}"\n'
+        )
+
+    def footer(self) -> str:
+        return ""
+
+
+# Formats that can be serialized incrementally (JSON is export_graph only)
+EXPORT_WRITERS: Dict[ExportFormat, Any] = {
+    ExportFormat.GRAPHML: _GraphMLWriter,
+    ExportFormat.GEXF: _GEXFWriter,
+    ExportFormat.CSV: _CSVWriter,
+}
+
+
+# ============================================================================
+# LAYOUT CACHE
+# ============================================================================
+
+
+def graph_content_hash(graph: VisualizationGraph) -> str:
+    """
+    Hash the structure of a graph independent of node and edge order.
+
+    Args:
+        graph: Graph whose nodes and edges define the layout input
+
+    Returns:
+        Short hex digest of node ids/types and edge endpoints/types/weights
+    """
+    digest = hashlib.sha256()
+    for node_id, node_type in sorted((n.id, n.type) for n in graph.nodes):
+        digest.update(f"n|{node_id}|{node_type}\n".encode("utf-8"))
+    for source, target, rel_type, weight in sorted(
+        (e.source, e.target, e.type, e.weight) for e in graph.edges
+    ):
+        digest.update(f"e|{source}|{target}|{rel_type}|{weight}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class LayoutCache:
+    """
+    Two-tier cache of computed node positions.
+
+    A bounded in-process LRU answers repeat requests without a network hop,
+    and Redis (when available) shares layouts across workers and restarts.
+    Values are {node_id: [x, y]} mappings.
+    """
+
+    def __init__(
+        self,
+        cache_client=None,
+        max_entries: int = LAYOUT_CACHE_MAX_ENTRIES,
+        ttl: int = LAYOUT_CACHE_TTL_SECONDS,
+    ):
+        """
+        Initialize LayoutCache.
+
+        Args:
+            cache_client: Redis cache client (optional, auto-imports if None)
+            max_entries: Maximum layouts held in the local LRU
+            ttl: Redis time-to-live in seconds
+        """
+        self._cache = cache_client
+        self._local: "OrderedDict[str, Dict[str, List[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def _get_cache(self):
+        """Get or initialize cache client."""
+        if self._cache is None:
+            try:
+                from api.cache import redis_client
+
+                self._cache = redis_client
+            except ImportError:
+                try:
+                    from cache import redis_client  # type: ignore[import-not-found]
+
+                    self._cache = redis_client
+                except ImportError:
+                    logger.debug("Cache not available")
+                    return None
+        return self._cache
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """Fraction of lookups answered from cache, or None before any."""
+        with self._lock:
+            hits, total = self.hits, self.hits + self.misses
+        return hits / total if total else None
+
+    def get(self, key: str, record: bool = True) -> Optional[Dict[str, List[float]]]:
+        """
+        Look up cached positions, promoting Redis hits into the local LRU.
+
+        Args:
+            key: Layout cache key
+            record: Count the lookup towards hit/miss statistics
+
+        Returns:
+            Positions keyed by node id, or None on a miss
+        """
+        with self._lock:
+            positions = self._local.get(key)
+            if positions is not None:
+                self._local.move_to_end(key)
+
+        if positions is None:
+            cache = self._get_cache()
+            if cache is not None:
+                try:
+                    data = cache.get(key)
+                    positions = data if isinstance(data, dict) else None
+                except Exception as e:
+                    logger.debug(f"Layout cache get failed: {e}")
+            if positions is not None:
+                self._store_local(key, positions)
+
+        if record:
+            with self._lock:
+                if positions is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+        return positions
+
+    def set(self, key: str, positions: Dict[str, List[float]]) -> None:
+        """
+        Store positions locally and in Redis.
+
+        Args:
+            key: Layout cache key
+            positions: Positions keyed by node id
+        """
+        self._store_local(key, positions)
+        cache = self._get_cache()
+        if cache is None:
+            return
+        try:
+            cache.set(key, positions, ttl=self.ttl)
+        except Exception as e:
+            logger.debug(f"Layout cache set failed: {e}")
+
+    def _store_local(self, key: str, positions: Dict[str, List[float]]) -> None:
+        """Insert into the local LRU, evicting the oldest entries."""
+        with self._lock:
+            self._local[key] = positions
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+
+# Shared across GraphVisualizer instances (one is created per request)
+_layout_cache = LayoutCache()
+
+
 # ============================================================================
 # GRAPH VISUALIZER CLASS
 # ============================================================================
@@ -525,14 +1298,16 @@ class GraphVisualizer:
         export_data = visualizer.export_graph(graph, ExportFormat.JSON)
     """
 
-    def __init__(self, graph_manager):
+    def __init__(self, graph_manager, layout_cache: Optional[LayoutCache] = None):
         """
         Initialize GraphVisualizer with a GraphManager.
 
         Args:
             graph_manager: GraphManager instance for Neo4j operations
+            layout_cache: Layout cache (defaults to the shared process cache)
         """
         self.graph_manager = graph_manager
+        self.layout_cache = layout_cache or _layout_cache
         logger.info("GraphVisualizer initialized")
 
     def _get_node_color(self, node_type: str) -> str:
@@ -617,30 +1392,63 @@ class GraphVisualizer:
         options = options or GraphOptions()  # type: ignore[call-arg]
 
         try:
-            # Query for module graph data
-            cypher = """
-            MATCH (m:Module {id: $module_id})
-            OPTIONAL MATCH (e)-[:BELONGS_TO_MODULE]->(m)
-            WHERE e:Topic OR e:Concept OR e:Methodology OR e:Finding OR e:Definition
+            # Serve from the version-stamped response cache when possible
+            version = get_module_version(module_id)
+            cache_key = None
+            if version is not None:
+                cache_key = response_cache_key(
+                    "visualizer", module_id, version, options.model_dump(mode="json")
+                )
+                cached = get_cached_response(cache_key)
+                if cached is not None:
+                    return VisualizationGraph.model_validate(cached)
+
+            module_fields = resolve_property_fields(
+                MODULE_DISPLAY_PROPERTIES, options.node_properties
+            )
+            entity_fields = resolve_property_fields(
+                ENTITY_DISPLAY_PROPERTIES, options.node_properties
+            )
+            document_fields = resolve_property_fields(
+                DOCUMENT_DISPLAY_PROPERTIES, options.node_properties
+            )
+
+            # Query for module graph data (display properties only)
+            cypher = f"""
+            MATCH (m:Module {{id: $module_id}})
+            OPTIONAL MATCH (e:Entity)-[:BELONGS_TO_MODULE]->(m)
+            WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding OR e:Definition)
+            WITH m, e
+            ORDER BY coalesce(e.mention_count, 0) DESC, e.id
             WITH m, collect(DISTINCT e) as entities
 
             OPTIONAL MATCH (d:Document)-[:BELONGS_TO_MODULE]->(m)
             WITH m, entities, collect(DISTINCT d) as documents
-            WITH m, entities[0..200] as limited_entities, documents
+            WITH m, entities[0..$max_entities] as limited_entities, documents,
+                 size(entities) > $max_entities as truncated
             UNWIND limited_entities as e1
             OPTIONAL MATCH (e1)-[r]->(e2)
             WHERE e2 IN limited_entities
 
             RETURN
-                m as module,
-                limited_entities as entities,
-                documents,
-                collect(DISTINCT {source: e1.id, target: e2.id, type: type(r)}) as relationships
+                {node_projection("m", "module_fields")} as module,
+                [e IN limited_entities | {node_projection("e", "entity_fields")}] as entities,
+                [d IN documents | {node_projection("d", "document_fields")}] as documents,
+                collect(DISTINCT {{source: e1.id, target: e2.id, type: type(r)}}) as relationships,
+                truncated
             """
 
-            with self.graph_manager.driver.session() as session:
-                result = session.run(cypher, {"module_id": module_id})
-                record = result.single()
+            records = await self.graph_manager.run_query(
+                cypher,
+                {
+                    "module_id": module_id,
+                    "max_entities": MODULE_GRAPH_MAX_ENTITIES,
+                    "module_fields": module_fields,
+                    "entity_fields": entity_fields,
+                    "document_fields": document_fields,
+                },
+            )
+            record = records[0] if records else None
 
             nodes: List[VisualizationNode] = []
             edges: List[VisualizationEdge] = []
@@ -651,54 +1459,54 @@ class GraphVisualizer:
                 if module:
                     nodes.append(
                         VisualizationNode(
-                            id=module.get("id", module_id),
-                            label=module.get("name", module_id),
+                            id=module.get("id") or module_id,
+                            label=module.get("name") or module_id,
                             type="Module",
                             color=self._get_node_color("Module"),
                             size=self._get_node_size("Module"),
                             group="module",
-                            properties=dict(module) if module else {},
+                            properties=_projected_properties(module_fields, module),
                         )
                     )
 
                 # Add entity nodes
-                for entity in record.get("entities", []):
+                for entity in record.get("entities") or []:
                     if entity:
-                        entity_type = (
-                            entity.labels[0] if hasattr(entity, "labels") else "Entity"
-                        )
+                        entity_type = _projected_type(entity, "Entity")
                         nodes.append(
                             VisualizationNode(
                                 id=entity.get("id"),
-                                label=entity.get("name", entity.get("id")),
+                                label=entity.get("name") or entity.get("id"),
                                 type=entity_type,
                                 color=self._get_node_color(entity_type),
                                 size=self._get_node_size(entity_type),
                                 group=entity_type.lower(),
-                                properties=dict(entity),
+                                properties=_projected_properties(entity_fields, entity),
                             )
                         )
 
                 # Add document nodes
                 if options.include_documents:
-                    for doc in record.get("documents", []):
+                    for doc in record.get("documents") or []:
                         if doc:
                             nodes.append(
                                 VisualizationNode(
                                     id=doc.get("id"),
-                                    label=doc.get("title", doc.get("id")),
+                                    label=doc.get("name") or doc.get("id"),
                                     type="Document",
                                     color=self._get_node_color("Document"),
                                     size=self._get_node_size("Document"),
                                     group="document",
-                                    properties=dict(doc),
+                                    properties=_projected_properties(
+                                        document_fields, doc
+                                    ),
                                 )
                             )
 
                 # Add edges
-                for rel in record.get("relationships", []):
+                for rel in record.get("relationships") or []:
                     if rel and rel.get("source") and rel.get("target"):
-                        rel_type = rel.get("type", "RELATED_TO")
+                        rel_type = rel.get("type") or "RELATED_TO"
                         edges.append(
                             VisualizationEdge(
                                 id=f"{rel['source']}_{rel['target']}_{rel_type}",
@@ -726,10 +1534,16 @@ class GraphVisualizer:
                     entity_type_counts=self._count_by_type(nodes),
                     relationship_type_counts=self._count_edges_by_type(edges),
                     options_used=options,
+                    truncated=bool(record and record.get("truncated")),
                 ),
             )
 
-            return self.apply_layout(graph, options.layout)
+            graph = await asyncio.to_thread(
+                self.apply_layout, graph, options.layout, scope=f"module:{module_id}"
+            )
+            if cache_key is not None:
+                set_cached_response(cache_key, graph.model_dump(mode="json"))
+            return graph
 
         except Exception as e:
             logger.error(f"Error getting module graph: {e}")
@@ -755,22 +1569,43 @@ class GraphVisualizer:
         options = options or GraphOptions()  # type: ignore[call-arg]
 
         try:
-            cypher = """
-            MATCH (d:Document {id: $document_id})
-            OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
-            OPTIONAL MATCH (c)-[:CONTAINS_ENTITY]->(e)
-            WHERE e:Topic OR e:Concept OR e:Methodology OR e:Finding
+            document_fields = resolve_property_fields(
+                DOCUMENT_DISPLAY_PROPERTIES, options.node_properties
+            )
+            chunk_fields = resolve_property_fields(
+                CHUNK_DISPLAY_PROPERTIES, options.node_properties
+            )
+            entity_fields = resolve_property_fields(
+                ENTITY_DISPLAY_PROPERTIES, options.node_properties
+            )
 
-            RETURN
-                d as document,
+            cypher = f"""
+            MATCH (d:Document {{id: $document_id}})
+            OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
+            OPTIONAL MATCH (c)-[:CONTAINS_ENTITY]->(e:Entity)
+            WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+            WITH d,
                 collect(DISTINCT c) as chunks,
                 collect(DISTINCT e) as entities,
-                collect(DISTINCT {chunk_id: c.id, entity_id: e.id}) as chunk_entities
+                collect(DISTINCT {{chunk_id: c.id, entity_id: e.id}}) as chunk_entities
+
+            RETURN
+                {node_projection("d", "document_fields")} as document,
+                [c IN chunks | {node_projection("c", "chunk_fields")}] as chunks,
+                [e IN entities | {node_projection("e", "entity_fields")}] as entities,
+                chunk_entities
             """
 
-            with self.graph_manager.driver.session() as session:
-                result = session.run(cypher, {"document_id": document_id})
-                record = result.single()
+            records = await self.graph_manager.run_query(
+                cypher,
+                {
+                    "document_id": document_id,
+                    "document_fields": document_fields,
+                    "chunk_fields": chunk_fields,
+                    "entity_fields": entity_fields,
+                },
+            )
+            record = records[0] if records else None
 
             nodes: List[VisualizationNode] = []
             edges: List[VisualizationEdge] = []
@@ -781,27 +1616,28 @@ class GraphVisualizer:
                 if doc:
                     nodes.append(
                         VisualizationNode(
-                            id=doc.get("id", document_id),
-                            label=doc.get("title", document_id),
+                            id=doc.get("id") or document_id,
+                            label=doc.get("name") or document_id,
                             type="Document",
                             color=self._get_node_color("Document"),
                             size=self._get_node_size("Document"),
-                            properties=dict(doc),
+                            properties=_projected_properties(document_fields, doc),
                         )
                     )
 
                 # Add chunk nodes if requested
                 if options.include_chunks:
-                    for chunk in record.get("chunks", []):
+                    for chunk in record.get("chunks") or []:
                         if chunk:
+                            chunk_props = _projected_properties(chunk_fields, chunk)
                             nodes.append(
                                 VisualizationNode(
                                     id=chunk.get("id"),
-                                    label=f"Chunk {chunk.get('position', '')}",
+                                    label=f"Chunk {chunk_props.get('index', '')}",
                                     type="Chunk",
                                     color=self._get_node_color("Chunk"),
                                     size=self._get_node_size("Chunk"),
-                                    properties=dict(chunk),
+                                    properties=chunk_props,
                                 )
                             )
 
@@ -817,25 +1653,23 @@ class GraphVisualizer:
                             )
 
                 # Add entity nodes
-                for entity in record.get("entities", []):
+                for entity in record.get("entities") or []:
                     if entity:
-                        entity_type = (
-                            entity.labels[0] if hasattr(entity, "labels") else "Entity"
-                        )
+                        entity_type = _projected_type(entity, "Entity")
                         nodes.append(
                             VisualizationNode(
                                 id=entity.get("id"),
-                                label=entity.get("name", entity.get("id")),
+                                label=entity.get("name") or entity.get("id"),
                                 type=entity_type,
                                 color=self._get_node_color(entity_type),
                                 size=self._get_node_size(entity_type),
-                                properties=dict(entity),
+                                properties=_projected_properties(entity_fields, entity),
                             )
                         )
 
                 # Add chunk-entity edges if chunks included
                 if options.include_chunks:
-                    for ce in record.get("chunk_entities", []):
+                    for ce in record.get("chunk_entities") or []:
                         if ce and ce.get("chunk_id") and ce.get("entity_id"):
                             edges.append(
                                 VisualizationEdge(
@@ -865,7 +1699,9 @@ class GraphVisualizer:
                 ),
             )
 
-            return self.apply_layout(graph, options.layout)
+            return await asyncio.to_thread(
+                self.apply_layout, graph, options.layout, scope=f"document:{document_id}"
+            )
 
         except Exception as e:
             logger.error(f"Error getting document graph: {e}")
@@ -891,22 +1727,35 @@ class GraphVisualizer:
         options = options or GraphOptions()  # type: ignore[call-arg]
 
         try:
+            module_fields = resolve_property_fields(
+                MODULE_DISPLAY_PROPERTIES, options.node_properties
+            )
+            entity_fields = resolve_property_fields(
+                ENTITY_DISPLAY_PROPERTIES, options.node_properties
+            )
+
             # Get entities for all modules
-            cypher = """
+            cypher = f"""
             UNWIND $module_ids as module_id
-            MATCH (m:Module {id: module_id})
-            OPTIONAL MATCH (e)-[:BELONGS_TO_MODULE]->(m)
-            WHERE e:Topic OR e:Concept OR e:Methodology OR e:Finding
+            MATCH (m:Module {{id: module_id}})
+            OPTIONAL MATCH (e:Entity)-[:BELONGS_TO_MODULE]->(m)
+            WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+            WITH module_id, m, collect(DISTINCT e) as entities
 
             RETURN
                 module_id,
-                m as module,
-                collect(DISTINCT e) as entities
+                {node_projection("m", "module_fields")} as module,
+                [e IN entities | {node_projection("e", "entity_fields")}] as entities
             """
 
-            with self.graph_manager.driver.session() as session:
-                result = session.run(cypher, {"module_ids": module_ids})
-                records = list(result)
+            records = await self.graph_manager.run_query(
+                cypher,
+                {
+                    "module_ids": module_ids,
+                    "module_fields": module_fields,
+                    "entity_fields": entity_fields,
+                },
+            )
 
             nodes: List[VisualizationNode] = []
             edges: List[VisualizationEdge] = []
@@ -920,34 +1769,34 @@ class GraphVisualizer:
                 if module:
                     nodes.append(
                         VisualizationNode(
-                            id=module.get("id", module_id),
-                            label=module.get("name", module_id),
+                            id=module.get("id") or module_id,
+                            label=module.get("name") or module_id,
                             type="Module",
                             color=self._get_node_color("Module"),
                             size=self._get_node_size("Module"),
                             group=f"module_{module_id}",
-                            properties=dict(module),
+                            properties=_projected_properties(module_fields, module),
                         )
                     )
 
                 # Add entity nodes with module grouping
-                for entity in record.get("entities", []):
+                for entity in record.get("entities") or []:
                     if entity:
                         entity_id = entity.get("id")
-                        entity_type = (
-                            entity.labels[0] if hasattr(entity, "labels") else "Entity"
-                        )
+                        entity_type = _projected_type(entity, "Entity")
 
                         if entity_id not in seen_entity_ids:
                             nodes.append(
                                 VisualizationNode(
                                     id=entity_id,
-                                    label=entity.get("name", entity_id),
+                                    label=entity.get("name") or entity_id,
                                     type=entity_type,
                                     color=self._get_node_color(entity_type),
                                     size=self._get_node_size(entity_type),
                                     group=f"module_{module_id}",
-                                    properties=dict(entity),
+                                    properties=_projected_properties(
+                                        entity_fields, entity
+                                    ),
                                 )
                             )
                             seen_entity_ids.add(entity_id)
@@ -965,28 +1814,27 @@ class GraphVisualizer:
 
             # Find cross-module relationships
             cross_cypher = """
-            MATCH (e1)-[r]->(e2)
-            WHERE e1:Topic OR e1:Concept OR e1:Methodology OR e1:Finding
-            AND e2:Topic OR e2:Concept OR e2:Methodology OR e2:Finding
+            MATCH (e1:Entity)-[r]->(e2:Entity)
+            WHERE (e1:Topic OR e1:Concept OR e1:Methodology OR e1:Finding)
+            AND (e2:Topic OR e2:Concept OR e2:Methodology OR e2:Finding)
             AND e1.id IN $entity_ids AND e2.id IN $entity_ids
             RETURN DISTINCT e1.id as source, e2.id as target, type(r) as rel_type
             """
 
-            with self.graph_manager.driver.session() as session:
-                rel_result = session.run(
-                    cross_cypher, {"entity_ids": list(seen_entity_ids)}
-                )
-                for rel in rel_result:
-                    rel_type = rel.get("rel_type", "RELATED_TO")
-                    edges.append(
-                        VisualizationEdge(
-                            id=f"{rel['source']}_{rel['target']}_{rel_type}",
-                            source=rel["source"],
-                            target=rel["target"],
-                            type=rel_type,
-                            color=self._get_edge_color(rel_type),
-                        )
+            rel_records = await self.graph_manager.run_query(
+                cross_cypher, {"entity_ids": list(seen_entity_ids)}
+            )
+            for rel in rel_records:
+                rel_type = rel.get("rel_type") or "RELATED_TO"
+                edges.append(
+                    VisualizationEdge(
+                        id=f"{rel['source']}_{rel['target']}_{rel_type}",
+                        source=rel["source"],
+                        target=rel["target"],
+                        type=rel_type,
+                        color=self._get_edge_color(rel_type),
                     )
+                )
 
             # Apply filters
             nodes = self._filter_nodes(nodes, options)
@@ -1006,7 +1854,12 @@ class GraphVisualizer:
                 ),
             )
 
-            return self.apply_layout(graph, options.layout)
+            return await asyncio.to_thread(
+                self.apply_layout,
+                graph,
+                options.layout,
+                scope="modules:" + ",".join(sorted(module_ids)),
+            )
 
         except Exception as e:
             logger.error(f"Error getting cross-module graph: {e}")
@@ -1015,7 +1868,10 @@ class GraphVisualizer:
             )
 
     async def get_entity_neighborhood(
-        self, entity_id: str, depth: int = 2
+        self,
+        entity_id: str,
+        depth: int = 2,
+        node_properties: Optional[List[str]] = None,
     ) -> VisualizationGraph:
         """
         Get neighborhood graph around an entity.
@@ -1023,6 +1879,8 @@ class GraphVisualizer:
         Args:
             entity_id: Entity identifier
             depth: Number of hops to expand (1-4)
+            node_properties: Extra node properties to return on top of the
+                display set
 
         Returns:
             VisualizationGraph of entity neighborhood
@@ -1035,27 +1893,37 @@ class GraphVisualizer:
         assert 1 <= depth <= 4, f"Depth must be 1-4, got {depth}"
 
         try:
+            entity_fields = resolve_property_fields(
+                ENTITY_DISPLAY_PROPERTIES, node_properties
+            )
+
             # Get entity and neighbors
             cypher = f"""
-            MATCH (center {{id: $entity_id}})
-            WHERE center:Topic OR center:Concept OR center:Methodology OR center:Finding
+            MATCH (center:Entity {{id: $entity_id}})
+            WHERE (center:Topic OR center:Concept OR center:Methodology OR center:Finding)
 
             CALL {{
                 WITH center
-                MATCH path = (center)-[*1..{depth}]-(neighbor)
-                WHERE neighbor:Topic OR neighbor:Concept OR neighbor:Methodology OR neighbor:Finding
+                MATCH path = (center)-[*1..{depth}]-(neighbor:Entity)
+                WHERE (neighbor:Topic OR neighbor:Concept OR neighbor:Methodology OR neighbor:Finding)
                 RETURN neighbor, relationships(path) as rels
             }}
 
+            WITH center, collect(DISTINCT neighbor) as neighbors, collect(DISTINCT rels) as all_rels
             RETURN
-                center,
-                collect(DISTINCT neighbor) as neighbors,
-                collect(DISTINCT rels) as all_rels
+                {node_projection("center", "entity_fields")} as center,
+                [n IN neighbors | {node_projection("n", "entity_fields")}] as neighbors,
+                [rels IN all_rels | [r IN rels | {{
+                    source: startNode(r).id,
+                    target: endNode(r).id,
+                    type: type(r)
+                }}]] as all_rels
             """
 
-            with self.graph_manager.driver.session() as session:
-                result = session.run(cypher, {"entity_id": entity_id})
-                record = result.single()
+            records = await self.graph_manager.run_query(
+                cypher, {"entity_id": entity_id, "entity_fields": entity_fields}
+            )
+            record = records[0] if records else None
 
             nodes: List[VisualizationNode] = []
             edges: List[VisualizationEdge] = []
@@ -1064,60 +1932,55 @@ class GraphVisualizer:
                 # Add center node
                 center = record.get("center")
                 if center:
-                    center_type = (
-                        center.labels[0] if hasattr(center, "labels") else "Entity"
-                    )
+                    center_type = _projected_type(center, "Entity")
                     nodes.append(
                         VisualizationNode(
                             id=center.get("id"),
-                            label=center.get("name", entity_id),
+                            label=center.get("name") or entity_id,
                             type=center_type,
                             color=self._get_node_color(center_type),
                             size=self._get_node_size(center_type)
                             * 1.5,  # Larger center
                             group="center",
-                            properties=dict(center),
+                            properties=_projected_properties(entity_fields, center),
                         )
                     )
 
                 # Add neighbor nodes
-                for neighbor in record.get("neighbors", []):
+                for neighbor in record.get("neighbors") or []:
                     if neighbor:
-                        n_type = (
-                            neighbor.labels[0]
-                            if hasattr(neighbor, "labels")
-                            else "Entity"
-                        )
+                        n_type = _projected_type(neighbor, "Entity")
                         nodes.append(
                             VisualizationNode(
                                 id=neighbor.get("id"),
-                                label=neighbor.get("name", neighbor.get("id")),
+                                label=neighbor.get("name") or neighbor.get("id"),
                                 type=n_type,
                                 color=self._get_node_color(n_type),
                                 size=self._get_node_size(n_type),
-                                properties=dict(neighbor),
+                                properties=_projected_properties(
+                                    entity_fields, neighbor
+                                ),
                             )
                         )
 
                 # Extract edges from relationships
                 seen_edges: Set[str] = set()
-                for rel_list in record.get("all_rels", []):
-                    if rel_list:
-                        for rel in rel_list:
-                            if rel:
-                                edge_id = f"{rel.start_node.get('id')}_{rel.end_node.get('id')}_{type(rel).__name__}"
-                                if edge_id not in seen_edges:
-                                    rel_type = type(rel).__name__
-                                    edges.append(
-                                        VisualizationEdge(
-                                            id=edge_id,
-                                            source=rel.start_node.get("id"),
-                                            target=rel.end_node.get("id"),
-                                            type=rel_type,
-                                            color=self._get_edge_color(rel_type),
-                                        )
+                for rel_list in record.get("all_rels") or []:
+                    for rel in rel_list or []:
+                        if rel and rel.get("source") and rel.get("target"):
+                            rel_type = rel.get("type") or "RELATED_TO"
+                            edge_id = f"{rel['source']}_{rel['target']}_{rel_type}"
+                            if edge_id not in seen_edges:
+                                edges.append(
+                                    VisualizationEdge(
+                                        id=edge_id,
+                                        source=rel["source"],
+                                        target=rel["target"],
+                                        type=rel_type,
+                                        color=self._get_edge_color(rel_type),
                                     )
-                                    seen_edges.add(edge_id)
+                                )
+                                seen_edges.add(edge_id)
 
             graph = VisualizationGraph(
                 nodes=nodes,
@@ -1131,7 +1994,9 @@ class GraphVisualizer:
             )
 
             # Use radial layout for neighborhood
-            return self.apply_layout(graph, LayoutType.RADIAL, center_node_id=entity_id)
+            return await asyncio.to_thread(
+                self.apply_layout, graph, LayoutType.RADIAL, center_node_id=entity_id
+            )
 
         except Exception as e:
             logger.error(f"Error getting entity neighborhood: {e}")
@@ -1142,29 +2007,99 @@ class GraphVisualizer:
         graph: VisualizationGraph,
         layout: LayoutType,
         center_node_id: Optional[str] = None,
+        scope: Optional[str] = None,
+        width: float = 1000,
+        height: float = 800,
     ) -> VisualizationGraph:
         """
         Apply layout algorithm to graph nodes.
 
+        Positions are cached by (graph content hash, layout, dimensions). On a
+        miss, a force-directed layout warm-starts from the last layout cached
+        for the same scope when enough of its nodes survive, so a graph that
+        gained a few nodes settles in WARM_START_ITERATIONS steps.
+
         Args:
             graph: Graph to layout
             layout: Layout algorithm to use
             center_node_id: Optional center node for radial layout
+            scope: Stable identity of the graph (e.g. "module:<id>") used to
+                find a previous layout to warm-start from
+            width: Canvas width
+            height: Canvas height
 
         Returns:
-            Graph with positions applied
+            Graph with positions applied and layout stats in metadata
         """
         if not graph.nodes:
             return graph
 
-        if layout == LayoutType.FORCE_DIRECTED:
-            graph.nodes = force_directed_layout(graph.nodes, graph.edges)
-        elif layout == LayoutType.HIERARCHICAL:
-            graph.nodes = hierarchical_layout(graph.nodes, graph.edges)
-        elif layout == LayoutType.RADIAL:
-            graph.nodes = radial_layout(graph.nodes, graph.edges, center_node_id)
-        elif layout == LayoutType.CIRCULAR:
-            graph.nodes = circular_layout(graph.nodes, graph.edges)
+        started = time.perf_counter()
+        layout_key = (
+            f"{CACHE_PREFIX_LAYOUT}:{layout.value}:{int(width)}x{int(height)}:"
+            f"{center_node_id or ''}:{graph_content_hash(graph)}"
+        )
+        latest_key = (
+            f"{CACHE_PREFIX_LAYOUT}:latest:{layout.value}:"
+            f"{int(width)}x{int(height)}:{scope}"
+            if scope
+            else None
+        )
+
+        cached = self.layout_cache.get(layout_key)
+        warm_positions: Optional[Dict[str, Tuple[float, float]]] = None
+
+        if cached is not None and all(n.id in cached for n in graph.nodes):
+            for node in graph.nodes:
+                node.x, node.y = cached[node.id]
+        else:
+            cached = None
+            if layout == LayoutType.FORCE_DIRECTED and latest_key:
+                previous = self.layout_cache.get(latest_key, record=False)
+                if previous:
+                    surviving = {
+                        n.id: tuple(previous[n.id])
+                        for n in graph.nodes
+                        if n.id in previous
+                    }
+                    if len(surviving) >= WARM_START_MIN_OVERLAP * len(graph.nodes):
+                        warm_positions = surviving
+
+            if layout == LayoutType.FORCE_DIRECTED:
+                graph.nodes = force_directed_layout(
+                    graph.nodes,
+                    graph.edges,
+                    width,
+                    height,
+                    iterations=WARM_START_ITERATIONS if warm_positions else 100,
+                    initial_positions=warm_positions,
+                )
+            elif layout == LayoutType.HIERARCHICAL:
+                graph.nodes = hierarchical_layout(
+                    graph.nodes, graph.edges, width, height
+                )
+            elif layout == LayoutType.RADIAL:
+                graph.nodes = radial_layout(
+                    graph.nodes, graph.edges, center_node_id, width, height
+                )
+            elif layout == LayoutType.CIRCULAR:
+                graph.nodes = circular_layout(graph.nodes, graph.edges, width, height)
+
+            positions = {
+                n.id: [n.x, n.y]
+                for n in graph.nodes
+                if n.x is not None and n.y is not None
+            }
+            self.layout_cache.set(layout_key, positions)
+            if latest_key:
+                self.layout_cache.set(latest_key, positions)
+
+        graph.metadata.layout_cache_hit = cached is not None
+        graph.metadata.layout_warm_started = warm_positions is not None
+        graph.metadata.layout_time_ms = round(
+            (time.perf_counter() - started) * 1000, 3
+        )
+        graph.metadata.layout_cache_hit_rate = self.layout_cache.hit_rate
 
         graph.layout_applied = True
         return graph
@@ -1180,169 +2115,126 @@ class GraphVisualizer:
         Returns:
             Bytes of exported graph
         """
-        if format == ExportFormat.JSON:
-            return self._export_json(graph)
-        elif format == ExportFormat.GRAPHML:
-            return self._export_graphml(graph)
-        elif format == ExportFormat.GEXF:
-            return self._export_gexf(graph)
-        elif format == ExportFormat.CSV:
-            return self._export_csv(graph)
-        else:
+        writer_cls = EXPORT_WRITERS.get(format)
+        if writer_cls is None:
             return self._export_json(graph)
 
+        writer = writer_cls()
+        parts = [writer.header()]
+        parts.extend(writer.node(node) for node in graph.nodes)
+        parts.append(writer.edges_start())
+        parts.extend(writer.edge(edge) for edge in graph.edges)
+        parts.append(writer.footer())
+        return "".join(parts).encode("utf-8")
+
     def _export_json(self, graph: VisualizationGraph) -> bytes:
         """Export graph as JSON."""
         return json.dumps(graph.model_dump(), default=str).encode("utf-8")
 
-    def _export_graphml(self, graph: VisualizationGraph) -> bytes:
-        """Export graph as GraphML format."""
-        root = ET.Element("graphml")
-        root.set("xmlns", "http://graphml.graphdrawing.org/xmlns")
-
-        # Define keys for node attributes
-        for key in ["label", "type", "color", "size", "x", "y"]:
-            key_elem = ET.SubElement(root, "key")
-            key_elem.set("id", key)
-            key_elem.set("for", "node")
-            key_elem.set("attr.name", key)
-            key_elem.set(
-                "attr.type", "string" if key in ["label", "type", "color"] else "double"
-            )
-
-        # Define keys for edge attributes
-        for key in ["type", "weight", "color"]:
-            key_elem = ET.SubElement(root, "key")
-            key_elem.set("id", f"e_{key}")
-            key_elem.set("for", "edge")
-            key_elem.set("attr.name", key)
-            key_elem.set(
-                "attr.type", "string" if key in ["type", "color"] else "double"
-            )
-
-        # Create graph element
-        graph_elem = ET.SubElement(root, "graph")
-        graph_elem.set("id", "G")
-        graph_elem.set("edgedefault", "directed")
+    async def stream_export(
+        self,
+        module_ids: List[str],
+        format: ExportFormat,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a GraphML, GEXF or CSV export of one or more modules.
 
-        # Add nodes
-        for node in graph.nodes:
-            node_elem = ET.SubElement(graph_elem, "node")
-            node_elem.set("id", node.id)
+        Nodes and then edges are paged out of Neo4j with keyset pagination on
+        entity id, and each page is serialized and yielded before the next
+        one is fetched. Memory stays bounded by page_size however large the
+        exported graph is. Nodes carry no layout positions.
 
-            for key, value in [
-                ("label", node.label),
-                ("type", node.type),
-                ("color", node.color or ""),
-                ("size", str(node.size)),
-                ("x", str(node.x or 0)),
-                ("y", str(node.y or 0)),
-            ]:
-                data_elem = ET.SubElement(node_elem, "data")
-                data_elem.set("key", key)
-                data_elem.text = value
-
-        # Add edges
-        for edge in graph.edges:
-            edge_elem = ET.SubElement(graph_elem, "edge")
-            edge_elem.set("id", edge.id)
-            edge_elem.set("source", edge.source)
-            edge_elem.set("target", edge.target)
+        Args:
+            module_ids: Modules whose entities and relationships to export
+            format: GraphML, GEXF or CSV (JSON is not streamable)
+            page_size: Entities fetched per Neo4j round trip
 
-            for key, value in [
-                ("e_type", edge.type),
-                ("e_weight", str(edge.weight)),
-                ("e_color", edge.color or ""),
-            ]:
-                data_elem = ET.SubElement(edge_elem, "data")
-                data_elem.set("key", key)
-                data_elem.text = value
-
-        return ET.tostring(root, encoding="unicode").encode("utf-8")
-
-    def _export_gexf(self, graph: VisualizationGraph) -> bytes:
-        """Export graph as GEXF format (Gephi)."""
-        root = ET.Element("gexf")
-        root.set("xmlns", "http://www.gexf.net/1.3")
-        root.set("version", "1.3")
-
-        # Meta
-        meta = ET.SubElement(root, "meta")
-        creator = ET.SubElement(meta, "creator")
-        creator.text = "AURA Platform"
-
-        # Graph
-        graph_elem = ET.SubElement(root, "graph")
-        graph_elem.set("mode", "static")
-        graph_elem.set("defaultedgetype", "directed")
-
-        # Node attributes
-        node_attrs = ET.SubElement(graph_elem, "attributes")
-        node_attrs.set("class", "node")
-        for i, (attr, atype) in enumerate([("type", "string"), ("color", "string")]):
-            attr_elem = ET.SubElement(node_attrs, "attribute")
-            attr_elem.set("id", str(i))
-            attr_elem.set("title", attr)
-            attr_elem.set("type", atype)
-
-        # Nodes
-        nodes_elem = ET.SubElement(graph_elem, "nodes")
-        for node in graph.nodes:
-            node_elem = ET.SubElement(nodes_elem, "node")
-            node_elem.set("id", node.id)
-            node_elem.set("label", node.label)
-
-            attvalues = ET.SubElement(node_elem, "attvalues")
-            for i, value in enumerate([node.type, node.color or ""]):
-                attvalue = ET.SubElement(attvalues, "attvalue")
-                attvalue.set("for", str(i))
-                attvalue.set("value", value)
-
-            if node.x is not None and node.y is not None:
-                viz_pos = ET.SubElement(node_elem, "viz:position")
-                viz_pos.set("x", str(node.x))
-                viz_pos.set("y", str(node.y))
-
-        # Edges
-        edges_elem = ET.SubElement(graph_elem, "edges")
-        for edge in graph.edges:
-            edge_elem = ET.SubElement(edges_elem, "edge")
-            edge_elem.set("id", edge.id)
-            edge_elem.set("source", edge.source)
-            edge_elem.set("target", edge.target)
-            edge_elem.set("label", edge.type)
-            edge_elem.set("weight", str(edge.weight))
-
-        return ET.tostring(root, encoding="unicode").encode("utf-8")
+        Yields:
+            UTF-8 encoded document fragments
+        """
+        writer_cls = EXPORT_WRITERS.get(format)
+        if writer_cls is None:
+            raise ValueError(f"Streaming export does not support {format.value}")
+
+        writer = writer_cls()
+        yield writer.header().encode("utf-8")
+
+        after = ""
+        node_count = 0
+        while True:
+            rows = await self.graph_manager.run_query(
+                EXPORT_NODES_QUERY,
+                {"module_ids": module_ids, "after": after, "limit": page_size},
+            )
+            if not rows:
+                break
+
+            chunk = []
+            for row in rows:
+                node = row["node"]
+                node_type = _projected_type(node, "Entity")
+                chunk.append(
+                    writer.node(
+                        VisualizationNode(
+                            id=node["id"],
+                            label=node.get("name") or node["id"],
+                            type=node_type,
+                            color=self._get_node_color(node_type),
+                            size=self._get_node_size(node_type),
+                        )
+                    )
+                )
+            node_count += len(rows)
+            yield "".join(chunk).encode("utf-8")
 
-    @staticmethod
-    def _csv_escape(val: str) -> str:
-        """Escape double quotes in CSV values."""
-        return val.replace('"', '""')
+            after = rows[-1]["node"]["id"]
+            if len(rows) < page_size:
+                break
 
-    def _export_csv(self, graph: VisualizationGraph) -> bytes:
-        """Export graph as CSV (nodes and edges in separate sections)."""
-        output = io.StringIO()
-        esc = self._csv_escape
-
-        # Nodes section
-        output.write("# NODES\n")
-        output.write("id,label,type,color,size,x,y\n")
-        for node in graph.nodes:
-            output.write(
-                f'"{esc(node.id)}","{esc(node.label)}","{esc(node.type)}",'
-                f'"{esc(node.color or "")}",{node.size},{node.x or 0},{node.y or 0}\n'
-            )
+        yield writer.edges_start().encode("utf-8")
 
-        output.write("\n# EDGES\n")
-        output.write("source,target,type,weight,color\n")
-        for edge in graph.edges:
-            output.write(
-                f'"{esc(edge.source)}","{esc(edge.target)}","{esc(edge.type)}",'
-                f'{edge.weight},"{esc(edge.color or "")}"\n'
+        after = ""
+        edge_count = 0
+        while True:
+            rows = await self.graph_manager.run_query(
+                EXPORT_EDGES_QUERY,
+                {"module_ids": module_ids, "after": after, "limit": page_size},
             )
-
-        return output.getvalue().encode("utf-8")
+            if not rows:
+                break
+
+            chunk = []
+            for row in rows:
+                for rel in row.get("relationships") or []:
+                    if not rel or not rel.get("target"):
+                        continue
+                    rel_type = rel.get("type") or "RELATED_TO"
+                    chunk.append(
+                        writer.edge(
+                            VisualizationEdge(
+                                id=f"{row['source']}_{rel['target']}_{rel_type}",
+                                source=row["source"],
+                                target=rel["target"],
+                                type=rel_type,
+                                weight=rel.get("weight") or 1.0,
+                                color=self._get_edge_color(rel_type),
+                            )
+                        )
+                    )
+            edge_count += len(chunk)
+            if chunk:
+                yield "".join(chunk).encode("utf-8")
+
+            after = rows[-1]["source"]
+            if len(rows) < page_size:
+                break
+
+        yield writer.footer().encode("utf-8")
+        logger.info(
+            f"Streamed {format.value} export of {len(module_ids)} modules: "
+            f"{node_count} nodes, {edge_count} edges"
+        )
 
     def _count_by_type(self, nodes: List[VisualizationNode]) -> Dict[str, int]:
         """Count nodes by type."""
@@ -1377,10 +2269,10 @@ def get_graph_visualizer():
             return await visualizer.get_module_graph(module_id)
     """
     from api.neo4j_config import neo4j_driver
-    from api.graph_manager import GraphManager
+    from api.graph_manager import create_graph_manager
 
     if neo4j_driver is None:
         raise RuntimeError("Neo4j driver not initialized")
 
-    graph_manager = GraphManager(neo4j_driver)
+    graph_manager = create_graph_manager(neo4j_driver)
     return GraphVisualizer(graph_manager)
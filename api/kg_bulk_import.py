@@ -0,0 +1,680 @@
+"""
+============================================================================
+FILE: kg_bulk_import.py
+LOCATION: api/kg_bulk_import.py
+============================================================================
+
+PURPOSE:
+    Bulk backfill import for knowledge graph rebuilds. Stages node and edge
+    rows for a module into local CSV files and loads them into Neo4j with
+    LOAD CSV + CALL {} IN TRANSACTIONS batches instead of one transactional
+    MERGE round trip per chunk/entity.
+
+ROLE IN PROJECT:
+    Backs KnowledgeGraphProcessor.bulk_rebuild_module, used when extraction
+    templates change and whole modules must be re-ingested.
+    - Key responsibility 1: Stage per-document rows atomically (resumable)
+    - Key responsibility 2: Check/create ID constraints before loading
+    - Key responsibility 3: Load staged files in dependency order with
+      progress reporting and per-file resume after failure
+
+KEY COMPONENTS:
+    - BulkImportStager: Buffers rows per document and appends them to CSVs
+    - BulkImporter: Verifies constraints and runs the batched LOAD CSV queries
+    - ensure_constraints: Creates missing uniqueness constraints from the
+      canonical schema (api/schemas/neo4j_schema.py)
+
+STAGING LAYOUT:
+    <NEO4J_IMPORT_DIR>/<module_id>/
+        manifest.json           Staged documents, file specs, loaded row counts
+        documents.csv           Document nodes
+        chunks.csv              Chunk nodes + HAS_CHUNK edges
+        parent_chunks.csv       ParentChunk nodes + HAS_PARENT_CHUNK edges
+        chunk_parents.csv       BELONGS_TO_PARENT edges
+        entities_<Label>.csv    Entity nodes per label
+        entity_embeddings_<Label>.csv
+        chunk_entities_<Label>.csv          CONTAINS_ENTITY edges
+        relationships_<Src>_<REL>_<Tgt>.csv Entity-entity edges
+
+    NEO4J_IMPORT_DIR must be the Neo4j server's import directory (or a
+    directory mounted there); NEO4J_IMPORT_URL_PREFIX is the URL LOAD CSV
+    uses to reach it (default file:///).
+
+DEPENDENCIES:
+    - External: neo4j
+    - Internal: api/schemas/neo4j_schema.py
+
+USAGE:
+    from api.kg_processor import KnowledgeGraphProcessor
+
+    processor = KnowledgeGraphProcessor(neo4j_driver)
+    summary = await processor.bulk_rebuild_module(
+        module_id="mod_123",
+        user_id="staff_1",
+        documents=[{"id": "doc_1"}, {"id": "doc_2"}],
+    )
+============================================================================
+"""
+
+import csv
+import json
+import logging
+import os
+import re
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from schemas.neo4j_schema import CONSTRAINTS, generate_constraint_cypher
+except ImportError:
+    from api.schemas.neo4j_schema import CONSTRAINTS, generate_constraint_cypher
+
+
+# ============================================================================
+# LOGGING
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION CONSTANTS
+# ============================================================================
+
+BULK_IMPORT_DIR = os.getenv("NEO4J_IMPORT_DIR", "./neo4j_import")
+BULK_IMPORT_URL_PREFIX = os.getenv("NEO4J_IMPORT_URL_PREFIX", "file:///")
+BULK_IMPORT_BATCH_ROWS = int(os.getenv("NEO4J_IMPORT_BATCH_ROWS", "1000"))
+
+MANIFEST_FILENAME = "manifest.json"
+LIST_SEPARATOR = "|"
+EMBEDDING_SEPARATOR = ";"
+
+# Files are loaded in this order so MATCH clauses always find their nodes
+LOAD_ORDER = [
+    "documents",
+    "chunks",
+    "parent_chunks",
+    "entities",
+    "entity_embeddings",
+    "chunk_parents",
+    "chunk_entities",
+    "relationships",
+]
+
+FILE_HEADERS: Dict[str, List[str]] = {
+    "documents": ["id", "module_id", "user_id", "chunk_count", "updated_at"],
+    "chunks": [
+        "id", "document_id", "module_id", "text", "chunk_labels",
+        "token_count", "index", "embedding",
+    ],
+    "parent_chunks": [
+        "id", "document_id", "module_id", "text", "token_count", "index",
+        "embedding",
+    ],
+    "chunk_parents": ["child_id", "parent_id"],
+    "entities": [
+        "id", "module_id", "name", "definition", "confidence", "embedding",
+        "updated_at",
+    ],
+    "entity_embeddings": ["id", "module_id", "embedding"],
+    "chunk_entities": ["chunk_id", "entity_id", "relevance_score"],
+    "relationships": [
+        "source_id", "target_id", "module_id", "confidence", "evidence",
+    ],
+}
+
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Cypher fragments decoding the CSV encodings written by the stager
+_EMBEDDING_EXPR = (
+    "CASE WHEN coalesce(row.embedding, '') = '' THEN null "
+    f"ELSE [x IN split(row.embedding, '{EMBEDDING_SEPARATOR}') | toFloat(x)] END"
+)
+_LABELS_EXPR = (
+    "CASE WHEN coalesce(row.chunk_labels, '') = '' THEN [] "
+    f"ELSE split(row.chunk_labels, '{LIST_SEPARATOR}') END"
+)
+
+_LOAD_QUERIES: Dict[str, str] = {
+    "documents": """
+        MERGE (d:Document {id: row.id})
+        SET d.module_id = row.module_id,
+            d.user_id = row.user_id,
+            d.chunk_count = toInteger(row.chunk_count),
+            d.updated_at = row.updated_at
+    """,
+    "chunks": f"""
+        MATCH (d:Document {{id: row.document_id}})
+        MERGE (c:Chunk {{id: row.id}})
+        SET c.text = row.text,
+            c.chunk_labels = {_LABELS_EXPR},
+            c.token_count = toInteger(row.token_count),
+            c.index = toInteger(row.index),
+            c.module_id = row.module_id,
+            c.embedding = {_EMBEDDING_EXPR}
+        MERGE (d)-[:HAS_CHUNK]->(c)
+    """,
+    "parent_chunks": f"""
+        MATCH (d:Document {{id: row.document_id}})
+        MERGE (pc:ParentChunk {{id: row.id}})
+        SET pc.text = row.text,
+            pc.token_count = toInteger(row.token_count),
+            pc.index = toInteger(row.index),
+            pc.module_id = row.module_id,
+            pc.document_id = row.document_id,
+            pc.embedding = {_EMBEDDING_EXPR}
+        MERGE (d)-[:HAS_PARENT_CHUNK]->(pc)
+    """,
+    "chunk_parents": """
+        MATCH (c:Chunk {id: row.child_id})
+        MATCH (pc:ParentChunk {id: row.parent_id})
+        MERGE (c)-[:BELONGS_TO_PARENT]->(pc)
+    """,
+    "entities": f"""
+        MERGE (e:Entity {{{{id: row.id}}}})
+        ON CREATE SET e:{{label}}, e.created_at = row.updated_at
+        SET e.name = row.name,
+            e.definition = row.definition,
+            e.module_id = row.module_id,
+            e.confidence = toFloat(row.confidence),
+            e.embedding = {_EMBEDDING_EXPR},
+            e.updated_at = row.updated_at
+    """,
+    "entity_embeddings": f"""
+        MATCH (e:Entity {{{{id: row.id, module_id: row.module_id}}}})
+        SET e.embedding = {_EMBEDDING_EXPR},
+            e.embedded_at = datetime()
+    """,
+    "chunk_entities": """
+        MATCH (c:Chunk {{id: row.chunk_id}})
+        MATCH (e:Entity {{id: row.entity_id}})
+        MERGE (c)-[r:CONTAINS_ENTITY]->(e)
+        SET r.relevance_score = toFloat(row.relevance_score)
+    """,
+    "relationships": """
+        MATCH (source:Entity {{id: row.source_id, module_id: row.module_id}})
+        MATCH (target:Entity {{id: row.target_id, module_id: row.module_id}})
+        MERGE (source)-[r:{rel_type}]->(target)
+        SET r.confidence = toFloat(row.confidence),
+            r.evidence = row.evidence,
+            r.created_at = datetime()
+    """,
+}
+
+_CLEAR_MODULE_QUERY = """
+MATCH (n)
+WHERE n.module_id = $module_id
+  AND (n:Document OR n:Chunk OR n:ParentChunk OR n:Entity)
+CALL {{
+    WITH n
+    DETACH DELETE n
+}} IN TRANSACTIONS OF {batch_rows} ROWS
+"""
+
+ProgressCallback = Callable[[str, int, int, str], None]
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+def _safe_identifier(value: str) -> str:
+    """Validate a label/relationship type before interpolating it into Cypher."""
+    if not _IDENTIFIER_PATTERN.match(value or ""):
+        raise ValueError(f"Invalid Cypher identifier: {value!r}")
+    return value
+
+
+def _safe_dirname(module_id: str) -> str:
+    """Map a module ID to a filesystem-safe directory name."""
+    return re.sub(r"[^A-Za-z0-9_-]", "_", module_id)
+
+
+def _encode_embedding(embedding: Optional[List[float]]) -> str:
+    if not embedding:
+        return ""
+    return EMBEDDING_SEPARATOR.join(repr(float(x)) for x in embedding)
+
+
+def _encode_list(values: Optional[List[str]]) -> str:
+    if not values:
+        return ""
+    return LIST_SEPARATOR.join(v.replace(LIST_SEPARATOR, "/") for v in values)
+
+
+def ensure_constraints(driver, create_missing: bool = True) -> List[str]:
+    """
+    Check the canonical uniqueness constraints before a bulk load.
+
+    MERGE on an unconstrained label is a label scan per row, which turns a
+    bulk load quadratic; loading is refused unless the constraints exist.
+
+    Args:
+        driver: Neo4j driver instance
+        create_missing: Create missing constraints instead of failing
+
+    Returns:
+        Names of constraints that were created
+
+    Raises:
+        RuntimeError: If constraints are missing and create_missing is False
+    """
+    with driver.session() as session:
+        existing = {record["name"] for record in session.run("SHOW CONSTRAINTS")}
+
+    missing = [c for c in CONSTRAINTS if c.name not in existing]
+    if missing and not create_missing:
+        raise RuntimeError(
+            "Missing constraints for bulk import: "
+            + ", ".join(c.name for c in missing)
+        )
+
+    created = []
+    with driver.session() as session:
+        for constraint in missing:
+            session.run(generate_constraint_cypher(constraint))
+            created.append(constraint.name)
+            logger.info(f"Created constraint for bulk import: {constraint.name}")
+
+    return created
+
+
+# ============================================================================
+# STAGER
+# ============================================================================
+
+
+class BulkImportStager:
+    """
+    Buffers node/edge rows for one document at a time and appends them to
+    the module's CSV files on commit.
+
+    A document's rows reach disk only when commit_document() is called, so a
+    crash mid-document never leaves partial rows behind and the manifest's
+    staged_documents list is an exact resume point. Only an unfinished
+    rebuild is resumed: a manifest whose load completed is discarded.
+    """
+
+    def __init__(self, module_id: str, staging_root: str = BULK_IMPORT_DIR):
+        """
+        Initialize the stager, loading an existing manifest if present.
+
+        Args:
+            module_id: Module being rebuilt
+            staging_root: Directory under which the module folder is created
+        """
+        self.module_id = module_id
+        self.dirname = _safe_dirname(module_id)
+        self.directory = os.path.join(staging_root, self.dirname)
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._document_id: Optional[str] = None
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self.manifest = self._load_manifest()
+        if self.manifest.get("load_completed"):
+            # Left over from a finished rebuild whose cleanup did not run
+            self.reset()
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.directory, MANIFEST_FILENAME)
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return {
+            "module_id": self.module_id,
+            "created_at": datetime.utcnow().isoformat(),
+            "staged_documents": [],
+            "files": {},
+            "loaded_rows": {},
+            "cleared": False,
+            "load_completed": False,
+        }
+
+    def save_manifest(self) -> None:
+        """Atomically persist the manifest."""
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def is_staged(self, document_id: str) -> bool:
+        return document_id in self.manifest["staged_documents"]
+
+    def reset(self) -> None:
+        """Discard all staged files and start a fresh manifest."""
+        for filename in list(self.manifest["files"]):
+            path = os.path.join(self.directory, filename)
+            if os.path.exists(path):
+                os.remove(path)
+        if os.path.exists(self.manifest_path):
+            os.remove(self.manifest_path)
+        self.manifest = self._load_manifest()
+
+    # ------------------------------------------------------------------
+    # Document lifecycle
+    # ------------------------------------------------------------------
+
+    def begin_document(self, document_id: str) -> None:
+        self._document_id = document_id
+        self._buffers = {}
+
+    def discard_document(self) -> None:
+        """Drop buffered rows for the current document (processing failed)."""
+        self._document_id = None
+        self._buffers = {}
+
+    def commit_document(self) -> int:
+        """
+        Append the current document's rows to disk and mark it staged.
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        for filename, rows in self._buffers.items():
+            spec = self.manifest["files"][filename]
+            path = os.path.join(self.directory, filename)
+            write_header = not os.path.exists(path)
+            with open(path, "a", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=FILE_HEADERS[spec["kind"]])
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(rows)
+            spec["rows"] += len(rows)
+            written += len(rows)
+
+        if self._document_id and not self.is_staged(self._document_id):
+            self.manifest["staged_documents"].append(self._document_id)
+        self.save_manifest()
+        self.discard_document()
+        return written
+
+    def _add_row(self, filename: str, spec: Dict[str, Any], row: Dict[str, Any]):
+        if filename not in self.manifest["files"]:
+            self.manifest["files"][filename] = {**spec, "rows": 0}
+        self._buffers.setdefault(filename, []).append(row)
+
+    # ------------------------------------------------------------------
+    # Row staging (mirrors the transactional store path in kg_processor)
+    # ------------------------------------------------------------------
+
+    def stage_document(
+        self,
+        document_id: str,
+        user_id: str,
+        chunks: List[Any],
+        entities: List[Any],
+    ) -> None:
+        """Stage the Document, its Chunks, entities and CONTAINS_ENTITY edges."""
+        now_iso = datetime.utcnow().isoformat()
+        self._add_row(
+            "documents.csv",
+            {"kind": "documents"},
+            {
+                "id": document_id,
+                "module_id": self.module_id,
+                "user_id": user_id,
+                "chunk_count": len(chunks),
+                "updated_at": now_iso,
+            },
+        )
+
+        for chunk in chunks:
+            self._add_row(
+                "chunks.csv",
+                {"kind": "chunks"},
+                {
+                    "id": chunk.id,
+                    "document_id": document_id,
+                    "module_id": self.module_id,
+                    "text": chunk.text[:10000],
+                    "chunk_labels": _encode_list(chunk.chunk_labels),
+                    "token_count": chunk.token_count,
+                    "index": chunk.index,
+                    "embedding": _encode_embedding(chunk.embedding),
+                },
+            )
+
+        for entity in entities:
+            label = _safe_identifier(entity.entity_type.value)
+            self._add_row(
+                f"entities_{label}.csv",
+                {"kind": "entities", "label": label},
+                {
+                    "id": entity.id,
+                    "module_id": self.module_id,
+                    "name": entity.name,
+                    "definition": entity.definition,
+                    "confidence": entity.properties.get("confidence", 0.7),
+                    "embedding": _encode_embedding(entity.embedding),
+                    "updated_at": now_iso,
+                },
+            )
+
+        for chunk in chunks:
+            for entity in chunk.entities:
+                label = _safe_identifier(entity.entity_type.value)
+                self._add_row(
+                    f"chunk_entities_{label}.csv",
+                    {"kind": "chunk_entities", "label": label},
+                    {
+                        "chunk_id": chunk.id,
+                        "entity_id": entity.id,
+                        "relevance_score": entity.properties.get("confidence", 0.7),
+                    },
+                )
+
+    def stage_parent_chunks(
+        self, document_id: str, parent_chunks: List[Dict[str, Any]]
+    ) -> None:
+        for parent in parent_chunks:
+            self._add_row(
+                "parent_chunks.csv",
+                {"kind": "parent_chunks"},
+                {
+                    "id": f"parent_chunk_{document_id}_{parent['index']}",
+                    "document_id": document_id,
+                    "module_id": self.module_id,
+                    "text": parent["text"][:10000],
+                    "token_count": parent["token_count"],
+                    "index": parent["index"],
+                    "embedding": _encode_embedding(parent.get("embedding")),
+                },
+            )
+
+    def stage_child_parent_link(self, child_id: str, parent_id: str) -> None:
+        self._add_row(
+            "chunk_parents.csv",
+            {"kind": "chunk_parents"},
+            {"child_id": child_id, "parent_id": parent_id},
+        )
+
+    def stage_entity_embedding(
+        self, entity_id: str, entity_type: str, embedding: List[float]
+    ) -> None:
+        label = _safe_identifier(entity_type)
+        self._add_row(
+            f"entity_embeddings_{label}.csv",
+            {"kind": "entity_embeddings", "label": label},
+            {
+                "id": entity_id,
+                "module_id": self.module_id,
+                "embedding": _encode_embedding(embedding),
+            },
+        )
+
+    def stage_entity_relationship(
+        self,
+        source_id: str,
+        source_type: str,
+        target_id: str,
+        target_type: str,
+        rel_type: str,
+        confidence: float,
+        evidence: Optional[str],
+    ) -> None:
+        source_label = _safe_identifier(source_type)
+        target_label = _safe_identifier(target_type)
+        rel_type = _safe_identifier(rel_type)
+        self._add_row(
+            f"relationships_{source_label}_{rel_type}_{target_label}.csv",
+            {
+                "kind": "relationships",
+                "source_label": source_label,
+                "target_label": target_label,
+                "rel_type": rel_type,
+            },
+            {
+                "source_id": source_id,
+                "target_id": target_id,
+                "module_id": self.module_id,
+                "confidence": confidence,
+                "evidence": evidence[:300] if evidence else "",
+            },
+        )
+
+
+# ============================================================================
+# LOADER
+# ============================================================================
+
+
+class BulkImporter:
+    """
+    Loads a module's staged CSV files into Neo4j with batched LOAD CSV.
+
+    Each file is loaded by one auto-commit query using CALL {} IN
+    TRANSACTIONS, so Neo4j commits every `batch_rows` rows and heap use stays
+    flat regardless of module size. The row count of each loaded file is
+    recorded in the manifest; because every statement is a MERGE, re-running
+    a file is safe, so resume reloads exactly the files that failed or have
+    gained rows since they were loaded.
+    """
+
+    def __init__(
+        self,
+        driver,
+        stager: BulkImportStager,
+        url_prefix: str = BULK_IMPORT_URL_PREFIX,
+        batch_rows: int = BULK_IMPORT_BATCH_ROWS,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        """
+        Initialize the importer.
+
+        Args:
+            driver: Neo4j driver instance
+            stager: Stager holding the module's files and manifest
+            url_prefix: URL prefix under which Neo4j sees the staging root
+            batch_rows: Rows per inner transaction
+            progress_callback: Optional (stage, current, total, message) hook
+        """
+        self.driver = driver
+        self.stager = stager
+        self.url_prefix = url_prefix if url_prefix.endswith("/") else url_prefix + "/"
+        self.batch_rows = int(batch_rows)
+        self._progress_callback = progress_callback
+
+    def _emit_progress(self, current: int, total: int, message: str) -> None:
+        if self._progress_callback:
+            self._progress_callback("bulk_load", current, total, message)
+        logger.debug(f"Bulk load: {current}/{total} - {message}")
+
+    def file_url(self, filename: str) -> str:
+        return f"{self.url_prefix}{self.stager.dirname}/{filename}"
+
+    def build_query(self, spec: Dict[str, Any]) -> str:
+        """Build the batched LOAD CSV query for a staged file spec."""
+        kind = spec["kind"]
+        body = _LOAD_QUERIES[kind]
+        if kind in ("entities", "entity_embeddings", "chunk_entities"):
+            body = body.format(label=_safe_identifier(spec["label"]))
+        elif kind == "relationships":
+            body = body.format(
+                source_label=_safe_identifier(spec["source_label"]),
+                target_label=_safe_identifier(spec["target_label"]),
+                rel_type=_safe_identifier(spec["rel_type"]),
+            )
+        return (
+            "LOAD CSV WITH HEADERS FROM $url AS row\n"
+            "CALL {\n"
+            "    WITH row\n"
+            f"{body}"
+            f"}} IN TRANSACTIONS OF {self.batch_rows} ROWS"
+        )
+
+    def pending_files(self) -> List[str]:
+        """Staged files with rows not yet loaded, in dependency order."""
+        files = self.stager.manifest["files"]
+        loaded = self.stager.manifest.setdefault("loaded_rows", {})
+        pending = [
+            name for name in files if files[name]["rows"] > loaded.get(name, 0)
+        ]
+        return sorted(
+            pending, key=lambda name: (LOAD_ORDER.index(files[name]["kind"]), name)
+        )
+
+    def clear_module(self) -> None:
+        """Delete the module's existing graph data once per rebuild."""
+        if self.stager.manifest.get("cleared"):
+            return
+        with self.driver.session() as session:
+            session.run(
+                _CLEAR_MODULE_QUERY.format(batch_rows=self.batch_rows),
+                {"module_id": self.stager.module_id},
+            ).consume()
+        self.stager.manifest["cleared"] = True
+        self.stager.save_manifest()
+        logger.info(f"Cleared existing graph data for module {self.stager.module_id}")
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Load all pending staged files and mark the load completed.
+
+        Returns:
+            Dict with files_loaded, rows_loaded, elapsed_seconds, and
+            rows_per_second
+        """
+        pending = self.pending_files()
+        total = len(pending)
+        rows_loaded = 0
+        start = time.perf_counter()
+
+        for index, filename in enumerate(pending):
+            spec = self.stager.manifest["files"][filename]
+            self._emit_progress(index, total, f"Loading {filename} ({spec['rows']} rows)")
+
+            file_start = time.perf_counter()
+            with self.driver.session() as session:
+                session.run(
+                    self.build_query(spec), {"url": self.file_url(filename)}
+                ).consume()
+
+            self.stager.manifest["loaded_rows"][filename] = spec["rows"]
+            self.stager.save_manifest()
+            rows_loaded += spec["rows"]
+            logger.info(
+                f"Bulk loaded {filename}: {spec['rows']} rows in "
+                f"{time.perf_counter() - file_start:.2f}s"
+            )
+
+        self.stager.manifest["load_completed"] = True
+        self.stager.save_manifest()
+
+        elapsed = time.perf_counter() - start
+        self._emit_progress(total, total, f"Loaded {total} files, {rows_loaded} rows")
+        return {
+            "files_loaded": total,
+            "rows_loaded": rows_loaded,
+            "elapsed_seconds": round(elapsed, 2),
+            "rows_per_second": round(rows_loaded / elapsed, 1) if elapsed else 0.0,
+        }
@@ -26,7 +26,8 @@ DEPENDENCIES:
     - Internal: api/neo4j_config.py, api/config.py, api/services/vertex_ai_client.py,
                 api/services/chunking_utils.py, api/services/llm_entity_extractor.py,
                 api/services/embeddings.py, api/services/entity_aware_chunker.py,
-                api/services/entity_deduplicator.py, api/services/document_parsers/docx_parser.py
+                api/services/entity_deduplicator.py, api/services/document_parsers/docx_parser.py,
+                api/graph_cache.py, api/ann_index.py, api/concept_rollups.py
 
 USAGE:
     from api.kg_processor import KnowledgeGraphProcessor
@@ -39,6 +40,7 @@ USAGE:
 import os
 import sys
 import json
+import contextlib
 import hashlib
 import asyncio
 import re
@@ -196,6 +198,39 @@ except ImportError:
         get_template_extractor,
     )
 
+try:
+    from kg_bulk_import import BulkImportStager, BulkImporter, ensure_constraints
+except ImportError:
+    from api.kg_bulk_import import BulkImportStager, BulkImporter, ensure_constraints
+
+try:
+    from graph_cache import bump_module_version
+except ImportError:
+    from api.graph_cache import bump_module_version
+
+try:
+    from concept_rollups import (
+        increment_concept_rollups,
+        normalize_concept_name,
+        refresh_module_concept_rollups,
+    )
+except ImportError:
+    from api.concept_rollups import (
+        increment_concept_rollups,
+        normalize_concept_name,
+        refresh_module_concept_rollups,
+    )
+
+try:
+    from ann_index import INDEX_KINDS, fetch_module_embeddings, get_ann_index, update_module_index
+except ImportError:
+    from api.ann_index import (
+        INDEX_KINDS,
+        fetch_module_embeddings,
+        get_ann_index,
+        update_module_index,
+    )
+
 # Timeout for LLM API calls in seconds
 LLM_CALL_TIMEOUT = 60.0
 
@@ -289,6 +324,19 @@ ENTITY_RELATIONSHIP_TYPES = [
     "RELATED_TO",
 ]
 
+# Relationship types accepted when writing entity-entity edges to Neo4j
+VALID_ENTITY_RELATIONSHIP_TYPES = [
+    "DEFINES",
+    "DEPENDS_ON",
+    "USES",
+    "SUPPORTS",
+    "CONTRADICTS",
+    "EXTENDS",
+    "IMPLEMENTS",
+    "REFERENCES",
+    "RELATED_TO",
+]
+
 
 class EntityType(str, Enum):
     """Supported entity types for knowledge graph extraction."""
@@ -823,6 +871,10 @@ class KnowledgeGraphProcessor:
         # Progress callback storage
         self._progress_callback: Optional[Callable[[ProcessingProgress], None]] = None
 
+        # Bulk import stager; when set, store paths stage CSV rows instead of
+        # writing to Neo4j (see bulk_rebuild_module)
+        self._bulk_stager: Optional[BulkImportStager] = None
+
         logger.info(
             f"KnowledgeGraphProcessor initialized: "
             f"chunk_size={chunk_size}, overlap={chunk_overlap}, "
@@ -1540,6 +1592,15 @@ class KnowledgeGraphProcessor:
             await self._store_in_neo4j(
                 document_id, module_id, user_id, chunks, all_entities
             )
+            if self._bulk_stager is None:
+                await asyncio.to_thread(
+                    update_module_index,
+                    self.driver,
+                    module_id,
+                    "chunk",
+                    [chunk.id for chunk in chunks],
+                    [chunk.embedding for chunk in chunks],
+                )
 
             # Step 5.5: Store entity-entity relationships
             if entity_relationships:
@@ -1566,7 +1627,13 @@ class KnowledgeGraphProcessor:
                 )
 
                 # Link child chunks to parent chunks
-                if relationships:
+                if relationships and self._bulk_stager is not None:
+                    for rel in relationships:
+                        self._bulk_stager.stage_child_parent_link(
+                            f"chunk_{document_id}_{rel['child_index']}",
+                            f"parent_chunk_{document_id}_{rel['parent_index']}",
+                        )
+                elif relationships:
                     with self.driver.session() as session:
                         for rel in relationships:
                             parent_id = (
@@ -1600,6 +1667,14 @@ class KnowledgeGraphProcessor:
                     result["entities_embedded"] = 0
 
             result["status"] = "success"
+            if self._bulk_stager is None:
+                # Staged rows only reach Neo4j in bulk_rebuild_module's load
+                bump_module_version(module_id)
+                await asyncio.to_thread(
+                    increment_concept_rollups,
+                    self.driver,
+                    [entity.id for entity in all_entities],
+                )
             self._emit_progress(
                 "complete", 1, 1, f"Processed {document_id} successfully"
             )
@@ -1621,6 +1696,10 @@ class KnowledgeGraphProcessor:
             result["status"] = "error"
             result["error"] = str(e)
             self._emit_progress("error", 0, 1, f"Processing failed: {e}")
+            # Bulk mode writes nothing until load; drop the buffered rows
+            if self._bulk_stager is not None:
+                self._bulk_stager.discard_document()
+                return result
             # Attempt cleanup of any partially written data
             try:
                 from api.graph_manager import GraphManager
@@ -1687,6 +1766,135 @@ class KnowledgeGraphProcessor:
         logger.info(f"Batch processing complete: {len(final_results)} documents")
         return final_results
 
+    async def bulk_rebuild_module(
+        self,
+        module_id: str,
+        user_id: str,
+        documents: List[Dict[str, Any]],
+        staging_root: str | None = None,
+        resume: bool = True,
+        clear_existing: bool = True,
+        create_missing_constraints: bool = True,
+        **process_kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Rebuild a whole module through the bulk import path.
+
+        Runs the normal extraction pipeline per document but stages the
+        resulting nodes/edges as CSV rows (api/kg_bulk_import.py) instead of
+        writing them transactionally, then loads everything with batched
+        LOAD CSV / CALL {} IN TRANSACTIONS queries.
+
+        Resume: documents already staged (manifest.json) are skipped and
+        files already loaded are not reloaded, so a failed rebuild can be
+        restarted with the same arguments. A successful load discards the
+        staging files, so the next rebuild starts from scratch.
+
+        Args:
+            module_id: Module to rebuild
+            user_id: User recorded as owner of the documents
+            documents: Dicts with 'id' and optionally 'content'/'file_path'
+            staging_root: Override for NEO4J_IMPORT_DIR
+            resume: Reuse an existing staging manifest (False starts over)
+            clear_existing: Delete the module's current graph before loading
+            create_missing_constraints: Create missing ID constraints instead
+                of refusing to load
+            **process_kwargs: Passed through to process_document
+
+        Returns:
+            Dict with staged/skipped/failed document counts and load stats
+        """
+        if not self.driver:
+            raise ValueError("Neo4j driver not available")
+
+        # Constraints first: without them every MERGE in the load is a scan
+        created_constraints = ensure_constraints(
+            self.driver, create_missing=create_missing_constraints
+        )
+
+        stager = (
+            BulkImportStager(module_id, staging_root)
+            if staging_root
+            else BulkImportStager(module_id)
+        )
+        if not resume:
+            stager.reset()
+
+        summary: Dict[str, Any] = {
+            "module_id": module_id,
+            "constraints_created": created_constraints,
+            "documents_total": len(documents),
+            "documents_staged": 0,
+            "documents_skipped": 0,
+            "documents_failed": [],
+            "load": None,
+            "status": "processing",
+        }
+
+        total = len(documents)
+        self._bulk_stager = stager
+        try:
+            for index, doc in enumerate(documents):
+                doc_id = doc["id"]
+                if stager.is_staged(doc_id):
+                    summary["documents_skipped"] += 1
+                    continue
+
+                self._emit_progress(
+                    "bulk_stage", index + 1, total,
+                    f"Staging document {index + 1}/{total}: {doc_id}",
+                )
+                stager.begin_document(doc_id)
+                result = await self.process_document(
+                    doc_id,
+                    module_id,
+                    user_id,
+                    file_path=doc.get("file_path"),
+                    document_data=doc if doc.get("content") else None,
+                    **process_kwargs,
+                )
+                if result.get("status") == "success":
+                    stager.commit_document()
+                    summary["documents_staged"] += 1
+                else:
+                    stager.discard_document()
+                    summary["documents_failed"].append(
+                        {"document_id": doc_id, "error": result.get("error")}
+                    )
+        finally:
+            self._bulk_stager = None
+
+        importer = BulkImporter(
+            self.driver,
+            stager,
+            progress_callback=self._emit_progress,
+        )
+        if clear_existing:
+            await asyncio.to_thread(importer.clear_module)
+        summary["load"] = await asyncio.to_thread(importer.load)
+        await asyncio.to_thread(stager.reset)
+        bump_module_version(module_id)
+        await asyncio.to_thread(refresh_module_concept_rollups, self.driver, module_id)
+        store = get_ann_index()
+        for kind in INDEX_KINDS if store is not None else ():
+            try:
+                ids, vectors = await asyncio.to_thread(
+                    fetch_module_embeddings, self.driver, module_id, kind
+                )
+                await asyncio.to_thread(store.build, module_id, kind, ids, vectors)
+            except Exception as e:
+                logger.warning(f"ANN {kind} index rebuild failed for {module_id}: {e}")
+                await asyncio.to_thread(store.drop, module_id, kind)
+        summary["status"] = "success" if not summary["documents_failed"] else "partial"
+
+        logger.info(
+            f"Bulk rebuild of {module_id}: staged={summary['documents_staged']}, "
+            f"skipped={summary['documents_skipped']}, "
+            f"failed={len(summary['documents_failed'])}, "
+            f"rows={summary['load']['rows_loaded']}"
+        )
+        return summary
+
     # ========================================================================
     # HELPER METHODS (02-03-PLAN)
     # ========================================================================
@@ -2494,7 +2702,7 @@ class KnowledgeGraphProcessor:
             module_id: Module ID for tagging all nodes
             user_id: User who owns the document
         """
-        if not self.driver:
+        if not self.driver and self._bulk_stager is None:
             raise ValueError("Neo4j driver not available")
 
         # Generate embeddings for parent chunks if needed
@@ -2504,6 +2712,10 @@ class KnowledgeGraphProcessor:
         for parent, embedding in zip(parent_chunks, embeddings):
             parent["embedding"] = embedding
 
+        if self._bulk_stager is not None:
+            self._bulk_stager.stage_parent_chunks(document_id, parent_chunks)
+            return
+
         with self.driver.session() as session:
             for parent in parent_chunks:
                 parent_id = f"parent_chunk_{document_id}_{parent['index']}"
@@ -3389,7 +3601,7 @@ class KnowledgeGraphProcessor:
             module_id: Module ID for filtering
             entities: List of Entity objects for name-to-ID lookup
         """
-        if not self.driver:
+        if not self.driver and self._bulk_stager is None:
             logger.warning("Neo4j driver not available for relationship storage")
             return
 
@@ -3402,7 +3614,12 @@ class KnowledgeGraphProcessor:
         stored_count = 0
         skipped_count = 0
 
-        with self.driver.session() as session:
+        session_ctx = (
+            contextlib.nullcontext()
+            if self._bulk_stager is not None
+            else self.driver.session()
+        )
+        with session_ctx as session:
             for rel in relationships:
                 try:
                     # Resolve entity names to IDs
@@ -3432,6 +3649,21 @@ class KnowledgeGraphProcessor:
                         skipped_count += 1
                         continue
 
+                    if self._bulk_stager is not None:
+                        self._bulk_stager.stage_entity_relationship(
+                            source_id,
+                            source_type.value,
+                            target_id,
+                            target_type.value,
+                            rel.relationship_type
+                            if rel.relationship_type in VALID_ENTITY_RELATIONSHIP_TYPES
+                            else "RELATED_TO",
+                            rel.confidence,
+                            rel.evidence,
+                        )
+                        stored_count += 1
+                        continue
+
                     # Store relationship in Neo4j
                     await self._create_entity_relationship(
                         session,
@@ -3487,19 +3719,7 @@ class KnowledgeGraphProcessor:
         # Build relationship query based on relationship type
         # Neo4j doesn't allow parameterized relationship types, so we use
         # dynamic query construction (safe since rel_type is validated)
-        valid_rel_types = [
-            "DEFINES",
-            "DEPENDS_ON",
-            "USES",
-            "SUPPORTS",
-            "CONTRADICTS",
-            "EXTENDS",
-            "IMPLEMENTS",
-            "REFERENCES",
-            "RELATED_TO",
-        ]
-
-        if rel_type not in valid_rel_types:
+        if rel_type not in VALID_ENTITY_RELATIONSHIP_TYPES:
             rel_type = "RELATED_TO"
 
         if source_type not in ALLOWED_ENTITY_TYPES:
@@ -3508,8 +3728,8 @@ class KnowledgeGraphProcessor:
             raise ValueError(f"Invalid target entity type: {target_type}")
 
         query = f"""
-        MATCH (source:{source_type} {{id: $source_id, module_id: $module_id}})
-        MATCH (target:{target_type} {{id: $target_id, module_id: $module_id}})
+        MATCH (source:Entity {{id: $source_id, module_id: $module_id}})
+        MATCH (target:Entity {{id: $target_id, module_id: $module_id}})
         MERGE (source)-[r:{rel_type}]->(target)
         SET r.confidence = $confidence,
             r.evidence = $evidence,
@@ -3549,7 +3769,7 @@ class KnowledgeGraphProcessor:
         if not entities:
             return 0
 
-        if not self.driver:
+        if not self.driver and self._bulk_stager is None:
             logger.warning("Neo4j driver not available for entity embedding storage")
             return 0
 
@@ -3566,6 +3786,16 @@ class KnowledgeGraphProcessor:
 
             # Store embeddings in Neo4j
             embedded_count = 0
+            if self._bulk_stager is not None:
+                for entity in entities:
+                    embedding = entity_embeddings.get(entity.id)
+                    if embedding:
+                        self._bulk_stager.stage_entity_embedding(
+                            entity.id, entity.entity_type.value, embedding
+                        )
+                        embedded_count += 1
+                return embedded_count
+
             with self.driver.session() as session:
                 for entity in entities:
                     embedding = entity_embeddings.get(entity.id)
@@ -3617,7 +3847,7 @@ class KnowledgeGraphProcessor:
             raise ValueError(f"Invalid entity type: {entity_type}")
 
         query = f"""
-        MATCH (e:{entity_type} {{id: $entity_id, module_id: $module_id}})
+        MATCH (e:Entity {{id: $entity_id, module_id: $module_id}})
         SET e.embedding = $embedding,
             e.embedded_at = datetime()
         RETURN e.id
@@ -3652,6 +3882,12 @@ class KnowledgeGraphProcessor:
             chunks: List of processed chunks
             all_entities: ALL extracted entities (including standalone)
         """
+        if self._bulk_stager is not None:
+            self._bulk_stager.stage_document(
+                document_id, user_id, chunks, all_entities
+            )
+            return
+
         if not self.driver:
             raise ValueError("Neo4j driver not available")
 
@@ -3710,15 +3946,18 @@ class KnowledgeGraphProcessor:
             for entity in all_entities:
                 tx.run(
                     f"""
-                    MERGE (e:{entity.entity_type.value} {{id: $id}})
-                    ON CREATE SET e.created_at = $created_at
-                    SET e.name = $name, e.definition = $definition,
+                    MERGE (e:Entity {{id: $id}})
+                    ON CREATE SET e:{entity.entity_type.value}, e.created_at = $created_at,
+                                  e.rollup_pending = true
+                    SET e.name = $name, e.name_normalized = $name_normalized,
+                        e.definition = $definition,
                         e.module_id = $module_id, e.confidence = $confidence,
                         e.embedding = $embedding, e.updated_at = $updated_at
                     """,
                     {
                         "id": entity.id,
                         "name": entity.name,
+                        "name_normalized": normalize_concept_name(entity.name),
                         "definition": entity.definition,
                         "module_id": module_id,
                         "confidence": entity.properties.get("confidence", 0.7),
@@ -3735,7 +3974,7 @@ class KnowledgeGraphProcessor:
                     tx.run(
                         """
                         MATCH (c:Chunk {id: $chunk_id})
-                        MATCH (e) WHERE e.id = $entity_id
+                        MATCH (e:Entity {id: $entity_id})
                         MERGE (c)-[r:CONTAINS_ENTITY]->(e)
                         SET r.relevance_score = $relevance_score
                         """,
@@ -3820,9 +4059,11 @@ class KnowledgeGraphProcessor:
             raise ValueError(f"Invalid entity type: {entity.entity_type.value}")
 
         query = f"""
-        MERGE (e:{entity.entity_type.value} {{id: $id}})
-        ON CREATE SET e.created_at = $created_at
+        MERGE (e:Entity {{id: $id}})
+        ON CREATE SET e:{entity.entity_type.value}, e.created_at = $created_at,
+                      e.rollup_pending = true
         SET e.name = $name,
+            e.name_normalized = $name_normalized,
             e.definition = $definition,
             e.module_id = $module_id,
             e.category = $category,
@@ -3839,6 +4080,7 @@ class KnowledgeGraphProcessor:
         params = {
             "id": entity.id,
             "name": entity.name,
+            "name_normalized": normalize_concept_name(entity.name),
             "definition": entity.definition,
             "module_id": module_id,
             "category": entity.properties.get("category", "General"),
@@ -3861,7 +4103,7 @@ class KnowledgeGraphProcessor:
         """Create CONTAINS_ENTITY relationship with relevance score."""
         query = """
         MATCH (c:Chunk {id: $chunk_id})
-        MATCH (e) WHERE e.id = $entity_id
+        MATCH (e:Entity {id: $entity_id})
         MERGE (c)-[r:CONTAINS_ENTITY]->(e)
         SET r.relevance_score = $relevance_score
         RETURN r
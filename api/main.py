@@ -132,6 +132,9 @@ from api.routers.schema import router as schema_router
 
 # Import Graph Preview API router (RC-02)
 from api.routers.graph_preview import router as graph_preview_router
+
+# Import Hybrid Search API router
+from api.routers.search import router as search_router
 from api.routers.settings import router as settings_router
 from api.routers.usage import router as usage_router
 
@@ -263,6 +266,7 @@ app.include_router(
     schema_router
 )  # Schema API (Phase 11-04) - prefix already set in router
 app.include_router(graph_preview_router)  # Graph Preview API (RC-02)
+app.include_router(search_router)  # Hybrid Search API
 app.include_router(settings_router)
 app.include_router(usage_router)
 
@@ -298,6 +302,14 @@ async def _wire_usage_tracking() -> None:
         logger.warning("Usage tracking setup skipped: %s", exc)
 
 
+@app.on_event("shutdown")
+async def _close_async_neo4j() -> None:
+    """Close the async Neo4j driver pool if graph reads created it."""
+    from api.neo4j_config import close_async_neo4j
+
+    await close_async_neo4j()
+
+
 base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 pdfs_dir = os.path.join(base_dir, "pdfs")
 os.makedirs(pdfs_dir, exist_ok=True)
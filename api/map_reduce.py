@@ -0,0 +1,188 @@
+"""
+============================================================================
+FILE: map_reduce.py
+LOCATION: api/map_reduce.py
+============================================================================
+
+PURPOSE:
+    Bounded-concurrency map and token-budgeted hierarchical reduce helpers
+    for LLM pipelines that must combine more text than one prompt can hold.
+
+ROLE IN PROJECT:
+    Backs SummaryService.summarize_module (services/summary_service.py).
+    Module summaries used to summarize documents one at a time and then
+    paste every document summary into a single synthesis prompt, which was
+    slow and overflowed the context window on large modules.
+
+    - bounded_gather runs the per-document (map) step with a concurrency cap
+    - pack_by_token_budget splits items into consecutive groups whose token
+      count fits the budget, so the fan-in width follows the budget rather
+      than a fixed group size
+    - reduce_by_token_budget combines groups level by level until the
+      remaining items fit into one final prompt
+
+KEY COMPONENTS:
+    - bounded_gather: asyncio.gather with a semaphore, results in order
+    - pack_by_token_budget: Greedy, order-preserving grouping by token count
+    - reduce_by_token_budget: Hierarchical reduce tree
+
+DEPENDENCIES:
+    - External: None
+    - Internal: None
+
+USAGE:
+    from api.map_reduce import bounded_gather, reduce_by_token_budget
+
+    summaries = await bounded_gather([make(d) for d in docs], limit=8)
+    parts = await reduce_by_token_budget(summaries, combine, 6000, count_tokens)
+============================================================================
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from functools import partial
+from typing import Awaitable, Callable, Iterable, List, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Safety net against a combine step that does not shrink its input
+MAX_REDUCE_LEVELS = 8
+
+
+# ============================================================================
+# MAP
+# ============================================================================
+
+
+async def bounded_gather(
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    limit: int,
+) -> List[T]:
+    """
+    Run coroutine factories with at most `limit` in flight.
+
+    Args:
+        factories: Zero-argument callables returning awaitables
+        limit: Maximum concurrent awaitables (at least 1)
+
+    Returns:
+        Results in the order of factories
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(factory: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await factory()
+
+    return list(await asyncio.gather(*(run(factory) for factory in factories)))
+
+
+# ============================================================================
+# REDUCE
+# ============================================================================
+
+
+def pack_by_token_budget(
+    items: List[T],
+    budget: int,
+    count_tokens: Callable[[T], int],
+) -> List[List[T]]:
+    """
+    Split items into consecutive groups that each fit the token budget.
+
+    An item larger than the budget on its own gets a group to itself.
+
+    Args:
+        items: Items in order
+        budget: Maximum tokens per group
+        count_tokens: Token count of one item
+
+    Returns:
+        Groups covering every item, in order
+    """
+    groups: List[List[T]] = []
+    current: List[T] = []
+    used = 0
+    for item in items:
+        tokens = count_tokens(item)
+        if current and used + tokens > budget:
+            groups.append(current)
+            current, used = [], 0
+        current.append(item)
+        used += tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+async def reduce_by_token_budget(
+    items: List[T],
+    combine: Callable[[int, int, List[T]], Awaitable[T]],
+    budget: int,
+    count_tokens: Callable[[T], int],
+    concurrency: int = 4,
+) -> List[T]:
+    """
+    Combine items level by level until they fit into one prompt.
+
+    Each level packs the items into budget-sized groups and combines every
+    group into one item (groups of a level run concurrently); a lone item
+    that fits the budget is carried up unchanged. Levels that would not
+    reduce the item count fall back to pairs, so the tree always converges.
+
+    Args:
+        items: Leaf items in order
+        combine: async (level, group index, group) -> combined item
+        budget: Token budget of one prompt
+        count_tokens: Token count of one item
+        concurrency: Maximum combine calls in flight per level
+
+    Returns:
+        Items whose total token count fits the budget (the input itself if
+        it already fits)
+    """
+    level = 0
+    while len(items) > 1 and sum(count_tokens(item) for item in items) > budget:
+        if level >= MAX_REDUCE_LEVELS:
+            logger.warning(
+                f"Reduce stopped after {level} levels with {len(items)} items over budget"
+            )
+            break
+        level += 1
+
+        groups = pack_by_token_budget(items, budget, count_tokens)
+        if len(groups) == len(items):
+            groups = [items[i:i + 2] for i in range(0, len(items), 2)]
+
+        logger.info(f"Reduce level {level}: {len(items)} items -> {len(groups)} groups")
+        items = await bounded_gather(
+            [
+                partial(_combine_group, combine, level, index, group, budget, count_tokens)
+                for index, group in enumerate(groups)
+            ],
+            limit=concurrency,
+        )
+    return items
+
+
+async def _combine_group(
+    combine: Callable[[int, int, List[T]], Awaitable[T]],
+    level: int,
+    index: int,
+    group: List[T],
+    budget: int,
+    count_tokens: Callable[[T], int],
+) -> T:
+    # A lone item that already fits moves up a level unchanged
+    if len(group) == 1 and count_tokens(group[0]) <= budget:
+        return group[0]
+    return await combine(level, index, group)
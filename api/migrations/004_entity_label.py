@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+============================================================================
+FILE: 004_entity_label.py
+LOCATION: api/migrations/004_entity_label.py
+============================================================================
+
+PURPOSE:
+    Add a common :Entity label to every entity node, with a uniqueness
+    constraint on id and a range index on name.
+
+ROLE IN PROJECT:
+    Fourth migration. Entity lookups previously needed a UNION across the
+    Topic/Concept/Methodology/Finding labels, and the chunk-entity edge writer
+    matched entities with an unlabelled `MATCH (e) WHERE e.id = ...` (a full
+    node scan per edge). After this migration those queries resolve through
+    a single index on :Entity.
+
+    Definition and Citation nodes carry the label too (the chunk-entity edge
+    writer links them), so queries that serve concepts keep a
+    Topic/Concept/Methodology/Finding filter on top of the :Entity match.
+
+KEY COMPONENTS:
+    - EntityLabel: Migration that backfills the label and creates the schema
+    - ENTITY_TYPE_LABELS: Per-type labels that receive the common label
+
+DEPENDENCIES:
+    - External: neo4j
+    - Internal: api/migrations/__init__.py, api/neo4j_config.py, api/schemas/neo4j_schema.py
+
+USAGE:
+    python api/migrations/004_entity_label.py
+    python api/migrations/004_entity_label.py --verify-only
+    python api/migrations/004_entity_label.py --downgrade
+============================================================================
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from migrations import Migration, run_migration
+from neo4j_config import neo4j_driver
+from logging_config import logger
+from schemas.neo4j_schema import (
+    ENTITY_LABEL,
+    RANGE_INDICES,
+    NodeType,
+    generate_constraint_cypher,
+    generate_range_index_cypher,
+    CONSTRAINTS,
+)
+
+
+# Per-type labels that all carry the common :Entity label
+ENTITY_TYPE_LABELS = [
+    NodeType.TOPIC.value,
+    NodeType.CONCEPT.value,
+    NodeType.METHODOLOGY.value,
+    NodeType.FINDING.value,
+    NodeType.DEFINITION.value,
+    NodeType.CITATION.value,
+]
+
+# Rows per transaction when (un)labelling existing nodes
+BATCH_SIZE = 10000
+
+# Non-unique fallback index used while duplicate ids block the constraint
+FALLBACK_ID_INDEX = "entity_id"
+
+ENTITY_CONSTRAINT = next(c for c in CONSTRAINTS if c.node_type == ENTITY_LABEL)
+
+_TYPE_FILTER = " OR ".join(f"e:{label}" for label in ENTITY_TYPE_LABELS)
+
+
+class EntityLabel(Migration):
+    """Migration adding the common :Entity label with id/name indexing."""
+
+    version = "004"
+    description = "Add common :Entity label with id uniqueness constraint and name index"
+
+    def upgrade(self, driver) -> bool:
+        """
+        Apply migration: label entities, then create the constraint and index.
+
+        The label is backfilled before the constraint is created so the
+        constraint validates against the full entity set. Entity ids that are
+        duplicated across type labels block the constraint; in that case a
+        plain range index on id is created instead (lookups stay indexed) and
+        the duplicates are logged so they can be merged and the migration re-run.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            logger.info("=" * 60)
+            logger.info("MIGRATION 004: Common Entity label")
+            logger.info("=" * 60)
+
+            # ========================================
+            # STEP 1: CHECK FOR DUPLICATE IDS
+            # ========================================
+            logger.info("Step 1: Checking entity ids are unique across types...")
+
+            duplicates = self.execute_cypher_query(
+                driver,
+                f"""
+                MATCH (e)
+                WHERE {_TYPE_FILTER}
+                WITH e.id as id, count(e) as copies
+                WHERE copies > 1
+                RETURN id, copies
+                ORDER BY copies DESC
+                LIMIT 20
+                """,
+            )
+            if duplicates:
+                # The constraint may already exist (003 or a bulk import
+                # creates it on an empty label); it would reject the backfill
+                self.execute_cypher_query(
+                    driver, f"DROP CONSTRAINT {ENTITY_CONSTRAINT.name} IF EXISTS"
+                )
+
+            # ========================================
+            # STEP 2: BACKFILL :Entity LABEL
+            # ========================================
+            logger.info("Step 2: Adding :Entity label to existing entities...")
+
+            self.execute_cypher_query(
+                driver,
+                f"""
+                MATCH (e)
+                WHERE ({_TYPE_FILTER}) AND NOT e:{ENTITY_LABEL}
+                CALL {{
+                    WITH e
+                    SET e:{ENTITY_LABEL}
+                }} IN TRANSACTIONS OF {BATCH_SIZE} ROWS
+                """,
+            )
+            total = self.execute_cypher_query(
+                driver, f"MATCH (e:{ENTITY_LABEL}) RETURN count(e) as count"
+            )[0]["count"]
+            logger.info(f"  ✓ {total} entities carry the :{ENTITY_LABEL} label")
+
+            # ========================================
+            # STEP 3: ID CONSTRAINT (OR FALLBACK INDEX)
+            # ========================================
+            logger.info("Step 3: Indexing entity ids...")
+
+            if duplicates:
+                logger.warning(
+                    f"  {len(duplicates)}+ entity ids are shared by several nodes; "
+                    f"creating non-unique index '{FALLBACK_ID_INDEX}' instead of "
+                    f"'{ENTITY_CONSTRAINT.name}'"
+                )
+                for record in duplicates:
+                    logger.warning(f"    {record['id']}: {record['copies']} nodes")
+                self.execute_cypher_query(
+                    driver,
+                    f"""
+                    CREATE INDEX {FALLBACK_ID_INDEX} IF NOT EXISTS
+                    FOR (e:{ENTITY_LABEL}) ON (e.id)
+                    """,
+                )
+            else:
+                self.execute_cypher_query(
+                    driver, f"DROP INDEX {FALLBACK_ID_INDEX} IF EXISTS"
+                )
+                self.execute_cypher_query(
+                    driver, generate_constraint_cypher(ENTITY_CONSTRAINT)
+                )
+                logger.info(f"  ✓ Created constraint: {ENTITY_CONSTRAINT.name}")
+
+            # ========================================
+            # STEP 4: NAME INDEX
+            # ========================================
+            logger.info("Step 4: Creating entity name index...")
+
+            for index in RANGE_INDICES:
+                self.execute_cypher_query(driver, generate_range_index_cypher(index))
+                logger.info(f"  ✓ Created index: {index.name}")
+
+            return self.verify(driver)
+
+        except Exception as e:
+            logger.error(f"Migration 004 failed: {e}")
+            raise
+
+    def downgrade(self, driver) -> bool:
+        """
+        Revert migration: drop the constraint/indexes and remove the label.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if successful
+        """
+        logger.warning("=" * 60)
+        logger.warning("MIGRATION 004: DOWNGRADE (REVERT)")
+        logger.warning("=" * 60)
+
+        try:
+            self.execute_cypher_query(
+                driver, f"DROP CONSTRAINT {ENTITY_CONSTRAINT.name} IF EXISTS"
+            )
+            self.execute_cypher_query(driver, f"DROP INDEX {FALLBACK_ID_INDEX} IF EXISTS")
+            for index in RANGE_INDICES:
+                self.execute_cypher_query(driver, f"DROP INDEX {index.name} IF EXISTS")
+
+            self.execute_cypher_query(
+                driver,
+                f"""
+                MATCH (e:{ENTITY_LABEL})
+                CALL {{
+                    WITH e
+                    REMOVE e:{ENTITY_LABEL}
+                }} IN TRANSACTIONS OF {BATCH_SIZE} ROWS
+                """,
+            )
+            logger.info("✓ Removed :Entity label, constraint and indexes")
+            return True
+
+        except Exception as e:
+            logger.error(f"Downgrade failed: {e}")
+            return False
+
+    def verify(self, driver) -> bool:
+        """
+        Verify every entity is labelled and the id/name lookups are indexed.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if migration is in place
+        """
+        try:
+            unlabelled = self.execute_cypher_query(
+                driver,
+                f"""
+                MATCH (e)
+                WHERE ({_TYPE_FILTER}) AND NOT e:{ENTITY_LABEL}
+                RETURN count(e) as count
+                """,
+            )[0]["count"]
+            if unlabelled:
+                logger.error(f"{unlabelled} entities are missing the :Entity label")
+                return False
+
+            indexes = {
+                r["name"] for r in self.execute_cypher_query(driver, "SHOW INDEXES")
+            }
+            constraints = {
+                r["name"] for r in self.execute_cypher_query(driver, "SHOW CONSTRAINTS")
+            }
+
+            if ENTITY_CONSTRAINT.name not in constraints:
+                if FALLBACK_ID_INDEX not in indexes:
+                    logger.error("Entity id is neither constrained nor indexed")
+                    return False
+                logger.warning(
+                    f"Entity ids are indexed but not unique; merge duplicates and "
+                    f"re-run to create '{ENTITY_CONSTRAINT.name}'"
+                )
+
+            missing = [i.name for i in RANGE_INDICES if i.name not in indexes]
+            if missing:
+                logger.error(f"Missing indexes: {missing}")
+                return False
+
+            logger.info("✓ Entity label migration verified")
+            return True
+
+        except Exception as e:
+            logger.error(f"Verification failed: {e}")
+            return False
+
+
+# ============================================================================
+# CLI ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run common Entity label migration")
+    parser.add_argument(
+        "--verify-only",
+        action="store_true",
+        help="Only verify current schema state"
+    )
+    parser.add_argument(
+        "--downgrade",
+        action="store_true",
+        help="Remove the :Entity label, constraint and indexes"
+    )
+
+    args = parser.parse_args()
+
+    if neo4j_driver is None:
+        print("ERROR: Neo4j driver not initialized. Check .env configuration.")
+        sys.exit(1)
+
+    migration = EntityLabel()
+
+    if args.verify_only:
+        sys.exit(0 if migration.verify(neo4j_driver) else 1)
+
+    if args.downgrade:
+        sys.exit(0 if migration.downgrade(neo4j_driver) else 1)
+
+    success = run_migration(migration, neo4j_driver)
+    sys.exit(0 if success else 1)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+============================================================================
+FILE: 005_search_indexes.py
+LOCATION: api/migrations/005_search_indexes.py
+============================================================================
+
+PURPOSE:
+    Index chunk module ids for hybrid search: add module_id to the chunk
+    fulltext index and a range index on Chunk.module_id.
+
+ROLE IN PROJECT:
+    Fifth migration. The search service (api/search_service.py) filters
+    by module inside the Lucene query, which needs module_id in the fulltext
+    index, and falls back to an exact per-module vector scan when the ANN
+    results are mostly outside the requested modules, which needs the range
+    index.
+
+KEY COMPONENTS:
+    - SearchIndexes: Migration that rebuilds the fulltext index and adds the
+      chunk module index
+
+DEPENDENCIES:
+    - External: neo4j
+    - Internal: api/migrations/__init__.py, api/neo4j_config.py, api/schemas/neo4j_schema.py
+
+USAGE:
+    python api/migrations/005_search_indexes.py
+    python api/migrations/005_search_indexes.py --verify-only
+    python api/migrations/005_search_indexes.py --downgrade
+============================================================================
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from migrations import Migration, run_migration
+from neo4j_config import neo4j_driver
+from logging_config import logger
+from schemas.neo4j_schema import (
+    FULLTEXT_INDICES,
+    RANGE_INDICES,
+    generate_fulltext_index_cypher,
+    generate_range_index_cypher,
+)
+
+
+CHUNK_FULLTEXT_INDEX = next(i for i in FULLTEXT_INDICES if i.name == "chunk_fulltext_index")
+CHUNK_MODULE_INDEX = next(i for i in RANGE_INDICES if i.name == "chunk_module_id")
+
+
+class SearchIndexes(Migration):
+    """Migration adding module_id to the chunk search indexes."""
+
+    version = "005"
+    description = "Index Chunk.module_id in the fulltext index and a range index"
+
+    def _fulltext_properties(self, driver):
+        """Properties currently covered by the chunk fulltext index, or None."""
+        records = self.execute_cypher_query(
+            driver,
+            """
+            SHOW FULLTEXT INDEXES YIELD name, properties
+            WHERE name = $name
+            RETURN properties
+            """,
+            {"name": CHUNK_FULLTEXT_INDEX.name},
+        )
+        return sorted(records[0]["properties"]) if records else None
+
+    def upgrade(self, driver) -> bool:
+        """
+        Apply migration: rebuild the fulltext index and add the range index.
+
+        Fulltext index properties cannot be altered in place, so the index is
+        dropped and recreated; Neo4j repopulates it in the background and
+        search falls back to vector results until it is ONLINE.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            logger.info("=" * 60)
+            logger.info("MIGRATION 005: Search indexes")
+            logger.info("=" * 60)
+
+            # ========================================
+            # STEP 1: CHUNK FULLTEXT INDEX
+            # ========================================
+            logger.info("Step 1: Adding module_id to the chunk fulltext index...")
+
+            current = self._fulltext_properties(driver)
+            if current != sorted(CHUNK_FULLTEXT_INDEX.properties):
+                if current is not None:
+                    self.execute_cypher_query(
+                        driver, f"DROP INDEX {CHUNK_FULLTEXT_INDEX.name} IF EXISTS"
+                    )
+                self.execute_cypher_query(
+                    driver, generate_fulltext_index_cypher(CHUNK_FULLTEXT_INDEX)
+                )
+                logger.info(
+                    f"  ✓ Rebuilt {CHUNK_FULLTEXT_INDEX.name} on "
+                    f"{CHUNK_FULLTEXT_INDEX.properties}"
+                )
+            else:
+                logger.info("  ✓ Fulltext index already covers module_id")
+
+            # ========================================
+            # STEP 2: CHUNK MODULE INDEX
+            # ========================================
+            logger.info("Step 2: Creating chunk module index...")
+
+            self.execute_cypher_query(driver, generate_range_index_cypher(CHUNK_MODULE_INDEX))
+            logger.info(f"  ✓ Created index: {CHUNK_MODULE_INDEX.name}")
+
+            return self.verify(driver)
+
+        except Exception as e:
+            logger.error(f"Migration 005 failed: {e}")
+            raise
+
+    def downgrade(self, driver) -> bool:
+        """
+        Revert migration: restore the text-only fulltext index.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if successful
+        """
+        logger.warning("=" * 60)
+        logger.warning("MIGRATION 005: DOWNGRADE (REVERT)")
+        logger.warning("=" * 60)
+
+        try:
+            self.execute_cypher_query(driver, f"DROP INDEX {CHUNK_MODULE_INDEX.name} IF EXISTS")
+            self.execute_cypher_query(
+                driver, f"DROP INDEX {CHUNK_FULLTEXT_INDEX.name} IF EXISTS"
+            )
+            self.execute_cypher_query(
+                driver,
+                generate_fulltext_index_cypher(
+                    CHUNK_FULLTEXT_INDEX.model_copy(update={"properties": ["text"]})
+                ),
+            )
+            logger.info("✓ Restored text-only fulltext index, dropped chunk module index")
+            return True
+
+        except Exception as e:
+            logger.error(f"Downgrade failed: {e}")
+            return False
+
+    def verify(self, driver) -> bool:
+        """
+        Verify both chunk search indexes cover module_id.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if migration is in place
+        """
+        try:
+            if self._fulltext_properties(driver) != sorted(CHUNK_FULLTEXT_INDEX.properties):
+                logger.error(f"{CHUNK_FULLTEXT_INDEX.name} does not cover module_id")
+                return False
+
+            indexes = {
+                r["name"] for r in self.execute_cypher_query(driver, "SHOW INDEXES")
+            }
+            if CHUNK_MODULE_INDEX.name not in indexes:
+                logger.error(f"Missing index: {CHUNK_MODULE_INDEX.name}")
+                return False
+
+            logger.info("✓ Search index migration verified")
+            return True
+
+        except Exception as e:
+            logger.error(f"Verification failed: {e}")
+            return False
+
+
+# ============================================================================
+# CLI ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run search index migration")
+    parser.add_argument(
+        "--verify-only",
+        action="store_true",
+        help="Only verify current schema state"
+    )
+    parser.add_argument(
+        "--downgrade",
+        action="store_true",
+        help="Restore the text-only fulltext index"
+    )
+
+    args = parser.parse_args()
+
+    if neo4j_driver is None:
+        print("ERROR: Neo4j driver not initialized. Check .env configuration.")
+        sys.exit(1)
+
+    migration = SearchIndexes()
+
+    if args.verify_only:
+        sys.exit(0 if migration.verify(neo4j_driver) else 1)
+
+    if args.downgrade:
+        sys.exit(0 if migration.downgrade(neo4j_driver) else 1)
+
+    success = run_migration(migration, neo4j_driver)
+    sys.exit(0 if success else 1)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+============================================================================
+FILE: 006_feedback_rollups.py
+LOCATION: api/migrations/006_feedback_rollups.py
+============================================================================
+
+PURPOSE:
+    Create the FeedbackRollup key constraint and module index, and backfill
+    rollup counters from existing Feedback nodes.
+
+ROLE IN PROJECT:
+    Sixth migration. FeedbackManager (api/feedback_manager.py) keeps one
+    FeedbackRollup node per (module, day, feedback type) up to date on every
+    submission and answers dashboard stats from them. The key constraint
+    keeps concurrent MERGEs from creating duplicate buckets; the backfill
+    covers feedback stored before rollups existed.
+
+KEY COMPONENTS:
+    - FeedbackRollups: Migration creating the schema and rebuilding rollups
+
+DEPENDENCIES:
+    - External: neo4j
+    - Internal: api/migrations/__init__.py, api/neo4j_config.py,
+      api/schemas/neo4j_schema.py, api/feedback_manager.py
+
+USAGE:
+    python api/migrations/006_feedback_rollups.py
+    python api/migrations/006_feedback_rollups.py --verify-only
+    python api/migrations/006_feedback_rollups.py --downgrade
+============================================================================
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports (and the repo root for api.*)
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from migrations import Migration, run_migration
+from neo4j_config import neo4j_driver
+from logging_config import logger
+from schemas.neo4j_schema import (
+    CONSTRAINTS,
+    RANGE_INDICES,
+    generate_constraint_cypher,
+    generate_range_index_cypher,
+)
+from api.feedback_manager import FeedbackManager
+
+
+ROLLUP_KEY_CONSTRAINT = next(c for c in CONSTRAINTS if c.name == "feedback_rollup_key_unique")
+ROLLUP_MODULE_INDEX = next(i for i in RANGE_INDICES if i.name == "feedback_rollup_module_id")
+
+
+class FeedbackRollups(Migration):
+    """Migration adding FeedbackRollup counters."""
+
+    version = "006"
+    description = "FeedbackRollup constraint, index and backfill"
+
+    def upgrade(self, driver) -> bool:
+        """
+        Apply migration: create the schema, then rebuild all rollups.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            logger.info("=" * 60)
+            logger.info("MIGRATION 006: Feedback rollups")
+            logger.info("=" * 60)
+
+            # ========================================
+            # STEP 1: SCHEMA
+            # ========================================
+            logger.info("Step 1: Creating FeedbackRollup constraint and index...")
+
+            self.execute_cypher_query(driver, generate_constraint_cypher(ROLLUP_KEY_CONSTRAINT))
+            self.execute_cypher_query(driver, generate_range_index_cypher(ROLLUP_MODULE_INDEX))
+            logger.info(f"  ✓ Created {ROLLUP_KEY_CONSTRAINT.name}, {ROLLUP_MODULE_INDEX.name}")
+
+            # ========================================
+            # STEP 2: BACKFILL
+            # ========================================
+            logger.info("Step 2: Rebuilding rollups from Feedback nodes...")
+
+            rollups = FeedbackManager(driver).rebuild_rollups()
+            logger.info(f"  ✓ Created {rollups} rollup nodes")
+
+            return self.verify(driver)
+
+        except Exception as e:
+            logger.error(f"Migration 006 failed: {e}")
+            raise
+
+    def downgrade(self, driver) -> bool:
+        """
+        Revert migration: drop rollup nodes, constraint and index.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if successful
+        """
+        logger.warning("=" * 60)
+        logger.warning("MIGRATION 006: DOWNGRADE (REVERT)")
+        logger.warning("=" * 60)
+
+        try:
+            self.execute_cypher_query(
+                driver,
+                "MATCH (r:FeedbackRollup) CALL { WITH r DETACH DELETE r } IN TRANSACTIONS",
+            )
+            self.execute_cypher_query(driver, f"DROP INDEX {ROLLUP_MODULE_INDEX.name} IF EXISTS")
+            self.execute_cypher_query(
+                driver, f"DROP CONSTRAINT {ROLLUP_KEY_CONSTRAINT.name} IF EXISTS"
+            )
+            logger.info("✓ Dropped feedback rollups")
+            return True
+
+        except Exception as e:
+            logger.error(f"Downgrade failed: {e}")
+            return False
+
+    def verify(self, driver) -> bool:
+        """
+        Verify the rollup constraint and index exist.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if migration is in place
+        """
+        try:
+            constraints = {
+                r["name"] for r in self.execute_cypher_query(driver, "SHOW CONSTRAINTS")
+            }
+            if ROLLUP_KEY_CONSTRAINT.name not in constraints:
+                logger.error(f"Missing constraint: {ROLLUP_KEY_CONSTRAINT.name}")
+                return False
+
+            indexes = {
+                r["name"] for r in self.execute_cypher_query(driver, "SHOW INDEXES")
+            }
+            if ROLLUP_MODULE_INDEX.name not in indexes:
+                logger.error(f"Missing index: {ROLLUP_MODULE_INDEX.name}")
+                return False
+
+            logger.info("✓ Feedback rollup migration verified")
+            return True
+
+        except Exception as e:
+            logger.error(f"Verification failed: {e}")
+            return False
+
+
+# ============================================================================
+# CLI ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run feedback rollup migration")
+    parser.add_argument(
+        "--verify-only",
+        action="store_true",
+        help="Only verify current schema state"
+    )
+    parser.add_argument(
+        "--downgrade",
+        action="store_true",
+        help="Drop rollup nodes, constraint and index"
+    )
+
+    args = parser.parse_args()
+
+    if neo4j_driver is None:
+        print("ERROR: Neo4j driver not initialized. Check .env configuration.")
+        sys.exit(1)
+
+    migration = FeedbackRollups()
+
+    if args.verify_only:
+        sys.exit(0 if migration.verify(neo4j_driver) else 1)
+
+    if args.downgrade:
+        sys.exit(0 if migration.downgrade(neo4j_driver) else 1)
+
+    success = run_migration(migration, neo4j_driver)
+    sys.exit(0 if success else 1)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+============================================================================
+FILE: 007_feedback_retention_index.py
+LOCATION: api/migrations/007_feedback_retention_index.py
+============================================================================
+
+PURPOSE:
+    Add a range index on Feedback.timestamp.
+
+ROLE IN PROJECT:
+    Seventh migration. FeedbackManager.delete_old_feedback deletes expired
+    feedback in many small batches; with this index each batch is an index
+    seek on the expired range instead of a full Feedback label scan, and
+    time-filtered stats scans benefit as well.
+
+KEY COMPONENTS:
+    - FeedbackRetentionIndex: Migration creating the timestamp index
+
+DEPENDENCIES:
+    - External: neo4j
+    - Internal: api/migrations/__init__.py, api/neo4j_config.py, api/schemas/neo4j_schema.py
+
+USAGE:
+    python api/migrations/007_feedback_retention_index.py
+    python api/migrations/007_feedback_retention_index.py --verify-only
+    python api/migrations/007_feedback_retention_index.py --downgrade
+============================================================================
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from migrations import Migration, run_migration
+from neo4j_config import neo4j_driver
+from logging_config import logger
+from schemas.neo4j_schema import RANGE_INDICES, generate_range_index_cypher
+
+
+FEEDBACK_TIMESTAMP_INDEX = next(i for i in RANGE_INDICES if i.name == "feedback_timestamp")
+
+
+class FeedbackRetentionIndex(Migration):
+    """Migration adding the Feedback.timestamp index."""
+
+    version = "007"
+    description = "Range index on Feedback.timestamp for batched retention"
+
+    def upgrade(self, driver) -> bool:
+        """
+        Apply migration: create the timestamp index.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            logger.info("=" * 60)
+            logger.info("MIGRATION 007: Feedback retention index")
+            logger.info("=" * 60)
+
+            self.execute_cypher_query(driver, generate_range_index_cypher(FEEDBACK_TIMESTAMP_INDEX))
+            logger.info(f"  ✓ Created index: {FEEDBACK_TIMESTAMP_INDEX.name}")
+
+            return self.verify(driver)
+
+        except Exception as e:
+            logger.error(f"Migration 007 failed: {e}")
+            raise
+
+    def downgrade(self, driver) -> bool:
+        """
+        Revert migration: drop the timestamp index.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if successful
+        """
+        logger.warning("=" * 60)
+        logger.warning("MIGRATION 007: DOWNGRADE (REVERT)")
+        logger.warning("=" * 60)
+
+        try:
+            self.execute_cypher_query(
+                driver, f"DROP INDEX {FEEDBACK_TIMESTAMP_INDEX.name} IF EXISTS"
+            )
+            logger.info(f"✓ Dropped index: {FEEDBACK_TIMESTAMP_INDEX.name}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Downgrade failed: {e}")
+            return False
+
+    def verify(self, driver) -> bool:
+        """
+        Verify the timestamp index exists.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if migration is in place
+        """
+        try:
+            indexes = {
+                r["name"] for r in self.execute_cypher_query(driver, "SHOW INDEXES")
+            }
+            if FEEDBACK_TIMESTAMP_INDEX.name not in indexes:
+                logger.error(f"Missing index: {FEEDBACK_TIMESTAMP_INDEX.name}")
+                return False
+
+            logger.info("✓ Feedback retention index verified")
+            return True
+
+        except Exception as e:
+            logger.error(f"Verification failed: {e}")
+            return False
+
+
+# ============================================================================
+# CLI ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run feedback retention index migration")
+    parser.add_argument(
+        "--verify-only",
+        action="store_true",
+        help="Only verify current schema state"
+    )
+    parser.add_argument(
+        "--downgrade",
+        action="store_true",
+        help="Drop the Feedback.timestamp index"
+    )
+
+    args = parser.parse_args()
+
+    if neo4j_driver is None:
+        print("ERROR: Neo4j driver not initialized. Check .env configuration.")
+        sys.exit(1)
+
+    migration = FeedbackRetentionIndex()
+
+    if args.verify_only:
+        sys.exit(0 if migration.verify(neo4j_driver) else 1)
+
+    if args.downgrade:
+        sys.exit(0 if migration.downgrade(neo4j_driver) else 1)
+
+    success = run_migration(migration, neo4j_driver)
+    sys.exit(0 if success else 1)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+============================================================================
+FILE: 008_concept_rollups.py
+LOCATION: api/migrations/008_concept_rollups.py
+============================================================================
+
+PURPOSE:
+    Create the ConceptRollup key constraint and indexes plus the
+    Entity.name_normalized index, and backfill rollups for every module.
+
+ROLE IN PROJECT:
+    Eighth migration. TrendAnalyzer (services/trend_analyzer.py) reads
+    concept frequency, trending and emerging concepts from ConceptRollup
+    nodes (api/concept_rollups.py) that the KG store path keeps up to date,
+    and looks up concept evolution by Entity.name_normalized. The backfill
+    stamps name_normalized on existing entities and builds their rollups.
+
+KEY COMPONENTS:
+    - ConceptRollups: Migration creating the schema and rebuilding rollups
+
+DEPENDENCIES:
+    - External: neo4j
+    - Internal: api/migrations/__init__.py, api/neo4j_config.py,
+      api/schemas/neo4j_schema.py, api/concept_rollups.py
+
+USAGE:
+    python api/migrations/008_concept_rollups.py
+    python api/migrations/008_concept_rollups.py --verify-only
+    python api/migrations/008_concept_rollups.py --downgrade
+============================================================================
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports (and the repo root for api.*)
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from migrations import Migration, run_migration
+from neo4j_config import neo4j_driver
+from logging_config import logger
+from schemas.neo4j_schema import (
+    CONSTRAINTS,
+    RANGE_INDICES,
+    generate_constraint_cypher,
+    generate_range_index_cypher,
+)
+from api.concept_rollups import rebuild_concept_rollups
+
+
+ROLLUP_KEY_CONSTRAINT = next(c for c in CONSTRAINTS if c.name == "concept_rollup_key_unique")
+ROLLUP_INDEXES = [
+    i for i in RANGE_INDICES
+    if i.name in (
+        "entity_name_normalized",
+        "concept_rollup_module_id",
+        "concept_rollup_day",
+        "concept_rollup_name_normalized",
+    )
+]
+
+
+class ConceptRollups(Migration):
+    """Migration adding ConceptRollup counters."""
+
+    version = "008"
+    description = "ConceptRollup constraint, indexes and backfill"
+
+    def upgrade(self, driver) -> bool:
+        """
+        Apply migration: create the schema, then rebuild all rollups.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            logger.info("=" * 60)
+            logger.info("MIGRATION 008: Concept rollups")
+            logger.info("=" * 60)
+
+            # ========================================
+            # STEP 1: SCHEMA
+            # ========================================
+            logger.info("Step 1: Creating ConceptRollup constraint and indexes...")
+
+            self.execute_cypher_query(driver, generate_constraint_cypher(ROLLUP_KEY_CONSTRAINT))
+            for index in ROLLUP_INDEXES:
+                self.execute_cypher_query(driver, generate_range_index_cypher(index))
+                logger.info(f"  ✓ Created index: {index.name}")
+
+            # ========================================
+            # STEP 2: BACKFILL
+            # ========================================
+            logger.info("Step 2: Rebuilding concept rollups from Entity nodes...")
+
+            summary = rebuild_concept_rollups(driver)
+            logger.info(
+                f"  ✓ Created {summary['rollups']} rollup nodes "
+                f"for {summary['modules']} modules"
+            )
+
+            return self.verify(driver)
+
+        except Exception as e:
+            logger.error(f"Migration 008 failed: {e}")
+            raise
+
+    def downgrade(self, driver) -> bool:
+        """
+        Revert migration: drop rollup nodes, constraint and indexes.
+
+        Entity.name_normalized values are left in place; they are harmless
+        without the index.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if successful
+        """
+        logger.warning("=" * 60)
+        logger.warning("MIGRATION 008: DOWNGRADE (REVERT)")
+        logger.warning("=" * 60)
+
+        try:
+            self.execute_cypher_query(
+                driver,
+                "MATCH (r:ConceptRollup) CALL { WITH r DETACH DELETE r } IN TRANSACTIONS",
+            )
+            for index in ROLLUP_INDEXES:
+                self.execute_cypher_query(driver, f"DROP INDEX {index.name} IF EXISTS")
+            self.execute_cypher_query(
+                driver, f"DROP CONSTRAINT {ROLLUP_KEY_CONSTRAINT.name} IF EXISTS"
+            )
+            logger.info("✓ Dropped concept rollups")
+            return True
+
+        except Exception as e:
+            logger.error(f"Downgrade failed: {e}")
+            return False
+
+    def verify(self, driver) -> bool:
+        """
+        Verify the rollup constraint and indexes exist.
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            bool: True if migration is in place
+        """
+        try:
+            constraints = {
+                r["name"] for r in self.execute_cypher_query(driver, "SHOW CONSTRAINTS")
+            }
+            if ROLLUP_KEY_CONSTRAINT.name not in constraints:
+                logger.error(f"Missing constraint: {ROLLUP_KEY_CONSTRAINT.name}")
+                return False
+
+            indexes = {
+                r["name"] for r in self.execute_cypher_query(driver, "SHOW INDEXES")
+            }
+            for index in ROLLUP_INDEXES:
+                if index.name not in indexes:
+                    logger.error(f"Missing index: {index.name}")
+                    return False
+
+            logger.info("✓ Concept rollup migration verified")
+            return True
+
+        except Exception as e:
+            logger.error(f"Verification failed: {e}")
+            return False
+
+
+# ============================================================================
+# CLI ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run concept rollup migration")
+    parser.add_argument(
+        "--verify-only",
+        action="store_true",
+        help="Only verify current schema state"
+    )
+    parser.add_argument(
+        "--downgrade",
+        action="store_true",
+        help="Drop rollup nodes, constraint and indexes"
+    )
+
+    args = parser.parse_args()
+
+    if neo4j_driver is None:
+        print("ERROR: Neo4j driver not initialized. Check .env configuration.")
+        sys.exit(1)
+
+    migration = ConceptRollups()
+
+    if args.verify_only:
+        sys.exit(0 if migration.verify(neo4j_driver) else 1)
+
+    if args.downgrade:
+        sys.exit(0 if migration.downgrade(neo4j_driver) else 1)
+
+    success = run_migration(migration, neo4j_driver)
+    sys.exit(0 if success else 1)
@@ -19,6 +19,8 @@ KEY COMPONENTS:
     - test_connection(): Verifies connectivity to Neo4j instance
     - neo4j_driver: Global Neo4j driver instance
     - close_neo4j(): Cleanup function to close driver
+    - get_async_neo4j_driver(): Lazily created AsyncDriver with its own pool
+    - close_async_neo4j(): Cleanup function to close the async driver
 
 DEPENDENCIES:
     - External: neo4j (official Python driver)
@@ -36,12 +38,14 @@ ENVIRONMENT VARIABLES:
     - NEO4J_URI: Connection URI (e.g., bolt://localhost:7687 or neo4j+s://xxx.databases.neo4j.io)
     - NEO4J_USER: Username (default: neo4j)
     - NEO4J_PASSWORD: Password for authentication
+    - NEO4J_USE_ASYNC_DRIVER: Route GraphManager through the async driver (default: false)
+    - NEO4J_ASYNC_POOL_SIZE: Connection pool size of the async driver (default: 100)
 ============================================================================
 """
 
 import os
 from typing import Optional, Dict, List, Any
-from neo4j import GraphDatabase, Driver
+from neo4j import AsyncDriver, AsyncGraphDatabase, GraphDatabase, Driver
 from dotenv import load_dotenv
 
 
@@ -90,6 +94,11 @@ load_dotenv()
 # Global driver instance
 _neo4j_driver: Optional[Driver] = None
 
+# Async driver (separate pool; created lazily on first use)
+_async_neo4j_driver: Optional[AsyncDriver] = None
+NEO4J_USE_ASYNC_DRIVER = os.getenv("NEO4J_USE_ASYNC_DRIVER", "false").lower() == "true"
+NEO4J_ASYNC_POOL_SIZE = int(os.getenv("NEO4J_ASYNC_POOL_SIZE", "100"))
+
 
 def init_neo4j() -> Driver:
     """
@@ -191,6 +200,63 @@ def close_neo4j():
         _neo4j_driver = None
 
 
+def get_async_neo4j_driver() -> Optional[AsyncDriver]:
+    """
+    Return the shared async Neo4j driver, creating it on first use.
+
+    The async driver keeps its own connection pool so graph reads served on
+    the event loop do not compete with the sync driver used by ingestion.
+    Connectivity is verified lazily by the first query.
+
+    Returns:
+        AsyncDriver instance, or None in test mode / without credentials
+    """
+    global _async_neo4j_driver
+
+    if _async_neo4j_driver is not None:
+        return _async_neo4j_driver
+
+    if os.getenv("AURA_TEST_MODE", "").lower() == "true":
+        return None
+
+    neo4j_uri = os.getenv("NEO4J_URI")
+    neo4j_user = os.getenv("NEO4J_USER", "neo4j")
+    neo4j_password = os.getenv("NEO4J_PASSWORD")
+
+    if not neo4j_uri or not neo4j_password:
+        print("Warning: Async Neo4j driver not created: NEO4J_URI/NEO4J_PASSWORD missing")
+        return None
+
+    try:
+        _async_neo4j_driver = AsyncGraphDatabase.driver(
+            neo4j_uri,
+            auth=(neo4j_user, neo4j_password),
+            keep_alive=True,
+            connection_timeout=30,
+            max_connection_lifetime=300,
+            max_connection_pool_size=NEO4J_ASYNC_POOL_SIZE,
+        )
+        print(f"✓ Async Neo4j driver created for {neo4j_uri}")
+        return _async_neo4j_driver
+
+    except Exception as e:
+        print(f"✗ Failed to create async Neo4j driver: {e}")
+        return None
+
+
+async def close_async_neo4j():
+    """
+    Close the async Neo4j driver (if created).
+    Should be awaited during application shutdown.
+    """
+    global _async_neo4j_driver
+
+    if _async_neo4j_driver is not None:
+        await _async_neo4j_driver.close()
+        print("✓ Async Neo4j driver closed")
+        _async_neo4j_driver = None
+
+
 def get_schema_status(driver: Driver | None = None) -> Dict[str, Any]:
     """
     Get the current status of all KG enhancement schema elements.
@@ -0,0 +1,449 @@
+"""
+============================================================================
+FILE: query_expansion.py
+LOCATION: api/query_expansion.py
+============================================================================
+
+PURPOSE:
+    Knowledge-graph query expansion from precomputed per-module expansion
+    tables (implements QueryExpansionConfig / ExpandedQuery / ExpansionTerm
+    from api/schemas/search.py).
+
+ROLE IN PROJECT:
+    Used by hybrid search (api/search_service.py) to add related entity
+    names to the fulltext query. Instead of a multi-hop Cypher query per
+    search, each module gets an ExpansionTable built once per module graph
+    version:
+    - alias index: normalized entity name/alias -> entity ids
+    - expansions: per entity, the top-k entities reachable in 1-2 outgoing
+      hops, weighted with weight_path (relationship type, confidence, hop
+      distance) exactly like expand_graph_context
+    Expanding a query is then a dictionary walk over its n-grams, well
+    under a millisecond. Tables are served stale-while-revalidate: when a
+    module's version changes, the old table keeps answering while a
+    background task rebuilds it (a module with no table yet is simply not
+    expanded until its first build completes). Built tables are shared
+    between API workers through the versioned graph response cache.
+
+KEY COMPONENTS:
+    - normalize_term: Name normalization shared by index and query
+    - ExpansionTable: Alias index + per-entity expansion lists
+    - build_expansion_table: Precomputes a table from a module snapshot
+    - QueryExpander: Table cache, background refresh and expand()
+
+DEPENDENCIES:
+    - External: None
+    - Internal: api/graph_manager.py (weight_path), api/graph_snapshot.py,
+      api/graph_cache.py, api/schemas/search.py
+
+USAGE:
+    from api.query_expansion import QueryExpander
+
+    expander = QueryExpander(graph_manager)
+    expanded = expander.expand("what is backprop", ["m1"], QueryExpansionConfig(enabled=True))
+============================================================================
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from api.graph_cache import (
+    get_cached_response,
+    get_module_version,
+    response_cache_key,
+    set_cached_response,
+)
+from api.graph_manager import EntityPath, weight_path
+from api.graph_snapshot import (
+    SNAPSHOT_EDGES_QUERY,
+    SNAPSHOT_ENTITIES_QUERY,
+    ModuleGraphSnapshot,
+)
+from api.schemas.search import ExpandedQuery, ExpansionTerm, QueryExpansionConfig
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Expansion entries kept per entity (QueryExpansionConfig allows up to 20)
+EXPANSION_TOP_K = 20
+
+# Paths scanned per entity when precomputing (bounds hub entities)
+EXPANSION_SCAN_LIMIT = 500
+
+EXPANSION_HOP_DEPTH = 2
+
+# Rebuild interval when module versions are unavailable (no Redis)
+EXPANSION_TABLE_MAX_AGE_SECONDS = 300
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+ENTITY_ALIASES_QUERY = """
+MATCH (e:Entity {module_id: $module_id})
+WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+  AND e.aliases IS NOT NULL
+RETURN e.id as id, e.aliases as aliases
+"""
+
+
+# ============================================================================
+# TABLES
+# ============================================================================
+
+
+def normalize_term(text: str) -> Tuple[str, ...]:
+    """
+    Normalize a name or query into comparable tokens.
+
+    Lowercases, splits on non-word characters and strips a plural "s" so
+    "Neural Networks" and "neural-network" match.
+
+    Args:
+        text: Entity name, alias or query text
+
+    Returns:
+        Normalized tokens
+    """
+    tokens = []
+    for token in _NON_WORD.split(text.lower()):
+        if not token:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tuple(tokens)
+
+
+class ExpansionTable:
+    """
+    Precomputed expansion data for one module at one graph version.
+
+    Attributes:
+        aliases: Normalized name tokens -> entity ids
+        names: Entity id -> display name
+        expansions: Entity id -> [(term, relationship, weight)], best first
+        max_phrase: Longest alias in tokens
+    """
+
+    def __init__(
+        self,
+        module_id: str,
+        version: Optional[int],
+        aliases: Dict[Tuple[str, ...], List[str]],
+        names: Dict[str, str],
+        expansions: Dict[str, List[Tuple[str, str, float]]],
+    ):
+        self.module_id = module_id
+        self.version = version
+        self.aliases = aliases
+        self.names = names
+        self.expansions = expansions
+        self.max_phrase = max((len(key) for key in aliases), default=0)
+        self.built_at = time.monotonic()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form for the shared cache."""
+        return {
+            "aliases": [[list(key), ids] for key, ids in self.aliases.items()],
+            "names": self.names,
+            "expansions": {k: [list(e) for e in v] for k, v in self.expansions.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, module_id: str, version: Optional[int], data: Dict[str, Any]):
+        """Rebuild a table from to_dict() output."""
+        return cls(
+            module_id,
+            version,
+            {tuple(key): ids for key, ids in data["aliases"]},
+            data["names"],
+            {k: [tuple(e) for e in v] for k, v in data["expansions"].items()},
+        )
+
+    def match(self, tokens: Sequence[str]) -> List[str]:
+        """
+        Entity ids mentioned in a tokenized query, longest match first.
+
+        Args:
+            tokens: normalize_term() output for the query
+
+        Returns:
+            Matched entity ids in query order
+        """
+        matched: List[str] = []
+        position = 0
+        while position < len(tokens):
+            for length in range(min(self.max_phrase, len(tokens) - position), 0, -1):
+                ids = self.aliases.get(tuple(tokens[position:position + length]))
+                if ids:
+                    matched.extend(ids)
+                    position += length
+                    break
+            else:
+                position += 1
+        return matched
+
+
+def build_expansion_table(
+    snapshot: ModuleGraphSnapshot,
+    aliases: Optional[Dict[str, List[str]]] = None,
+    top_k: int = EXPANSION_TOP_K,
+) -> ExpansionTable:
+    """
+    Precompute the alias index and per-entity expansion lists of a module.
+
+    Expansion follows expand_graph_context: outgoing paths of up to
+    EXPANSION_HOP_DEPTH hops within the module (or unassigned entities),
+    scored with weight_path on the last relationship, keeping each target's
+    best-scoring path.
+
+    Args:
+        snapshot: Module graph snapshot
+        aliases: Optional entity id -> alternative names
+        top_k: Expansion entries kept per entity
+
+    Returns:
+        ExpansionTable for the snapshot's module and version
+    """
+    module_scope = {snapshot.module_id}
+    alias_index: Dict[Tuple[str, ...], List[str]] = {}
+    names: Dict[str, str] = {}
+    expansions: Dict[str, List[Tuple[str, str, float]]] = {}
+
+    for node, entity_id in enumerate(snapshot.ids):
+        if not snapshot.in_module[node]:
+            continue
+        name = snapshot.names[node] or ""
+        names[entity_id] = name
+        for alias in [name, *(aliases or {}).get(entity_id, [])]:
+            key = normalize_term(alias)
+            if key and entity_id not in alias_index.setdefault(key, []):
+                alias_index[key].append(entity_id)
+
+        best: Dict[str, Tuple[float, str, str]] = {}
+        for row in snapshot.expand(
+            [entity_id], EXPANSION_HOP_DEPTH, module_scope, limit=EXPANSION_SCAN_LIMIT
+        ):
+            weight = weight_path(
+                EntityPath(
+                    source_entity=row["source"] or "",
+                    target_entity=row["target"] or "",
+                    relationship_type=row["relationship_type"],
+                    confidence=row["confidence"] or 1.0,
+                    hops=row["hops"],
+                )
+            )
+            target = row["target_id"]
+            if target != entity_id and row["target"] and weight > best.get(target, (0.0,))[0]:
+                best[target] = (weight, row["target"], row["relationship_type"])
+        ranked = sorted(best.values(), key=lambda item: item[0], reverse=True)[:top_k]
+        if ranked:
+            expansions[entity_id] = [
+                (term, relationship, round(min(weight, 1.0), 4))
+                for weight, term, relationship in ranked
+            ]
+
+    return ExpansionTable(snapshot.module_id, snapshot.version, alias_index, names, expansions)
+
+
+# ============================================================================
+# EXPANDER
+# ============================================================================
+
+
+class QueryExpander:
+    """
+    Expands queries from per-module expansion tables kept in memory.
+
+    expand() never waits for Neo4j: a missing or stale table triggers a
+    background rebuild and the request uses whatever table is present.
+
+    Example:
+        expander = QueryExpander(graph_manager, get_snapshot_cache())
+        await expander.refresh("m1")
+        expanded = expander.expand("gradient descent", ["m1"], config)
+    """
+
+    def __init__(self, graph_manager, snapshot_cache=None, top_k: int = EXPANSION_TOP_K):
+        """
+        Initialize the expander.
+
+        Args:
+            graph_manager: GraphManager used to load module graphs
+            snapshot_cache: Optional GraphSnapshotCache to reuse snapshots
+            top_k: Expansion entries kept per entity
+        """
+        self.graph_manager = graph_manager
+        self.snapshot_cache = snapshot_cache
+        self.top_k = top_k
+        self._tables: Dict[str, ExpansionTable] = {}
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+    # ------------------------------------------------------------------
+    # Tables
+    # ------------------------------------------------------------------
+
+    def _is_current(self, table: ExpansionTable, version: Optional[int]) -> bool:
+        if version is None:
+            return time.monotonic() - table.built_at < EXPANSION_TABLE_MAX_AGE_SECONDS
+        return table.version == version
+
+    async def _load_snapshot(self, module_id: str, version: Optional[int]):
+        if self.snapshot_cache is not None:
+            snapshot = await self.snapshot_cache.get(module_id, self.graph_manager)
+            if snapshot is not None:
+                return snapshot
+        params = {"module_id": module_id}
+        entities = await self.graph_manager.run_query(SNAPSHOT_ENTITIES_QUERY, params)
+        edges = await self.graph_manager.run_query(SNAPSHOT_EDGES_QUERY, params)
+        return ModuleGraphSnapshot(module_id, version, entities, edges)
+
+    async def refresh(self, module_id: str) -> Optional[ExpansionTable]:
+        """
+        Build (or fetch from the shared cache) the module's current table.
+
+        Args:
+            module_id: Module identifier
+
+        Returns:
+            The new table, or None if building failed
+        """
+        version = get_module_version(module_id)
+        cache_key = None
+        if version is not None:
+            cache_key = response_cache_key("expansion", module_id, version, {"top_k": self.top_k})
+            cached = get_cached_response(cache_key)
+            if cached is not None:
+                table = ExpansionTable.from_dict(module_id, version, cached)
+                self._tables[module_id] = table
+                return table
+
+        try:
+            snapshot = await self._load_snapshot(module_id, version)
+            alias_rows = await self.graph_manager.run_query(
+                ENTITY_ALIASES_QUERY, {"module_id": module_id}
+            )
+            aliases = {row["id"]: list(row["aliases"] or []) for row in alias_rows}
+            table = await asyncio.to_thread(
+                build_expansion_table, snapshot, aliases, self.top_k
+            )
+        except Exception as e:
+            logger.warning(f"Failed to build expansion table for {module_id}: {e}")
+            return None
+
+        table.version = version
+        self._tables[module_id] = table
+        if cache_key is not None:
+            set_cached_response(cache_key, table.to_dict())
+        logger.info(
+            f"Built expansion table for {module_id} v{version}: "
+            f"{len(table.names)} entities, {len(table.expansions)} with expansions"
+        )
+        return table
+
+    def _schedule_refresh(self, module_id: str) -> None:
+        """Start a background refresh unless one is already running."""
+        task = self._refreshing.get(module_id)
+        if task is not None and not task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.refresh(module_id))
+        self._refreshing[module_id] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(module_id, None))
+
+    def get_table(self, module_id: str) -> Optional[ExpansionTable]:
+        """Current table if present (possibly stale); schedules a refresh if needed."""
+        table = self._tables.get(module_id)
+        if table is None or not self._is_current(table, get_module_version(module_id)):
+            self._schedule_refresh(module_id)
+        return table
+
+    # ------------------------------------------------------------------
+    # Expansion
+    # ------------------------------------------------------------------
+
+    def expand(
+        self,
+        query: str,
+        module_ids: Optional[Sequence[str]],
+        config: QueryExpansionConfig,
+    ) -> ExpandedQuery:
+        """
+        Expand a query with names of entities related to those it mentions.
+
+        Only module-scoped queries are expanded; terms already in the query
+        or naming a matched entity are skipped, and the best weight per term
+        wins across matched entities and modules.
+
+        Args:
+            query: User query
+            module_ids: Modules whose tables are used
+            config: Expansion limits
+
+        Returns:
+            ExpandedQuery (unchanged query if nothing matched)
+        """
+        start = time.perf_counter()
+        tokens = normalize_term(query)
+        entities_found: List[str] = []
+        entity_ids: List[str] = []
+        candidates: Dict[Tuple[str, ...], ExpansionTerm] = {}
+
+        for module_id in module_ids or []:
+            table = self.get_table(module_id)
+            if table is None:
+                continue
+            for entity_id in table.match(tokens):
+                if entity_id in entity_ids:
+                    continue
+                entity_ids.append(entity_id)
+                entities_found.append(table.names.get(entity_id, entity_id))
+                for term, relationship, weight in table.expansions.get(entity_id, []):
+                    if weight < config.min_term_weight:
+                        break  # Lists are sorted by weight
+                    key = normalize_term(term)
+                    current = candidates.get(key)
+                    if current is None or weight > current.weight:
+                        candidates[key] = ExpansionTerm(
+                            term=term,
+                            source_entity=table.names.get(entity_id, entity_id),
+                            relationship=relationship,
+                            weight=weight,
+                        )
+
+        query_tokens = set(tokens)
+        found_keys = {normalize_term(name) for name in entities_found}
+        terms = sorted(
+            (
+                term for key, term in candidates.items()
+                if key not in found_keys and not set(key) <= query_tokens
+            ),
+            key=lambda term: term.weight,
+            reverse=True,
+        )[:config.max_expansion_terms]
+
+        expanded_query = " ".join([query, *(term.term for term in terms)])
+        return ExpandedQuery(
+            original_query=query,
+            expanded_query=expanded_query,
+            expansion_terms=terms,
+            entities_found=entities_found,
+            entity_ids=entity_ids,
+            expansion_time_ms=(time.perf_counter() - start) * 1000,
+        )
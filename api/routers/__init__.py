@@ -19,10 +19,12 @@ KEY COMPONENTS:
     - templates_router: Extraction template endpoints
     - schema_router: Schema validation and migration endpoints
     - graph_preview_router: Graph preview endpoints
+    - search_router: Hybrid search endpoint
 
 DEPENDENCIES:
     - External: None
-    - Internal: api.routers.summaries, templates, schema, graph_preview
+    - Internal: api.routers.summaries, templates, schema, graph_preview,
+      search
 
 USAGE:
     from api.routers import summaries_router, templates_router
@@ -33,10 +35,12 @@ from api.routers.summaries import router as summaries_router
 from api.routers.templates import router as templates_router
 from api.routers.schema import router as schema_router
 from api.routers.graph_preview import router as graph_preview_router
+from api.routers.search import router as search_router
 
 __all__ = [
     "summaries_router",
     "templates_router",
     "schema_router",
     "graph_preview_router",
+    "search_router",
 ]
@@ -16,11 +16,17 @@ KEY COMPONENTS:
     - router: FastAPI APIRouter with /api/v1/graph-preview prefix
     - get_module_graph: GET /modules/{module_id} - nodes and edges for a module
     - get_module_graph_stats: GET /modules/{module_id}/stats - entity/relationship counts
+    - get_module_graph_overview: GET /modules/{module_id}/overview - cluster supernodes
+    - expand_module_graph_cluster: GET /modules/{module_id}/clusters/{cluster_id}
+    - list_module_entities: GET /modules/{module_id}/entities - cursor-paged listing
+    - export_knowledge_graph: GET /export - streamed GraphML/GEXF/CSV export
     - get_graph_manager: Dependency injection for GraphManager
 
 DEPENDENCIES:
     - External: fastapi
-    - Internal: api/graph_manager.py, api/schemas/graph_preview.py, api/neo4j_config.py
+    - Internal: api/graph_manager.py, api/graph_visualizer.py, api/graph_cache.py,
+      api/graph_lod.py, api/community_detection.py,
+      api/schemas/graph_preview.py, api/neo4j_config.py, api/hierarchy.py
 
 USAGE:
     from api.routers.graph_preview import router as graph_preview_router
@@ -29,12 +35,41 @@ USAGE:
 """
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query, HTTPException
-from typing import Optional, List
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, Optional, List, Tuple
+import asyncio
 import logging
-
-from api.graph_manager import GraphManager
+import re
+
+from api.community_detection import get_community_stamp
+from api.graph_cache import (
+    etag_for,
+    etag_matches,
+    get_cached_response,
+    get_module_version,
+    response_cache_key,
+    set_cached_response,
+)
+from api.graph_lod import (
+    LOD_MAX_CLUSTERS,
+    LOD_MAX_PAGE_SIZE,
+    LOD_PAGE_SIZE,
+    ClusterGrouping,
+    EntityOrder,
+    ModuleGraphLOD,
+)
+from api.graph_manager import GraphManager, create_graph_manager
+from api.graph_visualizer import (
+    ENTITY_DISPLAY_PROPERTIES,
+    EXPORT_WRITERS,
+    ExportFormat,
+    GraphVisualizer,
+)
 from api.schemas.graph_preview import (
+    ClusterExpansionResponse,
+    EntityPageResponse,
+    GraphOverviewResponse,
     GraphPreviewResponse,
     GraphStatsResponse,
     GraphNode,
@@ -51,10 +86,48 @@ ALLOWED_ENTITY_TYPES = {"Topic", "Concept", "Methodology", "Finding"}
 
 
 def get_graph_manager() -> GraphManager:
-    """Dependency injection for GraphManager."""
+    """Dependency injection for GraphManager (sync or async driver)."""
     if neo4j_driver is None:
         raise HTTPException(status_code=503, detail="Neo4j driver not initialized")
-    return GraphManager(neo4j_driver)
+    return create_graph_manager(neo4j_driver)
+
+
+def _versioned_lookup(
+    scope: str,
+    module_id: str,
+    options: Dict[str, Any],
+    request: Request,
+    response: Response,
+) -> Tuple[Optional[str], Any]:
+    """
+    Look up a version-stamped cached response for a module endpoint.
+
+    Sets the ETag header on the outgoing response. When the client's
+    If-None-Match already names the current version, a bare 304 response is
+    returned in place of cached data.
+
+    Args:
+        scope: Endpoint name used in the cache key
+        module_id: Module identifier
+        options: Query options that affect the response body
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
+
+    Returns:
+        Tuple of (cache key or None if caching is unavailable,
+        304 Response / cached payload dict / None)
+    """
+    version = get_module_version(module_id)
+    if version is None:
+        return None, None
+
+    key = response_cache_key(scope, module_id, version, options)
+    etag = etag_for(key)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return key, Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return key, get_cached_response(key)
 
 
 @router.get(
@@ -64,10 +137,15 @@ def get_graph_manager() -> GraphManager:
 )
 async def get_module_graph(
     module_id: str,
+    request: Request,
+    response: Response,
     entity_types: Optional[List[str]] = Query(
         None, description="Filter by entity types"
     ),
     limit: int = Query(100, ge=1, le=500, description="Max nodes to return"),
+    fields: Optional[List[str]] = Query(
+        None, description="Extra entity properties to include (opt-in)"
+    ),
     graph_manager: GraphManager = Depends(get_graph_manager),
 ):
     """
@@ -78,12 +156,16 @@ async def get_module_graph(
 
     Args:
         module_id: Module identifier
+        request: Incoming request (If-None-Match revalidation)
+        response: Outgoing response (ETag header)
         entity_types: Optional filter for specific entity types (Topic, Concept, etc.)
         limit: Maximum number of nodes to return (1-500)
+        fields: Extra entity properties to project on top of the display set
         graph_manager: Injected GraphManager instance
 
     Returns:
-        GraphPreviewResponse with nodes, edges, and counts
+        GraphPreviewResponse with nodes, edges, and counts, or 304 when the
+        client's ETag matches the module's current graph version
     """
     # Validate entity_types against whitelist BEFORE try block
     # (HTTPException should not be caught by generic exception handler)
@@ -96,10 +178,26 @@ async def get_module_graph(
                 f"Allowed types: {ALLOWED_ENTITY_TYPES}",
             )
 
+    cache_key, cached = _versioned_lookup(
+        "preview",
+        module_id,
+        {
+            "entity_types": sorted(entity_types or []),
+            "limit": limit,
+            "fields": list(dict.fromkeys(fields or [])),
+        },
+        request,
+        response,
+    )
+    if isinstance(cached, Response):
+        return cached
+    if cached is not None:
+        return GraphPreviewResponse.model_validate(cached)
+
     try:
         # Query Neo4j for module entities
         cypher = """
-        MATCH (e)
+        MATCH (e:Entity)
         WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
         AND e.module_id = $module_id
         """
@@ -109,11 +207,15 @@ async def get_module_graph(
             type_filter = " OR ".join([f"e:{t}" for t in entity_types])
             cypher += f" AND ({type_filter})"
 
-        # Apply LIMIT in query (not Python) for efficiency
+        # Apply LIMIT in query (not Python) for efficiency. Ordering makes the
+        # returned subset stable; one extra row detects truncation. Larger
+        # modules are browsed through /overview and /entities instead.
         cypher += """
         WITH e
-        LIMIT $limit
-        WITH collect(e) as entities
+        ORDER BY coalesce(e.mention_count, 0) DESC, e.id
+        LIMIT $limit + 1
+        WITH collect(e) as fetched
+        WITH fetched[..$limit] as entities, size(fetched) > $limit as truncated
         UNWIND entities as e1
         OPTIONAL MATCH (e1)-[r]->(e2)
         WHERE e2 IN entities
@@ -121,23 +223,31 @@ async def get_module_graph(
             [entity IN entities | {
                 id: entity.id,
                 name: entity.name,
-                type: labels(entity)[0],
+                type: [l IN labels(entity) WHERE l <> 'Entity'][0],
                 definition: entity.definition,
                 confidence: entity.confidence,
-                mention_count: entity.mention_count
+                mention_count: entity.mention_count,
+                extra: [k IN $fields | entity[k]]
             }] as entity_data,
             collect(DISTINCT {
                 source: e1.id,
                 target: e2.id,
                 type: type(r),
                 confidence: r.confidence
-            }) as relationships
+            }) as relationships,
+            truncated
         LIMIT 1
         """
 
-        with graph_manager.driver.session() as session:
-            result = session.run(cypher, {"module_id": module_id, "limit": limit})
-            record = result.single()
+        # Extra properties are looked up by parameter, never interpolated
+        extra_fields = [
+            f for f in dict.fromkeys(fields or []) if f not in ENTITY_DISPLAY_PROPERTIES
+        ]
+
+        records = await graph_manager.run_query(
+            cypher, {"module_id": module_id, "limit": limit, "fields": extra_fields}
+        )
+        record = records[0] if records else None
 
         if not record:
             logger.info(f"No entities found for module {module_id}")
@@ -155,17 +265,19 @@ async def get_module_graph(
             if entity:
                 node_id = entity.get("id", "")
                 node_ids.add(node_id)
+                properties = {
+                    "definition": entity.get("definition"),
+                    "confidence": entity.get("confidence"),
+                    "mention_count": entity.get("mention_count"),
+                }
+                properties.update(zip(extra_fields, entity.get("extra") or []))
                 nodes.append(
                     GraphNode(
                         id=node_id,
                         label=entity.get("name", ""),
                         name=entity.get("name", ""),
                         type=entity.get("type", "Entity"),
-                        properties={
-                            "definition": entity.get("definition"),
-                            "confidence": entity.get("confidence"),
-                            "mention_count": entity.get("mention_count"),
-                        },
+                        properties=properties,
                     )
                 )
 
@@ -191,13 +303,17 @@ async def get_module_graph(
             f"Retrieved {len(nodes)} nodes and {len(edges)} edges for module {module_id}"
         )
 
-        return GraphPreviewResponse(
+        result = GraphPreviewResponse(
             nodes=nodes,
             edges=edges,
             node_count=len(nodes),
             edge_count=len(edges),
             module_id=module_id,
+            truncated=bool(record.get("truncated")),
         )
+        if cache_key is not None:
+            set_cached_response(cache_key, result.model_dump(mode="json"))
+        return result
 
     except HTTPException:
         # Re-raise HTTP exceptions (don't wrap in 500)
@@ -215,7 +331,10 @@ async def get_module_graph(
     summary="Get graph statistics for module",
 )
 async def get_module_graph_stats(
-    module_id: str, graph_manager: GraphManager = Depends(get_graph_manager)
+    module_id: str,
+    request: Request,
+    response: Response,
+    graph_manager: GraphManager = Depends(get_graph_manager),
 ):
     """
     Retrieve statistics about a module's knowledge graph.
@@ -224,23 +343,32 @@ async def get_module_graph_stats(
 
     Args:
         module_id: Module identifier
+        request: Incoming request (If-None-Match revalidation)
+        response: Outgoing response (ETag header)
         graph_manager: Injected GraphManager instance
 
     Returns:
-        GraphStatsResponse with entity and relationship counts
+        GraphStatsResponse with entity and relationship counts, or 304 when
+        the client's ETag matches the module's current graph version
     """
+    cache_key, cached = _versioned_lookup("stats", module_id, {}, request, response)
+    if isinstance(cached, Response):
+        return cached
+    if cached is not None:
+        return GraphStatsResponse.model_validate(cached)
+
     try:
         # Query for entity type counts
         entity_cypher = """
-        MATCH (e)
+        MATCH (e:Entity)
         WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
         AND e.module_id = $module_id
-        RETURN labels(e)[0] as entity_type, count(e) as count
+        RETURN [l IN labels(e) WHERE l <> 'Entity'][0] as entity_type, count(e) as count
         """
 
         # Query for relationship type counts
         rel_cypher = """
-        MATCH (e1)-[r]->(e2)
+        MATCH (e1:Entity)-[r]->(e2:Entity)
         WHERE (e1:Topic OR e1:Concept OR e1:Methodology OR e1:Finding)
         AND (e2:Topic OR e2:Concept OR e2:Methodology OR e2:Finding)
         AND e1.module_id = $module_id
@@ -253,22 +381,23 @@ async def get_module_graph_stats(
         total_nodes = 0
         total_edges = 0
 
-        with graph_manager.driver.session() as session:
-            # Get entity counts
-            result = session.run(entity_cypher, {"module_id": module_id})
-            for record in result:
-                entity_type = record["entity_type"]
-                count = record["count"]
-                entity_types[entity_type] = count
-                total_nodes += count
-
-            # Get relationship counts
-            result = session.run(rel_cypher, {"module_id": module_id})
-            for record in result:
-                rel_type = record["rel_type"]
-                count = record["count"]
-                relationship_types[rel_type] = count
-                total_edges += count
+        # Both counts are independent; run them concurrently
+        entity_records, rel_records = await asyncio.gather(
+            graph_manager.run_query(entity_cypher, {"module_id": module_id}),
+            graph_manager.run_query(rel_cypher, {"module_id": module_id}),
+        )
+
+        for record in entity_records:
+            entity_type = record["entity_type"]
+            count = record["count"]
+            entity_types[entity_type] = count
+            total_nodes += count
+
+        for record in rel_records:
+            rel_type = record["rel_type"]
+            count = record["count"]
+            relationship_types[rel_type] = count
+            total_edges += count
 
         # If no entities found, module doesn't exist
         if total_nodes == 0:
@@ -282,12 +411,15 @@ async def get_module_graph_stats(
             f"Retrieved stats for module {module_id}: {total_nodes} nodes, {total_edges} edges"
         )
 
-        return GraphStatsResponse(
+        result = GraphStatsResponse(
             node_count=total_nodes,
             edge_count=total_edges,
             entity_types=entity_types,
             relationship_types=relationship_types,
         )
+        if cache_key is not None:
+            set_cached_response(cache_key, result.model_dump(mode="json"))
+        return result
 
     except HTTPException:
         # Re-raise HTTP exceptions (don't wrap in 500)
@@ -297,3 +429,304 @@ async def get_module_graph_stats(
         raise HTTPException(
             status_code=500, detail=f"Failed to retrieve graph stats: {str(e)}"
         )
+
+
+@router.get(
+    "/modules/{module_id}/overview",
+    response_model=GraphOverviewResponse,
+    summary="Get cluster-level overview of a module graph",
+)
+async def get_module_graph_overview(
+    module_id: str,
+    request: Request,
+    response: Response,
+    group_by: ClusterGrouping = Query(
+        ClusterGrouping.COMMUNITY,
+        description="Cluster by precomputed community (falls back to type) or by type",
+    ),
+    max_clusters: int = Query(
+        LOD_MAX_CLUSTERS, ge=1, le=LOD_MAX_CLUSTERS, description="Max supernodes"
+    ),
+    graph_manager: GraphManager = Depends(get_graph_manager),
+):
+    """
+    Retrieve a bounded, cluster-level view of a module's knowledge graph.
+
+    Each node is a cluster supernode (size, type breakdown, top members);
+    edges carry aggregate relationship counts and confidence weights.
+
+    Args:
+        module_id: Module identifier
+        request: Incoming request (If-None-Match revalidation)
+        response: Outgoing response (ETag header)
+        group_by: Cluster grouping
+        max_clusters: Maximum number of supernodes (largest first)
+        graph_manager: Injected GraphManager instance
+
+    Returns:
+        GraphOverviewResponse with cluster nodes and aggregate edges
+    """
+    cache_key, cached = _versioned_lookup(
+        "overview",
+        module_id,
+        {
+            "group_by": group_by.value,
+            "max_clusters": max_clusters,
+            "communities": get_community_stamp(module_id),
+        },
+        request,
+        response,
+    )
+    if isinstance(cached, Response):
+        return cached
+    if cached is not None:
+        return GraphOverviewResponse.model_validate(cached)
+
+    try:
+        result = await ModuleGraphLOD(graph_manager).get_overview(
+            module_id, group_by, max_clusters
+        )
+        if not result.nodes:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Module '{module_id}' not found or has no entities",
+            )
+        if cache_key is not None:
+            set_cached_response(cache_key, result.model_dump(mode="json"))
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving graph overview for {module_id}: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to retrieve graph overview: {str(e)}"
+        )
+
+
+@router.get(
+    "/modules/{module_id}/clusters/{cluster_id}",
+    response_model=ClusterExpansionResponse,
+    summary="Expand one cluster of a module graph",
+)
+async def expand_module_graph_cluster(
+    module_id: str,
+    cluster_id: str,
+    request: Request,
+    response: Response,
+    group_by: ClusterGrouping = Query(
+        ClusterGrouping.COMMUNITY, description="Grouping used by the overview"
+    ),
+    order_by: EntityOrder = Query(EntityOrder.DEGREE, description="Member ordering"),
+    limit: int = Query(LOD_PAGE_SIZE, ge=1, le=LOD_MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    graph_manager: GraphManager = Depends(get_graph_manager),
+):
+    """
+    Expand a cluster supernode into one page of its member entities.
+
+    Edges between returned members are included as-is; edges to other
+    clusters are collapsed onto those clusters' supernodes.
+
+    Args:
+        module_id: Module identifier
+        cluster_id: Supernode id from the overview (e.g. "community:3")
+        request: Incoming request (If-None-Match revalidation)
+        response: Outgoing response (ETag header)
+        group_by: Grouping used by the overview
+        order_by: Member ordering
+        limit: Members per page
+        cursor: Cursor from the previous page
+        graph_manager: Injected GraphManager instance
+
+    Returns:
+        ClusterExpansionResponse with members, edges and next_cursor
+    """
+    cache_key, cached = _versioned_lookup(
+        "cluster",
+        module_id,
+        {
+            "cluster_id": cluster_id,
+            "group_by": group_by.value,
+            "order_by": order_by.value,
+            "limit": limit,
+            "cursor": cursor,
+            "communities": get_community_stamp(module_id),
+        },
+        request,
+        response,
+    )
+    if isinstance(cached, Response):
+        return cached
+    if cached is not None:
+        return ClusterExpansionResponse.model_validate(cached)
+
+    try:
+        result = await ModuleGraphLOD(graph_manager).expand_cluster(
+            module_id, cluster_id, group_by, order_by, limit, cursor
+        )
+        if cache_key is not None:
+            set_cached_response(cache_key, result.model_dump(mode="json"))
+        return result
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error expanding cluster {cluster_id} of {module_id}: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to expand cluster: {str(e)}"
+        )
+
+
+@router.get(
+    "/modules/{module_id}/entities",
+    response_model=EntityPageResponse,
+    summary="List module entities with cursor pagination",
+)
+async def list_module_entities(
+    module_id: str,
+    request: Request,
+    response: Response,
+    order_by: EntityOrder = Query(EntityOrder.ID, description="Stable ordering"),
+    limit: int = Query(LOD_PAGE_SIZE, ge=1, le=LOD_MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    graph_manager: GraphManager = Depends(get_graph_manager),
+):
+    """
+    Page through a module's entities in a stable order.
+
+    Args:
+        module_id: Module identifier
+        request: Incoming request (If-None-Match revalidation)
+        response: Outgoing response (ETag header)
+        order_by: Order by id, or by degree (hubs first) then id
+        limit: Entities per page
+        cursor: Cursor from the previous page
+        graph_manager: Injected GraphManager instance
+
+    Returns:
+        EntityPageResponse with one page and next_cursor (None on the last page)
+    """
+    cache_key, cached = _versioned_lookup(
+        "entities",
+        module_id,
+        {
+            "order_by": order_by.value,
+            "limit": limit,
+            "cursor": cursor,
+            "communities": get_community_stamp(module_id),
+        },
+        request,
+        response,
+    )
+    if isinstance(cached, Response):
+        return cached
+    if cached is not None:
+        return EntityPageResponse.model_validate(cached)
+
+    try:
+        result = await ModuleGraphLOD(graph_manager).list_entities(
+            module_id, order_by, limit, cursor
+        )
+        if cache_key is not None:
+            set_cached_response(cache_key, result.model_dump(mode="json"))
+        return result
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error listing entities for {module_id}: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to list entities: {str(e)}"
+        )
+
+
+def _department_module_ids(department_id: str) -> List[str]:
+    """Resolve every module id under a department from the Firestore hierarchy."""
+    try:
+        from api.hierarchy import (
+            get_modules_by_subject,
+            get_semesters_by_department,
+            get_subjects_by_semester,
+        )
+    except ImportError:
+        from hierarchy import (  # type: ignore[no-redef]
+            get_modules_by_subject,
+            get_semesters_by_department,
+            get_subjects_by_semester,
+        )
+
+    module_ids = []
+    for semester in get_semesters_by_department(department_id):
+        for subject in get_subjects_by_semester(semester["id"], department_id):
+            for module in get_modules_by_subject(
+                subject["id"], department_id, semester["id"]
+            ):
+                module_ids.append(module["id"])
+    return module_ids
+
+
+@router.get(
+    "/export",
+    summary="Stream a knowledge graph export",
+    response_class=StreamingResponse,
+)
+async def export_knowledge_graph(
+    module_ids: Optional[List[str]] = Query(
+        None, description="Modules to export"
+    ),
+    department_id: Optional[str] = Query(
+        None, description="Export every module in this department"
+    ),
+    format: ExportFormat = Query(ExportFormat.GRAPHML, description="Export format"),
+    graph_manager: GraphManager = Depends(get_graph_manager),
+):
+    """
+    Stream the knowledge graph of modules or a whole department for offline analysis.
+
+    Entities and relationships are paged out of Neo4j and serialized as they
+    arrive, so memory use does not grow with the size of the export.
+
+    Args:
+        module_ids: Modules to export
+        department_id: Department whose modules are exported (added to module_ids)
+        format: graphml, gexf or csv
+        graph_manager: Injected GraphManager instance
+
+    Returns:
+        StreamingResponse with the serialized graph as an attachment
+    """
+    writer_cls = EXPORT_WRITERS.get(format)
+    if writer_cls is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Streaming export supports: "
+            f"{', '.join(f.value for f in EXPORT_WRITERS)}",
+        )
+
+    selected = list(dict.fromkeys(module_ids or []))
+    if department_id:
+        try:
+            department_modules = await asyncio.to_thread(
+                _department_module_ids, department_id
+            )
+        except Exception as e:
+            logger.error(f"Error resolving modules for department {department_id}: {e}")
+            raise HTTPException(
+                status_code=500, detail="Failed to resolve department modules"
+            )
+        selected.extend(m for m in department_modules if m not in selected)
+
+    if not selected:
+        raise HTTPException(
+            status_code=400, detail="Provide module_ids or a department_id"
+        )
+
+    visualizer = GraphVisualizer(graph_manager)
+    label = re.sub(r"[^A-Za-z0-9_-]", "_", department_id or "modules")
+    filename = f"knowledge-graph-{label}.{writer_cls.extension}"
+    return StreamingResponse(
+        visualizer.stream_export(selected, format),
+        media_type=writer_cls.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
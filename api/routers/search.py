@@ -0,0 +1,126 @@
+"""
+============================================================================
+FILE: search.py
+LOCATION: api/routers/search.py
+============================================================================
+
+PURPOSE:
+    Hybrid search API over document chunks.
+
+ROLE IN PROJECT:
+    Serves SearchRequest/SearchResponse (api/schemas/search.py) so clients
+    get vector + fulltext retrieval, fusion and hydration in one call
+    instead of issuing the stages sequentially.
+
+KEY COMPONENTS:
+    - router: FastAPI APIRouter with /api/v1/search prefix
+    - hybrid_search: POST / - fused vector + BM25 search
+    - enriched_search: POST /enriched - hybrid search plus batched graph context
+    - cache_stats: GET /cache/stats - query embedding and result cache hit rates
+    - get_search_service: Dependency injection for HybridSearchService
+
+DEPENDENCIES:
+    - External: fastapi
+    - Internal: api/search_service.py, api/graph_manager.py,
+      api/schemas/search.py, api/neo4j_config.py, api/cache.py
+
+USAGE:
+    from api.routers.search import router as search_router
+    app.include_router(search_router)
+============================================================================
+"""
+from __future__ import annotations
+
+import logging
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from api.cache import all_cache_stats
+from api.graph_manager import create_graph_manager
+from api.neo4j_config import neo4j_driver
+from api.schemas.search import (
+    EnrichedSearchRequest,
+    EnrichedSearchResponse,
+    SearchRequest,
+    SearchResponse,
+)
+from api.search_service import HybridSearchService, create_search_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1/search", tags=["Search"])
+
+_search_service: HybridSearchService | None = None
+
+
+def get_search_service() -> HybridSearchService:
+    """Dependency injection for HybridSearchService (shared embedding client)."""
+    global _search_service
+    if neo4j_driver is None:
+        raise HTTPException(status_code=503, detail="Neo4j driver not initialized")
+    if _search_service is None:
+        _search_service = create_search_service(create_graph_manager(neo4j_driver))
+    return _search_service
+
+
+@router.post("", response_model=SearchResponse)
+async def hybrid_search(
+    request: SearchRequest,
+    service: HybridSearchService = Depends(get_search_service),
+) -> SearchResponse:
+    """
+    Hybrid vector + fulltext search over document chunks.
+
+    Vector and BM25 retrieval run concurrently with module_ids applied inside
+    both index queries; scores are fused by weighted sum (default) or
+    reciprocal rank fusion (fusion="rrf").
+
+    Args:
+        request: Search parameters
+
+    Returns:
+        SearchResponse with ranked results and per-stage timings
+    """
+    try:
+        return await service.search(request)
+    except Exception as e:
+        logger.error(f"Hybrid search failed for '{request.query[:50]}': {e}")
+        raise HTTPException(status_code=500, detail="Search failed")
+
+
+@router.post("/enriched", response_model=EnrichedSearchResponse)
+async def enriched_search(
+    request: EnrichedSearchRequest,
+    service: HybridSearchService = Depends(get_search_service),
+) -> EnrichedSearchResponse:
+    """
+    Hybrid search with related entities for every result.
+
+    Runs one batched graph expansion seeded by the entities of all hits and
+    returns parent chunk context with each child chunk; timings include a
+    graph_expansion stage.
+
+    Args:
+        request: Search parameters with graph expansion options
+
+    Returns:
+        EnrichedSearchResponse with per-result graph context
+    """
+    try:
+        return await service.enriched_search(request)
+    except Exception as e:
+        logger.error(f"Enriched search failed for '{request.query[:50]}': {e}")
+        raise HTTPException(status_code=500, detail="Search failed")
+
+
+@router.get("/cache/stats")
+async def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Hit/miss counters for the search caches of this worker process.
+
+    Returns:
+        Per-cache hits by tier, misses, request count and hit rate
+    """
+    return all_cache_stats()
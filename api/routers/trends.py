@@ -43,6 +43,7 @@ sys.path.insert(
     0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 )
 
+from api.concept_overlap import MAX_MODULES_FOR_OVERLAP
 from services.trend_analyzer import (
     ConceptEvolution,
     ConceptFrequency,
@@ -80,8 +81,8 @@ class ModuleOverlapRequest(BaseModel):
     module_ids: List[str] = Field(
         ...,
         min_length=2,
-        max_length=10,
-        description="List of module IDs to analyze (2-10 modules)",
+        max_length=MAX_MODULES_FOR_OVERLAP,
+        description=f"List of module IDs to analyze (2-{MAX_MODULES_FOR_OVERLAP} modules)",
     )
 
 
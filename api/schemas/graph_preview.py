@@ -19,6 +19,8 @@ KEY COMPONENTS:
     - GraphNode: Single node with id, label, name, type, and properties
     - GraphEdge: Relationship between nodes with source, target, and type
     - GraphPreviewResponse: Complete graph data for visualization
+    - GraphOverviewResponse / ClusterExpansionResponse: Level-of-detail views
+    - EntityPageResponse: Cursor-paginated entity listing
 
 DEPENDENCIES:
     - External: pydantic (BaseModel, Field), typing
@@ -64,6 +66,31 @@ class GraphPreviewResponse(BaseModel):
     node_count: int
     edge_count: int
     module_id: Optional[str] = None
+    truncated: bool = False
+
+
+class GraphOverviewResponse(GraphPreviewResponse):
+    """Cluster-level view of a module graph (one supernode per cluster)."""
+
+    grouping: str
+    entity_count: int = 0
+
+
+class ClusterExpansionResponse(GraphPreviewResponse):
+    """One page of a cluster's members with edges to neighbouring clusters."""
+
+    cluster_id: str
+    next_cursor: Optional[str] = None
+
+
+class EntityPageResponse(BaseModel):
+    """One page of a cursor-paginated entity listing."""
+
+    items: List[GraphNode]
+    count: int
+    module_id: str
+    order_by: str
+    next_cursor: Optional[str] = None
 
 
 class GraphStatsResponse(BaseModel):
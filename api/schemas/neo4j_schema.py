@@ -18,6 +18,7 @@ ROLE IN PROJECT:
 KEY COMPONENTS:
     - NodeType: Enum for canonical node types (DOCUMENT, CONCEPT, etc.)
     - RelationshipType: Enum for relationship types
+    - ENTITY_LABEL: Common label shared by all entity types
     - Schema definitions: Properties, indices, constraints
     - Validation models: Pydantic models for schema validation
 
@@ -51,7 +52,8 @@ class NodeType(str, Enum):
     - Entities: TOPIC, CONCEPT, METHODOLOGY, FINDING, DEFINITION, CITATION
     - Organization: MODULE
     - Sessions: STUDY_SESSION, MESSAGE (AURA-CHAT specific)
-    - Feedback: FEEDBACK
+    - Feedback: FEEDBACK, FEEDBACK_ROLLUP
+    - Analytics: CONCEPT_ROLLUP
     """
 
     # Document structure
@@ -76,6 +78,16 @@ class NodeType(str, Enum):
 
     # Feedback
     FEEDBACK = "Feedback"
+    FEEDBACK_ROLLUP = "FeedbackRollup"
+
+    # Analytics
+    CONCEPT_ROLLUP = "ConceptRollup"
+
+
+# Common label carried by every entity node in addition to its type label.
+# Gives entities one id constraint and one name index instead of a UNION (or
+# a full node scan) across the per-type labels.
+ENTITY_LABEL = "Entity"
 
 
 # ============================================================================
@@ -295,6 +307,25 @@ NODE_PROPERTIES: Dict[NodeType, List[str]] = {
         "comment",  # String - User comment
         "created_at",  # DateTime! - Creation timestamp
     ],
+    NodeType.FEEDBACK_ROLLUP: [
+        "key",  # String! - "module_id|day|feedback_type"
+        "module_id",  # String! - Module ID, or "*" for all feedback
+        "day",  # Date! - Day the feedback was given
+        "feedback_type",  # String! - FeedbackType value
+        "count",  # Integer - Feedback entries
+        "positive_count",  # Integer - Entries with is_positive
+        "relevance_sum",  # Float - Sum of per-entry relevance values
+    ],
+    NodeType.CONCEPT_ROLLUP: [
+        "key",  # String! - "module_id|name_normalized|entity_type|day"
+        "module_id",  # String! - Module ID
+        "name_normalized",  # String! - toLower(trim(entity name))
+        "name",  # String - A representative original spelling
+        "entity_type",  # String - Entity label (Topic, Concept, ...)
+        "day",  # Date! - Day the entities were created
+        "count",  # Integer - Entities created that day
+        "first_seen",  # String - Earliest entity created_at that day
+    ],
 }
 
 
@@ -384,7 +415,8 @@ FULLTEXT_INDICES: List[FulltextIndexDefinition] = [
     FulltextIndexDefinition(
         name="chunk_fulltext_index",
         node_type="Chunk",
-        properties=["text"],
+        # module_id is indexed so search filters by module inside Lucene
+        properties=["text", "module_id"],
     ),
 ]
 
@@ -422,6 +454,50 @@ CONSTRAINTS: List[ConstraintDefinition] = [
         name="study_session_id_unique", node_type="StudySession", property="id"
     ),
     ConstraintDefinition(name="message_id_unique", node_type="Message", property="id"),
+    ConstraintDefinition(
+        name="entity_id_unique", node_type=ENTITY_LABEL, property="id"
+    ),
+    ConstraintDefinition(
+        name="feedback_rollup_key_unique", node_type="FeedbackRollup", property="key"
+    ),
+    ConstraintDefinition(
+        name="concept_rollup_key_unique", node_type="ConceptRollup", property="key"
+    ),
+]
+
+
+class RangeIndexDefinition(BaseModel):
+    """Definition for a Neo4j range (property) index."""
+
+    name: str
+    node_type: str
+    property: str
+
+
+RANGE_INDICES: List[RangeIndexDefinition] = [
+    RangeIndexDefinition(name="entity_name", node_type=ENTITY_LABEL, property="name"),
+    RangeIndexDefinition(
+        name="entity_module_id", node_type=ENTITY_LABEL, property="module_id"
+    ),
+    RangeIndexDefinition(name="chunk_module_id", node_type="Chunk", property="module_id"),
+    RangeIndexDefinition(
+        name="feedback_rollup_module_id", node_type="FeedbackRollup", property="module_id"
+    ),
+    RangeIndexDefinition(
+        name="feedback_timestamp", node_type="Feedback", property="timestamp"
+    ),
+    RangeIndexDefinition(
+        name="entity_name_normalized", node_type=ENTITY_LABEL, property="name_normalized"
+    ),
+    RangeIndexDefinition(
+        name="concept_rollup_module_id", node_type="ConceptRollup", property="module_id"
+    ),
+    RangeIndexDefinition(name="concept_rollup_day", node_type="ConceptRollup", property="day"),
+    RangeIndexDefinition(
+        name="concept_rollup_name_normalized",
+        node_type="ConceptRollup",
+        property="name_normalized",
+    ),
 ]
 
 
@@ -536,6 +612,14 @@ def generate_constraint_cypher(constraint_def: ConstraintDefinition) -> str:
     """
 
 
+def generate_range_index_cypher(index_def: RangeIndexDefinition) -> str:
+    """Generate Cypher for creating a range index."""
+    return f"""
+    CREATE INDEX {index_def.name} IF NOT EXISTS
+    FOR (n:{index_def.node_type}) ON (n.{index_def.property})
+    """
+
+
 def generate_all_indices_cypher() -> List[str]:
     """Generate Cypher statements for all indices."""
     statements = []
@@ -543,6 +627,8 @@ def generate_all_indices_cypher() -> List[str]:
         statements.append(generate_vector_index_cypher(vi))
     for fi in FULLTEXT_INDICES:
         statements.append(generate_fulltext_index_cypher(fi))
+    for ri in RANGE_INDICES:
+        statements.append(generate_range_index_cypher(ri))
     return statements
 
 
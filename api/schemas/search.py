@@ -34,7 +34,7 @@ USAGE:
 
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Optional
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
@@ -124,6 +124,23 @@ class SearchRequest(BaseModel):
         le=1.0,
         description="Minimum combined score threshold (0.0-1.0)",
     )
+    fusion: Literal["weighted", "rrf"] = Field(
+        default="weighted",
+        description=(
+            "Score fusion: weighted sum of normalized scores, or weighted "
+            "reciprocal rank fusion"
+        ),
+    )
+    rrf_k: int = Field(
+        default=60,
+        ge=1,
+        le=1000,
+        description="Rank offset k for reciprocal rank fusion",
+    )
+    feedback_rerank: bool = Field(
+        default=True,
+        description="Blend precomputed user-feedback quality scores into the ranking",
+    )
     query_expansion: Optional[QueryExpansionConfig] = Field(
         default=None,
         description="Optional query expansion configuration",
@@ -246,6 +263,15 @@ class SearchResponse(BaseModel):
     weights: Dict[str, float] = Field(
         description="Weights used for hybrid search (vector, fulltext)"
     )
+    fusion: str = Field(
+        default="weighted",
+        description="Score fusion mode used (weighted or rrf)",
+    )
+    timings: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-stage timings in milliseconds (expansion, embedding, "
+        "vector, fulltext, fusion, rerank, hydration; cache on a cache hit)",
+    )
     expansion_info: Optional["ExpansionInfo"] = Field(
         default=None,
         description="Information about query expansion if performed",
@@ -272,6 +298,14 @@ class SearchResponse(BaseModel):
                 "total_count": 1,
                 "search_time_ms": 45.2,
                 "weights": {"vector": 0.7, "fulltext": 0.3},
+                "fusion": "weighted",
+                "timings": {
+                    "embedding": 12.1,
+                    "vector": 18.4,
+                    "fulltext": 9.7,
+                    "fusion": 0.2,
+                    "hydration": 11.3,
+                },
                 "expansion_info": {
                     "original_query": "machine learning",
                     "expanded_query": "machine learning neural networks deep learning",
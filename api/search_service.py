@@ -0,0 +1,840 @@
+"""
+============================================================================
+FILE: search_service.py
+LOCATION: api/search_service.py
+============================================================================
+
+PURPOSE:
+    Hybrid chunk search combining the Neo4j vector index and the BM25
+    fulltext index, with weighted or reciprocal-rank score fusion.
+
+ROLE IN PROJECT:
+    Backs POST /api/v1/search (api/routers/search.py). Replaces the chat
+    frontend's sequential vector, fulltext and hydration calls with a single
+    request:
+    - Vector (embed + ANN) and fulltext queries run concurrently
+    - module_ids filters are applied inside the index queries (Lucene clause
+      for fulltext, filtered ANN with an exact per-module fallback for vectors)
+    - With ANN_INDEX_ENABLED, module-scoped vector queries are answered by
+      the in-process index (api/ann_index.py) instead of Neo4j
+    - Optional knowledge-graph query expansion (api/query_expansion.py)
+      adds boosted related entity names to the fulltext query
+    - Scores are normalized and fused, then only the top_k results are
+      hydrated with document, parent context and entity names
+    - Fused candidates are reranked with precomputed user-feedback quality
+      scores (api/feedback_quality.py) held in memory, before the top_k cut
+    - Per-stage timings are returned with the response
+    - Module-scoped responses are cached briefly under the modules' graph
+      versions (api/graph_cache.py), so re-ingesting a module invalidates
+      them; hit rates are reported via api/cache.py metrics
+    Enriched search (POST /api/v1/search/enriched) adds graph context: the
+    entities of all hits seed ONE multi-seed expansion whose paths are
+    attributed back to each hit, instead of a graph round trip per result.
+
+KEY COMPONENTS:
+    - HybridSearchService: Runs the search and enriched search pipelines
+    - fuse_weighted / fuse_rrf: Score fusion strategies
+    - build_lucene_query: Escaped Lucene query with module filter
+    - search_result_cache_key: Versioned key for the search result cache
+    - create_search_service: Factory function
+
+DEPENDENCIES:
+    - External: None
+    - Internal: api/schemas/search.py, api/graph_manager.py,
+      api/ann_index.py, api/query_expansion.py, api/graph_cache.py,
+      api/cache.py, api/feedback_quality.py, services/embeddings.py
+
+USAGE:
+    from api.search_service import create_search_service
+
+    service = create_search_service(graph_manager)
+    response = await service.search(SearchRequest(query="gradient descent"))
+============================================================================
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from api.ann_index import get_ann_index
+from api.cache import get_cache_stats
+from api.feedback_quality import (
+    FeedbackQualityTable,
+    get_feedback_quality_table,
+    rerank_with_quality,
+)
+from api.graph_cache import get_cached_response, get_module_versions, set_cached_response
+from api.graph_snapshot import get_snapshot_cache
+from api.query_expansion import QueryExpander
+from api.graph_manager import EntityPath, weight_path
+from api.schemas.search import (
+    EnrichedSearchRequest,
+    EnrichedSearchResponse,
+    EnrichedSearchResult,
+    EntityContext,
+    ExpandedQuery,
+    ExpansionInfo,
+    ExpansionTerm,
+    GraphContextResponse,
+    SearchRequest,
+    SearchResponse,
+    SearchResult,
+)
+
+
+# ============================================================================
+# LOGGING
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION CONSTANTS
+# ============================================================================
+
+CHUNK_VECTOR_INDEX = "chunk_vector_index"
+CHUNK_FULLTEXT_INDEX = "chunk_fulltext_index"
+
+# Candidates fetched from each index per requested result
+CANDIDATE_MULTIPLIER = 3
+
+# Extra ANN candidates fetched when results are filtered by module
+VECTOR_FILTER_OVERSAMPLE = 4
+
+MAX_ENTITIES_PER_RESULT = 10
+
+# Expansion rows fetched per requested expanded entity, so that paths from
+# several results' seeds survive the row limit
+GRAPH_EXPANSION_ROW_MULTIPLIER = 5
+
+# Short-lived cache of module-scoped search responses; entries are keyed by
+# the modules' graph versions, so the TTL only bounds memory
+SEARCH_RESULT_CACHE_ENABLED = os.getenv("SEARCH_RESULT_CACHE_ENABLED", "true").lower() == "true"
+SEARCH_RESULT_CACHE_TTL = int(os.getenv("SEARCH_RESULT_CACHE_TTL", "300"))
+CACHE_PREFIX_SEARCH = "search:resp"
+
+# Lucene query syntax characters escaped in user queries
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+
+# ============================================================================
+# CYPHER QUERIES
+# ============================================================================
+
+VECTOR_SEARCH_QUERY = """
+CALL db.index.vector.queryNodes($index_name, $candidates, $embedding)
+YIELD node, score
+{module_filter}
+RETURN node.id as id, score
+LIMIT $limit
+"""
+
+# Exact scan of the requested modules' chunks, used when ANN candidates are
+# mostly from other modules
+VECTOR_SCAN_QUERY = """
+MATCH (node:Chunk)
+WHERE node.module_id IN $module_ids AND node.embedding IS NOT NULL
+WITH node, vector.similarity.cosine(node.embedding, $embedding) as score
+RETURN node.id as id, score
+ORDER BY score DESC
+LIMIT $limit
+"""
+
+FULLTEXT_SEARCH_QUERY = """
+CALL db.index.fulltext.queryNodes($index_name, $lucene_query, {{limit: $limit}})
+YIELD node, score
+{module_filter}
+RETURN node.id as id, score
+LIMIT $limit
+"""
+
+MODULE_FILTER = "WHERE node.module_id IN $module_ids"
+
+HYDRATE_CHUNKS_QUERY = """
+UNWIND $ids as chunk_id
+MATCH (c:Chunk {id: chunk_id})
+RETURN c.id as id, c.text as text, c.module_id as module_id,
+       head([(d:Document)-[:HAS_CHUNK]->(c) | d {.id, .title}]) as document,
+       CASE WHEN $include_parent
+            THEN head([(c)-[:BELONGS_TO_PARENT]->(p:ParentChunk) | p.text])
+       END as parent_text,
+       [(c)-[:CONTAINS_ENTITY]->(e:Entity) | e.name][..$max_entities] as entities,
+       [(c)-[:CONTAINS_ENTITY]->(e:Entity) | e.id][..$max_entities] as entity_ids
+"""
+
+
+# ============================================================================
+# QUERY BUILDING AND FUSION
+# ============================================================================
+
+
+def _escape_lucene(text: str) -> str:
+    return _LUCENE_SPECIAL.sub(r"\\\1", text.lower())
+
+
+def build_lucene_query(
+    query: str,
+    module_ids: Optional[Sequence[str]] = None,
+    expansion_terms: Optional[Sequence[ExpansionTerm]] = None,
+) -> str:
+    """
+    Build a Lucene query for the chunk fulltext index.
+
+    Query syntax characters are escaped and terms lowercased (so AND/OR/NOT
+    are not read as operators). Expansion terms are added as optional
+    phrases boosted by their weight. Module ids become a required clause on
+    the indexed module_id field.
+
+    Args:
+        query: User query text
+        module_ids: Optional module IDs to restrict to
+        expansion_terms: Optional query expansion terms
+
+    Returns:
+        Lucene query string
+    """
+    terms = _escape_lucene(query).split()
+    for term in expansion_terms or []:
+        terms.append(f'"{_escape_lucene(term.term)}"^{term.weight:g}')
+    lucene = f"text:({' '.join(terms)})"
+    if module_ids:
+        quoted = " OR ".join(
+            '"' + m.replace("\\", "\\\\").replace('"', '\\"') + '"' for m in module_ids
+        )
+        lucene = f"{lucene} AND module_id:({quoted})"
+    return lucene
+
+
+Hit = Tuple[str, float]
+Fused = Tuple[str, float, Optional[float], Optional[float]]
+
+
+def normalize_query_text(query: str) -> str:
+    """Case-fold and collapse whitespace so trivially different queries share cache entries."""
+    return " ".join(unicodedata.normalize("NFKC", query).lower().split())
+
+
+def search_result_cache_key(
+    scope: str, normalized_query: str, version_stamp: str, options: Dict[str, Any]
+) -> str:
+    """
+    Build the search result cache key.
+
+    Args:
+        scope: "search" or "enriched"
+        normalized_query: Query after normalization
+        version_stamp: get_module_versions() stamp of the filtered modules
+        options: Request options other than the query text
+
+    Returns:
+        Cache key
+    """
+    payload = json.dumps(
+        {"q": normalized_query, "v": version_stamp, "o": options},
+        sort_keys=True, default=str,
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+    return f"{CACHE_PREFIX_SEARCH}:{scope}:{digest}"
+
+
+def _max_normalized(hits: Sequence[Hit]) -> Dict[str, float]:
+    """Scale scores so the best hit is 1.0 (keeps 0 at 0)."""
+    top = max((score for _, score in hits), default=0.0)
+    if top <= 0:
+        return {hit_id: 0.0 for hit_id, _ in hits}
+    return {hit_id: score / top for hit_id, score in hits}
+
+
+def fuse_weighted(
+    vector_hits: Sequence[Hit],
+    fulltext_hits: Sequence[Hit],
+    vector_weight: float,
+    fulltext_weight: float,
+) -> List[Fused]:
+    """
+    Weighted sum of normalized scores.
+
+    Vector scores are cosine similarities already in [0, 1]; BM25 scores are
+    unbounded and are divided by the best fulltext score. A result missing
+    from one list contributes 0 for that list.
+
+    Args:
+        vector_hits: (id, score) from the vector index
+        fulltext_hits: (id, score) from the fulltext index
+        vector_weight: Weight of the vector score
+        fulltext_weight: Weight of the fulltext score
+
+    Returns:
+        (id, combined, vector_score, fulltext_score), best first
+    """
+    vector = {hit_id: score for hit_id, score in vector_hits}
+    fulltext = _max_normalized(fulltext_hits)
+
+    fused = [
+        (
+            hit_id,
+            vector_weight * vector.get(hit_id, 0.0)
+            + fulltext_weight * fulltext.get(hit_id, 0.0),
+            vector.get(hit_id),
+            fulltext.get(hit_id),
+        )
+        for hit_id in dict.fromkeys([*vector, *fulltext])
+    ]
+    fused.sort(key=lambda item: item[1], reverse=True)
+    return fused
+
+
+def fuse_rrf(
+    vector_hits: Sequence[Hit],
+    fulltext_hits: Sequence[Hit],
+    vector_weight: float,
+    fulltext_weight: float,
+    k: int = 60,
+) -> List[Fused]:
+    """
+    Weighted reciprocal rank fusion.
+
+    Each list contributes weight / (k + rank). Combined scores are divided
+    by the best achievable score 1 / (k + 1) (weights sum to 1), so a result
+    ranked first in both lists scores 1.0.
+
+    Args:
+        vector_hits: (id, score) from the vector index, best first
+        fulltext_hits: (id, score) from the fulltext index, best first
+        vector_weight: Weight of the vector ranking
+        fulltext_weight: Weight of the fulltext ranking
+        k: Rank offset
+
+    Returns:
+        (id, combined, vector_score, fulltext_score), best first
+    """
+    scores: Dict[str, float] = {}
+    for hits, weight in ((vector_hits, vector_weight), (fulltext_hits, fulltext_weight)):
+        for rank, (hit_id, _) in enumerate(hits, start=1):
+            scores[hit_id] = scores.get(hit_id, 0.0) + weight / (k + rank)
+
+    vector = {hit_id: score for hit_id, score in vector_hits}
+    fulltext = _max_normalized(fulltext_hits)
+    fused = [
+        (hit_id, score * (k + 1), vector.get(hit_id), fulltext.get(hit_id))
+        for hit_id, score in scores.items()
+    ]
+    fused.sort(key=lambda item: item[1], reverse=True)
+    return fused
+
+
+# ============================================================================
+# SEARCH SERVICE
+# ============================================================================
+
+
+class HybridSearchService:
+    """
+    Hybrid vector + fulltext search over document chunks.
+
+    Example:
+        service = HybridSearchService(graph_manager)
+        response = await service.search(SearchRequest(query="backpropagation"))
+    """
+
+    def __init__(
+        self,
+        graph_manager,
+        embedding_service=None,
+        ann_index=None,
+        query_expander: Optional[QueryExpander] = None,
+        quality_table: Optional[FeedbackQualityTable] = None,
+    ):
+        """
+        Initialize the search service.
+
+        Args:
+            graph_manager: GraphManager used to run Cypher
+            embedding_service: Service with embed_query(text) (default:
+                EmbeddingService, created on first use)
+            ann_index: Optional AnnIndexStore for module-scoped vector search
+            query_expander: QueryExpander for requests with query_expansion
+                enabled (default: one over graph_manager)
+            quality_table: Optional FeedbackQualityTable for feedback-aware
+                reranking
+        """
+        self.graph_manager = graph_manager
+        self._embedding_service = embedding_service
+        self.ann_index = ann_index
+        self.query_expander = query_expander or QueryExpander(graph_manager)
+        self.quality_table = quality_table
+        self.result_cache_stats = get_cache_stats("search_result")
+
+    def _get_embedding_service(self):
+        if self._embedding_service is None:
+            from services.embeddings import EmbeddingService
+
+            self._embedding_service = EmbeddingService()
+        return self._embedding_service
+
+    # ------------------------------------------------------------------
+    # Result cache
+    # ------------------------------------------------------------------
+
+    def _result_cache_key(self, scope: str, request: SearchRequest) -> Optional[str]:
+        """
+        Cache key for a request, or None if it must not be cached.
+
+        Only module-scoped requests are cached: unscoped searches span every
+        module and have no single version stamp to invalidate them by.
+        """
+        if not SEARCH_RESULT_CACHE_ENABLED or not request.module_ids:
+            return None
+        stamp = get_module_versions(request.module_ids)
+        if stamp is None:
+            return None
+        options = request.model_dump(exclude={"query", "module_ids"})
+        return search_result_cache_key(
+            scope, normalize_query_text(request.query), stamp, options
+        )
+
+    def _cached_response(self, key: Optional[str], model, request: SearchRequest, start: float):
+        """Rebuild a cached response for this request, or None on a miss."""
+        if key is None:
+            return None
+        data = get_cached_response(key)
+        if data is None:
+            self.result_cache_stats.miss()
+            return None
+        try:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            response = model.model_validate({
+                **data,
+                "query": request.query,
+                "search_time_ms": round(elapsed_ms, 2),
+                "timings": {"cache": round(elapsed_ms, 3)},
+            })
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cached search response: {e}")
+            self.result_cache_stats.miss()
+            return None
+        self.result_cache_stats.hit("redis")
+        return response
+
+    def _store_response(self, key: Optional[str], response) -> None:
+        if key is not None:
+            set_cached_response(key, response.model_dump(mode="json"), ttl=SEARCH_RESULT_CACHE_TTL)
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    async def _embed(self, query: str) -> List[float]:
+        """Embed the query off the event loop (the embedding client blocks)."""
+        service = self._get_embedding_service()
+        return await asyncio.to_thread(service.embed_query, query)
+
+    async def _vector_stage(
+        self,
+        request: SearchRequest,
+        limit: int,
+        timings: Dict[str, float],
+    ) -> List[Hit]:
+        """Embed the query and run the (module-filtered) ANN search."""
+        start = time.perf_counter()
+        try:
+            embedding = await self._embed(request.query)
+        except Exception as e:
+            logger.warning(f"Query embedding failed, using fulltext only: {e}")
+            embedding = []
+        timings["embedding"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        hits: List[Hit] = []
+        if embedding:
+            try:
+                hits = await self._vector_search(embedding, request.module_ids, limit)
+            except Exception as e:
+                logger.warning(f"Vector search failed: {e}")
+        timings["vector"] = (time.perf_counter() - start) * 1000
+        return hits
+
+    async def _vector_search(
+        self,
+        embedding: List[float],
+        module_ids: Optional[List[str]],
+        limit: int,
+    ) -> List[Hit]:
+        if self.ann_index is not None and module_ids:
+            try:
+                hits = await asyncio.to_thread(
+                    self.ann_index.search, module_ids, "chunk", embedding, limit
+                )
+            except Exception as e:
+                logger.warning(f"Local ANN search failed, using Neo4j: {e}")
+                hits = None
+            if hits is not None:
+                return hits
+            # Some module has no usable local index; Neo4j serves it meanwhile
+
+        params: Dict[str, Any] = {
+            "index_name": CHUNK_VECTOR_INDEX,
+            "embedding": embedding,
+            "limit": limit,
+            "candidates": limit,
+        }
+        module_filter = ""
+        if module_ids:
+            module_filter = MODULE_FILTER
+            params["module_ids"] = module_ids
+            params["candidates"] = limit * VECTOR_FILTER_OVERSAMPLE
+
+        records = await self.graph_manager.run_query(
+            VECTOR_SEARCH_QUERY.format(module_filter=module_filter), params
+        )
+
+        if module_ids and len(records) < limit:
+            # The ANN neighbourhood is dominated by other modules; an exact
+            # scan of the requested modules is both complete and cheap here
+            records = await self.graph_manager.run_query(
+                VECTOR_SCAN_QUERY,
+                {"module_ids": module_ids, "embedding": embedding, "limit": limit},
+            )
+
+        return [(r["id"], float(r["score"])) for r in records]
+
+    async def _fulltext_stage(
+        self,
+        request: SearchRequest,
+        limit: int,
+        timings: Dict[str, float],
+        expanded: Optional[ExpandedQuery] = None,
+    ) -> List[Hit]:
+        """Run the BM25 fulltext search (with expansion terms if any)."""
+        start = time.perf_counter()
+        hits: List[Hit] = []
+        params: Dict[str, Any] = {
+            "index_name": CHUNK_FULLTEXT_INDEX,
+            "lucene_query": build_lucene_query(
+                request.query,
+                request.module_ids,
+                expanded.expansion_terms if expanded else None,
+            ),
+            "limit": limit,
+        }
+        module_filter = ""
+        if request.module_ids:
+            # Re-checked exactly: the Lucene clause matches analyzed tokens
+            module_filter = MODULE_FILTER
+            params["module_ids"] = request.module_ids
+        try:
+            records = await self.graph_manager.run_query(
+                FULLTEXT_SEARCH_QUERY.format(module_filter=module_filter), params
+            )
+            hits = [(r["id"], float(r["score"])) for r in records]
+        except Exception as e:
+            logger.warning(f"Fulltext search failed: {e}")
+        timings["fulltext"] = (time.perf_counter() - start) * 1000
+        return hits
+
+    async def _hydrate(
+        self, ids: List[str], include_parent: bool
+    ) -> Dict[str, Dict[str, Any]]:
+        """Load text, document, parent context and entities for result ids."""
+        if not ids:
+            return {}
+        records = await self.graph_manager.run_query(
+            HYDRATE_CHUNKS_QUERY,
+            {
+                "ids": ids,
+                "include_parent": include_parent,
+                "max_entities": MAX_ENTITIES_PER_RESULT,
+            },
+        )
+        return {record["id"]: record for record in records}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def search(self, request: SearchRequest) -> SearchResponse:
+        """
+        Run a hybrid search.
+
+        Args:
+            request: Validated search request
+
+        Returns:
+            SearchResponse with fused results and per-stage timings
+        """
+        start = time.perf_counter()
+        key = self._result_cache_key("search", request)
+        cached = self._cached_response(key, SearchResponse, request, start)
+        if cached is not None:
+            return cached
+
+        response, _ = await self._search(request)
+        self._store_response(key, response)
+        return response
+
+    async def _search(
+        self, request: SearchRequest
+    ) -> Tuple[SearchResponse, Dict[str, Dict[str, Any]]]:
+        """
+        Run the hybrid search pipeline.
+
+        Either index failing degrades to the other's results rather than
+        failing the request. Query expansion only affects the fulltext
+        stage; the vector stage embeds the original query.
+
+        Args:
+            request: Validated search request
+
+        Returns:
+            (SearchResponse, hydrated chunk rows by id)
+        """
+        start_time = time.perf_counter()
+        timings: Dict[str, float] = {}
+        limit = request.top_k * CANDIDATE_MULTIPLIER
+
+        expanded: Optional[ExpandedQuery] = None
+        if request.query_expansion and request.query_expansion.enabled:
+            expanded = self.query_expander.expand(
+                request.query, request.module_ids, request.query_expansion
+            )
+            timings["expansion"] = expanded.expansion_time_ms
+
+        vector_hits, fulltext_hits = await asyncio.gather(
+            self._vector_stage(request, limit, timings),
+            self._fulltext_stage(request, limit, timings, expanded),
+        )
+
+        stage_start = time.perf_counter()
+        if request.fusion == "rrf":
+            fused = fuse_rrf(
+                vector_hits, fulltext_hits,
+                request.vector_weight, request.fulltext_weight, request.rrf_k,
+            )
+        else:
+            fused = fuse_weighted(
+                vector_hits, fulltext_hits,
+                request.vector_weight, request.fulltext_weight,
+            )
+        # Both fusions score in [0, 1], so one threshold applies to either
+        fused = [item for item in fused if item[1] >= request.min_score]
+        timings["fusion"] = (time.perf_counter() - stage_start) * 1000
+
+        if request.feedback_rerank and self.quality_table is not None:
+            stage_start = time.perf_counter()
+            fused = rerank_with_quality(fused, self.quality_table.scores())
+            timings["rerank"] = (time.perf_counter() - stage_start) * 1000
+        fused = fused[:request.top_k]
+
+        stage_start = time.perf_counter()
+        try:
+            rows = await self._hydrate(
+                [item[0] for item in fused], request.include_parent_context
+            )
+        except Exception as e:
+            logger.error(f"Search result hydration failed: {e}")
+            rows = {}
+        timings["hydration"] = (time.perf_counter() - stage_start) * 1000
+
+        results = []
+        for chunk_id, score, vector_score, fulltext_score in fused:
+            row = rows.get(chunk_id)
+            if row is None:
+                continue
+            document = row.get("document") or {}
+            results.append(
+                SearchResult(
+                    id=chunk_id,
+                    node_type="Chunk",
+                    text=row.get("text") or "",
+                    score=round(min(score, 1.0), 4),
+                    vector_score=None if vector_score is None else round(vector_score, 4),
+                    fulltext_score=None if fulltext_score is None else round(fulltext_score, 4),
+                    document_id=document.get("id") or "",
+                    document_title=document.get("title"),
+                    module_id=row.get("module_id"),
+                    parent_context=row.get("parent_text"),
+                    entities=[name for name in row.get("entities") or [] if name],
+                )
+            )
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        logger.info(
+            f"Hybrid search ({request.fusion}): {len(vector_hits)} vector + "
+            f"{len(fulltext_hits)} fulltext candidates -> {len(results)} results "
+            f"in {elapsed_ms:.1f}ms"
+        )
+
+        return SearchResponse(
+            query=request.query,
+            results=results,
+            total_count=len(results),
+            search_time_ms=round(elapsed_ms, 2),
+            weights={
+                "vector": request.vector_weight,
+                "fulltext": request.fulltext_weight,
+            },
+            fusion=request.fusion,
+            timings={stage: round(ms, 3) for stage, ms in timings.items()},
+            expansion_info=ExpansionInfo(
+                original_query=expanded.original_query,
+                expanded_query=expanded.expanded_query,
+                expansion_terms=expanded.expansion_terms,
+                entities_identified=expanded.entities_found,
+                expansion_time_ms=round(expanded.expansion_time_ms, 3),
+            ) if expanded else None,
+        ), rows
+
+    async def enriched_search(self, request: EnrichedSearchRequest) -> EnrichedSearchResponse:
+        """
+        Hybrid search with graph context for every result.
+
+        The entities of all top_k hits seed a single multi-seed expansion
+        (one snapshot traversal or Cypher query, not one per hit); each
+        expanded path is attributed back to the results containing its seed.
+        Parent chunk text is hydrated in the search's hydration query.
+
+        Args:
+            request: Validated enriched search request
+
+        Returns:
+            EnrichedSearchResponse with related entities per result
+        """
+        start = time.perf_counter()
+        key = self._result_cache_key("enriched", request)
+        cached = self._cached_response(key, EnrichedSearchResponse, request, start)
+        if cached is not None:
+            return cached
+
+        response, rows = await self._search(request)
+        config = request.graph_expansion
+
+        seeds_by_result = {
+            result.id: [e for e in (rows.get(result.id) or {}).get("entity_ids") or [] if e]
+            for result in response.results
+        }
+        seeds = list(dict.fromkeys(e for ids in seeds_by_result.values() for e in ids))
+
+        stage_start = time.perf_counter()
+        records: List[Dict[str, Any]] = []
+        if config.enabled and seeds:
+            try:
+                records = await self.graph_manager.expand_entities(
+                    seeds,
+                    config.max_hops,
+                    request.module_ids,
+                    config.max_expanded_entities * GRAPH_EXPANSION_ROW_MULTIPLIER,
+                    config.relationship_types,
+                )
+            except Exception as e:
+                logger.warning(f"Graph expansion for enriched search failed: {e}")
+        traversal_ms = (time.perf_counter() - stage_start) * 1000
+
+        # Best-scoring path per (seed, target); targets capped globally
+        by_seed: Dict[str, Dict[str, Tuple[EntityContext, Dict[str, Any]]]] = {}
+        kept_targets: Dict[str, float] = {}
+        for record in records:
+            target_id = record["target_id"]
+            path = EntityPath(
+                source_entity=record["source"] or "",
+                target_entity=record["target"] or "",
+                relationship_type=record["relationship_type"],
+                confidence=record.get("confidence") or 1.0,
+                hops=record["hops"],
+            )
+            relevance = round(min(weight_path(path), 1.0), 4)
+            if target_id not in kept_targets:
+                if len(kept_targets) >= config.max_expanded_entities:
+                    continue
+                kept_targets[target_id] = relevance
+            current = by_seed.setdefault(record["source_id"], {}).get(target_id)
+            if current is not None and current[0].relevance_score >= relevance:
+                continue
+            by_seed[record["source_id"]][target_id] = (
+                EntityContext(
+                    entity_id=target_id,
+                    entity_name=record["target"] or target_id,
+                    entity_type=record.get("entity_type") or "Entity",
+                    definition=record.get("definition"),
+                    relationship_to_query=record["relationship_type"],
+                    hops_from_result=record["hops"],
+                    relevance_score=relevance,
+                ),
+                path.model_dump(),
+            )
+
+        enriched = []
+        for result in response.results:
+            own = set(seeds_by_result[result.id])
+            related: Dict[str, Tuple[EntityContext, Dict[str, Any]]] = {}
+            for seed in seeds_by_result[result.id]:
+                for target_id, item in by_seed.get(seed, {}).items():
+                    if target_id in own:
+                        continue
+                    if target_id not in related or (
+                        item[0].relevance_score > related[target_id][0].relevance_score
+                    ):
+                        related[target_id] = item
+            ranked = sorted(related.values(), key=lambda i: i[0].relevance_score, reverse=True)
+            ranked = ranked[:config.max_expanded_entities]
+            enriched.append(
+                EnrichedSearchResult(
+                    **result.model_dump(),
+                    related_entities=[entity for entity, _ in ranked],
+                    graph_paths=[path for _, path in ranked],
+                )
+            )
+
+        timings = {**response.timings, "graph_expansion": round(traversal_ms, 3)}
+        enriched_response = EnrichedSearchResponse(
+            **response.model_dump(exclude={"results", "timings", "search_time_ms"}),
+            results=enriched,
+            timings=timings,
+            search_time_ms=round(
+                response.search_time_ms + (time.perf_counter() - stage_start) * 1000, 2
+            ),
+            graph_context=GraphContextResponse(
+                seed_entities=seeds,
+                total_expanded=len(kept_targets),
+                max_depth_reached=max((r["hops"] for r in records), default=0),
+                traversal_time_ms=round(traversal_ms, 2),
+            ),
+        )
+        self._store_response(key, enriched_response)
+        return enriched_response
+
+
+def create_search_service(graph_manager=None, embedding_service=None) -> HybridSearchService:
+    """
+    Factory function to create a HybridSearchService.
+
+    The shared ANN index is attached when ANN_INDEX_ENABLED is set, query
+    expansion reuses the shared graph snapshot cache when enabled, and
+    results are reranked with the shared feedback quality table.
+
+    Args:
+        graph_manager: Optional GraphManager (default: create_graph_manager())
+        embedding_service: Optional embedding service
+
+    Returns:
+        Configured HybridSearchService instance
+    """
+    if graph_manager is None:
+        from api.graph_manager import create_graph_manager
+
+        graph_manager = create_graph_manager()
+    return HybridSearchService(
+        graph_manager,
+        embedding_service,
+        get_ann_index(),
+        QueryExpander(graph_manager, get_snapshot_cache()),
+        get_feedback_quality_table(),
+    )
@@ -0,0 +1,264 @@
+"""
+============================================================================
+FILE: single_flight.py
+LOCATION: api/single_flight.py
+============================================================================
+
+PURPOSE:
+    Stampede-safe Redis caching for expensive, read-mostly results:
+    single-flight fills and stale-while-revalidate serving.
+
+ROLE IN PROJECT:
+    TrendAnalyzer (services/trend_analyzer.py) and SummaryService
+    (services/summary_service.py) cache heavy Cypher aggregations and LLM
+    output in Redis. With a plain get/set cache every request that arrives
+    while a popular key is missing runs the same query, which is what made
+    dashboard p99 spike at each TTL boundary.
+
+    SingleFlightCache.get_or_compute coordinates fills at two levels:
+    - In-process: one fill task per key; concurrent callers await it
+    - Cross-process: a short Redis lock (SET NX) elects one filler; other
+      workers poll for its result instead of recomputing
+
+    Entries are stored with a freshness deadline and kept in Redis for an
+    extra stale window. A stale entry is returned immediately while one
+    background task refreshes it, so readers only ever wait on a cold key.
+
+KEY COMPONENTS:
+    - SingleFlightCache: get_or_compute / peek over the shared Redis client
+    - Cache stats: registered per cache name (see GET /search/cache/stats)
+
+DEPENDENCIES:
+    - External: None
+    - Internal: api/cache.py
+
+USAGE:
+    from api.single_flight import SingleFlightCache
+
+    cache = SingleFlightCache("trends", get_client, ttl=3600, stale_ttl=600)
+    data = await cache.get_or_compute(key, lambda: asyncio.to_thread(load))
+============================================================================
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+try:
+    from api.cache import get_cache_stats
+except ImportError:
+    from cache import get_cache_stats  # type: ignore[import-not-found]
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+CACHE_PREFIX_FILL_LOCK = "lock:fill"
+
+# How long a filler may hold the cross-process lock before others give up
+# waiting and compute themselves
+DEFAULT_LOCK_TTL_SECONDS = 60
+
+# How often waiters re-check Redis for another worker's result
+LOCK_POLL_INTERVAL_SECONDS = 0.1
+
+# Envelope fields wrapped around cached values
+_VALUE_FIELD = "_sf_value"
+_FRESH_UNTIL_FIELD = "_sf_fresh_until"
+
+# In-flight fills shared by every SingleFlightCache in the process, keyed by
+# (cache key, whether callers wait for the result)
+_inflight: Dict[Tuple[str, bool], "asyncio.Task[Any]"] = {}
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+
+class SingleFlightCache:
+    """
+    Redis cache with single-flight fills and stale-while-revalidate.
+
+    Compute callables return the value to cache, or None for results that
+    must not be cached (errors, fallbacks); exceptions propagate to the
+    caller that waited for the fill.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        cache_getter: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int = 0,
+        lock_ttl: int = DEFAULT_LOCK_TTL_SECONDS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            name: Stats name
+            cache_getter: Returns the Redis cache client, or None
+            ttl: Seconds an entry is fresh
+            stale_ttl: Extra seconds a stale entry may be served while refreshing
+            lock_ttl: Expiry of the cross-process fill lock
+        """
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.lock_ttl = lock_ttl
+        self._cache_getter = cache_getter
+        self._stats = get_cache_stats(name)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _client(self):
+        try:
+            return self._cache_getter()
+        except Exception as e:
+            logger.debug(f"Cache client unavailable for {self.name}: {e}")
+            return None
+
+    def _read(self, key: str) -> Tuple[Optional[Any], float]:
+        """(value, fresh_until epoch) for a key; (None, 0) if missing."""
+        client = self._client()
+        if client is None:
+            return None, 0.0
+        try:
+            data = client.get(key)
+        except Exception as e:
+            logger.debug(f"Cache get failed for {key}: {e}")
+            return None, 0.0
+        if isinstance(data, dict) and _VALUE_FIELD in data:
+            return data[_VALUE_FIELD], float(data.get(_FRESH_UNTIL_FIELD) or 0)
+        # Entries written before envelopes existed are served as stale
+        return data, 0.0
+
+    def _write(self, key: str, value: Any) -> None:
+        client = self._client()
+        if client is None:
+            return
+        envelope = {_VALUE_FIELD: value, _FRESH_UNTIL_FIELD: time.time() + self.ttl}
+        try:
+            client.set(key, envelope, ttl=self.ttl + self.stale_ttl)
+        except Exception as e:
+            logger.debug(f"Cache set failed for {key}: {e}")
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Cached value, fresh or stale, without computing or refreshing."""
+        return self._read(key)[0]
+
+    # ------------------------------------------------------------------
+    # Fills
+    # ------------------------------------------------------------------
+
+    def _acquire_lock(self, key: str) -> Optional[str]:
+        """Token if this process may fill the key ("" if Redis is unavailable)."""
+        client = self._client()
+        is_available = getattr(client, "is_available", None)
+        if client is None or (is_available is not None and not is_available()):
+            return ""
+        token = uuid.uuid4().hex
+        try:
+            acquired = client.set_if_absent(
+                f"{CACHE_PREFIX_FILL_LOCK}:{key}", token, ttl=self.lock_ttl
+            )
+        except Exception as e:
+            logger.debug(f"Fill lock failed for {key}: {e}")
+            return ""
+        return token if acquired else None
+
+    def _release_lock(self, key: str, token: str) -> None:
+        client = self._client()
+        if client is None or not token:
+            return
+        lock_key = f"{CACHE_PREFIX_FILL_LOCK}:{key}"
+        try:
+            if client.get(lock_key) == token:
+                client.delete(lock_key)
+        except Exception as e:
+            logger.debug(f"Fill lock release failed for {key}: {e}")
+
+    async def _fill(
+        self, key: str, compute: Callable[[], Awaitable[Any]], wait: bool
+    ) -> Optional[Any]:
+        started = time.time()
+        token = self._acquire_lock(key)
+        if token is None:
+            if not wait:
+                return None  # Another worker is already refreshing
+            # Wait for the other worker's result; take over if it gives up
+            deadline = time.monotonic() + self.lock_ttl
+            while token is None and time.monotonic() < deadline:
+                await asyncio.sleep(LOCK_POLL_INTERVAL_SECONDS)
+                value, fresh_until = self._read(key)
+                if value is not None and fresh_until - self.ttl >= started:
+                    return value
+                token = self._acquire_lock(key)
+            if token is None:
+                logger.warning(f"Timed out waiting for fill of {key}; computing locally")
+
+        try:
+            value = await compute()
+            if value is not None:
+                self._write(key, value)
+            return value
+        finally:
+            self._release_lock(key, token or "")
+
+    def _start_fill(
+        self, key: str, compute: Callable[[], Awaitable[Any]], wait: bool
+    ) -> "asyncio.Task[Any]":
+        """The running fill task for key, started if there is none."""
+        loop = asyncio.get_running_loop()
+        task = _inflight.get((key, wait))
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return task
+        task = loop.create_task(self._fill(key, compute, wait))
+        _inflight[(key, wait)] = task
+
+        def _done(finished: "asyncio.Task[Any]") -> None:
+            if _inflight.get((key, wait)) is finished:
+                del _inflight[(key, wait)]
+            if not finished.cancelled() and finished.exception() is not None and not wait:
+                logger.warning(f"Background refresh of {key} failed: {finished.exception()}")
+
+        task.add_done_callback(_done)
+        return task
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        force: bool = False,
+    ) -> Optional[Any]:
+        """
+        Cached value for key, computing it at most once across callers.
+
+        Args:
+            key: Cache key
+            compute: Coroutine factory producing the value (None = don't cache)
+            force: Skip the cached value and recompute
+
+        Returns:
+            Fresh or stale cached value, or the newly computed one
+        """
+        if not force:
+            value, fresh_until = self._read(key)
+            fresh = time.time() < fresh_until
+            if value is not None:
+                self._stats.hit("fresh" if fresh else "stale")
+                if not fresh:
+                    self._start_fill(key, compute, wait=False)
+                return value
+        self._stats.miss()
+        return await asyncio.shield(self._start_fill(key, compute, wait=True))
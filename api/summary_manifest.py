@@ -0,0 +1,209 @@
+"""
+============================================================================
+FILE: summary_manifest.py
+LOCATION: api/summary_manifest.py
+============================================================================
+
+PURPOSE:
+    Per-module summary manifests: which document summaries a stored module
+    summary was built from, and whether it is still current.
+
+ROLE IN PROJECT:
+    Backs SummaryService.summarize_module (services/summary_service.py).
+    The module summary cache key used to be a hash of every document
+    summary, so checking it meant fetching or regenerating each document
+    summary first, and any single document change invalidated the whole
+    synthesis.
+
+    A manifest is stored in Redis per (module, summary length):
+
+        {
+            "graph_version": 1718000000123,      # api/graph_cache version
+            "documents": {
+                "doc_1": {
+                    "fingerprint": "12|2026-...|2026-...",
+                    "content_hash": "3f9c...",   # document summary cache key
+                    "summary_hash": "a71b...",
+                    "title": "...",
+                    "entities": ["..."],
+                },
+            },
+            "summary": {...},                    # ModuleSummary, no doc summaries
+            "delta_count": 2,                    # delta syntheses since last full one
+        }
+
+    Currency is checked in two steps, cheapest first:
+    - Same module graph version as recorded: nothing in the module was
+      written since, so the stored summary is current (Redis only)
+    - Otherwise one Cypher query returns a metadata fingerprint per document
+      (chunk count, newest chunk, document timestamps); only documents whose
+      fingerprint changed are re-summarized
+
+    When few documents changed, the service revises the stored overview
+    from the changed summaries (delta synthesis) instead of re-running the
+    full map-reduce. Deltas are chained at most MAX_DELTA_CHAIN times before
+    a full synthesis, so small edits cannot make the overview drift.
+
+KEY COMPONENTS:
+    - DOCUMENT_FINGERPRINTS_QUERY: Per-document fingerprint inputs for a module
+    - document_fingerprint: Fingerprint string from a query record
+    - is_manifest_current: Graph-version fast path
+    - diff_documents: Changed and removed documents against a manifest
+    - use_delta_synthesis: Delta vs full synthesis policy
+    - entity_frequency: Module entity counts from manifest entries
+
+DEPENDENCIES:
+    - External: None
+    - Internal: None (graph versions come from api/graph_cache.py)
+
+USAGE:
+    from api.summary_manifest import diff_documents, use_delta_synthesis
+
+    changed, removed = diff_documents(manifest["documents"], fingerprints)
+    if use_delta_synthesis(manifest, len(changed) + len(removed), len(fingerprints)):
+        ...
+============================================================================
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+CACHE_PREFIX_MANIFEST = "summary:manifest"
+
+# Manifests outlive the summaries they describe; a manifest whose documents
+# are no longer cached simply regenerates them
+MANIFEST_TTL_SECONDS = 30 * 24 * 60 * 60  # 30 days
+
+# Delta synthesis only while at most this share of documents changed
+DELTA_MAX_CHANGED_FRACTION = 0.25
+
+# Consecutive delta syntheses before a full re-synthesis
+MAX_DELTA_CHAIN = 5
+
+
+# ============================================================================
+# CYPHER QUERIES
+# ============================================================================
+
+# Reprocessing a document recreates its chunks, and edits touch its
+# timestamps, so these change whenever its summary input can
+DOCUMENT_FINGERPRINTS_QUERY = """
+MATCH (d:Document)
+WHERE d.module_id = $module_id
+OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
+WITH d, count(c) as chunk_count, max(c.created_at) as last_chunk_at
+RETURN d.id as id, d.title as title, chunk_count,
+       toString(last_chunk_at) as last_chunk_at,
+       toString(coalesce(d.updated_at, d.processed_at, d.created_at)) as updated_at
+ORDER BY d.title
+"""
+
+
+# ============================================================================
+# MANIFEST CHECKS
+# ============================================================================
+
+
+def manifest_key(module_id: str, length: str) -> str:
+    """Redis key of the manifest for a module summary length."""
+    return f"{CACHE_PREFIX_MANIFEST}:{module_id}:{length}"
+
+
+def document_fingerprint(record: Dict[str, Any]) -> str:
+    """Fingerprint string from a DOCUMENT_FINGERPRINTS_QUERY record."""
+    return f"{record['chunk_count']}|{record['last_chunk_at']}|{record['updated_at']}"
+
+
+def is_manifest_current(
+    manifest: Optional[Dict[str, Any]],
+    graph_version: Optional[int],
+) -> bool:
+    """
+    Whether nothing in the module changed since the manifest was written.
+
+    Args:
+        manifest: Stored manifest, or None
+        graph_version: Current module graph version (None if unknown)
+
+    Returns:
+        True if the stored module summary can be served as is
+    """
+    return bool(
+        manifest
+        and manifest.get("summary")
+        and graph_version is not None
+        and manifest.get("graph_version") == graph_version
+    )
+
+
+def diff_documents(
+    documents: Dict[str, Dict[str, Any]],
+    fingerprints: Dict[str, str],
+) -> Tuple[List[str], List[str]]:
+    """
+    Documents that changed or disappeared since the manifest was written.
+
+    Args:
+        documents: Manifest entries by document ID
+        fingerprints: Current fingerprints by document ID, in module order
+
+    Returns:
+        (changed or new document IDs in module order,
+         removed document IDs in manifest order)
+    """
+    changed = [
+        doc_id
+        for doc_id, fingerprint in fingerprints.items()
+        if documents.get(doc_id, {}).get("fingerprint") != fingerprint
+    ]
+    removed = [doc_id for doc_id in documents if doc_id not in fingerprints]
+    return changed, removed
+
+
+def use_delta_synthesis(
+    manifest: Optional[Dict[str, Any]],
+    changed_count: int,
+    document_count: int,
+) -> bool:
+    """
+    Whether a module summary should be revised rather than re-synthesized.
+
+    Args:
+        manifest: Stored manifest, or None
+        changed_count: Changed, new and removed documents
+        document_count: Documents currently in the module
+
+    Returns:
+        True for delta synthesis, False for a full synthesis
+    """
+    if not manifest or not manifest.get("summary") or changed_count == 0:
+        return False
+    if manifest.get("delta_count", 0) >= MAX_DELTA_CHAIN:
+        return False
+    return changed_count <= max(1, int(document_count * DELTA_MAX_CHANGED_FRACTION))
+
+
+def entity_frequency(entries: Iterable[Dict[str, Any]]) -> List[Tuple[str, int]]:
+    """
+    Entity counts across documents, most frequent first.
+
+    Args:
+        entries: Manifest document entries
+
+    Returns:
+        (entity, document count) pairs
+    """
+    counts: Dict[str, int] = {}
+    for entry in entries:
+        for entity in entry.get("entities") or []:
+            counts[entity] = counts.get(entity, 0) + 1
+    return sorted(counts.items(), key=lambda x: x[1], reverse=True)
@@ -15,6 +15,11 @@ ROLE IN PROJECT:
 KEY COMPONENTS:
     - process_document_task: Celery task for single document KG processing
     - process_batch_task: Celery task for batch document KG processing
+    - detect_communities_task: Celery task for per-module community detection
+    - schedule_community_detection: Debounced community detection trigger
+    - rollup_feedback_quality_task: Periodic feedback quality rollup
+    - purge_old_feedback_task: Daily throttled feedback retention
+    - rebuild_concept_rollups_task: Full rebuild of trend concept rollups
     - get_task_progress: Helper to poll task progress by task ID
     - cancel_task: Helper to cancel a running task
     - ProcessingState: Enum of task processing states
@@ -34,6 +39,11 @@ USAGE:
 from .document_processing_tasks import (
     process_document_task,
     process_batch_task,
+    detect_communities_task,
+    schedule_community_detection,
+    rollup_feedback_quality_task,
+    purge_old_feedback_task,
+    rebuild_concept_rollups_task,
     get_task_progress,
     cancel_task,
     ProcessingState,
@@ -43,6 +53,11 @@ from .document_processing_tasks import (
 __all__ = [
     "process_document_task",
     "process_batch_task",
+    "detect_communities_task",
+    "schedule_community_detection",
+    "rollup_feedback_quality_task",
+    "purge_old_feedback_task",
+    "rebuild_concept_rollups_task",
     "get_task_progress",
     "cancel_task",
     "ProcessingState",
@@ -17,16 +17,27 @@ KEY COMPONENTS:
     - Celery app instance configuration
     - process_document_task: Single document processing with retry
     - process_batch_task: Batch document processing
+    - detect_communities_task: Offline community detection per module
+    - schedule_community_detection: Debounced trigger after documents land
+    - rollup_feedback_quality_task: Periodic feedback quality rollup (beat)
+    - purge_old_feedback_task: Daily throttled feedback retention (beat)
+    - rebuild_concept_rollups_task: Full rebuild of trend concept rollups
     - Progress tracking via task state
     - Time limits and retry policies
 
 DEPENDENCIES:
     - External: celery, redis
-    - Internal: kg_processor (KnowledgeGraphProcessor)
+    - Internal: kg_processor (KnowledgeGraphProcessor),
+      community_detection (CommunityDetector),
+      feedback_quality (rollup_feedback_quality),
+      feedback_manager (FeedbackManager),
+      concept_rollups (rebuild_concept_rollups)
 
 USAGE:
-    # Start worker
-    celery -A api.tasks worker -l info
+    # Start workers (and the scheduler for periodic tasks)
+    celery -A api.tasks worker -l info -Q kg_processing
+    celery -A api.tasks worker -l info -Q maintenance
+    celery -A api.tasks beat -l info
 
     # Dispatch task
     from api.tasks import process_document_task
@@ -49,9 +60,21 @@ from celery import Celery, Task
 from celery.exceptions import SoftTimeLimitExceeded, MaxRetriesExceededError
 
 # Import processor
-from ..config import CELERY_RESULT_EXPIRES, REDIS_URL, db
+from ..cache import redis_client
+from ..community_detection import CACHE_PREFIX_COMMUNITY_RUN, CommunityDetector
+from ..concept_rollups import rebuild_concept_rollups
+from ..config import (
+    CELERY_RESULT_EXPIRES,
+    COMMUNITY_DETECTION_DELAY,
+    FEEDBACK_RETENTION_INTERVAL,
+    REDIS_URL,
+    db,
+)
+from ..feedback_manager import FeedbackManager
+from ..feedback_quality import FEEDBACK_ROLLUP_INTERVAL, rollup_feedback_quality
 from ..kg_processor import KnowledgeGraphProcessor, process_document_simple
 from ..logging_config import logger
+from ..neo4j_config import neo4j_driver
 
 # Firestore filter for positional-arg-free queries
 from google.cloud.firestore import FieldFilter
@@ -187,6 +210,9 @@ logger.info(
     f"Celery Redis config: URL='{REDIS_URL}', result_expires={CELERY_RESULT_EXPIRES}s"
 )
 
+# Queue for long-running housekeeping tasks, served by a separate worker
+MAINTENANCE_QUEUE = "maintenance"
+
 # Create Celery app using centralized config
 app = Celery(
     "aura_notes_tasks",
@@ -211,10 +237,23 @@ app.conf.update(
     # Result settings (use centralized config)
     result_expires=CELERY_RESULT_EXPIRES,
     task_track_started=True,  # Track when task starts
-    # Task routing (optional - can be configured in worker)
+    # Task routing (optional - can be configured in worker). Exact names win
+    # over the wildcard, so long-running maintenance stays off the KG workers
     task_routes={
+        "api.tasks.purge_old_feedback": {"queue": MAINTENANCE_QUEUE},
         "api.tasks.*": {"queue": "kg_processing"},
     },
+    # Periodic tasks (run `celery -A api.tasks beat`)
+    beat_schedule={
+        "rollup-feedback-quality": {
+            "task": "api.tasks.rollup_feedback_quality",
+            "schedule": FEEDBACK_ROLLUP_INTERVAL,
+        },
+        "purge-old-feedback": {
+            "task": "api.tasks.purge_old_feedback",
+            "schedule": FEEDBACK_RETENTION_INTERVAL,
+        },
+    },
 )
 
 
@@ -477,6 +516,9 @@ def process_document_task(
         # Update state: COMPLETED (100%)
         self.update_progress("completed", 100, final_result)
 
+        # Refresh the module's precomputed communities once documents settle
+        schedule_community_detection(module_id)
+
         # Update Firestore status to READY
         update_document_status(
             document_id,
@@ -715,6 +757,194 @@ def process_batch_task(
         raise
 
 
+# ============================================================================
+# COMMUNITY DETECTION TASK
+# ============================================================================
+
+
+@app.task(
+    bind=True,
+    base=KGProcessingTask,
+    name="api.tasks.detect_communities",
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_backoff=True,
+    retry_backoff_max=300,
+    retry_jitter=True,
+    max_retries=3,
+    acks_late=True,
+    reject_on_worker_lost=True,
+    time_limit=1800,  # 30 minutes hard limit
+    soft_time_limit=1500,  # 25 minutes soft limit
+)
+def detect_communities_task(
+    self, module_id: str, force: bool = False
+) -> Dict[str, Any]:
+    """
+    Recompute and persist entity communities and centrality for a module.
+
+    Skips the work when the module's graph version is unchanged since the
+    last run, unless force is set.
+
+    Args:
+        module_id: Module whose entity graph is clustered
+        force: Recompute even if the module version is unchanged
+
+    Returns:
+        Run summary from CommunityDetector.detect
+    """
+    task_logger = logging.getLogger(f"community_task.{self.request.id}")
+    task_logger.info(f"Detecting communities for module {module_id}")
+
+    self.update_state(
+        state="PROCESSING",
+        meta={"stage": "community_detection", "progress": 0, "module_id": module_id},
+    )
+
+    try:
+        return CommunityDetector(self.processor.driver).detect(module_id, force=force)
+    except Exception as e:
+        task_logger.exception(f"Community detection failed for {module_id}: {e}")
+        self.update_state(
+            state=ProcessingState.FAILED.value,
+            meta={
+                "stage": "community_detection",
+                "progress": 0,
+                "error": str(e),
+                "module_id": module_id,
+            },
+        )
+        raise
+
+
+def schedule_community_detection(
+    module_id: Optional[str], delay: int = COMMUNITY_DETECTION_DELAY
+) -> Optional[str]:
+    """
+    Queue a delayed community detection run for a module.
+
+    Only one run is queued per module per delay window; documents stored
+    within the window are covered by that run. Without Redis there is no
+    debounce, so every call queues its own run.
+
+    Args:
+        module_id: Module whose graph changed
+        delay: Seconds to wait before running
+
+    Returns:
+        Task ID if a run was queued, None otherwise
+    """
+    if not module_id:
+        return None
+    try:
+        pending_key = f"{CACHE_PREFIX_COMMUNITY_RUN}:pending:{module_id}"
+        if redis_client.is_available() and not redis_client.set_if_absent(
+            pending_key, True, ttl=delay
+        ):
+            return None
+        return detect_communities_task.apply_async(
+            args=[module_id], countdown=delay
+        ).id
+    except Exception as e:
+        logger.warning(f"Could not schedule community detection for {module_id}: {e}")
+        return None
+
+
+# ============================================================================
+# FEEDBACK QUALITY ROLLUP TASK
+# ============================================================================
+
+
+@app.task(
+    bind=True,
+    base=Task,
+    name="api.tasks.rollup_feedback_quality",
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_backoff=True,
+    max_retries=2,
+    time_limit=600,
+    soft_time_limit=540,
+)
+def rollup_feedback_quality_task(self) -> Dict[str, Any]:
+    """
+    Recompute the per-result feedback quality table used by search reranking.
+
+    Returns:
+        Run summary from rollup_feedback_quality
+    """
+    return rollup_feedback_quality(neo4j_driver)
+
+
+# ============================================================================
+# FEEDBACK RETENTION TASK
+# ============================================================================
+
+
+@app.task(
+    bind=True,
+    base=Task,
+    name="api.tasks.purge_old_feedback",
+    acks_late=True,
+    time_limit=4 * 3600,
+    soft_time_limit=4 * 3600 - 300,
+)
+def purge_old_feedback_task(
+    self, days: Optional[int] = None, dry_run: bool = False
+) -> Dict[str, Any]:
+    """
+    Delete expired Feedback nodes in throttled batches.
+
+    Progress (deleted so far, rows per second) is published as task state
+    after every batch. A run cut short by the time limit is simply resumed
+    by the next scheduled run.
+
+    Args:
+        days: Retention in days (default FEEDBACK_RETENTION_DAYS)
+        dry_run: Only count the expired feedback
+
+    Returns:
+        Retention report from FeedbackManager.delete_old_feedback
+    """
+    manager = FeedbackManager(neo4j_driver)
+    kwargs: Dict[str, Any] = {"dry_run": dry_run}
+    if days is not None:
+        kwargs["days"] = days
+
+    def publish(report: Dict[str, Any]) -> None:
+        self.update_state(state="PROCESSING", meta={"stage": "feedback_retention", **report})
+
+    try:
+        return asyncio.run(manager.delete_old_feedback(progress_callback=publish, **kwargs))
+    except SoftTimeLimitExceeded:
+        logger.warning("Feedback retention hit its time limit; the next run continues")
+        return {"stage": "feedback_retention", "timed_out": True}
+
+
+# ============================================================================
+# CONCEPT ROLLUP REBUILD TASK
+# ============================================================================
+
+
+@app.task(
+    bind=True,
+    base=KGProcessingTask,
+    name="api.tasks.rebuild_concept_rollups",
+    acks_late=True,
+    time_limit=3600,
+    soft_time_limit=3300,
+)
+def rebuild_concept_rollups_task(self) -> Dict[str, Any]:
+    """
+    Recompute the concept rollups of every module.
+
+    The KG store path keeps rollups current; this batch job repairs them
+    after manual graph edits or a failed refresh.
+
+    Returns:
+        Summary from rebuild_concept_rollups
+    """
+    return rebuild_concept_rollups(self.processor.driver)
+
+
 # ============================================================================
 # HELPER FUNCTIONS FOR PROGRESS POLLING
 # ============================================================================
@@ -802,6 +1032,8 @@ def cancel_task(task_id: str) -> bool:
 __all__ = [
     "process_document_task",
     "process_batch_task",
+    "detect_communities_task",
+    "schedule_community_detection",
     "get_task_progress",
     "cancel_task",
     "ProcessingState",
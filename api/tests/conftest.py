@@ -10,6 +10,13 @@ PURPOSE:
 ROLE IN PROJECT:
     Sets up test environment before imports to avoid Python 3.14 protobuf compatibility issues.
     Mocks all google.cloud and firebase admin imports that fail on Python 3.14.
+    Also provides the shared in-memory Redis stand-in used by cache tests
+    and the type-label filter check used by concept query tests.
+
+KEY COMPONENTS:
+    - DictCacheClient: dict-backed replacement for api.cache.redis_client
+    - cache_client / cache_targets / cache fixtures
+    - admits: evaluates the Cypher type-label filters on a variable
 
 DEPENDENCIES:
     - External: pytest, sys, unittest.mock, types
@@ -20,10 +27,13 @@ USAGE:
 ============================================================================
 """
 
+import re
 import sys
 from unittest.mock import MagicMock
 import types
 
+import pytest
+
 
 class MockModule(types.ModuleType):
     """
@@ -133,3 +143,85 @@ chunking_utils = MockModule("services.chunking_utils", auto_register=True)
 chunking_utils.count_tokens = MagicMock(return_value=100)
 chunking_utils.split_into_sentences = MagicMock(return_value=["sentence1", "sentence2"])
 sys.modules["services.chunking_utils"] = chunking_utils
+
+
+# ============================================================================
+# SHARED CACHE FIXTURES
+# ============================================================================
+
+
+class DictCacheClient:
+    """Dict-backed stand-in for the Redis cache client."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ttl=None):
+        self.store[key] = value
+        return True
+
+    def set_if_absent(self, key, value, ttl=None):
+        if key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+    def incr(self, key, amount=1):
+        self.store[key] = int(self.store.get(key, 0)) + amount
+        return self.store[key]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+        return len(keys)
+
+    def is_available(self):
+        return True
+
+
+@pytest.fixture
+def cache_client():
+    """A fresh, unpatched DictCacheClient."""
+    return DictCacheClient()
+
+
+@pytest.fixture
+def cache_targets():
+    """
+    Modules whose ``_get_cache`` the ``cache`` fixture patches.
+
+    Override this fixture in a test module to patch additional modules.
+    """
+    return ("api.graph_cache",)
+
+
+@pytest.fixture
+def cache(monkeypatch, cache_client, cache_targets):
+    """Route every module in ``cache_targets`` to one DictCacheClient."""
+    for target in cache_targets:
+        monkeypatch.setattr(f"{target}._get_cache", lambda: cache_client)
+    return cache_client
+
+
+# ============================================================================
+# CYPHER LABEL FILTERS
+# ============================================================================
+
+
+def label_filter_admits(cypher, variable, labels):
+    """Whether every type-label filter on variable accepts a node with labels."""
+    filters = re.findall(rf"\(({variable}:\w+(?: OR {variable}:\w+)*)\)", cypher)
+    assert filters, f"no type filter on {variable}"
+    return all(
+        any(term.split(":")[1] in labels for term in group.split(" OR "))
+        for group in filters
+    )
+
+
+@pytest.fixture
+def admits():
+    """label_filter_admits, for tests that check concept-only queries."""
+    return label_filter_admits
@@ -0,0 +1,130 @@
+"""
+============================================================================
+FILE: test_ann_index.py
+LOCATION: api/tests/test_ann_index.py
+============================================================================
+
+PURPOSE:
+    Unit tests for the memory-mapped IVF index.
+
+ROLE IN PROJECT:
+    Validates recall against exact search, incremental add/remove with
+    tombstones and compaction, that readers pick up another writer's
+    updates, and that hybrid search uses the local index for module-scoped
+    queries instead of the Neo4j vector index, falling back to Neo4j when
+    the local index fails.
+
+KEY COMPONENTS:
+    - TestAnnIndexStore
+    - TestSearchIntegration
+
+DEPENDENCIES:
+    - External: pytest, numpy
+    - Internal: api.ann_index, api.search_service
+
+USAGE:
+    pytest api/tests/test_ann_index.py -v
+============================================================================
+"""
+
+import asyncio
+
+import numpy as np
+
+import api.ann_index as ann_index
+from api.ann_index import AnnIndexStore, exact_search, normalize_rows
+from api.schemas.search import SearchRequest
+from api.search_service import HybridSearchService
+from api.tests.test_search_service import _FakeEmbeddings, _SearchGraphManager
+
+
+def _clustered(rows, dim=32, topics=20, seed=0):
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((topics, dim))
+    points = centres[rng.integers(0, topics, rows)] + 0.6 * rng.standard_normal((rows, dim))
+    return normalize_rows(points)
+
+
+class TestAnnIndexStore:
+    def test_recall_against_exact_search(self, tmp_path):
+        vectors = _clustered(3000)
+        ids = [f"c{i}" for i in range(len(vectors))]
+        store = AnnIndexStore(str(tmp_path), nprobe=8)
+        store.build("m1", "chunk", ids, vectors)
+
+        queries = _clustered(50, seed=1)
+        recall = np.mean([
+            len({ids[i] for i in exact_search(vectors, q, 10)}
+                & {hit for hit, _ in store.search(["m1"], "chunk", q, 10)}) / 10
+            for q in queries
+        ])
+
+        assert recall >= 0.9
+        assert store.search(["m2"], "chunk", queries[0], 10) is None
+
+    def test_add_remove_and_compaction(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ann_index, "ANN_COMPACT_MIN_ROWS", 2)
+        monkeypatch.setattr(ann_index, "ANN_COMPACT_RATIO", 0.05)
+        vectors = _clustered(40)
+        store = AnnIndexStore(str(tmp_path))
+        store.build("m1", "chunk", [f"c{i}" for i in range(40)], vectors)
+        query = vectors[0]
+
+        # Replacing c0's vector moves it away from the query
+        store.add("m1", "chunk", ["c0", "new"], [-query, query])
+        hits = dict(store.search(["m1"], "chunk", query, 50))
+        assert hits["new"] == 1.0 and hits["c0"] < 0.01
+
+        store.remove("m1", "chunk", ["new", "c1"])
+        hits = [hit for hit, _ in store.search(["m1"], "chunk", query, 50)]
+        assert "new" not in hits and "c1" not in hits and len(hits) == 39
+
+        manifest = store._load_manifest(store._directory("m1", "chunk"))
+        assert manifest["segments"] == [] and manifest["deleted"] == {}
+        assert manifest["base_rows"] == 39
+
+    def test_reader_sees_other_writer(self, tmp_path):
+        vectors = _clustered(20)
+        writer, reader = AnnIndexStore(str(tmp_path)), AnnIndexStore(str(tmp_path))
+        writer.build("m1", "chunk", [f"c{i}" for i in range(20)], vectors)
+        assert reader.search(["m1"], "chunk", vectors[3], 1)[0][0] == "c3"
+
+        writer.add("m1", "chunk", ["c3b"], [vectors[3]])
+        writer.remove("m1", "chunk", ["c3"])
+        assert reader.search(["m1"], "chunk", vectors[3], 1)[0][0] == "c3b"
+
+        writer.drop("m1", "chunk")
+        assert reader.search(["m1"], "chunk", vectors[3], 1) is None
+
+
+class TestSearchIntegration:
+    def test_module_search_uses_local_index(self, tmp_path):
+        store = AnnIndexStore(str(tmp_path))
+        store.build("m1", "chunk", ["a", "b"], [[0.1] * 768, [-0.1] * 768])
+        manager = _SearchGraphManager(vector=[], fulltext=[])
+        service = HybridSearchService(manager, _FakeEmbeddings(), ann_index=store)
+
+        response = asyncio.run(service.search(
+            SearchRequest(query="q", module_ids=["m1"], top_k=1, min_score=0.0)
+        ))
+
+        assert [r.id for r in response.results] == ["a"]
+        assert response.results[0].vector_score == 1.0
+        assert not any("db.index.vector" in c for c, _ in manager.calls)
+
+    def test_local_index_failure_falls_back_to_neo4j(self):
+        class _BrokenStore:
+            def search(self, *args):
+                raise OSError("index parts vanished")
+
+        manager = _SearchGraphManager(
+            vector=[], fulltext=[], scan=[{"id": "n", "score": 0.9}]
+        )
+        service = HybridSearchService(manager, _FakeEmbeddings(), ann_index=_BrokenStore())
+
+        response = asyncio.run(service.search(
+            SearchRequest(query="q", module_ids=["m1"], top_k=1, min_score=0.0)
+        ))
+
+        assert [r.id for r in response.results] == ["n"]
+        assert any("db.index.vector" in c for c, _ in manager.calls)
@@ -0,0 +1,195 @@
+"""
+============================================================================
+FILE: test_community_detection.py
+LOCATION: api/tests/test_community_detection.py
+============================================================================
+
+PURPOSE:
+    Unit tests for offline community detection and centrality scoring.
+
+ROLE IN PROJECT:
+    Validates that label propagation separates loosely linked clusters, that
+    stored community ids survive a warm-started re-run, that write-back is
+    batched and limited to changed entities, that unchanged module
+    versions skip the job, that write-back moves the community stamp rather
+    than the module graph version, that only concept entities are
+    clustered, and that runs are still scheduled when Redis is down.
+
+KEY COMPONENTS:
+    - TestSparseAlgorithms
+    - TestCommunityDetector
+    - TestScheduling
+
+DEPENDENCIES:
+    - External: pytest, numpy
+    - Internal: api.community_detection, api.graph_cache,
+      api.tasks.document_processing_tasks
+
+USAGE:
+    pytest api/tests/test_community_detection.py -v
+============================================================================
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+import api.graph_cache as graph_cache
+from api.community_detection import (
+    _MODULE_EDGES_QUERY,
+    _MODULE_ENTITIES_QUERY,
+    CommunityDetector,
+    assign_community_ids,
+    build_adjacency,
+    get_community_stamp,
+    label_propagation,
+    pagerank,
+)
+
+
+def _two_cliques():
+    """Two 4-cliques (a*, b*) joined by a single weak bridge a0-b0."""
+    ids = [f"a{i}" for i in range(4)] + [f"b{i}" for i in range(4)]
+    edges = []
+    for group in ("a", "b"):
+        for i in range(4):
+            for j in range(i + 1, 4):
+                edges.append({"source": f"{group}{i}", "target": f"{group}{j}",
+                              "weight": 1.0})
+    edges.append({"source": "a0", "target": "b0", "weight": 0.2})
+    return ids, edges
+
+
+class _FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, cypher, **params):
+        if "UNWIND $rows" in cypher:
+            self.driver.writes.append(params["rows"])
+            for row in params["rows"]:
+                self.driver.entities[row["id"]].update(row)
+            return []
+        if "RETURN a.id as source" in cypher:
+            return self.driver.edges
+        return [dict(e) for e in self.driver.entities.values()]
+
+
+class _FakeDriver:
+    def __init__(self, ids, edges):
+        self.entities = {i: {"id": i, "community_id": None, "centrality": None}
+                         for i in ids}
+        self.edges = edges
+        self.writes = []
+
+    def session(self):
+        return _FakeSession(self)
+
+
+@pytest.fixture
+def cache_targets():
+    return ("api.graph_cache", "api.community_detection")
+
+
+class TestSparseAlgorithms:
+    def test_adjacency_is_symmetric_and_merges_parallel_edges(self):
+        adjacency = build_adjacency(
+            3, np.array([0, 0, 1, 2]), np.array([1, 1, 2, 2]),
+            np.array([1.0, 0.5, 2.0, 9.0]),
+        )
+
+        assert adjacency.indptr.tolist() == [0, 1, 3, 4]
+        assert adjacency.indices.tolist() == [1, 0, 2, 1]
+        assert adjacency.weights.tolist() == [1.5, 1.5, 2.0, 2.0]
+
+    def test_label_propagation_separates_bridged_cliques(self):
+        ids, edges = _two_cliques()
+        index = {i: n for n, i in enumerate(ids)}
+        adjacency = build_adjacency(
+            len(ids),
+            np.array([index[e["source"]] for e in edges]),
+            np.array([index[e["target"]] for e in edges]),
+            np.array([e["weight"] for e in edges]),
+        )
+
+        labels = label_propagation(adjacency).tolist()
+
+        assert len(set(labels[:4])) == 1
+        assert len(set(labels[4:])) == 1
+        assert labels[0] != labels[4]
+
+        scores = pagerank(adjacency)
+        assert scores.sum() == pytest.approx(1.0)
+        assert scores[0] > scores[1]
+
+    def test_community_ids_are_reused_largest_first(self):
+        labels = np.array([0, 0, 0, 3, 3, 5])
+        previous = [7, 7, None, 7, None, None]
+
+        assert assign_community_ids(labels, previous) == [7, 7, 7, 8, 8, 9]
+
+
+class TestCommunityDetector:
+    def test_detect_writes_in_batches_and_skips_unchanged_version(self, cache):
+        ids, edges = _two_cliques()
+        driver = _FakeDriver(ids, edges)
+        detector = CommunityDetector(driver, batch_size=3)
+
+        version = graph_cache.get_module_version("m1")
+        summary = detector.detect("m1")
+
+        assert summary["status"] == "completed"
+        assert summary["community_count"] == 2
+        assert [len(batch) for batch in driver.writes] == [3, 3, 2]
+        assert driver.entities["a0"]["centrality"] == 1.0
+        assert detector.detect("m1")["status"] == "skipped"
+        # Write-back moves the community stamp, not the module graph version
+        assert graph_cache.get_module_version("m1") == version
+        assert get_community_stamp("m1") == summary["assignments_updated_at"]
+
+    def test_rerun_after_version_bump_keeps_ids_and_writes_nothing(self, cache):
+        ids, edges = _two_cliques()
+        driver = _FakeDriver(ids, edges)
+        detector = CommunityDetector(driver)
+        detector.detect("m1")
+        before = {i: e["community_id"] for i, e in driver.entities.items()}
+        stamp = get_community_stamp("m1")
+        driver.writes.clear()
+
+        graph_cache.bump_module_version("m1")
+        summary = detector.detect("m1")
+
+        assert summary["status"] == "completed"
+        assert summary["updated_count"] == 0
+        assert driver.writes == []
+        assert {i: e["community_id"] for i, e in driver.entities.items()} == before
+        assert get_community_stamp("m1") == stamp
+
+    def test_only_concept_entities_are_clustered(self, admits):
+        for cypher, variable in [
+            (_MODULE_ENTITIES_QUERY, "e"),
+            (_MODULE_EDGES_QUERY, "a"),
+            (_MODULE_EDGES_QUERY, "b"),
+        ]:
+            assert admits(cypher, variable, {"Entity", "Methodology"})
+            assert not admits(cypher, variable, {"Entity", "Definition"})
+
+
+class TestScheduling:
+    def test_schedules_directly_when_redis_is_down(self, monkeypatch):
+        tasks = pytest.importorskip("api.tasks.document_processing_tasks")
+        monkeypatch.setattr(tasks.redis_client, "is_available", lambda: False)
+        monkeypatch.setattr(tasks.redis_client, "set_if_absent", lambda *a, **k: False)
+        apply_async = MagicMock(return_value=MagicMock(id="task-1"))
+        monkeypatch.setattr(tasks.detect_communities_task, "apply_async", apply_async)
+
+        assert tasks.schedule_community_detection("m1") == "task-1"
+        assert tasks.schedule_community_detection("m1") == "task-1"
+        assert apply_async.call_count == 2
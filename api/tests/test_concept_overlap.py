@@ -0,0 +1,77 @@
+"""
+============================================================================
+FILE: test_concept_overlap.py
+LOCATION: api/tests/test_concept_overlap.py
+============================================================================
+
+PURPOSE:
+    Unit tests for the vectorized cross-module concept overlap.
+
+ROLE IN PROJECT:
+    Validates the sparse Jaccard matrix against plain set arithmetic on a
+    department-sized random input, and the shared / unique / bridging
+    classification on a small hand-checked example.
+
+KEY COMPONENTS:
+    - TestConceptOverlap
+
+DEPENDENCIES:
+    - External: pytest, numpy
+    - Internal: api.concept_overlap
+
+USAGE:
+    pytest api/tests/test_concept_overlap.py -v
+============================================================================
+"""
+
+import random
+
+from api.concept_overlap import compute_concept_overlap
+
+
+def _rows(memberships):
+    return [
+        {"module_id": module_id, "name_normalized": name}
+        for module_id, names in memberships.items()
+        for name in names
+    ]
+
+
+class TestConceptOverlap:
+    def test_jaccard_matches_set_arithmetic(self):
+        rng = random.Random(7)
+        vocabulary = [f"c{i}" for i in range(3000)]
+        sets = {f"m{i}": set(rng.sample(vocabulary, rng.randint(0, 200))) for i in range(200)}
+        module_ids = list(sets)
+
+        overlap = compute_concept_overlap(module_ids, _rows(sets))
+
+        for i, a in enumerate(module_ids):
+            for j, b in enumerate(module_ids):
+                union = len(sets[a] | sets[b])
+                expected = 1.0 if i == j else (
+                    round(len(sets[a] & sets[b]) / union, 4) if union else 0.0
+                )
+                assert overlap.jaccard[i][j] == expected
+
+    def test_shared_unique_and_bridging(self):
+        memberships = {
+            "m1": ["graphs", "trees", "sorting"],
+            "m2": ["graphs", "trees", "hashing"],
+            "m3": ["graphs", "calculus"],
+            "m4": [],
+        }
+        rows = _rows(memberships) + [
+            {"module_id": "m1", "name_normalized": "graphs"},  # duplicate
+            {"module_id": "other", "name_normalized": "sorting"},  # not analyzed
+        ]
+
+        overlap = compute_concept_overlap(list(memberships), rows)
+
+        assert overlap.shared == [("graphs", ["m1", "m2", "m3"]), ("trees", ["m1", "m2"])]
+        assert overlap.unique == {
+            "m1": ["sorting"], "m2": ["hashing"], "m3": ["calculus"], "m4": [],
+        }
+        assert overlap.bridging == ["graphs", "trees"]
+        assert overlap.jaccard[0][1] == 0.5
+        assert overlap.jaccard[3] == [0.0, 0.0, 0.0, 1.0]
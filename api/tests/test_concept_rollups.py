@@ -0,0 +1,172 @@
+"""
+============================================================================
+FILE: test_concept_rollups.py
+LOCATION: api/tests/test_concept_rollups.py
+============================================================================
+
+PURPOSE:
+    Unit tests for the materialized concept frequency rollups.
+
+ROLE IN PROJECT:
+    Validates name normalization and whole-day range bounds, that module
+    refreshes, the full rebuild and store increments run one statement each
+    and never raise into the write path, and that orphan cleanup subtracts
+    deleted entities from their rollups instead of refreshing modules.
+
+KEY COMPONENTS:
+    - TestHelpers
+    - TestRefresh
+    - TestIncrements
+    - TestOrphanCleanup
+
+DEPENDENCIES:
+    - External: pytest
+    - Internal: api.concept_rollups, api.graph_manager
+
+USAGE:
+    pytest api/tests/test_concept_rollups.py -v
+============================================================================
+"""
+
+import asyncio
+from datetime import datetime
+
+import api.graph_manager as graph_manager
+from api.concept_rollups import (
+    CONCEPT_ROLLUP_DECREMENT_QUERY,
+    CONCEPT_ROLLUP_INCREMENT_QUERY,
+    CONCEPT_ROLLUP_REFRESH_QUERY,
+    ENTITY_MODULES_QUERY,
+    day_bounds,
+    increment_concept_rollups,
+    normalize_concept_name,
+    rebuild_concept_rollups,
+    refresh_module_concept_rollups,
+    rollup_decrements,
+)
+from api.graph_manager import GraphManager
+
+
+class _Result(list):
+    def single(self):
+        return self[0] if self else None
+
+
+class _FakeDriver:
+    def __init__(self, modules=(), fail=False):
+        self.modules = list(modules)
+        self.fail = fail
+        self.calls = []
+
+    def session(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, cypher, params=None):
+        self.calls.append((cypher, params))
+        if self.fail:
+            raise RuntimeError("neo4j down")
+        if cypher == ENTITY_MODULES_QUERY:
+            return _Result({"module_id": m} for m in self.modules)
+        return _Result([{"rollups": 3}])
+
+
+class TestHelpers:
+    def test_normalization_matches_cypher(self):
+        assert normalize_concept_name("  Neural Networks ") == "neural networks"
+
+    def test_day_bounds_cover_partial_days(self):
+        assert day_bounds(datetime(2026, 3, 1, 15), datetime(2026, 3, 8)) == (
+            "2026-03-01", "2026-03-08"
+        )
+        assert day_bounds(datetime(2026, 3, 1), datetime(2026, 3, 8, 0, 5)) == (
+            "2026-03-01", "2026-03-09"
+        )
+
+
+class TestRefresh:
+    def test_refresh_runs_one_statement(self):
+        driver = _FakeDriver()
+
+        assert refresh_module_concept_rollups(driver, "m1") == 3
+        assert driver.calls == [(CONCEPT_ROLLUP_REFRESH_QUERY, {"module_id": "m1"})]
+        assert refresh_module_concept_rollups(driver, None) == 0
+        assert len(driver.calls) == 1
+
+    def test_refresh_failure_is_swallowed(self):
+        assert refresh_module_concept_rollups(_FakeDriver(fail=True), "m1") == 0
+
+    def test_refresh_counts_concepts_only(self, admits):
+        assert admits(CONCEPT_ROLLUP_REFRESH_QUERY, "e", {"Entity", "Finding"})
+        assert not admits(CONCEPT_ROLLUP_REFRESH_QUERY, "e", {"Entity", "Definition"})
+
+    def test_rebuild_refreshes_every_module(self):
+        driver = _FakeDriver(modules=["m1", "m2"])
+
+        assert rebuild_concept_rollups(driver) == {"modules": 2, "rollups": 6}
+        refreshed = [p["module_id"] for c, p in driver.calls if c == CONCEPT_ROLLUP_REFRESH_QUERY]
+        assert refreshed == ["m1", "m2"]
+
+
+class TestIncrements:
+    def test_increment_runs_one_statement_for_the_store(self):
+        driver = _FakeDriver()
+
+        assert increment_concept_rollups(driver, ["e1", "e2"]) == 3
+        assert driver.calls == [(CONCEPT_ROLLUP_INCREMENT_QUERY, {"entity_ids": ["e1", "e2"]})]
+        assert increment_concept_rollups(driver, []) == 0
+        assert len(driver.calls) == 1
+
+    def test_increment_failure_is_swallowed(self):
+        assert increment_concept_rollups(_FakeDriver(fail=True), ["e1"]) == 0
+
+    def test_increment_counts_each_entity_once(self):
+        # The pending flag is consumed before counting, and the refresh
+        # clears it too, so re-stores and rebuilds never double count
+        assert "WHERE e.rollup_pending\nREMOVE e.rollup_pending" in CONCEPT_ROLLUP_INCREMENT_QUERY
+        assert "MERGE (r:ConceptRollup {key: key})" in CONCEPT_ROLLUP_INCREMENT_QUERY
+        assert "r.count = r.count + count" in CONCEPT_ROLLUP_INCREMENT_QUERY
+        assert "REMOVE pending.rollup_pending" in CONCEPT_ROLLUP_REFRESH_QUERY
+
+    def test_decrements_group_counted_entities_by_rollup(self):
+        deleted = [
+            {"id": "e1", "rollup_key": "m1|graphs|Concept|2026-03-01"},
+            {"id": "e2", "rollup_key": None},
+            {"id": "e3", "rollup_key": "m1|graphs|Concept|2026-03-01"},
+            {"id": "e4", "rollup_key": "m2|trees|Topic|2026-03-02"},
+        ]
+
+        assert rollup_decrements(deleted) == [
+            {"key": "m1|graphs|Concept|2026-03-01", "count": 2},
+            {"key": "m2|trees|Topic|2026-03-02", "count": 1},
+        ]
+
+
+class TestOrphanCleanup:
+    def test_cleanup_decrements_rollups_and_bumps_modules(self, monkeypatch):
+        manager = GraphManager(None)
+        calls = []
+        deleted = [{"id": "e1", "module_id": "m1", "rollup_key": "m1|a|Concept|2026-03-01"},
+                   {"id": "e2", "module_id": "m2", "rollup_key": None},
+                   {"id": "e3", "module_id": "m1", "rollup_key": "m1|a|Concept|2026-03-01"}]
+
+        async def run_query(cypher, params=None):
+            calls.append((cypher, params))
+            return [{"deleted_count": 3, "deleted": deleted}]
+
+        monkeypatch.setattr(manager, "run_query", run_query)
+        monkeypatch.setattr(graph_manager, "remove_from_module_index", lambda *args: None)
+        bumped = []
+        monkeypatch.setattr(graph_manager, "bump_module_version", bumped.append)
+
+        assert asyncio.run(manager.cleanup_orphaned_entities(["e1", "e2", "e3"])) == 3
+        assert not any(c == CONCEPT_ROLLUP_REFRESH_QUERY for c, _ in calls)
+        assert [p for c, p in calls if c == CONCEPT_ROLLUP_DECREMENT_QUERY] == [
+            {"rollups": [{"key": "m1|a|Concept|2026-03-01", "count": 2}]}
+        ]
+        assert sorted(bumped) == ["m1", "m2"]
@@ -0,0 +1,100 @@
+"""
+============================================================================
+FILE: test_entity_label.py
+LOCATION: api/tests/test_entity_label.py
+============================================================================
+
+PURPOSE:
+    Unit tests for the common :Entity label lookups.
+
+ROLE IN PROJECT:
+    Guards that entity queries resolve through the single :Entity index
+    rather than per-type UNIONs or unlabelled scans, that concept queries
+    still exclude the Definition and Citation nodes :Entity also covers, and
+    that the canonical schema declares the id constraint and name index.
+
+KEY COMPONENTS:
+    - TestEntityQueries
+    - TestEntitySchema
+
+DEPENDENCIES:
+    - External: pytest
+    - Internal: api.graph_manager, api.kg_bulk_import, api.schemas.neo4j_schema
+
+USAGE:
+    pytest api/tests/test_entity_label.py -v
+============================================================================
+"""
+
+import re
+from unittest.mock import MagicMock
+
+import api.graph_manager as graph_manager
+from api.kg_bulk_import import BulkImporter, BulkImportStager
+from api.schemas.neo4j_schema import (
+    CONSTRAINTS,
+    ENTITY_LABEL,
+    RANGE_INDICES,
+    generate_range_index_cypher,
+)
+
+CONCEPT_QUERY_VARIABLES = {
+    "ENTITY_BY_ID_QUERY": ["e"],
+    "ENTITIES_BY_NAME_QUERY": ["e"],
+    "ENTITY_NEIGHBORS_QUERY": ["start", "neighbor"],
+    "PATHS_BETWEEN_QUERY": ["source", "target"],
+    "SUBGRAPH_QUERY": ["start", "related"],
+    "DOCUMENT_ENTITIES_QUERY": ["e"],
+    "ORPHAN_CLEANUP_QUERY": ["e"],
+    "EXPAND_ONE_HOP_QUERY": ["start", "related"],
+    "EXPAND_TWO_HOP_QUERY": ["start", "hop1", "hop2"],
+}
+
+
+def _graph_manager_queries():
+    return {
+        name: value
+        for name, value in vars(graph_manager).items()
+        if name.endswith("_QUERY") and isinstance(value, str)
+    }
+
+
+class TestEntityQueries:
+    def test_graph_manager_queries_use_entity_label(self):
+        queries = _graph_manager_queries()
+
+        assert "UNION\n" not in queries["ENTITY_BY_ID_QUERY"]
+        assert "MATCH (e:Entity {id: $entity_id})" in queries["ENTITY_BY_ID_QUERY"]
+        for name, cypher in queries.items():
+            # Type filters narrow an :Entity match, never an unlabelled scan
+            assert not re.search(r"MATCH \((\w+)\)\s*WHERE \(\1:Topic", cypher), name
+            assert "labels(e)[0]" not in cypher, name
+
+    def test_definition_nodes_are_not_concepts(self, admits):
+        queries = _graph_manager_queries()
+
+        for name, variables in CONCEPT_QUERY_VARIABLES.items():
+            for variable in variables:
+                cypher = queries[name]
+                assert admits(cypher, variable, {"Entity", "Concept"})
+                assert not admits(cypher, variable, {"Entity", "Definition"})
+                assert not admits(cypher, variable, {"Entity", "Citation"})
+
+    def test_bulk_entity_rows_merge_on_entity_label(self, tmp_path):
+        importer = BulkImporter(MagicMock(), BulkImportStager("m1", str(tmp_path)))
+
+        entities = importer.build_query({"kind": "entities", "label": "Concept"})
+        edges = importer.build_query({"kind": "chunk_entities", "label": "Concept"})
+
+        assert "MERGE (e:Entity {id: row.id})" in entities
+        assert "ON CREATE SET e:Concept" in entities
+        assert "MATCH (e:Entity {id: row.entity_id})" in edges
+
+
+class TestEntitySchema:
+    def test_entity_constraint_and_name_index_declared(self):
+        constraint = next(c for c in CONSTRAINTS if c.node_type == ENTITY_LABEL)
+        assert constraint.property == "id"
+
+        cypher = generate_range_index_cypher(RANGE_INDICES[0])
+        assert "FOR (n:Entity) ON (n.name)" in cypher
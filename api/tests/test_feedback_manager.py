@@ -0,0 +1,182 @@
+"""
+============================================================================
+FILE: test_feedback_manager.py
+LOCATION: api/tests/test_feedback_manager.py
+============================================================================
+
+PURPOSE:
+    Unit tests for FeedbackManager statistics and rollup maintenance.
+
+ROLE IN PROJECT:
+    Validates that submissions update the per-(module, day, type) rollups,
+    that whole-day and all-time stats are answered from rollups, and that
+    other ranges aggregate totals, types and modules in a single scan, and
+    that retention deletes in throttled batches with a dry-run mode.
+
+KEY COMPONENTS:
+    - TestRollupMaintenance
+    - TestFeedbackStats
+    - TestRetention
+
+DEPENDENCIES:
+    - External: pytest
+    - Internal: api.feedback_manager, api.schemas.feedback
+
+USAGE:
+    pytest api/tests/test_feedback_manager.py -v
+============================================================================
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+import api.feedback_manager as feedback_manager
+from api.feedback_manager import (
+    FEEDBACK_EXPIRED_COUNT_QUERY,
+    FEEDBACK_EXPIRED_DELETE_QUERY,
+    FEEDBACK_ROLLUP_STATS_QUERY,
+    FEEDBACK_ROLLUP_UPDATE_QUERY,
+    FeedbackManager,
+)
+from api.schemas.feedback import ResultFeedback
+
+
+class _Result(list):
+    def single(self):
+        return self[0] if self else None
+
+    def consume(self):
+        return None
+
+
+class _Record(dict):
+    def data(self):
+        return dict(self)
+
+
+class _RecordingDriver:
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.calls = []
+
+    def session(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, cypher, params=None):
+        self.calls.append((cypher, params))
+        if "CREATE (f:Feedback" in cypher:
+            return _Result([_Record(id=params["feedback_id"])])
+        return _Result(_Record(row) for row in self.rows)
+
+
+class TestRollupMaintenance:
+    def test_submission_counts_into_all_and_module_buckets(self):
+        driver = _RecordingDriver()
+        feedback = ResultFeedback(
+            query="gradient descent",
+            result_id="chunk_1",
+            result_rank=0,
+            relevance_score=0.8,
+            module_ids=["m2", "m1", "m1"],
+            timestamp=datetime(2026, 3, 4, 15, 30),
+        )
+
+        asyncio.run(FeedbackManager(driver).submit_result_feedback(feedback))
+
+        params = next(p for c, p in driver.calls if c == FEEDBACK_ROLLUP_UPDATE_QUERY)
+        assert params["scopes"] == ["*", "m1", "m2"]
+        assert params["day"] == "2026-03-04"
+        assert params["positive"] == 1 and params["relevance"] == 0.8
+
+
+class TestFeedbackStats:
+    def test_whole_days_are_answered_from_rollups(self):
+        driver = _RecordingDriver([
+            {"module_id": "*", "feedback_type": "click", "count": 6,
+             "positive_count": 6, "relevance_sum": 3.0},
+            {"module_id": "*", "feedback_type": "result_relevance", "count": 4,
+             "positive_count": 1, "relevance_sum": 1.0},
+            {"module_id": "m1", "feedback_type": "result_relevance", "count": 3,
+             "positive_count": 1, "relevance_sum": 0.9},
+        ])
+
+        stats = asyncio.run(FeedbackManager(driver).get_feedback_stats(
+            time_range=(datetime(2026, 3, 1), datetime(2026, 4, 1))
+        ))
+
+        assert [c for c, _ in driver.calls] == [FEEDBACK_ROLLUP_STATS_QUERY]
+        assert driver.calls[0][1]["end_day"] == "2026-04-01"
+        assert stats.total_feedback_count == 10
+        assert stats.positive_feedback_ratio == pytest.approx(0.7)
+        assert stats.average_relevance_score == pytest.approx(0.4)
+        assert stats.feedback_by_type == {"click": 6, "result_relevance": 4}
+        assert stats.feedback_by_module == {"m1": 3}
+
+    def test_partial_days_use_one_scan(self):
+        driver = _RecordingDriver([
+            {"feedback_type": "result_relevance", "module_ids": ["m1", "m2"],
+             "count": 2, "positive_count": 2, "relevance_sum": 1.8},
+            {"feedback_type": "answer_quality", "module_ids": ["m1"],
+             "count": 2, "positive_count": 0, "relevance_sum": 0.0},
+        ])
+
+        stats = asyncio.run(FeedbackManager(driver).get_feedback_stats(
+            module_id="m1",
+            time_range=(datetime(2026, 3, 1, 9), datetime(2026, 3, 1, 17)),
+        ))
+
+        assert len(driver.calls) == 1
+        assert "MATCH (f:Feedback)" in driver.calls[0][0]
+        assert stats.total_feedback_count == 4
+        assert stats.positive_feedback_ratio == pytest.approx(0.5)
+        assert stats.feedback_by_module == {"m1": 4, "m2": 2}
+
+
+class _DeletingDriver(_RecordingDriver):
+    def __init__(self, batches, expired=0):
+        super().__init__()
+        self.batches, self.expired = list(batches), expired
+
+    def run(self, cypher, params=None):
+        self.calls.append((cypher, params))
+        if cypher == FEEDBACK_EXPIRED_COUNT_QUERY:
+            return _Result([_Record(expired=self.expired)])
+        return _Result([_Record(deleted=self.batches.pop(0))])
+
+
+class TestRetention:
+    def test_deletes_in_throttled_batches_until_short_batch(self, monkeypatch):
+        pauses = []
+
+        async def fake_sleep(seconds):
+            pauses.append(seconds)
+
+        monkeypatch.setattr(feedback_manager.asyncio, "sleep", fake_sleep)
+        driver = _DeletingDriver([2, 2, 1])
+        progress = []
+
+        report = asyncio.run(FeedbackManager(driver).delete_old_feedback(
+            days=30, batch_size=2, progress_callback=progress.append
+        ))
+
+        assert report["deleted"] == 5 and report["batches"] == 3
+        assert [p["deleted"] for p in progress] == [2, 4, 5]
+        assert len(pauses) == 2 and all(p > 0 for p in pauses)
+        cutoffs = {p["cutoff"] for c, p in driver.calls if c == FEEDBACK_EXPIRED_DELETE_QUERY}
+        assert len(cutoffs) == 1
+
+    def test_dry_run_only_counts(self):
+        driver = _DeletingDriver([], expired=1234)
+
+        report = asyncio.run(FeedbackManager(driver).delete_old_feedback(dry_run=True))
+
+        assert report["expired"] == 1234 and report["deleted"] == 0
+        assert [c for c, _ in driver.calls] == [FEEDBACK_EXPIRED_COUNT_QUERY]
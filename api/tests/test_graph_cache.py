@@ -0,0 +1,118 @@
+"""
+============================================================================
+FILE: test_graph_cache.py
+LOCATION: api/tests/test_graph_cache.py
+============================================================================
+
+PURPOSE:
+    Unit tests for per-module graph versions and the version-stamped
+    response cache.
+
+ROLE IN PROJECT:
+    Validates that version bumps invalidate cached reads without key scans,
+    that ETags follow the version, that the visualizer serves repeat reads
+    from the cache, and that document deletion bumps the owning module.
+
+KEY COMPONENTS:
+    - TestModuleVersions
+    - TestResponseCache
+    - TestVersionBumps
+
+DEPENDENCIES:
+    - External: pytest
+    - Internal: api.graph_cache, api.graph_visualizer, api.graph_manager
+
+USAGE:
+    pytest api/tests/test_graph_cache.py -v
+============================================================================
+"""
+
+import asyncio
+
+import api.graph_cache as graph_cache
+from api.graph_cache import (
+    bump_module_version,
+    etag_for,
+    etag_matches,
+    get_module_version,
+    get_module_versions,
+    response_cache_key,
+)
+from api.graph_manager import GraphManager
+from api.graph_visualizer import GraphOptions, GraphVisualizer, LayoutCache
+
+
+class _FakeGraphManager:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    async def run_query(self, cypher, params=None):
+        self.calls += 1
+        return self.rows
+
+
+class TestModuleVersions:
+    def test_missing_version_is_seeded_and_bumps_increase(self, cache):
+        first = get_module_version("m1")
+        assert first == get_module_version("m1")
+
+        assert bump_module_version("m1") == first + 1
+        assert get_module_version("m1") == first + 1
+
+    def test_bump_of_unknown_module_starts_from_clock(self, cache):
+        assert bump_module_version("fresh") > 1_000_000_000_000
+        assert bump_module_version(None) is None
+
+    def test_combined_versions_are_order_independent(self, cache):
+        assert get_module_versions(["b", "a"]) == get_module_versions(["a", "b", "a"])
+
+    def test_unavailable_cache_disables_versions(self, monkeypatch):
+        monkeypatch.setattr(graph_cache, "_get_cache", lambda: None)
+        assert get_module_version("m1") is None
+        assert bump_module_version("m1") is None
+
+
+class TestResponseCache:
+    def test_key_and_etag_follow_version_and_options(self):
+        key = response_cache_key("stats", "m1", 5, {"limit": 10, "fields": []})
+
+        assert key == response_cache_key("stats", "m1", 5, {"fields": [], "limit": 10})
+        assert key != response_cache_key("stats", "m1", 6, {"limit": 10, "fields": []})
+        assert etag_matches(f'"x", {etag_for(key)}', etag_for(key))
+        assert etag_matches("*", etag_for(key))
+        assert not etag_matches(None, etag_for(key))
+
+    def test_visualizer_reuses_response_until_bump(self, cache):
+        rows = [{"module": {"id": "m1", "name": "ML", "labels": ["Module"],
+                            "props": [None]},
+                 "entities": [], "documents": [], "relationships": []}]
+        manager = _FakeGraphManager(rows)
+        visualizer = GraphVisualizer(manager, layout_cache=LayoutCache(cache))
+        options = GraphOptions(include_documents=False)
+
+        first = asyncio.run(visualizer.get_module_graph("m1", options))
+        second = asyncio.run(visualizer.get_module_graph("m1", options))
+        assert manager.calls == 1
+        assert second.nodes[0].id == first.nodes[0].id == "m1"
+
+        bump_module_version("m1")
+        asyncio.run(visualizer.get_module_graph("m1", options))
+        assert manager.calls == 2
+
+
+class TestVersionBumps:
+    def test_delete_document_bumps_owning_module(self, cache, monkeypatch):
+        manager = GraphManager(None)
+        results = iter([[{"id": "d1", "module_id": "m1"}], [], [], [], []])
+
+        async def run_query(cypher, params=None):
+            return next(results)
+
+        monkeypatch.setattr(manager, "run_query", run_query)
+        before = get_module_version("m1")
+
+        success, _ = asyncio.run(manager.delete_document("d1"))
+
+        assert success
+        assert get_module_version("m1") == before + 1
@@ -0,0 +1,165 @@
+"""
+============================================================================
+FILE: test_graph_export.py
+LOCATION: api/tests/test_graph_export.py
+============================================================================
+
+PURPOSE:
+    Unit tests for in-memory and streaming graph export.
+
+ROLE IN PROJECT:
+    Verifies that the incremental GraphML/GEXF/CSV writers produce
+    well-formed documents and that stream_export pages nodes and edges out
+    of Neo4j with keyset cursors.
+
+KEY COMPONENTS:
+    - TestExportWriters
+    - TestStreamExport
+
+DEPENDENCIES:
+    - External: pytest
+    - Internal: api.graph_visualizer
+
+USAGE:
+    pytest api/tests/test_graph_export.py -v
+============================================================================
+"""
+
+import asyncio
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from api.graph_visualizer import (
+    EXPORT_EDGES_QUERY,
+    EXPORT_NODES_QUERY,
+    ExportFormat,
+    GraphVisualizer,
+    VisualizationEdge,
+    VisualizationGraph,
+    VisualizationNode,
+)
+
+ENTITIES = [f"e{i}" for i in range(5)]
+
+
+class _PagingGraphManager:
+    """Serves keyset pages of a small chain graph e0 -> e1 -> ... -> e4."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def run_query(self, cypher, params=None):
+        self.calls.append((cypher, params))
+        page = [e for e in ENTITIES if e > params["after"]][: params["limit"]]
+        if cypher == EXPORT_EDGES_QUERY:
+            return [
+                {
+                    "source": e,
+                    "relationships": [
+                        {"target": f"e{int(e[1:]) + 1}", "type": "USES", "weight": 0.5}
+                    ]
+                    if e != ENTITIES[-1]
+                    else [{"target": None, "type": None, "weight": 1.0}],
+                }
+                for e in page
+            ]
+        return [
+            {"node": {"id": e, "name": f"Entity <{e}>", "labels": ["Concept"]}}
+            for e in page
+        ]
+
+
+class _IngestedGraphManager:
+    """
+    Entities stored the way kg_processor writes them: a module_id property
+    and entity-to-entity relationships, no BELONGS_TO_MODULE edges.
+    """
+
+    ENTITIES = {
+        "a1": {"module_id": "m1", "targets": ["a2", "b1"]},
+        "a2": {"module_id": "m1", "targets": []},
+        "b1": {"module_id": "m2", "targets": ["a1"]},
+    }
+
+    async def run_query(self, cypher, params=None):
+        if "BELONGS_TO_MODULE" in cypher:
+            return []
+        assert "module_id IN $module_ids" in cypher
+        page = [
+            e for e, props in sorted(self.ENTITIES.items())
+            if props["module_id"] in params["module_ids"] and e > params["after"]
+        ][: params["limit"]]
+        if cypher == EXPORT_EDGES_QUERY:
+            return [
+                {
+                    "source": e,
+                    "relationships": [
+                        {"target": t, "type": "RELATED_TO", "weight": 1.0}
+                        for t in self.ENTITIES[e]["targets"]
+                        if self.ENTITIES[t]["module_id"] in params["module_ids"]
+                    ],
+                }
+                for e in page
+            ]
+        assert cypher == EXPORT_NODES_QUERY
+        return [{"node": {"id": e, "name": e, "labels": ["Concept"]}} for e in page]
+
+
+def _collect(visualizer, fmt, page_size=2):
+    async def run():
+        return [
+            part
+            async for part in visualizer.stream_export(["m1"], fmt, page_size=page_size)
+        ]
+
+    return asyncio.run(run())
+
+
+class TestExportWriters:
+    @pytest.mark.parametrize("fmt", [ExportFormat.GRAPHML, ExportFormat.GEXF])
+    def test_xml_exports_are_well_formed(self, fmt):
+        graph = VisualizationGraph(
+            nodes=[
+                VisualizationNode(id="a", label='A & "B"', type="Concept", x=1, y=2),
+                VisualizationNode(id="b", label="<b>", type="Topic"),
+            ],
+            edges=[VisualizationEdge(id="ab", source="a", target="b", type="USES")],
+        )
+
+        root = ET.fromstring(GraphVisualizer(None).export_graph(graph, fmt))
+
+        assert len([el for el in root.iter() if el.tag.endswith("}node")]) == 2
+        assert len([el for el in root.iter() if el.tag.endswith("}edge")]) == 1
+
+
+class TestStreamExport:
+    def test_streams_pages_with_keyset_cursor(self):
+        manager = _PagingGraphManager()
+        parts = _collect(GraphVisualizer(manager), ExportFormat.CSV)
+
+        text = b"".join(parts).decode("utf-8")
+        node_section, edge_section = text.split("# EDGES")
+        assert node_section.count('"Concept"') == 5
+        assert edge_section.count('"USES"') == 4
+        afters = [params["after"] for _, params in manager.calls]
+        assert afters == ["", "e1", "e3", "", "e1", "e3"]
+        assert len(parts) > 4
+
+    def test_exports_entities_tagged_with_module_id(self):
+        parts = _collect(GraphVisualizer(_IngestedGraphManager()), ExportFormat.CSV)
+
+        node_section, edge_section = b"".join(parts).decode("utf-8").split("# EDGES")
+        assert '"a1"' in node_section and '"a2"' in node_section
+        assert '"b1"' not in node_section
+        assert edge_section.count('"RELATED_TO"') == 1
+
+    def test_streamed_graphml_is_well_formed(self):
+        parts = _collect(GraphVisualizer(_PagingGraphManager()), ExportFormat.GRAPHML)
+
+        root = ET.fromstring(b"".join(parts))
+        assert len([el for el in root.iter() if el.tag.endswith("}edge")]) == 4
+
+    def test_json_is_not_streamable(self):
+        with pytest.raises(ValueError):
+            _collect(GraphVisualizer(_PagingGraphManager()), ExportFormat.JSON)
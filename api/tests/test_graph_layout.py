@@ -0,0 +1,176 @@
+"""
+============================================================================
+FILE: test_graph_layout.py
+LOCATION: api/tests/test_graph_layout.py
+============================================================================
+
+PURPOSE:
+    Unit tests for the vectorized and Barnes-Hut force-directed layouts.
+
+ROLE IN PROJECT:
+    Guards layout determinism, the accuracy of the Barnes-Hut repulsion
+    approximation, agreement with the pure-Python fallback, and the layout
+    cache with warm-start relayout.
+
+KEY COMPONENTS:
+    - TestForceDirectedLayout
+    - TestLayoutCache
+
+DEPENDENCIES:
+    - External: pytest, numpy
+    - Internal: api.graph_visualizer
+
+USAGE:
+    pytest api/tests/test_graph_layout.py -v
+============================================================================
+"""
+
+import random
+
+import numpy as np
+
+from api.graph_visualizer import (
+    LAYOUT_COOLING,
+    LAYOUT_WARM_TEMPERATURE,
+    GraphVisualizer,
+    LayoutCache,
+    LayoutType,
+    VisualizationEdge,
+    VisualizationGraph,
+    VisualizationNode,
+    _barnes_hut_repulsion,
+    _exact_repulsion,
+    _force_directed_layout_python,
+    force_directed_layout,
+)
+
+
+def _graph(node_count, edge_count, seed=1):
+    rng = random.Random(seed)
+    nodes = [
+        VisualizationNode(id=f"n{i}", label=f"n{i}", type="Concept")
+        for i in range(node_count)
+    ]
+    edges = [
+        VisualizationEdge(
+            id=f"e{k}",
+            source=f"n{rng.randrange(node_count)}",
+            target=f"n{rng.randrange(node_count)}",
+            type="USES",
+        )
+        for k in range(edge_count)
+    ]
+    return nodes, edges
+
+
+def _positions(nodes):
+    return np.array([[n.x, n.y] for n in nodes])
+
+
+class TestForceDirectedLayout:
+    def test_layout_is_deterministic_and_in_bounds(self):
+        first = _positions(force_directed_layout(*_graph(80, 120)))
+        second = _positions(force_directed_layout(*_graph(80, 120)))
+
+        assert np.array_equal(first, second)
+        assert first[:, 0].min() >= 50 and first[:, 0].max() <= 950
+        assert first[:, 1].min() >= 50 and first[:, 1].max() <= 750
+
+    def test_barnes_hut_matches_exact_repulsion(self):
+        pos = np.random.default_rng(0).uniform(50, 950, size=(1200, 2))
+
+        exact = _exact_repulsion(np, pos)
+        approx = _barnes_hut_repulsion(np, pos)
+
+        assert np.linalg.norm(exact - approx) / np.linalg.norm(exact) < 0.01
+
+    def test_vectorized_layout_tracks_python_fallback(self):
+        vectorized = _positions(force_directed_layout(*_graph(40, 60)))
+        nodes, edges = _graph(40, 60)
+        reference = _positions(
+            _force_directed_layout_python(nodes, edges, 1000, 800, 100)
+        )
+
+        assert np.abs(vectorized - reference).mean() < 25
+
+    def test_large_graph_uses_every_node(self):
+        nodes = force_directed_layout(*_graph(600, 900))
+
+        assert all(n.x is not None and n.y is not None for n in nodes)
+        assert len({(round(n.x), round(n.y)) for n in nodes}) > 500
+
+
+class _NullCacheClient:
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl=None):
+        return False
+
+
+def _visualizer(cache_client, max_entries=16):
+    cache = LayoutCache(cache_client=cache_client, max_entries=max_entries)
+    return GraphVisualizer(graph_manager=None, layout_cache=cache)
+
+
+class TestLayoutCache:
+    def test_repeat_layout_is_served_from_cache(self, cache_client):
+        visualizer = _visualizer(cache_client)
+        nodes, edges = _graph(30, 40)
+        first = visualizer.apply_layout(
+            VisualizationGraph(nodes=nodes, edges=edges),
+            LayoutType.FORCE_DIRECTED,
+            scope="module:m1",
+        )
+        nodes, edges = _graph(30, 40)
+        second = visualizer.apply_layout(
+            VisualizationGraph(nodes=list(reversed(nodes)), edges=edges),
+            LayoutType.FORCE_DIRECTED,
+            scope="module:m1",
+        )
+
+        assert not first.metadata.layout_cache_hit
+        assert second.metadata.layout_cache_hit
+        assert second.metadata.layout_cache_hit_rate == 0.5
+        by_id = {n.id: (n.x, n.y) for n in first.nodes}
+        assert all(by_id[n.id] == (n.x, n.y) for n in second.nodes)
+
+    def test_changed_graph_warm_starts_from_scope(self, cache_client):
+        visualizer = _visualizer(cache_client)
+        nodes, edges = _graph(30, 40)
+        base = visualizer.apply_layout(
+            VisualizationGraph(nodes=nodes, edges=edges),
+            LayoutType.FORCE_DIRECTED,
+            scope="module:m1",
+        )
+        before = {n.id: (n.x, n.y) for n in base.nodes}
+
+        nodes, edges = _graph(30, 40)
+        nodes.append(VisualizationNode(id="new", label="new", type="Topic"))
+        edges.append(
+            VisualizationEdge(id="e_new", source="new", target="n0", type="USES")
+        )
+        grown = visualizer.apply_layout(
+            VisualizationGraph(nodes=nodes, edges=edges),
+            LayoutType.FORCE_DIRECTED,
+            scope="module:m1",
+        )
+
+        assert not grown.metadata.layout_cache_hit
+        assert grown.metadata.layout_warm_started
+        # Surviving nodes move at most the sum of the cooled warm-start steps
+        bound = LAYOUT_WARM_TEMPERATURE * 800 / (1 - LAYOUT_COOLING) + 1
+        drift = max(
+            np.hypot(n.x - before[n.id][0], n.y - before[n.id][1])
+            for n in grown.nodes
+            if n.id in before
+        )
+        assert drift <= bound
+
+    def test_local_lru_evicts_oldest_entry(self):
+        cache = LayoutCache(cache_client=_NullCacheClient(), max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, {"n": [1.0, 2.0]})
+
+        assert cache.get("a") is None
+        assert cache.get("c") == {"n": [1.0, 2.0]}
@@ -0,0 +1,172 @@
+"""
+============================================================================
+FILE: test_graph_lod.py
+LOCATION: api/tests/test_graph_lod.py
+============================================================================
+
+PURPOSE:
+    Unit tests for the level-of-detail module graph API.
+
+ROLE IN PROJECT:
+    Validates cursor encoding, keyset paging (next cursor and resume
+    parameters), cluster overview assembly with truncation, collapsing
+    of cross-cluster edges when a cluster is expanded, and that only
+    concept-typed entities (not Definition nodes) are returned.
+
+KEY COMPONENTS:
+    - TestCursors
+    - TestModuleGraphLOD
+
+DEPENDENCIES:
+    - External: pytest
+    - Internal: api.graph_lod
+
+USAGE:
+    pytest api/tests/test_graph_lod.py -v
+============================================================================
+"""
+
+import asyncio
+
+import pytest
+
+from api.graph_lod import (
+    CLUSTER_LINK_TYPE,
+    ClusterGrouping,
+    EntityOrder,
+    ModuleGraphLOD,
+    _cluster_edges_query,
+    _expansion_edges_query,
+    _overview_query,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class _ScriptedGraphManager:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    async def run_query(self, cypher, params=None):
+        self.calls.append((cypher, params))
+        return self.responses.pop(0)
+
+
+class _SeededGraphManager:
+    """Returns the seeded entities that pass every label filter on e."""
+
+    def __init__(self, labels_by_id, admits):
+        self.labels_by_id = labels_by_id
+        self.admits = admits
+
+    async def run_query(self, cypher, params=None):
+        if "e.id as id" not in cypher:
+            return []
+        return [
+            _entity(entity_id)
+            for entity_id, labels in sorted(self.labels_by_id.items())
+            if self.admits(cypher, "e", labels)
+        ]
+
+
+def _entity(entity_id, degree=1):
+    return {"id": entity_id, "name": entity_id.upper(), "type": "Concept",
+            "definition": None, "community_id": 1, "degree": degree}
+
+
+class TestCursors:
+    def test_round_trip(self):
+        values = {"order": "degree", "id": "e:9", "degree": 4}
+        assert decode_cursor(encode_cursor(values)) == values
+        assert decode_cursor(None) is None
+
+    def test_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor!")
+
+
+class TestModuleGraphLOD:
+    def test_entity_pages_resume_from_cursor(self):
+        manager = _ScriptedGraphManager(
+            [_entity("a", 5), _entity("b", 3), _entity("c", 3)],
+            [_entity("c", 3)],
+        )
+        lod = ModuleGraphLOD(manager)
+
+        first = asyncio.run(lod.list_entities("m1", EntityOrder.DEGREE, limit=2))
+        assert [n.id for n in first.items] == ["a", "b"]
+        assert first.next_cursor
+
+        second = asyncio.run(
+            lod.list_entities("m1", EntityOrder.DEGREE, limit=2, cursor=first.next_cursor)
+        )
+        cypher, params = manager.calls[1]
+        assert "degree < $after_degree" in cypher
+        assert params["after_id"] == "b" and params["after_degree"] == 3
+        assert [n.id for n in second.items] == ["c"]
+        assert second.next_cursor is None
+
+        with pytest.raises(ValueError):
+            asyncio.run(lod.list_entities("m1", EntityOrder.ID, cursor=first.next_cursor))
+
+    def test_overview_builds_bounded_supernodes(self):
+        clusters = [
+            {"cluster": f"community:{i}", "size": 10 - i,
+             "type_counts": [{"type": "Concept", "count": 10 - i}],
+             "top_names": [f"n{i}"]}
+            for i in range(3)
+        ]
+        manager = _ScriptedGraphManager(
+            clusters,
+            [{"source": "community:0", "target": "community:1", "count": 4,
+              "weight": 3.5}],
+        )
+
+        overview = asyncio.run(
+            ModuleGraphLOD(manager).get_overview("m1", ClusterGrouping.COMMUNITY, 2)
+        )
+
+        assert overview.truncated
+        assert [n.id for n in overview.nodes] == ["community:0", "community:1"]
+        assert overview.nodes[0].properties["type_counts"] == {"Concept": 10}
+        assert overview.edges[0].properties == {"count": 4, "weight": 3.5}
+        assert manager.calls[1][1]["clusters"] == ["community:0", "community:1"]
+
+    def test_expansion_collapses_links_to_other_clusters(self):
+        manager = _ScriptedGraphManager(
+            [_entity("a"), _entity("b")],
+            [
+                {"source": "a", "target": "b", "rel_type": "USES", "count": 1,
+                 "weight": 0.9},
+                {"source": "community:7", "target": "a",
+                 "rel_type": CLUSTER_LINK_TYPE, "count": 3, "weight": 2.0},
+            ],
+        )
+
+        page = asyncio.run(ModuleGraphLOD(manager).expand_cluster("m1", "community:1"))
+
+        assert [n.id for n in page.nodes] == ["a", "b", "community:7"]
+        assert page.nodes[-1].type == "Cluster"
+        assert manager.calls[0][1]["cluster"] == "community:1"
+        assert page.next_cursor is None
+
+    def test_definition_nodes_are_not_returned(self, admits):
+        manager = _SeededGraphManager({
+            "a": {"Entity", "Concept"},
+            "d": {"Entity", "Definition"},
+        }, admits)
+        lod = ModuleGraphLOD(manager)
+
+        for order_by in EntityOrder:
+            page = asyncio.run(lod.list_entities("m1", order_by))
+            assert [n.id for n in page.items] == ["a"]
+        page = asyncio.run(lod.expand_cluster("m1", "type:Concept", ClusterGrouping.TYPE))
+        assert [n.id for n in page.nodes] == ["a"]
+
+        for grouping in ClusterGrouping:
+            assert not admits(_overview_query(grouping), "e", {"Entity", "Definition"})
+            for cypher in (_cluster_edges_query(grouping), _expansion_edges_query(grouping)):
+                for variable in ("a", "b"):
+                    assert admits(cypher, variable, {"Entity", "Finding"})
+                    assert not admits(cypher, variable, {"Entity", "Definition"})
@@ -0,0 +1,117 @@
+"""
+============================================================================
+FILE: test_graph_manager_async.py
+LOCATION: api/tests/test_graph_manager_async.py
+============================================================================
+
+PURPOSE:
+    Unit tests for the sync and async GraphManager query paths.
+
+ROLE IN PROJECT:
+    Verifies that both GraphManager variants issue the same Cypher through
+    run_query and that create_graph_manager picks the right implementation.
+
+KEY COMPONENTS:
+    - TestRunQuery
+    - TestCreateGraphManager
+
+DEPENDENCIES:
+    - External: pytest, unittest.mock, neo4j
+    - Internal: api.graph_manager
+
+USAGE:
+    pytest api/tests/test_graph_manager_async.py -v
+============================================================================
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from neo4j import AsyncDriver
+
+from api.graph_manager import (
+    ENTITY_BY_ID_QUERY,
+    AsyncGraphManager,
+    GraphManager,
+    create_graph_manager,
+)
+
+ENTITY_ROW = {
+    "id": "e1",
+    "name": "Gradient Descent",
+    "entity_type": "Concept",
+    "definition": "",
+    "document_id": "doc_1",
+    "module_id": "mod_1",
+}
+
+
+class _Record:
+    def __init__(self, data):
+        self._data = data
+
+    def data(self):
+        return self._data
+
+
+class _AsyncResult:
+    def __init__(self, rows):
+        self._rows = [_Record(row) for row in rows]
+
+    def __aiter__(self):
+        self._iter = iter(self._rows)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _AsyncSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run(self, cypher, params):
+        self.calls.append((cypher, params))
+        return _AsyncResult(self.rows)
+
+
+class TestRunQuery:
+    def test_sync_and_async_share_cypher(self):
+        sync_driver = MagicMock()
+        sync_session = sync_driver.session.return_value.__enter__.return_value
+        sync_session.run.return_value = [_Record(ENTITY_ROW)]
+
+        async_session = _AsyncSession([ENTITY_ROW])
+        async_driver = MagicMock(spec=AsyncDriver)
+        async_driver.session.return_value = async_session
+
+        sync_entity = asyncio.run(GraphManager(sync_driver).get_entity_by_id("e1"))
+        async_entity = asyncio.run(AsyncGraphManager(async_driver).get_entity_by_id("e1"))
+
+        assert sync_entity.name == async_entity.name == "Gradient Descent"
+        assert sync_session.run.call_args.args[0] == ENTITY_BY_ID_QUERY
+        assert async_session.calls[0][0] == ENTITY_BY_ID_QUERY
+
+
+class TestCreateGraphManager:
+    def test_async_driver_yields_async_manager(self):
+        manager = create_graph_manager(MagicMock(spec=AsyncDriver))
+        assert isinstance(manager, AsyncGraphManager)
+
+    def test_falls_back_to_sync_driver(self):
+        sync_driver = MagicMock()
+        with patch("api.neo4j_config.get_async_neo4j_driver", return_value=None):
+            manager = create_graph_manager(sync_driver, use_async=True)
+
+        assert type(manager) is GraphManager
+        assert manager.driver is sync_driver
@@ -0,0 +1,189 @@
+"""
+============================================================================
+FILE: test_graph_snapshot.py
+LOCATION: api/tests/test_graph_snapshot.py
+============================================================================
+
+PURPOSE:
+    Unit tests for in-memory CSR module graph snapshots.
+
+ROLE IN PROJECT:
+    Validates the snapshot traversals against the Cypher projections they
+    replace (null ordering, per-seed path bounds, module filtering and the
+    path lengths a snapshot can answer exactly), that GraphManager serves
+    module-scoped traversals without Neo4j round trips once a snapshot is
+    loaded, and that snapshots are rebuilt on version bumps and evicted LRU
+    under the memory budget.
+
+KEY COMPONENTS:
+    - TestSnapshotTraversals
+    - TestCypherParity
+    - TestSnapshotCache
+
+DEPENDENCIES:
+    - External: pytest, numpy
+    - Internal: api.graph_snapshot, api.graph_manager, api.graph_cache
+
+USAGE:
+    pytest api/tests/test_graph_snapshot.py -v
+============================================================================
+"""
+
+import asyncio
+
+import api.graph_cache as graph_cache
+from api.graph_manager import GraphManager
+from api.graph_snapshot import (
+    SNAPSHOT_EDGES_QUERY,
+    SNAPSHOT_ENTITIES_QUERY,
+    SUBGRAPH_PATHS_PER_SEED,
+    GraphSnapshotCache,
+    ModuleGraphSnapshot,
+)
+
+
+def _entity(entity_id, module_id="m1"):
+    return {"id": entity_id, "name": entity_id.upper(), "entity_type": "Concept",
+            "definition": None, "module_id": module_id}
+
+
+# a -> b -> c -> d, a -> c, plus a cross-module edge b -> x
+ENTITIES = [_entity("a"), _entity("b"), _entity("c"), _entity("d"), _entity("x", "m2")]
+EDGES = [
+    {"source": "a", "target": "b", "type": "USES", "confidence": 0.9},
+    {"source": "b", "target": "c", "type": "DEFINES", "confidence": 0.5},
+    {"source": "c", "target": "d", "type": "USES", "confidence": None},
+    {"source": "a", "target": "c", "type": "RELATED_TO", "confidence": 0.3},
+    {"source": "b", "target": "x", "type": "EXTENDS", "confidence": 0.8},
+]
+
+
+class _SnapshotGraphManager(GraphManager):
+    def __init__(self, snapshot_cache):
+        super().__init__(None, snapshot_cache)
+        self.queries = []
+
+    async def run_query(self, cypher, params=None):
+        self.queries.append(cypher)
+        return EDGES if cypher == SNAPSHOT_EDGES_QUERY else ENTITIES
+
+
+class TestSnapshotTraversals:
+    def test_snapshot_holds_concepts_only(self, admits):
+        for cypher, variable in [
+            (SNAPSHOT_ENTITIES_QUERY, "e"),
+            (SNAPSHOT_EDGES_QUERY, "a"),
+            (SNAPSHOT_EDGES_QUERY, "b"),
+        ]:
+            assert admits(cypher, variable, {"Entity", "Concept"})
+            assert not admits(cypher, variable, {"Entity", "Definition"})
+
+    def test_neighbors_expand_and_paths(self):
+        snapshot = ModuleGraphSnapshot("m1", 1, ENTITIES, EDGES)
+
+        neighbors = snapshot.neighbors("b")
+        assert [n["id"] for n in neighbors] == ["a", "x", "c"]
+        assert [n["is_outgoing"] for n in neighbors] == [False, True, True]
+        assert [n["id"] for n in snapshot.neighbors("b", direction="outgoing",
+                                                     relationship_types=["DEFINES"])] == ["c"]
+
+        rows = snapshot.expand(["a"], 2, module_ids={"m1"})
+        # Null confidences sort first, as in Cypher's ORDER BY ... DESC
+        assert [(r["target_id"], r["hops"]) for r in rows] == [
+            ("b", 1), ("c", 1), ("d", 2), ("c", 2)
+        ]
+        rows = snapshot.expand(["a", "c"], 2, module_ids={"m1"}, relationship_types=["USES"])
+        assert [(r["source_id"], r["target_id"]) for r in rows] == [("c", "d"), ("a", "b")]
+
+        steps = snapshot.shortest_path("a", "d", 3)
+        assert [s["relationship_type"] for s in steps] == ["RELATED_TO", "USES"]
+        assert snapshot.shortest_path("a", "d", 1) is None
+
+    def test_subgraph_within_depth(self):
+        snapshot = ModuleGraphSnapshot("m1", 1, ENTITIES, EDGES)
+
+        nodes, edges = snapshot.subgraph(["a"], 1, module_ids={"m1"})
+
+        assert {n["id"] for n in nodes} == {"a", "b", "c"}
+        assert {(e["source"], e["target"]) for e in edges} == {("a", "b"), ("a", "c")}
+
+        nodes, edges = snapshot.subgraph(["a"], 2, module_ids={"m1"})
+        assert {n["id"] for n in nodes} == {"a", "b", "c", "d"}
+        assert ("b", "c") in {(e["source"], e["target"]) for e in edges}
+
+
+class TestCypherParity:
+    def test_null_confidence_sorts_first(self):
+        snapshot = ModuleGraphSnapshot("m1", 1, ENTITIES, EDGES)
+
+        # c: -> d (null), <- b (0.5), <- a (0.3)
+        assert [n["id"] for n in snapshot.neighbors("c")] == ["d", "b", "a"]
+
+    def test_expand_passes_through_other_modules(self):
+        # a -> x (m2) -> d: EXPAND_TWO_HOP_QUERY filters hop2 only
+        edges = [
+            {"source": "a", "target": "x", "type": "USES", "confidence": 0.9},
+            {"source": "x", "target": "d", "type": "USES", "confidence": 0.8},
+        ]
+        snapshot = ModuleGraphSnapshot("m1", 1, ENTITIES, edges)
+
+        rows = snapshot.expand(["a"], 2, module_ids={"m1"})
+
+        assert [(r["target_id"], r["hops"]) for r in rows] == [("d", 2)]
+
+    def test_subgraph_keeps_bounded_paths_per_seed(self):
+        leaves = [_entity(f"l{i}") for i in range(SUBGRAPH_PATHS_PER_SEED + 50)]
+        edges = [{"source": "a", "target": leaf["id"], "type": "USES", "confidence": 1.0}
+                 for leaf in leaves]
+        snapshot = ModuleGraphSnapshot("m1", 1, [_entity("a")] + leaves, edges)
+
+        nodes, edges = snapshot.subgraph(["a"], 1, module_ids={"m1"})
+
+        assert len(nodes) == SUBGRAPH_PATHS_PER_SEED + 1
+        assert len(edges) == SUBGRAPH_PATHS_PER_SEED
+
+    def test_subgraph_filters_path_ends_only(self):
+        snapshot = ModuleGraphSnapshot("m1", 1, ENTITIES, EDGES)
+
+        # a - b - x ends outside m1; b is still reached via a - b
+        nodes, edges = snapshot.subgraph(["a"], 2, module_ids={"m1"})
+        assert "x" not in {n["id"] for n in nodes}
+
+        nodes, _ = snapshot.subgraph(["x"], 2, module_ids={"m1"})
+        assert {n["id"] for n in nodes} == {"x", "b", "a", "c"}
+
+    def test_long_paths_are_left_to_neo4j(self):
+        snapshot = ModuleGraphSnapshot("m1", 1, ENTITIES, EDGES)
+
+        # d - c - a is 2 hops; x - b - c - d could be beaten by a chunk detour
+        assert len(snapshot.shortest_path("d", "a", 4)) == 2
+        assert snapshot.shortest_path("x", "d", 4) is None
+
+
+class TestSnapshotCache:
+    def test_manager_reuses_snapshot_until_version_bump(self, cache):
+        manager = _SnapshotGraphManager(GraphSnapshotCache())
+
+        context = asyncio.run(manager.expand_graph_context(["a"], module_ids=["m1"]))
+        neighbors = asyncio.run(manager.get_entity_neighbors("a", module_id="m1"))
+        paths = asyncio.run(manager.get_paths_between("a", "d", module_id="m1"))
+
+        assert len(manager.queries) == 2
+        assert {e["id"] for e in context.expanded_entities} == {"b", "c", "d"}
+        assert [n["id"] for n in neighbors] == ["b", "c"]
+        assert [p.hops for p in paths] == [2, 2]
+
+        graph_cache.bump_module_version("m1")
+        asyncio.run(manager.get_entity_neighbors("a", module_id="m1"))
+        assert len(manager.queries) == 4
+
+    def test_lru_eviction_respects_budget(self, cache):
+        size = ModuleGraphSnapshot("m1", 1, ENTITIES, EDGES).nbytes
+        snapshots = GraphSnapshotCache(max_bytes=int(size * 2.5))
+        manager = _SnapshotGraphManager(snapshots)
+
+        for module_id in ("m1", "m2", "m1", "m3"):
+            asyncio.run(snapshots.get(module_id, manager))
+
+        assert list(snapshots._snapshots) == ["m1", "m3"]
+        assert snapshots.total_bytes <= snapshots.max_bytes
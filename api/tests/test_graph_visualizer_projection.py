@@ -0,0 +1,129 @@
+"""
+============================================================================
+FILE: test_graph_visualizer_projection.py
+LOCATION: api/tests/test_graph_visualizer_projection.py
+============================================================================
+
+PURPOSE:
+    Unit tests for lean property projection in GraphVisualizer.
+
+ROLE IN PROJECT:
+    Ensures graph visualization queries return only display properties by
+    default, honour the opt-in field list, and go through the non-blocking
+    GraphManager.run_query primitive.
+
+KEY COMPONENTS:
+    - TestPropertyHelpers
+    - TestModuleGraphProjection
+
+DEPENDENCIES:
+    - External: pytest
+    - Internal: api.graph_visualizer
+
+USAGE:
+    pytest api/tests/test_graph_visualizer_projection.py -v
+============================================================================
+"""
+
+import asyncio
+import threading
+
+from api.graph_visualizer import (
+    ENTITY_DISPLAY_PROPERTIES,
+    GraphOptions,
+    GraphVisualizer,
+    node_projection,
+    resolve_property_fields,
+)
+
+
+class _FakeGraphManager:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    async def run_query(self, cypher, params=None):
+        self.calls.append((cypher, params))
+        return self.rows
+
+
+def _module_rows():
+    return [
+        {
+            "module": {"id": "m1", "name": "ML", "labels": ["Module"], "props": [None]},
+            "entities": [
+                {
+                    "id": "e1",
+                    "name": "Gradient Descent",
+                    "labels": ["Entity", "Concept"],
+                    "props": ["Optimiser", 0.9, None, [0.1, 0.2]],
+                },
+                {
+                    "id": "e2",
+                    "name": "Loss",
+                    "labels": ["Topic"],
+                    "props": [None, None, 3, None],
+                },
+            ],
+            "documents": [],
+            "relationships": [
+                {"source": "e1", "target": "e2", "type": "USES"},
+                {"source": "e1", "target": None, "type": None},
+            ],
+        }
+    ]
+
+
+class TestPropertyHelpers:
+    def test_resolve_property_fields_appends_unique_extras(self):
+        fields = resolve_property_fields(["a", "b"], ["b", "c", ""])
+        assert fields == ["a", "b", "c"]
+
+    def test_node_projection_is_parameterised(self):
+        projection = node_projection("e", "entity_fields")
+        assert "[k IN $entity_fields | e[k]]" in projection
+        assert "embedding" not in projection
+
+
+class TestModuleGraphProjection:
+    def test_default_projection_excludes_embedding(self):
+        manager = _FakeGraphManager(_module_rows())
+        visualizer = GraphVisualizer(manager)
+
+        graph = asyncio.run(visualizer.get_module_graph("m1"))
+
+        cypher, params = manager.calls[0]
+        assert "embedding" not in cypher
+        assert params["entity_fields"] == ENTITY_DISPLAY_PROPERTIES
+        entity = next(n for n in graph.nodes if n.id == "e1")
+        assert entity.type == "Concept"
+        assert entity.properties == {"definition": "Optimiser", "confidence": 0.9}
+        assert [e.type for e in graph.edges] == ["USES"]
+
+    def test_opt_in_fields_are_returned(self):
+        manager = _FakeGraphManager(_module_rows())
+        visualizer = GraphVisualizer(manager)
+        options = GraphOptions(node_properties=["embedding"])
+
+        graph = asyncio.run(visualizer.get_module_graph("m1", options))
+
+        _, params = manager.calls[0]
+        assert params["entity_fields"][-1] == "embedding"
+        entity = next(n for n in graph.nodes if n.id == "e1")
+        assert entity.properties["embedding"] == [0.1, 0.2]
+
+    def test_layout_runs_off_the_event_loop(self, monkeypatch):
+        manager = _FakeGraphManager(_module_rows())
+        visualizer = GraphVisualizer(manager)
+        layout_threads = []
+        apply_layout = visualizer.apply_layout
+
+        def recording_layout(*args, **kwargs):
+            layout_threads.append(threading.current_thread())
+            return apply_layout(*args, **kwargs)
+
+        monkeypatch.setattr(visualizer, "apply_layout", recording_layout)
+        graph = asyncio.run(visualizer.get_module_graph("m1"))
+
+        assert graph.nodes
+        assert layout_threads and layout_threads[0] is not threading.main_thread()
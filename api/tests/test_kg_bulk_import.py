@@ -0,0 +1,196 @@
+"""
+============================================================================
+FILE: test_kg_bulk_import.py
+LOCATION: api/tests/test_kg_bulk_import.py
+============================================================================
+
+PURPOSE:
+    Unit tests for the bulk backfill import staging and loading logic.
+
+ROLE IN PROJECT:
+    Validates that staged CSV rows are written per document, that failed
+    documents leave nothing behind, that the manifest supports resume of an
+    unfinished rebuild only, that rows appended after a load are reloaded,
+    and that LOAD CSV queries are built in dependency order.
+
+KEY COMPONENTS:
+    - TestBulkImportStager
+    - TestBulkImporter
+
+DEPENDENCIES:
+    - External: pytest, unittest.mock
+    - Internal: api.kg_bulk_import
+
+USAGE:
+    pytest api/tests/test_kg_bulk_import.py -v
+============================================================================
+"""
+
+import csv
+import os
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from api.kg_bulk_import import BulkImporter, BulkImportStager
+
+
+class _EntityType(str, Enum):
+    CONCEPT = "Concept"
+    TOPIC = "Topic"
+
+
+@dataclass
+class _Entity:
+    id: str
+    name: str
+    entity_type: _EntityType
+    definition: str = ""
+    properties: Dict[str, Any] = field(default_factory=dict)
+    embedding: Optional[List[float]] = None
+
+
+@dataclass
+class _Chunk:
+    id: str
+    text: str
+    index: int
+    token_count: int
+    embedding: Optional[List[float]] = None
+    entities: List[_Entity] = field(default_factory=list)
+    chunk_labels: List[str] = field(default_factory=list)
+
+
+@pytest.fixture
+def stager(tmp_path):
+    return BulkImportStager("module/1", str(tmp_path))
+
+
+def _stage_sample(stager: BulkImportStager, doc_id: str = "doc_1") -> None:
+    concept = _Entity("e1", "Gradient Descent", _EntityType.CONCEPT, embedding=[0.5, 1.0])
+    chunk = _Chunk(
+        "c1", 'Text with "quotes",\nand newlines', 0, 12,
+        embedding=[0.25, 0.75], entities=[concept], chunk_labels=["A", "B|C"],
+    )
+    stager.begin_document(doc_id)
+    stager.stage_document(doc_id, "user_1", [chunk], [concept])
+
+
+class TestBulkImportStager:
+    def test_commit_writes_rows_and_manifest(self, stager):
+        _stage_sample(stager)
+        written = stager.commit_document()
+
+        assert written == 4
+        assert stager.is_staged("doc_1")
+        assert stager.dirname == "module_1"
+        with open(os.path.join(stager.directory, "chunks.csv"), newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]["text"] == 'Text with "quotes",\nand newlines'
+        assert rows[0]["embedding"] == "0.25;0.75"
+        assert rows[0]["chunk_labels"] == "A|B/C"
+        assert stager.manifest["files"]["chunk_entities_Concept.csv"]["label"] == "Concept"
+
+    def test_discard_leaves_nothing_on_disk(self, stager):
+        _stage_sample(stager)
+        stager.discard_document()
+
+        assert not stager.is_staged("doc_1")
+        assert not os.path.exists(os.path.join(stager.directory, "chunks.csv"))
+
+    def test_manifest_is_reloaded_for_resume(self, stager, tmp_path):
+        _stage_sample(stager)
+        stager.commit_document()
+
+        resumed = BulkImportStager("module/1", str(tmp_path))
+        assert resumed.is_staged("doc_1")
+        assert resumed.manifest["files"]["documents.csv"]["rows"] == 1
+
+        resumed.reset()
+        assert not resumed.is_staged("doc_1")
+
+    def test_rejects_unsafe_identifiers(self, stager):
+        stager.begin_document("doc_1")
+        with pytest.raises(ValueError):
+            stager.stage_entity_relationship(
+                "a", "Concept", "b", "Topic", "USES]->() DETACH DELETE", 0.9, None
+            )
+
+
+class TestBulkImporter:
+    def test_pending_files_follow_dependency_order(self, stager):
+        stager.begin_document("doc_1")
+        stager.stage_entity_relationship("e1", "Concept", "e2", "Topic", "USES", 0.9, "x")
+        stager.commit_document()
+        _stage_sample(stager, "doc_2")
+        stager.commit_document()
+
+        importer = BulkImporter(MagicMock(), stager)
+        assert importer.pending_files() == [
+            "documents.csv",
+            "chunks.csv",
+            "entities_Concept.csv",
+            "chunk_entities_Concept.csv",
+            "relationships_Concept_USES_Topic.csv",
+        ]
+
+    def test_build_query_batches_with_call_in_transactions(self, stager):
+        importer = BulkImporter(MagicMock(), stager, batch_rows=500)
+        query = importer.build_query(
+            {"kind": "relationships", "source_label": "Concept",
+             "target_label": "Topic", "rel_type": "USES"}
+        )
+
+        assert query.startswith("LOAD CSV WITH HEADERS FROM $url AS row")
+        assert "MATCH (source:Entity {id: row.source_id" in query
+        assert "MERGE (source)-[r:USES]->(target)" in query
+        assert query.rstrip().endswith("} IN TRANSACTIONS OF 500 ROWS")
+        assert importer.file_url("x.csv") == "file:///module_1/x.csv"
+
+    def test_load_skips_already_loaded_files(self, stager):
+        _stage_sample(stager)
+        stager.commit_document()
+        stager.manifest["loaded_rows"]["documents.csv"] = 1
+
+        driver = MagicMock()
+        session = driver.session.return_value.__enter__.return_value
+        progress = []
+        importer = BulkImporter(
+            driver, stager, progress_callback=lambda *args: progress.append(args)
+        )
+        stats = importer.load()
+
+        assert stats["files_loaded"] == 3
+        assert session.run.call_count == 3
+        assert "documents.csv" not in [
+            c.args[1]["url"].rsplit("/", 1)[-1] for c in session.run.call_args_list
+        ]
+        assert importer.pending_files() == []
+        assert progress[-1][0] == "bulk_load"
+
+    def test_rows_appended_after_load_are_reloaded(self, stager):
+        _stage_sample(stager)
+        stager.commit_document()
+        importer = BulkImporter(MagicMock(), stager)
+        importer.load()
+
+        _stage_sample(stager, "doc_2")
+        stager.commit_document()
+
+        assert "documents.csv" in importer.pending_files()
+        assert stager.manifest["files"]["documents.csv"]["rows"] == 2
+
+    def test_completed_load_is_not_resumed(self, stager, tmp_path):
+        _stage_sample(stager)
+        stager.commit_document()
+        BulkImporter(MagicMock(), stager).load()
+        assert stager.manifest["load_completed"]
+
+        fresh = BulkImportStager("module/1", str(tmp_path))
+
+        assert not fresh.is_staged("doc_1")
+        assert fresh.manifest["files"] == {}
+        assert not os.path.exists(os.path.join(fresh.directory, "documents.csv"))
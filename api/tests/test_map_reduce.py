@@ -0,0 +1,114 @@
+"""
+============================================================================
+FILE: test_map_reduce.py
+LOCATION: api/tests/test_map_reduce.py
+============================================================================
+
+PURPOSE:
+    Unit tests for the bounded map and token-budgeted hierarchical reduce.
+
+ROLE IN PROJECT:
+    Validates that bounded_gather keeps result order under its concurrency
+    cap, that packing follows the token budget, and that the reduce tree
+    converges to items fitting one prompt, carrying lone fitting items up
+    unchanged and falling back to pairs when packing cannot shrink a level.
+
+KEY COMPONENTS:
+    - TestBoundedGather
+    - TestPackByTokenBudget
+    - TestReduceByTokenBudget
+
+DEPENDENCIES:
+    - External: pytest
+    - Internal: api.map_reduce
+
+USAGE:
+    pytest api/tests/test_map_reduce.py -v
+============================================================================
+"""
+
+import asyncio
+
+from api.map_reduce import bounded_gather, pack_by_token_budget, reduce_by_token_budget
+
+
+def _tokens(item):
+    return len(item.split())
+
+
+class TestBoundedGather:
+    def test_respects_limit_and_order(self):
+        running = []
+        peak = []
+
+        def factory(i):
+            async def run():
+                running.append(i)
+                peak.append(len(running))
+                await asyncio.sleep(0.01 * (5 - i % 5))
+                running.remove(i)
+                return i * i
+            return run
+
+        results = asyncio.run(bounded_gather([factory(i) for i in range(20)], limit=3))
+
+        assert results == [i * i for i in range(20)]
+        assert max(peak) == 3
+
+
+class TestPackByTokenBudget:
+    def test_groups_fit_budget_in_order(self):
+        items = ["a b", "c d e", "f", "g h i j", "k"]
+
+        assert pack_by_token_budget(items, 5, _tokens) == [
+            ["a b", "c d e"], ["f", "g h i j"], ["k"],
+        ]
+
+    def test_oversized_item_stands_alone(self):
+        items = ["a", "b c d e f g", "h"]
+
+        assert pack_by_token_budget(items, 3, _tokens) == [["a"], ["b c d e f g"], ["h"]]
+
+
+class TestReduceByTokenBudget:
+    def test_input_that_fits_is_returned_unchanged(self):
+        async def combine(level, index, group):
+            raise AssertionError("combine should not run")
+
+        items = ["a b", "c"]
+        assert asyncio.run(reduce_by_token_budget(items, combine, 10, _tokens)) == items
+
+    def test_reduces_level_by_level_until_it_fits(self):
+        calls = []
+
+        async def combine(level, index, group):
+            calls.append((level, len(group)))
+            return f"s{level}.{index} x"
+
+        items = [f"doc{i} w w" for i in range(12)]  # 3 tokens each, 36 total
+        result = asyncio.run(reduce_by_token_budget(items, combine, 6, _tokens))
+
+        assert calls == [(1, 2)] * 6 + [(2, 3)] * 2
+        assert result == ["s2.0 x", "s2.1 x"]
+
+    def test_lone_fitting_item_is_not_recombined(self):
+        combined = []
+
+        async def combine(level, index, group):
+            combined.append(group)
+            return "merged"
+
+        items = ["a b c", "d e f", "g"]
+        result = asyncio.run(reduce_by_token_budget(items, combine, 6, _tokens))
+
+        assert combined == [["a b c", "d e f"]]
+        assert result == ["merged", "g"]
+
+    def test_oversized_items_fall_back_to_pairs(self):
+        async def combine(level, index, group):
+            return "short"
+
+        items = ["a b c d", "e f g h", "i j k l"]
+        result = asyncio.run(reduce_by_token_budget(items, combine, 3, _tokens))
+
+        assert result == ["short", "short"]
@@ -0,0 +1,143 @@
+"""
+============================================================================
+FILE: test_query_expansion.py
+LOCATION: api/tests/test_query_expansion.py
+============================================================================
+
+PURPOSE:
+    Unit tests for knowledge-graph query expansion.
+
+ROLE IN PROJECT:
+    Validates that precomputed expansion tables match aliases and weight
+    related entities with weight_path, that expansion honours
+    max_expansion_terms/min_term_weight and feeds boosted phrases into the
+    fulltext query, and that tables are rebuilt in the background on module
+    version changes while the stale table keeps serving.
+
+KEY COMPONENTS:
+    - TestExpansionTable
+    - TestQueryExpander
+
+DEPENDENCIES:
+    - External: pytest
+    - Internal: api.query_expansion, api.graph_snapshot, api.search_service
+
+USAGE:
+    pytest api/tests/test_query_expansion.py -v
+============================================================================
+"""
+
+import asyncio
+
+import api.graph_cache as graph_cache
+from api.graph_snapshot import SNAPSHOT_EDGES_QUERY, SNAPSHOT_ENTITIES_QUERY, ModuleGraphSnapshot
+from api.query_expansion import (
+    ENTITY_ALIASES_QUERY,
+    QueryExpander,
+    build_expansion_table,
+)
+from api.schemas.search import QueryExpansionConfig
+from api.search_service import build_lucene_query
+
+
+def _entity(entity_id, name, module_id="m1"):
+    return {"id": entity_id, "name": name, "entity_type": "Concept",
+            "definition": None, "module_id": module_id}
+
+
+ENTITIES = [
+    _entity("nn", "Neural Networks"),
+    _entity("bp", "Backpropagation"),
+    _entity("gd", "Gradient Descent"),
+    _entity("ca", "Calculus"),
+    _entity("xx", "Other Module Topic", "m2"),
+]
+EDGES = [
+    {"source": "nn", "target": "bp", "type": "USES", "confidence": 0.9},
+    {"source": "bp", "target": "gd", "type": "DEPENDS_ON", "confidence": 0.8},
+    {"source": "gd", "target": "ca", "type": "USES", "confidence": None},
+    {"source": "nn", "target": "xx", "type": "DEFINES", "confidence": 1.0},
+]
+
+
+class _ExpansionGraphManager:
+    def __init__(self):
+        self.queries = []
+
+    async def run_query(self, cypher, params=None):
+        self.queries.append(cypher)
+        if cypher == SNAPSHOT_ENTITIES_QUERY:
+            return ENTITIES
+        if cypher == SNAPSHOT_EDGES_QUERY:
+            return EDGES
+        if cypher == ENTITY_ALIASES_QUERY:
+            return [{"id": "bp", "aliases": ["backprop"]}]
+        return []
+
+
+class TestExpansionTable:
+    def test_aliases_come_from_concepts_only(self, admits):
+        assert admits(ENTITY_ALIASES_QUERY, "e", {"Entity", "Topic"})
+        assert not admits(ENTITY_ALIASES_QUERY, "e", {"Entity", "Definition"})
+
+    def test_weights_follow_weight_path_within_module(self):
+        table = build_expansion_table(
+            ModuleGraphSnapshot("m1", 1, ENTITIES, EDGES), {"bp": ["backprop"]}
+        )
+
+        # USES (0.8) * conf 0.9 at 1 hop; DEPENDS_ON (0.9) * conf 0.8 / 2 hops
+        assert table.expansions["nn"] == [
+            ("Backpropagation", "USES", 0.72),
+            ("Gradient Descent", "DEPENDS_ON", 0.36),
+        ]
+        assert table.match(("what", "is", "backprop")) == ["bp"]
+        assert "xx" not in table.names
+
+    def test_expand_respects_limits_and_boosts_fulltext(self, cache):
+        expander = QueryExpander(_ExpansionGraphManager())
+        asyncio.run(expander.refresh("m1"))
+
+        expanded = expander.expand(
+            "How do neural-network models learn?", ["m1"],
+            QueryExpansionConfig(enabled=True, min_term_weight=0.3),
+        )
+        assert expanded.entities_found == ["Neural Networks"]
+        assert [t.term for t in expanded.expansion_terms] == [
+            "Backpropagation", "Gradient Descent"
+        ]
+
+        narrow = expander.expand(
+            "neural networks and gradient descent", ["m1"],
+            QueryExpansionConfig(enabled=True, max_expansion_terms=1),
+        )
+        # Gradient Descent -USES-> Calculus (0.8) beats Backpropagation (0.72)
+        assert [t.term for t in narrow.expansion_terms] == ["Calculus"]
+        assert 'text:(neural networks and gradient descent "calculus"^0.8)' in (
+            build_lucene_query(narrow.original_query, ["m1"], narrow.expansion_terms)
+        )
+
+
+class TestQueryExpander:
+    def test_stale_table_serves_while_rebuilding(self, cache):
+        manager = _ExpansionGraphManager()
+        expander = QueryExpander(manager)
+        config = QueryExpansionConfig(enabled=True)
+
+        async def scenario():
+            first = expander.expand("neural networks", ["m1"], config)
+            await asyncio.sleep(0.05)
+            second = expander.expand("neural networks", ["m1"], config)
+            built = len(manager.queries)
+
+            graph_cache.bump_module_version("m1")
+            stale = expander.expand("neural networks", ["m1"], config)
+            await asyncio.sleep(0.05)
+            return first, second, built, stale
+
+        first, second, built, stale = asyncio.run(scenario())
+
+        assert first.expansion_terms == [] and second.expansion_terms
+        assert built == 3
+        assert [t.term for t in stale.expansion_terms] == [t.term for t in second.expansion_terms]
+        assert len(manager.queries) == 6
+        assert expander._tables["m1"].version == graph_cache.get_module_version("m1")
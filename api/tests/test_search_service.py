@@ -0,0 +1,264 @@
+"""
+============================================================================
+FILE: test_search_service.py
+LOCATION: api/tests/test_search_service.py
+============================================================================
+
+PURPOSE:
+    Unit tests for the hybrid vector + fulltext search service.
+
+ROLE IN PROJECT:
+    Validates score fusion (weighted and RRF), Lucene query escaping and
+    module filtering, concurrent index stages with graceful degradation,
+    that only the final top_k results are hydrated, that module-scoped
+    results are cached until the module's graph version changes, and that
+    enriched search expands all hits with a single batched traversal.
+
+KEY COMPONENTS:
+    - TestFusion
+    - TestHybridSearchService
+    - TestSearchResultCache
+    - TestEnrichedSearch
+
+DEPENDENCIES:
+    - External: pytest
+    - Internal: api.search_service, api.schemas.search
+
+USAGE:
+    pytest api/tests/test_search_service.py -v
+============================================================================
+"""
+
+import asyncio
+
+import pytest
+
+import api.search_service as search_service
+from api.graph_cache import bump_module_version
+from api.schemas.search import EnrichedSearchRequest, SearchRequest
+from api.search_service import (
+    HYDRATE_CHUNKS_QUERY,
+    VECTOR_SCAN_QUERY,
+    HybridSearchService,
+    build_lucene_query,
+    fuse_rrf,
+    fuse_weighted,
+)
+
+
+class _FakeEmbeddings:
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def embed_query(self, query):
+        if self.fail:
+            raise RuntimeError("quota exceeded")
+        return [0.1] * 768
+
+
+class _SearchGraphManager:
+    def __init__(self, vector, fulltext, scan=None):
+        self.vector, self.fulltext, self.scan = vector, fulltext, scan or []
+        self.calls = []
+
+    async def run_query(self, cypher, params=None):
+        self.calls.append((cypher, params))
+        if cypher == HYDRATE_CHUNKS_QUERY:
+            return [
+                {"id": i, "text": f"text {i}", "module_id": "m1",
+                 "document": {"id": "d1", "title": "Doc"},
+                 "parent_text": None, "entities": ["ML", None]}
+                for i in params["ids"]
+            ]
+        if cypher == VECTOR_SCAN_QUERY:
+            return self.scan
+        if "db.index.vector" in cypher:
+            return self.vector
+        return self.fulltext
+
+
+class TestFusion:
+    def test_weighted_normalizes_bm25_and_rrf_tops_at_one(self):
+        vector = [("a", 0.9), ("b", 0.8)]
+        fulltext = [("b", 12.0), ("c", 6.0)]
+
+        weighted = fuse_weighted(vector, fulltext, 0.5, 0.5)
+        assert [item[0] for item in weighted] == ["b", "a", "c"]
+        assert weighted[0][1] == pytest.approx(0.9)
+        assert weighted[2][3] == pytest.approx(0.5)
+
+        rrf = fuse_rrf([("a", 0.9)], [("a", 3.0), ("c", 1.0)], 0.7, 0.3)
+        assert rrf[0][0] == "a" and rrf[0][1] == pytest.approx(1.0)
+        assert rrf[1][2] is None
+
+    def test_lucene_query_escapes_and_filters_modules(self):
+        lucene = build_lucene_query('What is C++ AND "RL"?', ["m1", 'm"2'])
+
+        assert lucene == (
+            'text:(what is c\\+\\+ and \\"rl\\"\\?) '
+            'AND module_id:("m1" OR "m\\"2")'
+        )
+
+
+class TestHybridSearchService:
+    def test_search_fuses_concurrent_stages_and_hydrates_top_k(self):
+        manager = _SearchGraphManager(
+            vector=[{"id": "a", "score": 0.95}, {"id": "b", "score": 0.6}],
+            fulltext=[{"id": "b", "score": 8.0}, {"id": "c", "score": 2.0}],
+        )
+        service = HybridSearchService(manager, _FakeEmbeddings())
+
+        response = asyncio.run(service.search(
+            SearchRequest(query="neural nets", top_k=2, min_score=0.0)
+        ))
+
+        assert [r.id for r in response.results] == ["b", "a"]
+        assert response.results[0].entities == ["ML"]
+        assert set(response.timings) == {
+            "embedding", "vector", "fulltext", "fusion", "hydration"
+        }
+        hydrate_params = manager.calls[-1][1]
+        assert hydrate_params["ids"] == ["b", "a"]
+
+    def test_module_filter_falls_back_to_exact_scan(self):
+        manager = _SearchGraphManager(
+            vector=[], fulltext=[], scan=[{"id": "z", "score": 0.8}]
+        )
+        service = HybridSearchService(manager, _FakeEmbeddings())
+
+        response = asyncio.run(service.search(
+            SearchRequest(query="q", module_ids=["m1"], top_k=1, fusion="rrf")
+        ))
+
+        assert [r.id for r in response.results] == ["z"]
+        ann_params = next(p for c, p in manager.calls if "db.index.vector" in c)
+        assert ann_params["candidates"] > ann_params["limit"]
+        assert "module_id:(" in next(
+            p["lucene_query"] for c, p in manager.calls if "fulltext" in c
+        )
+
+    def test_rrf_applies_min_score(self):
+        manager = _SearchGraphManager(
+            vector=[{"id": "a", "score": 0.9}, {"id": "b", "score": 0.8}],
+            fulltext=[{"id": "a", "score": 5.0}, {"id": "c", "score": 1.0}],
+        )
+        service = HybridSearchService(manager, _FakeEmbeddings())
+
+        response = asyncio.run(service.search(
+            SearchRequest(query="q", top_k=3, fusion="rrf", min_score=0.5)
+        ))
+
+        # a tops both lists (1.0), b is second in vector only (~0.69),
+        # c is second in fulltext only (~0.30)
+        assert [r.id for r in response.results] == ["a", "b"]
+
+    def test_embedding_failure_degrades_to_fulltext(self):
+        manager = _SearchGraphManager(vector=[], fulltext=[{"id": "c", "score": 4.0}])
+        service = HybridSearchService(manager, _FakeEmbeddings(fail=True))
+
+        response = asyncio.run(service.search(
+            SearchRequest(query="q", vector_weight=0.0, fulltext_weight=1.0)
+        ))
+
+        assert [r.id for r in response.results] == ["c"]
+        assert not any("db.index.vector" in c for c, _ in manager.calls)
+
+
+class TestSearchResultCache:
+    def test_key_keeps_query_punctuation(self, monkeypatch):
+        class _StrippingEmbeddings(_FakeEmbeddings):
+            # Embedding-cache normalizer that drops symbols such as + and #
+            def _normalize_query(self, query):
+                return "".join(ch for ch in query.lower() if ch.isalnum() or ch == " ")
+
+        monkeypatch.setattr(search_service, "get_module_versions", lambda ids: "m1:1")
+        service = HybridSearchService(None, _StrippingEmbeddings())
+
+        def key(query):
+            return service._result_cache_key(
+                "search", SearchRequest(query=query, module_ids=["m1"])
+            )
+
+        assert key("C++ templates") != key("C# templates")
+        assert key("C++  Templates") == key("c++ templates")
+
+    def test_hit_until_module_version_bump(self, cache):
+        manager = _SearchGraphManager(vector=[], fulltext=[{"id": "c", "score": 4.0}])
+        service = HybridSearchService(manager, _FakeEmbeddings())
+        stats = service.result_cache_stats.snapshot()
+
+        def run(query):
+            return asyncio.run(service.search(
+                SearchRequest(query=query, module_ids=["m1"], top_k=1, min_score=0.0)
+            ))
+
+        first = run("Neural  Nets")
+        calls = len(manager.calls)
+        second = run("neural nets")
+
+        assert len(manager.calls) == calls
+        assert [r.id for r in second.results] == [r.id for r in first.results] == ["c"]
+        assert second.query == "neural nets" and set(second.timings) == {"cache"}
+        after = service.result_cache_stats.snapshot()
+        assert after["hits"].get("redis", 0) == stats["hits"].get("redis", 0) + 1
+
+        bump_module_version("m1")
+        run("neural nets")
+        assert len(manager.calls) > calls
+
+
+class _EnrichedGraphManager(_SearchGraphManager):
+    def __init__(self, vector, fulltext, chunk_entities, paths):
+        super().__init__(vector, fulltext)
+        self.chunk_entities, self.paths = chunk_entities, paths
+        self.expansions = []
+
+    async def run_query(self, cypher, params=None):
+        rows = await super().run_query(cypher, params)
+        if cypher == HYDRATE_CHUNKS_QUERY:
+            for row in rows:
+                row["parent_text"] = f"parent of {row['id']}"
+                row["entity_ids"] = self.chunk_entities[row["id"]]
+        return rows
+
+    async def expand_entities(self, entity_ids, hop_depth, module_ids, limit,
+                              relationship_types=None):
+        self.expansions.append(entity_ids)
+        return self.paths
+
+
+def _path(source_id, target_id, rel, confidence, hops=1):
+    return {"source_id": source_id, "source": source_id.upper(), "target_id": target_id,
+            "target": target_id.upper(), "definition": None, "entity_type": "Concept",
+            "module_id": "m1", "relationship_type": rel, "confidence": confidence,
+            "hops": hops}
+
+
+class TestEnrichedSearch:
+    def test_single_batched_expansion_attributed_per_result(self):
+        manager = _EnrichedGraphManager(
+            vector=[{"id": "a", "score": 0.9}, {"id": "b", "score": 0.8}],
+            fulltext=[],
+            chunk_entities={"a": ["e1"], "b": ["e2"]},
+            paths=[
+                _path("e1", "t1", "USES", 0.9),
+                _path("e2", "t2", "DEFINES", 1.0),
+                _path("e1", "e2", "RELATED_TO", 0.5),
+                _path("e2", "t1", "RELATED_TO", 1.0, hops=2),
+            ],
+        )
+        service = HybridSearchService(manager, _FakeEmbeddings())
+
+        response = asyncio.run(service.enriched_search(
+            EnrichedSearchRequest(query="q", top_k=2, min_score=0.0)
+        ))
+
+        assert manager.expansions == [["e1", "e2"]]
+        first, second = response.results
+        assert [e.entity_id for e in first.related_entities] == ["t1", "e2"]
+        assert first.related_entities[0].relevance_score == pytest.approx(0.72)
+        assert [e.entity_id for e in second.related_entities] == ["t2", "t1"]
+        assert second.graph_paths[1]["hops"] == 2
+        assert first.parent_context == "parent of a"
+        assert response.graph_context.total_expanded == 3
+        assert "graph_expansion" in response.timings
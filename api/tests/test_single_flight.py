@@ -0,0 +1,112 @@
+"""
+============================================================================
+FILE: test_single_flight.py
+LOCATION: api/tests/test_single_flight.py
+============================================================================
+
+PURPOSE:
+    Unit tests for the stampede-safe SingleFlightCache.
+
+ROLE IN PROJECT:
+    Validates that concurrent misses compute once, that stale entries are
+    served while a single background refresh runs, that uncacheable (None)
+    results are not stored, that a worker holding the fill lock is waited
+    on rather than duplicated, and that force bypasses fresh entries.
+
+KEY COMPONENTS:
+    - TestSingleFlightCache
+
+DEPENDENCIES:
+    - External: pytest
+    - Internal: api.single_flight
+
+USAGE:
+    pytest api/tests/test_single_flight.py -v
+============================================================================
+"""
+
+import asyncio
+import time
+
+import api.single_flight as single_flight
+from api.single_flight import CACHE_PREFIX_FILL_LOCK, SingleFlightCache
+
+
+def _counting(value, delay=0.05):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return value
+
+    return compute, calls
+
+
+class TestSingleFlightCache:
+    def test_concurrent_misses_compute_once(self, cache_client):
+        cache = SingleFlightCache("test-sf", lambda: cache_client, ttl=60)
+        compute, calls = _counting({"n": 1})
+
+        async def run():
+            return await asyncio.gather(*[cache.get_or_compute("k", compute) for _ in range(10)])
+
+        assert asyncio.run(run()) == [{"n": 1}] * 10
+        assert len(calls) == 1
+        assert cache.peek("k") == {"n": 1}
+        assert f"{CACHE_PREFIX_FILL_LOCK}:k" not in cache_client.store
+
+    def test_stale_entry_served_while_refreshing(self, cache_client):
+        cache = SingleFlightCache("test-sf", lambda: cache_client, ttl=60, stale_ttl=60)
+        cache_client.store["k"] = {"_sf_value": "old", "_sf_fresh_until": time.time() - 1}
+        compute, calls = _counting("new")
+
+        async def run():
+            served = await asyncio.gather(*[cache.get_or_compute("k", compute) for _ in range(5)])
+            await asyncio.sleep(0.1)
+            return served
+
+        assert asyncio.run(run()) == ["old"] * 5
+        assert len(calls) == 1
+        assert cache.peek("k") == "new"
+
+    def test_none_results_are_not_cached(self, cache_client):
+        cache = SingleFlightCache("test-sf", lambda: cache_client, ttl=60)
+        compute, calls = _counting(None, delay=0)
+
+        assert asyncio.run(cache.get_or_compute("k", compute)) is None
+        assert asyncio.run(cache.get_or_compute("k", compute)) is None
+        assert len(calls) == 2
+        assert "k" not in cache_client.store
+
+    def test_waits_for_other_workers_fill(self, monkeypatch, cache_client):
+        monkeypatch.setattr(single_flight, "LOCK_POLL_INTERVAL_SECONDS", 0.01)
+        cache = SingleFlightCache("test-sf", lambda: cache_client, ttl=60)
+        other_worker = SingleFlightCache("test-sf", lambda: cache_client, ttl=60)
+        cache_client.store[f"{CACHE_PREFIX_FILL_LOCK}:k"] = "other-token"
+        compute, calls = _counting("mine", delay=0)
+
+        async def run():
+            waiter = asyncio.create_task(cache.get_or_compute("k", compute))
+            await asyncio.sleep(0.05)
+            other_worker._write("k", "theirs")
+            return await waiter
+
+        assert asyncio.run(run()) == "theirs"
+        assert calls == []
+
+    def test_force_skips_fresh_entry(self, cache_client):
+        cache = SingleFlightCache("test-sf", lambda: cache_client, ttl=60)
+        cache._write("k", "old")
+        compute, calls = _counting("new", delay=0)
+
+        assert asyncio.run(cache.get_or_compute("k", compute)) == "old"
+        assert asyncio.run(cache.get_or_compute("k", compute, force=True)) == "new"
+        assert len(calls) == 1
+
+    def test_works_without_cache_client(self):
+        cache = SingleFlightCache("test-sf", lambda: None, ttl=60)
+        compute, calls = _counting("value", delay=0)
+
+        assert asyncio.run(cache.get_or_compute("k", compute)) == "value"
+        assert len(calls) == 1
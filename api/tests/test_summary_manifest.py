@@ -0,0 +1,99 @@
+"""
+============================================================================
+FILE: test_summary_manifest.py
+LOCATION: api/tests/test_summary_manifest.py
+============================================================================
+
+PURPOSE:
+    Unit tests for the per-module summary manifest checks.
+
+ROLE IN PROJECT:
+    Validates the graph-version fast path, detection of changed, new and
+    removed documents from fingerprints, the delta vs full synthesis
+    policy, and entity frequencies rebuilt from manifest entries.
+
+KEY COMPONENTS:
+    - TestCurrency
+    - TestDiffDocuments
+    - TestDeltaPolicy
+
+DEPENDENCIES:
+    - External: pytest
+    - Internal: api.summary_manifest
+
+USAGE:
+    pytest api/tests/test_summary_manifest.py -v
+============================================================================
+"""
+
+from api.summary_manifest import (
+    MAX_DELTA_CHAIN,
+    diff_documents,
+    document_fingerprint,
+    entity_frequency,
+    is_manifest_current,
+    manifest_key,
+    use_delta_synthesis,
+)
+
+
+def _manifest(documents=None, graph_version=7, delta_count=0):
+    return {
+        "graph_version": graph_version,
+        "documents": documents or {},
+        "summary": {"summary": "overview"},
+        "delta_count": delta_count,
+    }
+
+
+class TestCurrency:
+    def test_current_only_for_same_graph_version(self):
+        assert is_manifest_current(_manifest(), 7)
+        assert not is_manifest_current(_manifest(), 8)
+        assert not is_manifest_current(_manifest(), None)
+        assert not is_manifest_current(_manifest(graph_version=None), 7)
+        assert not is_manifest_current(None, 7)
+
+    def test_fingerprint_and_key(self):
+        record = {"chunk_count": 12, "last_chunk_at": "2026-03-01T10:00:00Z",
+                  "updated_at": "2026-03-02T09:00:00Z"}
+
+        assert document_fingerprint(record) == "12|2026-03-01T10:00:00Z|2026-03-02T09:00:00Z"
+        assert manifest_key("CS101", "brief") == "summary:manifest:CS101:brief"
+
+
+class TestDiffDocuments:
+    def test_changed_new_and_removed(self):
+        documents = {
+            "d1": {"fingerprint": "a"},
+            "d2": {"fingerprint": "b"},
+            "d3": {"fingerprint": "c"},
+            "d4": {"fingerprint": ""},  # fallback summary, retried
+        }
+        fingerprints = {"d1": "a", "d2": "b2", "d4": "d", "d5": "e"}
+
+        assert diff_documents(documents, fingerprints) == (["d2", "d4", "d5"], ["d3"])
+
+    def test_no_manifest_means_everything_changed(self):
+        assert diff_documents({}, {"d1": "a", "d2": "b"}) == (["d1", "d2"], [])
+
+
+class TestDeltaPolicy:
+    def test_small_change_uses_delta(self):
+        assert use_delta_synthesis(_manifest(), 2, 60)
+        assert use_delta_synthesis(_manifest(), 1, 3)
+
+    def test_large_change_or_long_chain_is_full(self):
+        assert not use_delta_synthesis(_manifest(), 30, 60)
+        assert not use_delta_synthesis(_manifest(), 2, 3)
+        assert not use_delta_synthesis(_manifest(delta_count=MAX_DELTA_CHAIN), 1, 60)
+
+    def test_nothing_to_revise_from(self):
+        assert not use_delta_synthesis(None, 1, 60)
+        assert not use_delta_synthesis({"documents": {}}, 1, 60)
+        assert not use_delta_synthesis(_manifest(), 0, 60)
+
+    def test_entity_frequency_across_entries(self):
+        entries = [{"entities": ["graphs", "trees"]}, {"entities": ["graphs"]}, {}]
+
+        assert entity_frequency(entries) == [("graphs", 2), ("trees", 1)]
@@ -51,8 +51,9 @@ def _get_encoding():
             import tiktoken
 
             _encoding = tiktoken.get_encoding("cl100k_base")
-        except ImportError:
-            _encoding = None  # Mark as unavailable
+        except Exception:
+            # Not installed, or the encoding file could not be downloaded
+            _encoding = False  # Mark as unavailable
     return _encoding if _encoding else None
 
 
@@ -17,13 +17,15 @@ ROLE IN PROJECT:
 
 KEY COMPONENTS:
     - EmbeddingService: Main class for embedding generation with caching
+    - QueryEmbeddingCache: Process-wide LRU + Redis cache of query embeddings,
+      shared by every EmbeddingService instance
     - batch_embed: Batch processing with configurable batch size
     - embed: Single text embedding with retry logic
     - cosine_similarity: Utility for computing similarity between embeddings
 
 DEPENDENCIES:
     - External: model_router (internal router for Vertex AI)
-    - Internal: None (standalone service)
+    - Internal: api/cache.py (optional, Redis tier and hit/miss metrics)
 
 USAGE:
     from services.embeddings import EmbeddingService
@@ -34,13 +36,18 @@ USAGE:
 
 from __future__ import annotations
 
+import base64
+import hashlib
 import logging
 import os
 import random
 import re
 import sys
+import threading
 import time
 import unicodedata
+from array import array
+from collections import OrderedDict
 from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
@@ -66,9 +73,126 @@ RETRY_BACKOFF_MULTIPLIER = 2.0
 RETRY_BACKOFF_MAX = 30.0
 MAX_TEXT_LENGTH = 30000
 
+# Query embedding cache: in-process LRU in front of Redis
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1024"))
+QUERY_EMBEDDING_CACHE_TTL = int(os.getenv("QUERY_EMBEDDING_CACHE_TTL", str(7 * 24 * 3600)))
+CACHE_PREFIX_QUERY_EMBEDDING = "embedding:query"
+
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# QUERY EMBEDDING CACHE
+# ============================================================================
+
+
+def _load_cache_module():
+    """api.cache when importable from either sys.path layout, else None."""
+    try:
+        import api.cache as cache_module
+    except ImportError:
+        try:
+            import cache as cache_module  # type: ignore[import-not-found]
+        except ImportError:
+            logger.debug("Cache not available")
+            return None
+    return cache_module
+
+
+class QueryEmbeddingCache:
+    """
+    Two-tier cache of query embeddings keyed by (model, normalized query).
+
+    The memory tier is a bounded LRU shared by every EmbeddingService in the
+    process; the Redis tier is shared across workers and survives restarts.
+    Redis values are base64-encoded float32 arrays (~4KB for 768 dims
+    instead of ~15KB of JSON floats).
+    """
+
+    def __init__(self, max_size: int = QUERY_EMBEDDING_CACHE_SIZE, ttl: int = QUERY_EMBEDDING_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[tuple, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._cache_module = None
+        self._cache_loaded = False
+
+    def _backend(self):
+        """Lazily resolve api.cache (Redis client and metrics)."""
+        if not self._cache_loaded:
+            self._cache_module = _load_cache_module()
+            self._cache_loaded = True
+        return self._cache_module
+
+    def _stats(self):
+        backend = self._backend()
+        return backend.get_cache_stats("query_embedding") if backend else None
+
+    @staticmethod
+    def redis_key(model: str, query: str) -> str:
+        digest = hashlib.sha256(query.encode("utf-8")).hexdigest()[:32]
+        return f"{CACHE_PREFIX_QUERY_EMBEDDING}:{model}:{digest}"
+
+    def _remember(self, key: tuple, embedding: List[float]) -> None:
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get(self, model: str, query: str) -> Optional[List[float]]:
+        """Cached embedding for an already-normalized query, or None."""
+        key = (model, query)
+        stats = self._stats()
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+        if embedding is not None:
+            if stats:
+                stats.hit("memory")
+            return embedding
+
+        backend = self._backend()
+        if backend is not None:
+            try:
+                encoded = backend.redis_client.get(self.redis_key(model, query))
+                if isinstance(encoded, str):
+                    embedding = array("f", base64.b64decode(encoded)).tolist()
+            except Exception as e:
+                logger.debug(f"Query embedding cache read failed: {e}")
+                embedding = None
+        if embedding:
+            self._remember(key, embedding)
+            if stats:
+                stats.hit("redis")
+            return embedding
+
+        if stats:
+            stats.miss()
+        return None
+
+    def set(self, model: str, query: str, embedding: List[float]) -> None:
+        """Store an embedding in both tiers."""
+        self._remember((model, query), embedding)
+        backend = self._backend()
+        if backend is None:
+            return
+        try:
+            encoded = base64.b64encode(array("f", embedding).tobytes()).decode("ascii")
+            backend.redis_client.set(self.redis_key(model, query), encoded, ttl=self.ttl)
+        except Exception as e:
+            logger.debug(f"Query embedding cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop the memory tier (Redis entries expire on their own)."""
+        with self._lock:
+            self._entries.clear()
+
+
+_query_embedding_cache = QueryEmbeddingCache()
+
+
 class EmbeddingService:
     """Embedding service for generating 768-dimensional text embeddings."""
 
@@ -309,24 +433,12 @@ class EmbeddingService:
         return normalized.strip()
 
     def _get_cached_query_embedding(self, query: str) -> Optional[List[float]]:
-        """Get cached query embedding using the instance cache."""
-        return self._query_embedding_cache(query)
+        """Get cached query embedding from the shared query cache."""
+        return _query_embedding_cache.get(self.model_name, query)
 
     def _cache_query_embedding(self, query: str, embedding: List[float]) -> None:
-        """Store query embedding in the instance cache with LRU eviction."""
-        if not hasattr(self, "_query_cache"):
-            self._query_cache = {}
-            self._query_cache_order = []
-            self._query_cache_max = 100
-
-        if len(self._query_cache) >= self._query_cache_max:
-            if self._query_cache_order:
-                oldest = self._query_cache_order.pop(0)
-                self._query_cache.pop(oldest, None)
-
-        if query not in self._query_cache:
-            self._query_cache_order.append(query)
-        self._query_cache[query] = embedding
+        """Store query embedding in the shared query cache."""
+        _query_embedding_cache.set(self.model_name, query, embedding)
 
     def embed_batch(
         self,
@@ -14,6 +14,15 @@ ROLE IN PROJECT:
     - Key responsibility 1: Generate hierarchical summaries (document/module level)
     - Key responsibility 2: Cache summaries with 24-hour TTL for performance
 
+    Summaries go through api/single_flight.SingleFlightCache, so concurrent
+    requests for the same content trigger one LLM call, and Neo4j reads and
+    LLM calls run in worker threads instead of on the event loop. Module
+    summaries map over documents concurrently and reduce their summaries
+    hierarchically (api/map_reduce), so large modules never exceed one
+    prompt's context. A per-module manifest (api/summary_manifest) tells
+    whether a stored module summary is current without touching every
+    document, and lets a few changed documents update it incrementally.
+
 KEY COMPONENTS:
     - SummaryService: Main service class with caching
     - SummaryLength: Enum for brief/standard/detailed summary types
@@ -22,7 +31,9 @@ KEY COMPONENTS:
 
 DEPENDENCIES:
     - External: pydantic
-    - Internal: services/vertex_ai_client, api/graph_manager, api/cache, api/config
+    - Internal: services/vertex_ai_client, services/chunking_utils, api/graph_manager,
+      api/cache, api/config, api/graph_cache, api/single_flight, api/map_reduce,
+      api/summary_manifest
 
 USAGE:
     from services.summary_service import SummaryService, SummaryLength
@@ -33,8 +44,10 @@ USAGE:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
 import re
 from datetime import datetime
 from enum import Enum
@@ -46,6 +59,21 @@ from api.config import LLM_SUMMARIZATION_MODEL
 from services.vertex_ai_client import GenerationConfig, generate_content
 from model_router.settings_store import get_default_sync
 from api.config import REDIS_URL
+from api.single_flight import SingleFlightCache
+from api.map_reduce import bounded_gather, reduce_by_token_budget
+from api.graph_cache import get_module_version
+from api.summary_manifest import (
+    CACHE_PREFIX_MANIFEST,
+    DOCUMENT_FINGERPRINTS_QUERY,
+    MANIFEST_TTL_SECONDS,
+    diff_documents,
+    document_fingerprint,
+    entity_frequency,
+    is_manifest_current,
+    manifest_key,
+    use_delta_synthesis,
+)
+from services.chunking_utils import count_tokens
 
 
 # ============================================================================
@@ -66,8 +94,22 @@ DETAILED_WORD_COUNT = 500
 
 # Cache configuration
 CACHE_TTL_SECONDS = 24 * 60 * 60  # 24 hours
+# Keys are content-addressed, so an expired summary is still correct and is
+# served for another TTL while it regenerates in the background
+CACHE_STALE_SECONDS = CACHE_TTL_SECONDS
+# Upper bound on one LLM generation; other workers wait this long for it
+SUMMARY_FILL_LOCK_SECONDS = 120
 CACHE_PREFIX_DOCUMENT = "summary:doc"
 CACHE_PREFIX_MODULE = "summary:mod"
+CACHE_PREFIX_SECTION = "summary:section"
+
+# Marks document summaries built without the LLM
+FALLBACK_SUMMARY_PREFIX = "[Auto-extracted]"
+
+# Module map-reduce: documents summarized concurrently, and summaries
+# combined in groups until they fit one synthesis prompt
+SUMMARY_MAP_CONCURRENCY = int(os.getenv("SUMMARY_MAP_CONCURRENCY", "8"))
+SUMMARY_REDUCE_TOKEN_BUDGET = int(os.getenv("SUMMARY_REDUCE_TOKEN_BUDGET", "6000"))
 
 
 # ============================================================================
@@ -200,6 +242,64 @@ LEARNING_OBJECTIVES:
 - Objective 3
 """
 
+MODULE_DELTA_PROMPT_TEMPLATE = """You are updating the overview of an academic module after some of its documents changed.
+
+Module: {module_name}
+
+Current overview:
+{previous_overview}
+
+Current key themes:
+{previous_themes}
+
+New or updated document summaries:
+{changed_summaries}
+
+Removed documents:
+{removed_documents}
+
+Top entities and their frequencies:
+{entity_frequencies}
+
+Instructions:
+1. Revise the {length} overview (~{word_count} words) so it reflects the changes
+2. Keep material about unchanged documents unless the changes contradict it
+3. Drop material that only came from removed documents
+4. Keep the structure, tone and learning roadmap of the current overview
+
+Format your response EXACTLY as:
+OVERVIEW:
+<your module overview>
+
+KEY_THEMES:
+- Theme 1
+- Theme 2
+- Theme 3
+
+LEARNING_OBJECTIVES:
+- Objective 1
+- Objective 2
+- Objective 3
+"""
+
+SECTION_SYNTHESIS_PROMPT_TEMPLATE = """You are condensing part of an academic module for a later overview.
+
+Module: {module_name}
+
+Summaries of consecutive documents (or of earlier sections):
+{document_summaries}
+
+Instructions:
+1. Merge these into one summary (~{word_count} words)
+2. Keep every distinct concept and how the documents build on each other
+3. Preserve the order in which topics are introduced
+4. Use clear, academic language
+
+Format your response EXACTLY as:
+SUMMARY:
+<your summary>
+"""
+
 
 # ============================================================================
 # SUMMARY SERVICE CLASS
@@ -251,6 +351,13 @@ class SummaryService:
         self._graph_manager = graph_manager
         self._neo4j_driver = neo4j_driver
         self._cache = None
+        self._summaries = SingleFlightCache(
+            "summaries",
+            self._get_cache,
+            ttl=CACHE_TTL_SECONDS,
+            stale_ttl=CACHE_STALE_SECONDS,
+            lock_ttl=SUMMARY_FILL_LOCK_SECONDS,
+        )
 
         # Resolve admin-configured default from SettingsStore
         try:
@@ -284,15 +391,8 @@ class SummaryService:
         return self._cache
 
     async def _get_cached_summary(self, cache_key: str) -> Optional[Any]:
-        """Retrieve a cached summary from Redis."""
-        cache = self._get_cache()
-        if cache is None:
-            return None
-        try:
-            return cache.get(cache_key)
-        except Exception as e:
-            logger.debug(f"Cache retrieval failed for {cache_key}: {e}")
-            return None
+        """Retrieve a cached summary (fresh or stale) from Redis."""
+        return self._summaries.peek(cache_key)
 
     def _compute_content_hash(self, content: str) -> str:
         """Compute SHA256 hash of content for cache key generation."""
@@ -319,23 +419,6 @@ class SummaryService:
         }
         return word_counts.get(length, STANDARD_WORD_COUNT)
 
-    def _cache_summary(
-        self,
-        cache_key: str,
-        summary_data: Dict[str, Any],
-        ttl: int = CACHE_TTL_SECONDS,
-    ) -> bool:
-        """Store a summary in cache."""
-        cache = self._get_cache()
-        if cache is None:
-            return False
-
-        try:
-            return cache.set(cache_key, summary_data, ttl=ttl)
-        except Exception as e:
-            logger.debug(f"Cache storage failed for {cache_key}: {e}")
-            return False
-
     def invalidate_cache(self, cache_key: str) -> int:
         """Invalidate a specific cached summary. Returns number of keys deleted."""
         cache = self._get_cache()
@@ -366,8 +449,8 @@ class SummaryService:
         if cache is None:
             return 0
 
-        pattern = f"{CACHE_PREFIX_MODULE}:{module_id}:*"
-        keys = cache.keys(pattern)
+        keys = cache.keys(f"{CACHE_PREFIX_MODULE}:{module_id}:*")
+        keys += cache.keys(f"{CACHE_PREFIX_MANIFEST}:{module_id}:*")
         if keys:
             return cache.delete(*keys)
         return 0
@@ -397,30 +480,26 @@ class SummaryService:
         length: SummaryLength = SummaryLength.STANDARD,
         include_document_summaries: bool = True,
     ) -> Optional[ModuleSummary]:
-        """Retrieve a cached module summary."""
-        module_name, doc_ids = await self._get_module_documents(module_id)
-        if not doc_ids:
+        """
+        Retrieve a cached module summary if it is still current.
+
+        Answered from the module's summary manifest: Redis alone when the
+        module graph is unchanged, otherwise one fingerprint query. Document
+        summaries are included only where already cached; none are fetched
+        or regenerated.
+        """
+        manifest = await asyncio.to_thread(self._load_manifest, module_id, length)
+        if not manifest or not manifest.get("summary"):
             return None
-        doc_summaries = []
-        for doc_id in doc_ids:
-            doc_summary = await self.summarize_document(
-                document_id=doc_id,
-                length=SummaryLength.BRIEF,
-                force_regenerate=True,
-            )
-            doc_summaries.append(doc_summary)
-        combined_content = "".join([ds.summary for ds in doc_summaries])
-        content_hash = self._compute_content_hash(combined_content)
-        cache_key = self._generate_cache_key(
-            CACHE_PREFIX_MODULE,
-            module_id,
-            length,
-            content_hash,
+        graph_version = await asyncio.to_thread(get_module_version, module_id)
+        if not is_manifest_current(manifest, graph_version):
+            _, fingerprints = await self._get_module_documents(module_id)
+            changed, removed = diff_documents(manifest["documents"], fingerprints)
+            if changed or removed:
+                return None
+        return await self._module_summary_from_manifest(
+            manifest, include_document_summaries, regenerate_missing=False
         )
-        cached = await self._get_cached_summary(cache_key)
-        if cached is not None:
-            return ModuleSummary(**cached)
-        return None
 
     async def _get_document_content(
         self,
@@ -448,47 +527,52 @@ class SummaryService:
             return "", "", []
 
         try:
-            with self._neo4j_driver.session() as session:
-                # Get document and its chunks
-                result = session.run(
-                    """
-                    MATCH (d:Document {id: $doc_id})
-                    OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
-                    OPTIONAL MATCH (c)-[:MENTIONS]->(e)
-                    WHERE e:Topic OR e:Concept OR e:Methodology OR e:Finding
-                    WITH d, collect(DISTINCT c.text) as chunks,
-                         collect(DISTINCT e.name) as entities
-                    RETURN d.id as id, d.title as title, d.module_id as module_id,
-                           chunks, entities
-                    """,
-                    {"doc_id": document_id},
-                )
-                record = result.single()
-
-                if record:
-                    chunks = record["chunks"] or []
-                    content = "\n\n".join([c for c in chunks if c])
-                    title = record["title"] or document_id
-                    entities = record["entities"] or []
-                    return content, title, entities
-
+            return await asyncio.to_thread(self._load_document_content, document_id)
         except Exception as e:
             logger.warning(f"Failed to get document content for {document_id}: {e}")
 
         return "", "", []
 
+    def _load_document_content(self, document_id: str) -> tuple[str, str, List[str]]:
+        """Blocking Neo4j read behind _get_document_content."""
+        with self._neo4j_driver.session() as session:
+            # Get document and its chunks
+            result = session.run(
+                """
+                MATCH (d:Document {id: $doc_id})
+                OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
+                OPTIONAL MATCH (c)-[:MENTIONS]->(e)
+                WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
+                WITH d, collect(DISTINCT c.text) as chunks,
+                     collect(DISTINCT e.name) as entities
+                RETURN d.id as id, d.title as title, d.module_id as module_id,
+                       chunks, entities
+                """,
+                {"doc_id": document_id},
+            )
+            record = result.single()
+
+        if record:
+            chunks = record["chunks"] or []
+            content = "\n\n".join([c for c in chunks if c])
+            title = record["title"] or document_id
+            entities = record["entities"] or []
+            return content, title, entities
+
+        return "", "", []
+
     async def _get_module_documents(
         self,
         module_id: str,
-    ) -> tuple[str, List[str]]:
+    ) -> tuple[str, Dict[str, str]]:
         """
-        Get module name and list of document IDs.
+        Get module name and the fingerprint of each document.
 
         Args:
             module_id: Module ID to retrieve.
 
         Returns:
-            Tuple of (module_name, document_ids)
+            Tuple of (module_name, {document_id: fingerprint}) in title order
         """
         if self._neo4j_driver is None:
             try:
@@ -497,36 +581,163 @@ class SummaryService:
                 self._neo4j_driver = neo4j_driver
             except ImportError:
                 logger.warning("Neo4j driver not available")
-                return "", []
+                return "", {}
 
         if self._neo4j_driver is None:
-            return "", []
+            return "", {}
 
         try:
-            with self._neo4j_driver.session() as session:
-                result = session.run(
-                    """
-                    MATCH (d:Document)
-                    WHERE d.module_id = $module_id
-                    RETURN d.id as id, d.title as title
-                    ORDER BY d.title
-                    """,
-                    {"module_id": module_id},
-                )
+            return await asyncio.to_thread(self._load_module_documents, module_id)
+        except Exception as e:
+            logger.warning(f"Failed to get module documents for {module_id}: {e}")
 
-                doc_ids = []
-                for record in result:
-                    doc_ids.append(record["id"])
+        return "", {}
 
-                # Module name - use module_id as fallback
-                module_name = module_id
+    def _load_module_documents(self, module_id: str) -> tuple[str, Dict[str, str]]:
+        """Blocking Neo4j read behind _get_module_documents."""
+        with self._neo4j_driver.session() as session:
+            result = session.run(
+                DOCUMENT_FINGERPRINTS_QUERY,
+                {"module_id": module_id},
+            )
+
+            fingerprints = {}
+            for record in result:
+                fingerprints[record["id"]] = document_fingerprint(record)
+
+        # Module name - use module_id as fallback
+        module_name = module_id
 
-                return module_name, doc_ids
+        return module_name, fingerprints
 
+    # ========================================================================
+    # MODULE SUMMARY MANIFEST
+    # ========================================================================
+
+    def _load_manifest(
+        self, module_id: str, length: SummaryLength
+    ) -> Optional[Dict[str, Any]]:
+        """Stored summary manifest of a module, or None."""
+        cache = self._get_cache()
+        if cache is None:
+            return None
+        try:
+            return cache.get(manifest_key(module_id, length.value))
         except Exception as e:
-            logger.warning(f"Failed to get module documents for {module_id}: {e}")
+            logger.debug(f"Manifest read failed for {module_id}: {e}")
+            return None
 
-        return "", []
+    def _save_manifest(
+        self, module_id: str, length: SummaryLength, manifest: Dict[str, Any]
+    ) -> None:
+        """Store the summary manifest of a module."""
+        cache = self._get_cache()
+        if cache is None:
+            return
+        try:
+            cache.set(manifest_key(module_id, length.value), manifest, ttl=MANIFEST_TTL_SECONDS)
+        except Exception as e:
+            logger.debug(f"Manifest write failed for {module_id}: {e}")
+
+    def _manifest_entry(self, summary: DocumentSummary, fingerprint: str) -> Dict[str, Any]:
+        """Manifest entry for a document summary."""
+        return {
+            # Fallback summaries get no fingerprint, so the next run retries them
+            "fingerprint": "" if summary.summary.startswith(FALLBACK_SUMMARY_PREFIX) else fingerprint,
+            # Cache keys end with the content hash (see _generate_cache_key)
+            "content_hash": summary.cache_key.rsplit(":", 1)[-1] if summary.cache_key else "",
+            "summary_hash": self._compute_content_hash(summary.summary),
+            "title": summary.document_title,
+            "entities": summary.key_entities,
+        }
+
+    def _module_cache_key(
+        self,
+        module_id: str,
+        length: SummaryLength,
+        entries: Dict[str, Dict[str, Any]],
+    ) -> str:
+        """Module summary cache key from the summary hashes of its documents."""
+        summary_hashes = ",".join(entry["summary_hash"] for entry in entries.values())
+        return self._generate_cache_key(
+            CACHE_PREFIX_MODULE,
+            module_id,
+            length,
+            self._compute_content_hash(summary_hashes),
+        )
+
+    def _write_manifest(
+        self,
+        module_id: str,
+        length: SummaryLength,
+        entries: Dict[str, Dict[str, Any]],
+        summary: Dict[str, Any],
+        graph_version: Optional[int],
+        delta_count: int,
+    ) -> None:
+        """Record which document summaries a module summary was built from."""
+        # A retried fallback must not be skipped by the graph-version check
+        if any(not entry["fingerprint"] for entry in entries.values()):
+            graph_version = None
+        self._save_manifest(
+            module_id,
+            length,
+            {
+                "graph_version": graph_version,
+                "documents": entries,
+                "summary": summary,
+                "delta_count": delta_count,
+            },
+        )
+
+    async def _module_summary_from_manifest(
+        self,
+        manifest: Dict[str, Any],
+        include_document_summaries: bool,
+        regenerate_missing: bool = True,
+    ) -> ModuleSummary:
+        """Stored module summary, with document summaries if requested."""
+        result = ModuleSummary(**manifest["summary"])
+        if include_document_summaries:
+            result.document_summaries = await self._manifest_document_summaries(
+                manifest["documents"], regenerate_missing
+            )
+        return result
+
+    async def _manifest_document_summaries(
+        self,
+        entries: Dict[str, Dict[str, Any]],
+        regenerate_missing: bool = True,
+    ) -> List[DocumentSummary]:
+        """
+        Document summaries named by manifest entries.
+
+        Cached summaries are read in one worker-thread pass. Missing ones are
+        regenerated, or left out when regenerate_missing is False.
+        """
+        summaries = await asyncio.to_thread(self._peek_document_summaries, entries)
+        if regenerate_missing:
+            missing = [doc_id for doc_id in entries if doc_id not in summaries]
+            for summary in await self._summarize_documents(missing):
+                summaries[summary.document_id] = summary
+        return [summaries[doc_id] for doc_id in entries if doc_id in summaries]
+
+    def _peek_document_summaries(
+        self,
+        entries: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, DocumentSummary]:
+        """Cached brief summaries for manifest entries, keyed by document ID."""
+        summaries: Dict[str, DocumentSummary] = {}
+        for doc_id, entry in entries.items():
+            if not entry["content_hash"]:
+                continue
+            cache_key = self._generate_cache_key(
+                CACHE_PREFIX_DOCUMENT, doc_id, SummaryLength.BRIEF, entry["content_hash"]
+            )
+            cached = self._summaries.peek(cache_key)
+            if cached is not None:
+                summaries[doc_id] = DocumentSummary(**cached)
+        return summaries
 
     def _parse_summary_response(
         self,
@@ -666,21 +877,7 @@ class SummaryService:
             content_hash,
         )
 
-        # Check cache unless force regenerate
-        if not force_regenerate:
-            cached = await self._get_cached_summary(cache_key)
-            if cached:
-                return DocumentSummary(**cached)
-
-        # Get model
-        model = self._get_model()
-        if model is None:
-            logger.warning("Vertex AI not available, returning fallback summary")
-            return self._build_fallback_document_summary(
-                document_id, title, content, entities, length, cache_key
-            )
-
-        # Build and execute prompt
+        # Build prompt
         word_count = self._get_word_count(length)
         entities_str = ", ".join(entities[:20]) if entities else "None identified"
 
@@ -691,19 +888,26 @@ class SummaryService:
             word_count=word_count,
         )
 
-        try:
-            response = generate_content(
-                model,
-                prompt,
-                generation_config=GenerationConfig(
-                    temperature=0.2,
-                    max_output_tokens=4096,
-                ),
-            )
-            response_text = response.text
+        async def generate() -> Optional[Dict[str, Any]]:
+            model = self._get_model()
+            if model is None:
+                logger.warning("Vertex AI not available, returning fallback summary")
+                return None
 
-            # Parse response
-            parsed = self._parse_summary_response(response_text)
+            try:
+                response = await asyncio.to_thread(
+                    generate_content,
+                    model,
+                    prompt,
+                    generation_config=GenerationConfig(
+                        temperature=0.2,
+                        max_output_tokens=4096,
+                    ),
+                )
+                parsed = self._parse_summary_response(response.text)
+            except Exception as e:
+                logger.error(f"LLM summarization failed for {document_id}: {e}")
+                return None
 
             summary = DocumentSummary(
                 document_id=document_id,
@@ -714,21 +918,21 @@ class SummaryService:
                 word_count=len(parsed["summary"].split()),
                 cache_key=cache_key,
             )
-
-            # Cache the result
-            self._cache_summary(cache_key, summary.model_dump())
-
             logger.info(
                 f"Document summary generated: {document_id}, words={summary.word_count}"
             )
+            return summary.model_dump()
 
-            return summary
-
-        except Exception as e:
-            logger.error(f"LLM summarization failed for {document_id}: {e}")
+        # Cached, or generated once across concurrent requests and workers;
+        # fallbacks (None) are never cached
+        data = await self._summaries.get_or_compute(
+            cache_key, generate, force=force_regenerate
+        )
+        if data is None:
             return self._build_fallback_document_summary(
                 document_id, title, content, entities, length, cache_key
             )
+        return DocumentSummary(**data)
 
     def _build_fallback_document_summary(
         self,
@@ -751,7 +955,7 @@ class SummaryService:
         return DocumentSummary(
             document_id=document_id,
             document_title=title,
-            summary=f"[Auto-extracted] {summary}",
+            summary=f"{FALLBACK_SUMMARY_PREFIX} {summary}",
             key_entities=entities[:5],
             key_concepts=[],
             word_count=len(summary.split()),
@@ -768,8 +972,16 @@ class SummaryService:
         """
         Generate or retrieve a cached summary for a module.
 
-        Aggregates summaries from all documents in the module and
-        synthesizes a cohesive module-level overview.
+        Summarizes the module's documents concurrently (map), condenses
+        their summaries in token-budgeted groups until they fit one prompt
+        (reduce), and synthesizes a cohesive module-level overview. Document
+        and section summaries are cached as they complete, so a retry
+        resumes where a failed run stopped.
+
+        A manifest of the document summaries behind the stored summary makes
+        repeat calls cheap: an unchanged module graph returns it directly,
+        and when only a few documents changed the previous overview is
+        revised from their new summaries (delta synthesis).
 
         Args:
             module_id: Module ID to summarize.
@@ -782,10 +994,23 @@ class SummaryService:
         """
         logger.info(f"Summarizing module {module_id} (length={length.value})")
 
+        manifest = (
+            None if force_regenerate
+            else await asyncio.to_thread(self._load_manifest, module_id, length)
+        )
+        graph_version = await asyncio.to_thread(get_module_version, module_id)
+
+        # Nothing in the module was written since the stored summary
+        if is_manifest_current(manifest, graph_version):
+            logger.info(f"Module summary for {module_id} is current")
+            return await self._module_summary_from_manifest(
+                manifest, include_document_summaries
+            )
+
         # Get module documents
-        module_name, doc_ids = await self._get_module_documents(module_id)
+        module_name, fingerprints = await self._get_module_documents(module_id)
 
-        if not doc_ids:
+        if not fingerprints:
             logger.warning(f"No documents found for module {module_id}")
             return ModuleSummary(
                 module_id=module_id,
@@ -797,117 +1022,105 @@ class SummaryService:
                 entity_frequency={},
             )
 
-        # Generate individual document summaries
-        doc_summaries = []
-        entity_freq: Dict[str, int] = {}
-
-        for doc_id in doc_ids:
-            doc_summary = await self.summarize_document(
-                document_id=doc_id,
-                length=SummaryLength.BRIEF,  # Use brief for components
-                force_regenerate=force_regenerate,
-            )
-            doc_summaries.append(doc_summary)
-
-            # Track entity frequencies
-            for entity in doc_summary.key_entities:
-                entity_freq[entity] = entity_freq.get(entity, 0) + 1
-
-        # Sort entities by frequency
-        sorted_entities = sorted(
-            entity_freq.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )
-
-        # Generate cache key using all doc summaries
-        combined_content = "".join([ds.summary for ds in doc_summaries])
-        content_hash = self._compute_content_hash(combined_content)
-        cache_key = self._generate_cache_key(
-            CACHE_PREFIX_MODULE,
-            module_id,
-            length,
-            content_hash,
+        changed, removed = diff_documents(
+            manifest["documents"] if manifest else {}, fingerprints
         )
+        if manifest and manifest.get("summary") and not changed and not removed:
+            # Graph writes that did not touch any document (e.g. entity cleanup)
+            self._write_manifest(
+                module_id, length, manifest["documents"], manifest["summary"],
+                graph_version, delta_count=manifest.get("delta_count", 0),
+            )
+            return await self._module_summary_from_manifest(
+                manifest, include_document_summaries
+            )
 
-        # Check cache unless force regenerate
-        if not force_regenerate:
-            cached = await self._get_cached_summary(cache_key)
-            if cached:
-                # Update with fresh doc_summaries if requested
-                result = ModuleSummary(**cached)
-                if include_document_summaries:
-                    result.document_summaries = doc_summaries
-                return result
-
-        # Synthesize module overview
-        model = self._get_model()
-        if model is None:
-            logger.warning("Vertex AI not available, returning aggregated summary")
-            return self._build_fallback_module_summary(
+        if use_delta_synthesis(manifest, len(changed) + len(removed), len(fingerprints)):
+            result = await self._revise_module_summary(
                 module_id,
                 module_name,
-                doc_summaries,
-                sorted_entities,
                 length,
+                manifest,
+                fingerprints,
+                changed,
+                removed,
+                graph_version,
                 include_document_summaries,
             )
+            if result is not None:
+                return result
+
+        # Generate individual document summaries (map)
+        doc_summaries = await self._summarize_documents(list(fingerprints), force_regenerate)
+        entries = {
+            ds.document_id: self._manifest_entry(ds, fingerprints[ds.document_id])
+            for ds in doc_summaries
+        }
+
+        # Sort entities by frequency
+        sorted_entities = entity_frequency(entries.values())
+
+        # Cache key from the summaries the synthesis is built on
+        cache_key = self._module_cache_key(module_id, length, entries)
 
-        # Build synthesis prompt
-        word_count = self._get_word_count(length)
-        doc_summaries_text = "\n\n".join(
-            [f"- {ds.document_title}: {ds.summary}" for ds in doc_summaries]
-        )
         entity_freq_text = ", ".join(
             [f"{e[0]} ({e[1]}x)" for e in sorted_entities[:15]]
         )
 
-        prompt = MODULE_SYNTHESIS_PROMPT_TEMPLATE.format(
-            module_name=module_name,
-            document_summaries=doc_summaries_text,
-            entity_frequencies=entity_freq_text,
-            length=length.value,
-            word_count=word_count,
-        )
-
-        try:
-            response = generate_content(
-                model,
-                prompt,
-                generation_config=GenerationConfig(
-                    temperature=0.2,
-                    max_output_tokens=4096,
-                ),
-            )
-            response_text = response.text
+        async def synthesize() -> Optional[Dict[str, Any]]:
+            model = self._get_model()
+            if model is None:
+                logger.warning("Vertex AI not available, returning aggregated summary")
+                return None
 
-            # Parse response
-            parsed = self._parse_module_response(response_text)
+            try:
+                # Reduce document summaries until they fit one prompt
+                sections = await self._reduce_summaries(
+                    module_id,
+                    module_name,
+                    [f"- {ds.document_title}: {ds.summary}" for ds in doc_summaries],
+                    force_regenerate,
+                )
+                prompt = MODULE_SYNTHESIS_PROMPT_TEMPLATE.format(
+                    module_name=module_name,
+                    document_summaries="\n\n".join(sections),
+                    entity_frequencies=entity_freq_text,
+                    length=length.value,
+                    word_count=self._get_word_count(length),
+                )
+                response = await asyncio.to_thread(
+                    generate_content,
+                    model,
+                    prompt,
+                    generation_config=GenerationConfig(
+                        temperature=0.2,
+                        max_output_tokens=4096,
+                    ),
+                )
+                parsed = self._parse_module_response(response.text)
+            except Exception as e:
+                logger.error(f"LLM module synthesis failed for {module_id}: {e}")
+                return None
 
             module_summary = ModuleSummary(
                 module_id=module_id,
                 module_name=module_name,
                 summary=parsed["overview"],
                 document_count=len(doc_summaries),
-                document_summaries=doc_summaries if include_document_summaries else [],
+                document_summaries=[],  # Don't cache these
                 key_themes=parsed["key_themes"],
                 entity_frequency=dict(sorted_entities[:20]),
             )
-
-            # Cache the result (without doc_summaries to save space)
-            cache_data = module_summary.model_dump()
-            cache_data["document_summaries"] = []  # Don't cache these
-            self._cache_summary(cache_key, cache_data)
-
             logger.info(
                 f"Module summary generated: {module_id}, "
                 f"docs={module_summary.document_count}"
             )
+            return module_summary.model_dump()
 
-            return module_summary
-
-        except Exception as e:
-            logger.error(f"LLM module synthesis failed for {module_id}: {e}")
+        data = await self._summaries.get_or_compute(
+            cache_key, synthesize, force=force_regenerate
+        )
+        if data is None:
             return self._build_fallback_module_summary(
                 module_id,
                 module_name,
@@ -916,6 +1129,243 @@ class SummaryService:
                 length,
                 include_document_summaries,
             )
+        self._write_manifest(module_id, length, entries, data, graph_version, delta_count=0)
+
+        # Attach fresh doc_summaries if requested
+        result = ModuleSummary(**data)
+        if include_document_summaries:
+            result.document_summaries = doc_summaries
+        return result
+
+    async def _revise_module_summary(
+        self,
+        module_id: str,
+        module_name: str,
+        length: SummaryLength,
+        manifest: Dict[str, Any],
+        fingerprints: Dict[str, str],
+        changed: List[str],
+        removed: List[str],
+        graph_version: Optional[int],
+        include_document_summaries: bool,
+    ) -> Optional[ModuleSummary]:
+        """
+        Update a stored module summary from the documents that changed.
+
+        Only changed and new documents are summarized; the previous overview
+        is revised from their summaries and the titles of removed documents.
+
+        Args:
+            module_id: Module being summarized.
+            module_name: Module name for the prompt.
+            length: Summary length.
+            manifest: Stored manifest with the previous summary.
+            fingerprints: Current fingerprints by document ID, in module order.
+            changed: Changed or new document IDs.
+            removed: Document IDs no longer in the module.
+            graph_version: Module graph version read before the fingerprints.
+            include_document_summaries: Include individual doc summaries.
+
+        Returns:
+            Revised ModuleSummary, or None to fall back to a full synthesis.
+        """
+        previous = manifest["documents"]
+        changed_summaries = await self._summarize_documents(changed)
+        updated = {
+            ds.document_id: self._manifest_entry(ds, fingerprints[ds.document_id])
+            for ds in changed_summaries
+        }
+        entries = {
+            doc_id: updated.get(doc_id) or previous[doc_id] for doc_id in fingerprints
+        }
+
+        # Reprocessed documents often summarize to the same text. Fallback
+        # summaries are raw excerpts and stay out of the overview; their
+        # entries have no fingerprint, so the next run retries them
+        revised = [
+            ds for ds in changed_summaries
+            if not ds.summary.startswith(FALLBACK_SUMMARY_PREFIX)
+            and previous.get(ds.document_id, {}).get("summary_hash")
+            != updated[ds.document_id]["summary_hash"]
+        ]
+        if not revised and not removed:
+            logger.info(f"Module summary for {module_id} unaffected by document changes")
+            self._write_manifest(
+                module_id, length, entries, manifest["summary"], graph_version,
+                delta_count=manifest.get("delta_count", 0),
+            )
+            return await self._module_summary_from_manifest(
+                {"summary": manifest["summary"], "documents": entries},
+                include_document_summaries,
+            )
+
+        sorted_entities = entity_frequency(entries.values())
+        cache_key = self._module_cache_key(module_id, length, entries)
+        previous_summary = ModuleSummary(**manifest["summary"])
+
+        async def revise() -> Optional[Dict[str, Any]]:
+            model = self._get_model()
+            if model is None:
+                return None
+
+            prompt = MODULE_DELTA_PROMPT_TEMPLATE.format(
+                module_name=module_name,
+                previous_overview=previous_summary.summary,
+                previous_themes="\n".join(f"- {t}" for t in previous_summary.key_themes),
+                changed_summaries="\n\n".join(
+                    f"- {ds.document_title}: {ds.summary}" for ds in revised
+                ) or "None",
+                removed_documents="\n".join(
+                    f"- {previous[doc_id].get('title') or doc_id}" for doc_id in removed
+                ) or "None",
+                entity_frequencies=", ".join(
+                    f"{e[0]} ({e[1]}x)" for e in sorted_entities[:15]
+                ),
+                length=length.value,
+                word_count=self._get_word_count(length),
+            )
+            try:
+                response = await asyncio.to_thread(
+                    generate_content,
+                    model,
+                    prompt,
+                    generation_config=GenerationConfig(
+                        temperature=0.2,
+                        max_output_tokens=4096,
+                    ),
+                )
+                parsed = self._parse_module_response(response.text)
+            except Exception as e:
+                logger.error(f"LLM module revision failed for {module_id}: {e}")
+                return None
+
+            module_summary = ModuleSummary(
+                module_id=module_id,
+                module_name=module_name,
+                summary=parsed["overview"] or previous_summary.summary,
+                document_count=len(entries),
+                document_summaries=[],  # Don't cache these
+                key_themes=parsed["key_themes"] or previous_summary.key_themes,
+                entity_frequency=dict(sorted_entities[:20]),
+            )
+            logger.info(
+                f"Module summary revised: {module_id}, changed={len(revised)}, "
+                f"removed={len(removed)}"
+            )
+            return module_summary.model_dump()
+
+        data = await self._summaries.get_or_compute(cache_key, revise)
+        if data is None:
+            return None
+        self._write_manifest(
+            module_id, length, entries, data, graph_version,
+            delta_count=manifest.get("delta_count", 0) + 1,
+        )
+
+        result = ModuleSummary(**data)
+        if include_document_summaries:
+            result.document_summaries = await self._manifest_document_summaries(entries)
+        return result
+
+    async def _summarize_documents(
+        self,
+        doc_ids: List[str],
+        force_regenerate: bool = False,
+    ) -> List[DocumentSummary]:
+        """
+        Brief summaries of documents, SUMMARY_MAP_CONCURRENCY at a time.
+
+        Each summary is cached as soon as it completes, so a module summary
+        that fails part-way resumes from the documents already done.
+        """
+        return await bounded_gather(
+            [
+                lambda doc_id=doc_id: self.summarize_document(
+                    document_id=doc_id,
+                    length=SummaryLength.BRIEF,  # Use brief for components
+                    force_regenerate=force_regenerate,
+                )
+                for doc_id in doc_ids
+            ],
+            limit=SUMMARY_MAP_CONCURRENCY,
+        )
+
+    async def _reduce_summaries(
+        self,
+        module_id: str,
+        module_name: str,
+        summaries: List[str],
+        force_regenerate: bool = False,
+    ) -> List[str]:
+        """
+        Combine summary lines in groups until they fit one synthesis prompt.
+
+        Groups are sized by SUMMARY_REDUCE_TOKEN_BUDGET. Each section summary
+        is cached under the hash of its inputs, so retries reuse finished
+        sections.
+
+        Args:
+            module_id: Module being summarized (cache key namespace)
+            module_name: Module name for the section prompt
+            summaries: "- title: summary" lines in document order
+            force_regenerate: Regenerate cached sections
+
+        Returns:
+            Summary lines whose total fits the token budget
+        """
+        word_count = self._get_word_count(SummaryLength.STANDARD)
+
+        async def combine(level: int, index: int, group: List[str]) -> str:
+            group_text = "\n\n".join(group)
+            cache_key = self._generate_cache_key(
+                CACHE_PREFIX_SECTION,
+                module_id,
+                SummaryLength.STANDARD,
+                self._compute_content_hash(group_text),
+            )
+            prompt = SECTION_SYNTHESIS_PROMPT_TEMPLATE.format(
+                module_name=module_name,
+                document_summaries=group_text,
+                word_count=word_count,
+            )
+
+            async def generate() -> Optional[str]:
+                try:
+                    response = await asyncio.to_thread(
+                        generate_content,
+                        self._get_model(),
+                        prompt,
+                        generation_config=GenerationConfig(
+                            temperature=0.2,
+                            max_output_tokens=2048,
+                        ),
+                    )
+                    return self._parse_summary_response(response.text)["summary"] or None
+                except Exception as e:
+                    logger.error(
+                        f"Section synthesis failed for {module_id} "
+                        f"(level {level}, group {index}): {e}"
+                    )
+                    return None
+
+            summary = await self._summaries.get_or_compute(
+                cache_key, generate, force=force_regenerate
+            )
+            if summary is None:
+                # Extractive fallback keeps the tree shrinking
+                per_item = max(1, word_count // len(group))
+                summary = " ".join(
+                    " ".join(item.split()[:per_item]) + "..." for item in group
+                )
+            return f"- Section {level}.{index + 1}: {summary}"
+
+        return await reduce_by_token_budget(
+            summaries,
+            combine,
+            SUMMARY_REDUCE_TOKEN_BUDGET,
+            count_tokens,
+            concurrency=SUMMARY_MAP_CONCURRENCY,
+        )
 
     def _build_fallback_module_summary(
         self,
@@ -976,34 +1426,22 @@ class SummaryService:
             return "Unable to retrieve chunk content."
 
         try:
-            with self._neo4j_driver.session() as session:
-                result = session.run(
-                    """
-                    MATCH (c:Chunk)
-                    WHERE c.id IN $chunk_ids
-                    RETURN c.text as text
-                    ORDER BY c.id
-                    """,
-                    {"chunk_ids": chunk_ids},
-                )
-
-                chunks = [record["text"] for record in result if record["text"]]
-
-                if not chunks:
-                    return ""
+            chunks = await asyncio.to_thread(self._load_chunk_texts, chunk_ids)
+            if not chunks:
+                return ""
 
-                content = "\n\n".join(chunks)
-
-                # Use LLM if available
-                model = self._get_model()
-                if model is None:
-                    # Fallback: return truncated content
-                    word_count = self._get_word_count(length)
-                    words = content.split()[:word_count]
-                    return " ".join(words)
+            content = "\n\n".join(chunks)
 
+            # Use LLM if available
+            model = self._get_model()
+            if model is None:
+                # Fallback: return truncated content
                 word_count = self._get_word_count(length)
-                prompt = f"""Summarize the following content in approximately {word_count} words:
+                words = content.split()[:word_count]
+                return " ".join(words)
+
+            word_count = self._get_word_count(length)
+            prompt = f"""Summarize the following content in approximately {word_count} words:
 
 {content[:5000]}
 
@@ -1011,20 +1449,35 @@ class SummaryService:
 
 Provide a concise, coherent summary:"""
 
-                response = generate_content(
-                    model,
-                    prompt,
-                    generation_config=GenerationConfig(
-                        temperature=0.2,
-                        max_output_tokens=2048,
-                    ),
-                )
-                return response.text.strip()
+            response = await asyncio.to_thread(
+                generate_content,
+                model,
+                prompt,
+                generation_config=GenerationConfig(
+                    temperature=0.2,
+                    max_output_tokens=2048,
+                ),
+            )
+            return response.text.strip()
 
         except Exception as e:
             logger.error(f"Chunk summarization failed: {e}")
             return ""
 
+    def _load_chunk_texts(self, chunk_ids: List[str]) -> List[str]:
+        """Blocking Neo4j read behind summarize_chunks."""
+        with self._neo4j_driver.session() as session:
+            result = session.run(
+                """
+                MATCH (c:Chunk)
+                WHERE c.id IN $chunk_ids
+                RETURN c.text as text
+                ORDER BY c.id
+                """,
+                {"chunk_ids": chunk_ids},
+            )
+            return [record["text"] for record in result if record["text"]]
+
 
 # ============================================================================
 # FACTORY FUNCTION
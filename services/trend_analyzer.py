@@ -14,6 +14,10 @@ ROLE IN PROJECT:
     - Key responsibility 1: Track concept frequency and emergence patterns
     - Key responsibility 2: Analyze knowledge evolution across modules and time periods
 
+    Results are cached through api/single_flight.SingleFlightCache: one
+    request per key runs the Cypher (in a worker thread), and expired
+    results are served stale for up to an hour while they refresh.
+
 KEY COMPONENTS:
     - TrendAnalyzer: Main analyzer class with caching support
     - analyze_concept_trends: Track concept frequency changes over time
@@ -22,7 +26,7 @@ KEY COMPONENTS:
 
 DEPENDENCIES:
     - External: pydantic, neo4j, redis
-    - Internal: api/graph_manager, api/neo4j_config, api/cache
+    - Internal: api/concept_rollups, api/single_flight, api/neo4j_config, api/cache
 
 USAGE:
     from services.trend_analyzer import TrendAnalyzer
@@ -33,14 +37,50 @@ USAGE:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+try:
+    from api.concept_rollups import (
+        CONCEPT_EMERGING_QUERY,
+        CONCEPT_EVOLUTION_QUERY,
+        CONCEPT_FREQUENCY_QUERY,
+        CONCEPT_RELATED_QUERY,
+        CONCEPT_TRENDING_QUERY,
+        day_bounds,
+        normalize_concept_name,
+    )
+    from api.concept_overlap import (
+        CONCEPT_MEMBERSHIP_QUERY,
+        MAX_MODULES_FOR_OVERLAP,
+        SHARED_DEFINITIONS_QUERY,
+        compute_concept_overlap,
+    )
+    from api.single_flight import SingleFlightCache
+except ImportError:
+    from concept_rollups import (  # type: ignore[import-not-found]
+        CONCEPT_EMERGING_QUERY,
+        CONCEPT_EVOLUTION_QUERY,
+        CONCEPT_FREQUENCY_QUERY,
+        CONCEPT_RELATED_QUERY,
+        CONCEPT_TRENDING_QUERY,
+        day_bounds,
+        normalize_concept_name,
+    )
+    from concept_overlap import (  # type: ignore[import-not-found]
+        CONCEPT_MEMBERSHIP_QUERY,
+        MAX_MODULES_FOR_OVERLAP,
+        SHARED_DEFINITIONS_QUERY,
+        compute_concept_overlap,
+    )
+    from single_flight import SingleFlightCache  # type: ignore[import-not-found]
+
 
 # ============================================================================
 # LOGGING
@@ -55,6 +95,7 @@ logger = logging.getLogger(__name__)
 
 # Cache configuration for trend analysis
 CACHE_TTL_SECONDS = 6 * 60 * 60  # 6 hours (shorter than summaries due to dynamic data)
+CACHE_STALE_SECONDS = 60 * 60  # Served while a background refresh runs
 CACHE_PREFIX_FREQUENCY = "trend:freq"
 CACHE_PREFIX_TRENDING = "trend:trending"
 CACHE_PREFIX_EMERGING = "trend:emerging"
@@ -66,7 +107,6 @@ CACHE_PREFIX_COMPARISON = "trend:compare"
 DEFAULT_CONCEPT_LIMIT = 100
 DEFAULT_TRENDING_LIMIT = 20
 DEFAULT_EMERGING_LIMIT = 20
-MAX_MODULES_FOR_OVERLAP = 10
 
 
 # ============================================================================
@@ -267,6 +307,12 @@ class TrendAnalyzer:
         """
         self._neo4j_driver = neo4j_driver
         self._cache = cache_client
+        self._results = SingleFlightCache(
+            "trends",
+            self._get_cache,
+            ttl=CACHE_TTL_SECONDS,
+            stale_ttl=CACHE_STALE_SECONDS,
+        )
         logger.info("TrendAnalyzer initialized")
 
     def _get_driver(self):
@@ -310,33 +356,26 @@ class TrendAnalyzer:
         content_hash = hashlib.md5(key_content.encode("utf-8")).hexdigest()[:12]
         return f"{prefix}:{content_hash}"
 
-    async def _get_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Retrieve cached result if available."""
-        cache = self._get_cache()
-        if cache is None:
-            return None
-        try:
-            data = cache.get(cache_key)
-            return data if isinstance(data, dict) else None
-        except Exception as e:
-            logger.debug(f"Cache get failed: {e}")
-            return None
+    async def _cached(
+        self, cache_key: str, load: Callable[[Any], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Cached result of load(driver), computed off the event loop.
 
-    def _set_cached(
-        self,
-        cache_key: str,
-        data: Dict[str, Any],
-        ttl: int = CACHE_TTL_SECONDS,
-    ) -> bool:
-        """Store result in cache."""
-        cache = self._get_cache()
-        if cache is None:
-            return False
-        try:
-            return cache.set(cache_key, data, ttl=ttl)
-        except Exception as e:
-            logger.debug(f"Cache set failed: {e}")
-            return False
+        Concurrent misses share one computation across requests and workers,
+        and stale entries are served while a background refresh runs.
+
+        Raises:
+            RuntimeError: If Neo4j is unavailable and nothing is cached
+        """
+
+        async def compute() -> Dict[str, Any]:
+            driver = self._get_driver()
+            if driver is None:
+                raise RuntimeError("Neo4j driver not available")
+            return await asyncio.to_thread(load, driver)
+
+        return await self._results.get_or_compute(cache_key, compute)
 
     # ========================================================================
     # CONCEPT FREQUENCY
@@ -363,58 +402,27 @@ class TrendAnalyzer:
             f"Getting concept frequency: modules={module_ids}, types={entity_types}"
         )
 
-        # Check cache
         cache_key = self._generate_cache_key(
             CACHE_PREFIX_FREQUENCY,
             str(module_ids),
             str(entity_types),
             limit,
         )
-        cached = await self._get_cached(cache_key)
-        if cached:
-            return ConceptFrequency(**cached)
-
-        driver = self._get_driver()
-        if driver is None:
-            logger.warning("Neo4j driver not available for concept frequency")
-            return ConceptFrequency(
-                concepts=[],
-                total_concepts=0,
-                by_type={},
-                by_module={},
-            )
 
-        try:
-            # Build Cypher query with filters
-            where_clauses = ["(e:Topic OR e:Concept OR e:Methodology OR e:Finding)"]
-            params: Dict[str, Any] = {"limit": limit}
-
-            if module_ids:
-                where_clauses.append("e.module_id IN $module_ids")
-                params["module_ids"] = module_ids
-
-            if entity_types:
-                type_conditions = " OR ".join([f"e:{t}" for t in entity_types])
-                where_clauses.append(f"({type_conditions})")
-
-            where_clause = " AND ".join(where_clauses)
-
-            cypher = f"""
-            MATCH (e)
-            WHERE {where_clause}
-            WITH e.name as name, labels(e)[0] as type,
-                 count(*) as count, collect(DISTINCT e.module_id) as modules
-            RETURN name, type, count, modules
-            ORDER BY count DESC
-            LIMIT $limit
-            """
+        def load(driver) -> Dict[str, Any]:
+            # Summed from materialized (module, name, type, day) rollups
+            params: Dict[str, Any] = {
+                "module_ids": module_ids or None,
+                "entity_types": entity_types or None,
+                "limit": limit,
+            }
 
             concepts = []
             by_type: Dict[str, int] = {}
             by_module: Dict[str, int] = {}
 
             with driver.session() as session:
-                result = session.run(cypher, params)
+                result = session.run(CONCEPT_FREQUENCY_QUERY, params)
                 for record in result:
                     concept = {
                         "name": record["name"],
@@ -440,12 +448,10 @@ class TrendAnalyzer:
                 by_module=by_module,
             )
 
-            # Cache result
-            self._set_cached(cache_key, frequency.model_dump())
-
-            logger.info(f"Concept frequency: found {len(concepts)} concepts")
-            return frequency
+            return frequency.model_dump()
 
+        try:
+            data = await self._cached(cache_key, load)
         except Exception as e:
             logger.error(f"Concept frequency query failed: {e}")
             return ConceptFrequency(
@@ -455,6 +461,10 @@ class TrendAnalyzer:
                 by_module={},
             )
 
+        frequency = ConceptFrequency(**data)
+        logger.info(f"Concept frequency: found {frequency.total_concepts} concepts")
+        return frequency
+
     # ========================================================================
     # TRENDING CONCEPTS
     # ========================================================================
@@ -483,7 +493,6 @@ class TrendAnalyzer:
             f"Getting trending concepts: {time_range.start} to {time_range.end}"
         )
 
-        # Check cache
         cache_key = self._generate_cache_key(
             CACHE_PREFIX_TRENDING,
             time_range.start.isoformat(),
@@ -491,62 +500,25 @@ class TrendAnalyzer:
             min_growth_rate,
             limit,
         )
-        cached = await self._get_cached(cache_key)
-        if cached:
-            raw = cached.get("data", [])
-            return [TrendingConcept(**c) for c in raw]
-
-        driver = self._get_driver()
-        if driver is None:
-            logger.warning("Neo4j driver not available for trending concepts")
-            return []
 
-        try:
-            # Calculate previous period (same duration, immediately before)
+        def load(driver) -> Dict[str, Any]:
+            # Previous period has the same duration, immediately before;
+            # rollups are per day, so both periods are widened to whole days
             duration = time_range.end - time_range.start
-            previous_start = time_range.start - duration
-            previous_end = time_range.start
-
-            cypher = """
-            // Current period frequency
-            MATCH (e)
-            WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
-            AND e.created_at >= $current_start AND e.created_at < $current_end
-            WITH e.name as name, labels(e)[0] as type,
-                 count(*) as current_count,
-                 collect(DISTINCT e.module_id) as modules,
-                 min(e.created_at) as first_seen
-
-            // Previous period frequency
-            OPTIONAL MATCH (e2)
-            WHERE (e2:Topic OR e2:Concept OR e2:Methodology OR e2:Finding)
-            AND e2.name = name
-            AND e2.created_at >= $previous_start AND e2.created_at < $previous_end
-            WITH name, type, current_count, modules, first_seen,
-                 count(e2) as previous_count
-
-            WHERE previous_count > 0
-            WITH name, type, current_count, previous_count, modules, first_seen,
-                 toFloat(current_count - previous_count) / previous_count as growth_rate
-            WHERE growth_rate >= $min_growth_rate
-            RETURN name, type, current_count, previous_count, growth_rate,
-                   modules, first_seen
-            ORDER BY growth_rate DESC
-            LIMIT $limit
-            """
+            previous_start, _ = day_bounds(time_range.start - duration, time_range.start)
+            current_start, current_end = day_bounds(time_range.start, time_range.end)
 
             params = {
-                "current_start": time_range.start.isoformat(),
-                "current_end": time_range.end.isoformat(),
-                "previous_start": previous_start.isoformat(),
-                "previous_end": previous_end.isoformat(),
+                "current_start": current_start,
+                "current_end": current_end,
+                "previous_start": previous_start,
                 "min_growth_rate": min_growth_rate,
                 "limit": limit,
             }
 
             trending = []
             with driver.session() as session:
-                result = session.run(cypher, params)
+                result = session.run(CONCEPT_TRENDING_QUERY, params)
                 for record in result:
                     first_seen = record.get("first_seen")
                     if first_seen and isinstance(first_seen, str):
@@ -564,16 +536,18 @@ class TrendAnalyzer:
                         )
                     )
 
-            # Cache result
-            self._set_cached(cache_key, {"data": [t.model_dump() for t in trending]})
-
-            logger.info(f"Trending concepts: found {len(trending)} concepts")
-            return trending
+            return {"data": [t.model_dump() for t in trending]}
 
+        try:
+            data = await self._cached(cache_key, load)
         except Exception as e:
             logger.error(f"Trending concepts query failed: {e}")
             return []
 
+        trending = [TrendingConcept(**c) for c in data.get("data", [])]
+        logger.info(f"Trending concepts: found {len(trending)} concepts")
+        return trending
+
     # ========================================================================
     # EMERGING CONCEPTS
     # ========================================================================
@@ -597,100 +571,65 @@ class TrendAnalyzer:
         """
         logger.info(f"Getting emerging concepts since {since}")
 
-        # Check cache
         cache_key = self._generate_cache_key(
             CACHE_PREFIX_EMERGING,
             since.isoformat(),
             str(module_ids),
             limit,
         )
-        cached = await self._get_cached(cache_key)
-        if cached:
-            raw = cached.get("data", [])
-            return [EmergingConcept(**c) for c in raw]
-
-        driver = self._get_driver()
-        if driver is None:
-            logger.warning("Neo4j driver not available for emerging concepts")
-            return []
 
-        try:
-            # Build module filter
-            module_filter = ""
+        def load(driver) -> Dict[str, Any]:
+            # A concept is new if no rollup of its name predates the cutoff
+            # day; related concepts are fetched for the whole page at once
+            since_day, _ = day_bounds(since, since)
             params: Dict[str, Any] = {
-                "since": since.isoformat(),
+                "since": since_day,
+                "module_ids": module_ids or None,
                 "limit": limit,
             }
-            if module_ids:
-                module_filter = "AND e.module_id IN $module_ids"
-                params["module_ids"] = module_ids
-
-            cypher = f"""
-            // Find concepts first appearing after the given date
-            MATCH (e)
-            WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
-            AND e.created_at >= $since
-            {module_filter}
-            WITH e.name as name, labels(e)[0] as type,
-                 min(e.created_at) as first_seen,
-                 collect(e.module_id)[0] as module_id,
-                 collect(e.document_id)[0] as document_id,
-                 count(*) as mention_count
-
-            // Verify this is truly a new concept (not seen before)
-            OPTIONAL MATCH (older)
-            WHERE (older:Topic OR older:Concept OR older:Methodology OR older:Finding)
-            AND older.name = name
-            AND older.created_at < $since
-            WITH name, type, first_seen, module_id, document_id, mention_count,
-                 count(older) as older_count
-            WHERE older_count = 0
-
-            // Get related concepts
-            OPTIONAL MATCH (e2)-[r]-(related)
-            WHERE e2.name = name
-            AND (related:Topic OR related:Concept OR related:Methodology OR related:Finding)
-            WITH name, type, first_seen, module_id, document_id, mention_count,
-                 collect(DISTINCT related.name)[..5] as related_concepts
-
-            RETURN name, type, first_seen, module_id, document_id,
-                   mention_count, related_concepts
-            ORDER BY first_seen DESC
-            LIMIT $limit
-            """
 
-            emerging = []
             with driver.session() as session:
-                result = session.run(cypher, params)
-                for record in result:
-                    first_seen = record["first_seen"]
-                    if isinstance(first_seen, str):
-                        first_seen = datetime.fromisoformat(first_seen)
-                    elif first_seen is None:
-                        first_seen = since
-
-                    emerging.append(
-                        EmergingConcept(
-                            name=record["name"],
-                            type=record["type"],
-                            first_seen=first_seen,
-                            module_id=record["module_id"] or "",
-                            document_id=record.get("document_id"),
-                            mention_count=record["mention_count"],
-                            related_concepts=record["related_concepts"] or [],
-                        )
+                rows = [record.data() for record in session.run(CONCEPT_EMERGING_QUERY, params)]
+                related: Dict[str, List[str]] = {}
+                if rows:
+                    result = session.run(
+                        CONCEPT_RELATED_QUERY,
+                        {"names": [row["name_normalized"] for row in rows]},
                     )
+                    for record in result:
+                        related[record["name_normalized"]] = record["related_concepts"]
 
-            # Cache result
-            self._set_cached(cache_key, {"data": [e.model_dump() for e in emerging]})
+            emerging = []
+            for row in rows:
+                first_seen = row["first_seen"]
+                if isinstance(first_seen, str):
+                    first_seen = datetime.fromisoformat(first_seen)
+                elif first_seen is None:
+                    first_seen = since
+
+                emerging.append(
+                    EmergingConcept(
+                        name=row["name"],
+                        type=row["type"],
+                        first_seen=first_seen,
+                        module_id=row["module_id"] or "",
+                        mention_count=row["mention_count"],
+                        related_concepts=related.get(row["name_normalized"]) or [],
+                    )
+                )
 
-            logger.info(f"Emerging concepts: found {len(emerging)} concepts")
-            return emerging
+            return {"data": [e.model_dump() for e in emerging]}
 
+        try:
+            data = await self._cached(cache_key, load)
         except Exception as e:
             logger.error(f"Emerging concepts query failed: {e}")
             return []
 
+        emerging = [EmergingConcept(**c) for c in data.get("data", [])]
+        logger.info(f"Emerging concepts: found {len(emerging)} concepts")
+        return emerging
+
     # ========================================================================
     # CROSS-MODULE OVERLAP
     # ========================================================================
@@ -706,7 +645,7 @@ class TrendAnalyzer:
         and calculates Jaccard similarity matrix.
 
         Args:
-            module_ids: List of module IDs to analyze (2-10 modules)
+            module_ids: List of module IDs to analyze (at most MAX_MODULES_FOR_OVERLAP)
 
         Returns:
             CrossModuleAnalysis with overlap metrics
@@ -726,102 +665,55 @@ class TrendAnalyzer:
 
         logger.info(f"Analyzing cross-module overlap: {module_ids}")
 
-        # Check cache
         cache_key = self._generate_cache_key(
             CACHE_PREFIX_OVERLAP,
             ",".join(sorted(module_ids)),
         )
-        cached = await self._get_cached(cache_key)
-        if cached:
-            return CrossModuleAnalysis(**cached)
-
-        driver = self._get_driver()
-        if driver is None:
-            logger.warning("Neo4j driver not available for cross-module overlap")
-            return CrossModuleAnalysis(
-                modules=module_ids,
-                shared_concepts=[],
-                unique_concepts={},
-                overlap_matrix=[],
-                bridging_concepts=[],
-            )
-
-        try:
-            # Get concepts per module
-            concepts_by_module: Dict[str, set] = {m: set() for m in module_ids}
-            concept_details: Dict[str, Dict[str, Any]] = {}
-
-            cypher_concepts = """
-            MATCH (e)
-            WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
-            AND e.module_id IN $module_ids
-            RETURN e.name as name, labels(e)[0] as type,
-                   e.module_id as module_id, e.definition as definition
-            """
 
+        def load(driver) -> Dict[str, Any]:
+            # Distinct (module, concept) pairs from the concept rollups
             with driver.session() as session:
-                result = session.run(cypher_concepts, {"module_ids": module_ids})
-                for record in result:
-                    name = record["name"]
-                    module_id = record["module_id"]
-                    if module_id in concepts_by_module:
-                        concepts_by_module[module_id].add(name)
-                        if name not in concept_details:
-                            concept_details[name] = {
-                                "name": name,
-                                "type": record["type"],
-                                "definitions": {},
-                                "modules": [],
-                            }
-                        concept_details[name]["modules"].append(module_id)
-                        if record["definition"]:
-                            concept_details[name]["definitions"][module_id] = record[
-                                "definition"
-                            ]
-
-            # Calculate shared vs unique concepts
-            all_concepts = set()
-            for concepts in concepts_by_module.values():
-                all_concepts.update(concepts)
-
-            shared_concepts = []
-            unique_concepts: Dict[str, List[str]] = {m: [] for m in module_ids}
-            bridging_concepts = []
-
-            for name in all_concepts:
-                modules_with_concept = [
-                    m for m in module_ids if name in concepts_by_module[m]
+                rows = [
+                    record.data()
+                    for record in session.run(
+                        CONCEPT_MEMBERSHIP_QUERY, {"module_ids": module_ids}
+                    )
                 ]
-                if len(modules_with_concept) > 1:
-                    detail = concept_details.get(name, {})
-                    shared_concepts.append(
+            details = {row["name_normalized"]: row for row in rows}
+
+            overlap = compute_concept_overlap(module_ids, rows)
+
+            # Definitions are only reported for shared concepts
+            definitions: Dict[str, Dict[str, str]] = {}
+            if overlap.shared:
+                with driver.session() as session:
+                    result = session.run(
+                        SHARED_DEFINITIONS_QUERY,
                         {
-                            "name": name,
-                            "type": detail.get("type", "Unknown"),
-                            "modules": modules_with_concept,
-                            "definitions": detail.get("definitions", {}),
-                        }
+                            "names": [name for name, _ in overlap.shared],
+                            "module_ids": module_ids,
+                        },
                     )
-                    if len(modules_with_concept) >= len(module_ids) // 2:
-                        bridging_concepts.append(name)
-                elif len(modules_with_concept) == 1:
-                    unique_concepts[modules_with_concept[0]].append(name)
-
-            # Calculate Jaccard similarity matrix
-            overlap_matrix = []
-            for i, mod_a in enumerate(module_ids):
-                row = []
-                for j, mod_b in enumerate(module_ids):
-                    if i == j:
-                        row.append(1.0)
-                    else:
-                        set_a = concepts_by_module[mod_a]
-                        set_b = concepts_by_module[mod_b]
-                        intersection = len(set_a & set_b)
-                        union = len(set_a | set_b)
-                        similarity = intersection / union if union > 0 else 0.0
-                        row.append(round(similarity, 4))
-                overlap_matrix.append(row)
+                    for record in result:
+                        definitions.setdefault(record["name_normalized"], {})[
+                            record["module_id"]
+                        ] = record["definition"]
+
+            shared_concepts = [
+                {
+                    "name": details[name]["name"],
+                    "type": details[name]["type"] or "Unknown",
+                    "modules": modules,
+                    "definitions": definitions.get(name, {}),
+                }
+                for name, modules in overlap.shared
+            ]
+            unique_concepts = {
+                module_id: [details[name]["name"] for name in names]
+                for module_id, names in overlap.unique.items()
+            }
+            bridging_concepts = [details[name]["name"] for name in overlap.bridging]
+            overlap_matrix = overlap.jaccard
 
             analysis = CrossModuleAnalysis(
                 modules=module_ids,
@@ -831,15 +723,10 @@ class TrendAnalyzer:
                 bridging_concepts=bridging_concepts,
             )
 
-            # Cache result
-            self._set_cached(cache_key, analysis.model_dump())
-
-            logger.info(
-                f"Cross-module overlap: {len(shared_concepts)} shared, "
-                f"{len(bridging_concepts)} bridging concepts"
-            )
-            return analysis
+            return analysis.model_dump()
 
+        try:
+            data = await self._cached(cache_key, load)
         except Exception as e:
             logger.error(f"Cross-module overlap query failed: {e}")
             return CrossModuleAnalysis(
@@ -850,6 +737,13 @@ class TrendAnalyzer:
                 bridging_concepts=[],
             )
 
+        analysis = CrossModuleAnalysis(**data)
+        logger.info(
+            f"Cross-module overlap: {len(analysis.shared_concepts)} shared, "
+            f"{len(analysis.bridging_concepts)} bridging concepts"
+        )
+        return analysis
+
     # ========================================================================
     # CONCEPT EVOLUTION
     # ========================================================================
@@ -882,7 +776,6 @@ class TrendAnalyzer:
                 granularity="month",
             )
 
-        # Check cache
         cache_key = self._generate_cache_key(
             CACHE_PREFIX_EVOLUTION,
             concept_name,
@@ -890,34 +783,11 @@ class TrendAnalyzer:
             time_range.end.isoformat(),
             time_range.granularity,
         )
-        cached = await self._get_cached(cache_key)
-        if cached:
-            return ConceptEvolution(**cached)
-
-        driver = self._get_driver()
-        if driver is None:
-            logger.warning("Neo4j driver not available for concept evolution")
-            return ConceptEvolution(
-                concept_name=concept_name,
-                timeline=[],
-                related_concept_changes=[],
-                definition_changes=[],
-            )
-
-        try:
-            # Get concept occurrences over time
-            cypher_timeline = """
-            MATCH (e)
-            WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
-            AND toLower(e.name) = toLower($concept_name)
-            AND e.created_at >= $start AND e.created_at < $end
-            RETURN e.created_at as created_at, e.module_id as module_id,
-                   e.definition as definition, e.document_id as document_id
-            ORDER BY e.created_at
-            """
 
+        def load(driver) -> Dict[str, Any]:
+            # Concept occurrences over time, via the name_normalized index
             params = {
-                "concept_name": concept_name,
+                "name_normalized": normalize_concept_name(concept_name),
                 "start": time_range.start.isoformat(),
                 "end": time_range.end.isoformat(),
             }
@@ -926,7 +796,7 @@ class TrendAnalyzer:
             definitions_seen: Dict[str, datetime] = {}
 
             with driver.session() as session:
-                result = session.run(cypher_timeline, params)
+                result = session.run(CONCEPT_EVOLUTION_QUERY, params)
                 occurrences = list(result)
 
                 # Group by time period based on granularity
@@ -999,15 +869,10 @@ class TrendAnalyzer:
                 definition_changes=definition_changes,
             )
 
-            # Cache result
-            self._set_cached(cache_key, evolution.model_dump())
-
-            logger.info(
-                f"Concept evolution: {len(timeline)} periods, "
-                f"{len(definition_changes)} definition changes"
-            )
-            return evolution
+            return evolution.model_dump()
 
+        try:
+            data = await self._cached(cache_key, load)
         except Exception as e:
             logger.error(f"Concept evolution query failed: {e}")
             return ConceptEvolution(
@@ -1017,6 +882,13 @@ class TrendAnalyzer:
                 definition_changes=[],
             )
 
+        evolution = ConceptEvolution(**data)
+        logger.info(
+            f"Concept evolution: {len(evolution.timeline)} periods, "
+            f"{len(evolution.definition_changes)} definition changes"
+        )
+        return evolution
+
     # ========================================================================
     # MODULE COMPARISON
     # ========================================================================
@@ -1041,37 +913,20 @@ class TrendAnalyzer:
         """
         logger.info(f"Comparing modules: {module_id_a} vs {module_id_b}")
 
-        # Check cache
         cache_key = self._generate_cache_key(
             CACHE_PREFIX_COMPARISON,
             module_id_a,
             module_id_b,
         )
-        cached = await self._get_cached(cache_key)
-        if cached:
-            return ModuleComparison(**cached)
-
-        driver = self._get_driver()
-        if driver is None:
-            logger.warning("Neo4j driver not available for module comparison")
-            return ModuleComparison(
-                module_a=module_id_a,
-                module_b=module_id_b,
-                shared_concepts=[],
-                unique_to_a=[],
-                unique_to_b=[],
-                similarity_score=0.0,
-                concept_alignment=[],
-            )
 
-        try:
+        def load(driver) -> Dict[str, Any]:
             # Get concepts and definitions for each module
             cypher = """
-            MATCH (e)
+            MATCH (e:Entity)
             WHERE (e:Topic OR e:Concept OR e:Methodology OR e:Finding)
             AND e.module_id IN [$module_a, $module_b]
             RETURN e.name as name, e.module_id as module_id,
-                   e.definition as definition, labels(e)[0] as type
+                   e.definition as definition, [l IN labels(e) WHERE l <> 'Entity'][0] as type
             """
 
             concepts_a: Dict[str, str] = {}  # name -> definition
@@ -1128,14 +983,10 @@ class TrendAnalyzer:
                 concept_alignment=concept_alignment,
             )
 
-            # Cache result
-            self._set_cached(cache_key, comparison.model_dump())
-
-            logger.info(
-                f"Module comparison: {len(shared)} shared, similarity={similarity:.2%}"
-            )
-            return comparison
+            return comparison.model_dump()
 
+        try:
+            data = await self._cached(cache_key, load)
         except Exception as e:
             logger.error(f"Module comparison query failed: {e}")
             return ModuleComparison(
@@ -1148,6 +999,13 @@ class TrendAnalyzer:
                 concept_alignment=[],
             )
 
+        comparison = ModuleComparison(**data)
+        logger.info(
+            f"Module comparison: {len(comparison.shared_concepts)} shared, "
+            f"similarity={comparison.similarity_score:.2%}"
+        )
+        return comparison
+
 
 # ============================================================================
 # FACTORY FUNCTION
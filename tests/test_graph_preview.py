@@ -54,6 +54,11 @@ from api.schemas.graph_preview import (
 client = TestClient(app)
 
 
+def _record(data):
+    """Mock Neo4j record exposing data() like neo4j.Record."""
+    return Mock(data=Mock(return_value=data))
+
+
 @pytest.fixture
 def mock_graph_data():
     """Sample graph data for testing."""
@@ -123,9 +128,8 @@ class TestGraphPreviewEndpoints:
     def test_get_module_graph_success(self, mock_neo4j_session):
         """GET /modules/{module_id} returns graph data with correct property mappings."""
         # Mock Neo4j query result
-        mock_record = Mock()
-        mock_record.__getitem__ = Mock(
-            side_effect=lambda key: {
+        mock_record = _record(
+            {
                 "entity_data": [
                     {
                         "id": "n1",
@@ -152,12 +156,10 @@ class TestGraphPreviewEndpoints:
                         "confidence": 0.92,
                     }
                 ],
-            }[key]
+            }
         )
 
-        mock_result = Mock()
-        mock_result.single = Mock(return_value=mock_record)
-        mock_neo4j_session.run = Mock(return_value=mock_result)
+        mock_neo4j_session.run = Mock(return_value=[mock_record])
 
         with patch("api.routers.graph_preview.neo4j_driver") as mock_driver:
             mock_driver.session = Mock(return_value=mock_neo4j_session)
@@ -204,9 +206,8 @@ class TestGraphPreviewEndpoints:
     def test_get_module_graph_with_filters(self, mock_neo4j_session):
         """GET /modules/{module_id} accepts query parameters."""
         # Mock Neo4j query result with single entity
-        mock_record = Mock()
-        mock_record.__getitem__ = Mock(
-            side_effect=lambda key: {
+        mock_record = _record(
+            {
                 "entity_data": [
                     {
                         "id": "n1",
@@ -218,12 +219,10 @@ class TestGraphPreviewEndpoints:
                     }
                 ],
                 "relationships": [],
-            }[key]
+            }
         )
 
-        mock_result = Mock()
-        mock_result.single = Mock(return_value=mock_record)
-        mock_neo4j_session.run = Mock(return_value=mock_result)
+        mock_neo4j_session.run = Mock(return_value=[mock_record])
 
         with patch("api.routers.graph_preview.neo4j_driver") as mock_driver:
             mock_driver.session = Mock(return_value=mock_neo4j_session)
@@ -240,47 +239,22 @@ class TestGraphPreviewEndpoints:
 
     def test_get_module_graph_stats_success(self, mock_neo4j_session):
         """GET /modules/{module_id}/stats returns statistics."""
-        # Mock Neo4j query results for entity counts
-        entity_record_1 = Mock()
-        entity_record_1.__getitem__ = Mock(
-            side_effect=lambda k: {"entity_type": "Topic", "count": 10}[k]
-        )
-
-        entity_record_2 = Mock()
-        entity_record_2.__getitem__ = Mock(
-            side_effect=lambda k: {"entity_type": "Concept", "count": 30}[k]
-        )
-
-        entity_record_3 = Mock()
-        entity_record_3.__getitem__ = Mock(
-            side_effect=lambda k: {"entity_type": "Finding", "count": 10}[k]
-        )
-
-        # Mock Neo4j query results for relationship counts
-        rel_record_1 = Mock()
-        rel_record_1.__getitem__ = Mock(
-            side_effect=lambda k: {"rel_type": "CONTAINS", "count": 40}[k]
-        )
-
-        rel_record_2 = Mock()
-        rel_record_2.__getitem__ = Mock(
-            side_effect=lambda k: {"rel_type": "RELATES_TO", "count": 35}[k]
-        )
-
-        # Create separate result mocks for each query
-        mock_result_entities = Mock()
-        mock_result_entities.__iter__ = Mock(
-            return_value=iter([entity_record_1, entity_record_2, entity_record_3])
-        )
-
-        mock_result_rels = Mock()
-        mock_result_rels.__iter__ = Mock(
-            return_value=iter([rel_record_1, rel_record_2])
-        )
-
-        # Session.run returns different results for each call
+        # Mock Neo4j query results for entity and relationship counts
+        entity_records = [
+            _record({"entity_type": "Topic", "count": 10}),
+            _record({"entity_type": "Concept", "count": 30}),
+            _record({"entity_type": "Finding", "count": 10}),
+        ]
+        rel_records = [
+            _record({"rel_type": "CONTAINS", "count": 40}),
+            _record({"rel_type": "RELATES_TO", "count": 35}),
+        ]
+
+        # The two count queries run concurrently, so route by query text
         mock_neo4j_session.run = Mock(
-            side_effect=[mock_result_entities, mock_result_rels]
+            side_effect=lambda cypher, params: (
+                entity_records if "entity_type" in cypher else rel_records
+            )
         )
 
         with patch("api.routers.graph_preview.neo4j_driver") as mock_driver:
@@ -300,9 +274,7 @@ class TestGraphPreviewEndpoints:
     def test_get_module_graph_not_found(self, mock_neo4j_session):
         """GET /modules/{module_id} returns 404 for unknown module."""
         # Mock Neo4j query result with no records
-        mock_result = Mock()
-        mock_result.single = Mock(return_value=None)
-        mock_neo4j_session.run = Mock(return_value=mock_result)
+        mock_neo4j_session.run = Mock(return_value=[])
 
         with patch("api.routers.graph_preview.neo4j_driver") as mock_driver:
             mock_driver.session = Mock(return_value=mock_neo4j_session)
@@ -343,16 +315,8 @@ class TestGraphPreviewEndpoints:
 
     def test_get_module_graph_stats_not_found(self, mock_neo4j_session):
         """GET /modules/{module_id}/stats returns 404 for unknown module."""
-        # Mock Neo4j query results with empty iterators (no entities)
-        mock_result_entities = Mock()
-        mock_result_entities.__iter__ = Mock(return_value=iter([]))
-
-        mock_result_rels = Mock()
-        mock_result_rels.__iter__ = Mock(return_value=iter([]))
-
-        mock_neo4j_session.run = Mock(
-            side_effect=[mock_result_entities, mock_result_rels]
-        )
+        # Mock Neo4j query results with no records (no entities)
+        mock_neo4j_session.run = Mock(return_value=[])
 
         with patch("api.routers.graph_preview.neo4j_driver") as mock_driver:
             mock_driver.session = Mock(return_value=mock_neo4j_session)
@@ -374,9 +338,8 @@ class TestGraphPreviewEndpoints:
         """GET /modules/{module_id} filters edges to only include returned nodes."""
         # Mock scenario: 3 nodes (n1, n2, n3) but relationship to n3 exists
         # The query should only return edges where BOTH endpoints are in node set
-        mock_record = Mock()
-        mock_record.__getitem__ = Mock(
-            side_effect=lambda key: {
+        mock_record = _record(
+            {
                 "entity_data": [
                     {
                         "id": "n1",
@@ -418,12 +381,10 @@ class TestGraphPreviewEndpoints:
                         "confidence": 0.7,
                     },
                 ],
-            }[key]
+            }
         )
 
-        mock_result = Mock()
-        mock_result.single = Mock(return_value=mock_record)
-        mock_neo4j_session.run = Mock(return_value=mock_result)
+        mock_neo4j_session.run = Mock(return_value=[mock_record])
 
         with patch("api.routers.graph_preview.neo4j_driver") as mock_driver:
             mock_driver.session = Mock(return_value=mock_neo4j_session)
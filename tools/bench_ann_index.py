@@ -0,0 +1,245 @@
+"""
+============================================================================
+FILE: bench_ann_index.py
+LOCATION: tools/bench_ann_index.py
+============================================================================
+
+PURPOSE:
+    Benchmark for the memory-mapped IVF index (api/ann_index.py): build
+    time, on-disk size, query latency and recall@k against exact search for
+    a range of nprobe settings.
+
+ROLE IN PROJECT:
+    Development tool used to pick ANN_NPROBE and to check that the local
+    index is an acceptable substitute for db.index.vector.queryNodes before
+    enabling ANN_INDEX_ENABLED. Runs offline on synthetic clustered
+    embeddings, or on a real module's chunk embeddings with --module.
+    Not used in production - development tool only.
+
+KEY COMPONENTS:
+    - synthetic_embeddings: Deterministic clustered vectors and queries
+    - run_benchmark: Builds the index and measures every nprobe setting
+
+OUTPUT METRICS:
+    - build_s: Index training + write time
+    - index_mb: Bytes on disk
+    - exact_ms_p50/p95: Brute-force numpy query latency
+    - per nprobe: recall_at_k, ms_p50, ms_p95
+
+DEPENDENCIES:
+    - External: numpy, neo4j (only with --module)
+    - Internal: api/ann_index.py
+
+USAGE:
+    python tools/bench_ann_index.py --rows 100000
+    python tools/bench_ann_index.py --module mod_123 --output bench-results/ann.json
+
+EXAMPLE OUTPUT:
+    {"commit": "5816193", "rows": 100000, "build_s": 9.8,
+     "exact_ms_p50": 21.4, "nprobe": {"8": {"recall_at_k": 0.93, ...}}}
+============================================================================
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from api.ann_index import (  # noqa: E402
+    AnnIndexStore,
+    exact_search,
+    fetch_module_embeddings,
+    normalize_rows,
+)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_ROWS = 50_000
+DEFAULT_DIM = 768
+DEFAULT_QUERIES = 200
+DEFAULT_K = 10
+DEFAULT_NPROBES = [1, 2, 4, 8, 16, 32]
+TOPICS_PER_10K_ROWS = 40  # Roughly one topic per lecture section
+NOISE = 0.9
+SEED = 1337
+
+
+# ============================================================================
+# DATA
+# ============================================================================
+
+
+def synthetic_embeddings(rows: int, dim: int, queries: int, seed: int = SEED):
+    """
+    Clustered unit vectors resembling chunk embeddings.
+
+    Chunks are noisy points around topic centres; queries are drawn the same
+    way, so true neighbours are spread over several nearby lists.
+
+    Returns:
+        (vectors (rows, dim), queries (queries, dim)), both normalized
+    """
+    rng = np.random.default_rng(seed)
+    topics = max(1, rows * TOPICS_PER_10K_ROWS // 10_000)
+    centres = rng.standard_normal((topics, dim)).astype(np.float32)
+
+    def draw(count):
+        points = centres[rng.integers(0, topics, count)]
+        points += NOISE * rng.standard_normal((count, dim)).astype(np.float32)
+        return normalize_rows(points)
+
+    return draw(rows), draw(queries)
+
+
+def module_embeddings(module_id: str, queries: int, seed: int = SEED):
+    """A module's chunk embeddings from Neo4j, with perturbed copies as queries."""
+    from api.neo4j_config import neo4j_driver
+
+    if neo4j_driver is None:
+        raise SystemExit("Neo4j driver not initialized. Check .env configuration.")
+    _, vectors = fetch_module_embeddings(neo4j_driver, module_id, "chunk")
+    if not len(vectors):
+        raise SystemExit(f"No chunk embeddings found for module {module_id}")
+    vectors = normalize_rows(vectors)
+    rng = np.random.default_rng(seed)
+    picks = vectors[rng.integers(0, len(vectors), queries)]
+    noise = 0.05 * rng.standard_normal(picks.shape).astype(np.float32)
+    return vectors, normalize_rows(picks + noise)
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+
+def _percentiles(samples_ms):
+    return (
+        round(float(np.percentile(samples_ms, 50)), 3),
+        round(float(np.percentile(samples_ms, 95)), 3),
+    )
+
+
+def _directory_bytes(path: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def run_benchmark(vectors, queries, k: int, nprobes, workdir: str) -> dict:
+    """
+    Build an index over `vectors` and measure recall@k per nprobe.
+
+    Args:
+        vectors: Normalized (N, D) corpus
+        queries: Normalized (Q, D) queries
+        k: Neighbours per query
+        nprobes: nprobe values to evaluate
+        workdir: Directory for the index files
+
+    Returns:
+        JSON-serializable report
+    """
+    ids = [f"row_{i}" for i in range(len(vectors))]
+    store = AnnIndexStore(workdir)
+
+    start = time.perf_counter()
+    store.build("bench", "chunk", ids, vectors)
+    build_s = time.perf_counter() - start
+
+    truth, exact_ms = [], []
+    for query in queries:
+        start = time.perf_counter()
+        rows = exact_search(vectors, query, k)
+        exact_ms.append((time.perf_counter() - start) * 1000)
+        truth.append({ids[row] for row in rows})
+
+    report = {
+        "rows": len(vectors),
+        "dim": int(vectors.shape[1]),
+        "queries": len(queries),
+        "k": k,
+        "build_s": round(build_s, 3),
+        "index_mb": round(_directory_bytes(workdir) / 1e6, 2),
+        "exact_ms_p50": _percentiles(exact_ms)[0],
+        "exact_ms_p95": _percentiles(exact_ms)[1],
+        "nprobe": {},
+    }
+
+    store.search(["bench"], "chunk", queries[0], k)  # Map the files once
+    for nprobe in nprobes:
+        recalls, latencies = [], []
+        for query, expected in zip(queries, truth):
+            start = time.perf_counter()
+            hits = store.search(["bench"], "chunk", query, k, nprobe=nprobe)
+            latencies.append((time.perf_counter() - start) * 1000)
+            recalls.append(len(expected & {hit_id for hit_id, _ in hits}) / len(expected))
+        p50, p95 = _percentiles(latencies)
+        report["nprobe"][str(nprobe)] = {
+            "recall_at_k": round(float(np.mean(recalls)), 4),
+            "ms_p50": p50,
+            "ms_p95": p95,
+        }
+    return report
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the local ANN index")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="Synthetic corpus size")
+    parser.add_argument("--dim", type=int, default=DEFAULT_DIM, help="Embedding dimension")
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERIES)
+    parser.add_argument("--k", type=int, default=DEFAULT_K, help="Recall@k cutoff")
+    parser.add_argument(
+        "--nprobe", type=int, nargs="+", default=DEFAULT_NPROBES, help="nprobe values"
+    )
+    parser.add_argument("--module", help="Use this module's chunk embeddings from Neo4j")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args()
+
+    if args.module:
+        vectors, queries = module_embeddings(args.module, args.queries)
+    else:
+        vectors, queries = synthetic_embeddings(args.rows, args.dim, args.queries)
+
+    with tempfile.TemporaryDirectory(prefix="ann_bench_") as workdir:
+        report = run_benchmark(vectors, queries, args.k, args.nprobe, workdir)
+
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "source": args.module or "synthetic",
+        **report,
+    }
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+============================================================================
+FILE: bench_feedback_rerank.py
+LOCATION: tools/bench_feedback_rerank.py
+============================================================================
+
+PURPOSE:
+    Benchmark for feedback-aware reranking (api/feedback_quality.py): cost
+    of the rerank stage and of a full hybrid search with and without it.
+
+ROLE IN PROJECT:
+    Development tool used to check that blending precomputed quality scores
+    adds negligible latency at large top_k. Runs offline: fused candidates,
+    the quality table and the graph manager are synthetic and in-memory, so
+    the numbers isolate the service's own overhead from Neo4j.
+    Not used in production - development tool only.
+
+KEY COMPONENTS:
+    - synthetic_candidates: Fused candidate lists and a quality table
+    - bench_stage: fuse_weighted vs rerank_with_quality timings
+    - bench_search: HybridSearchService.search with rerank on and off
+
+OUTPUT METRICS:
+    - fusion_us_p50/p95: Weighted fusion of the candidate lists
+    - rerank_us_p50/p95: Rerank of the fused candidates
+    - search_ms_p50 (rerank on/off): End-to-end search against in-memory stubs
+
+DEPENDENCIES:
+    - External: None
+    - Internal: api/feedback_quality.py, api/search_service.py
+
+USAGE:
+    python tools/bench_feedback_rerank.py --top-k 50
+    python tools/bench_feedback_rerank.py --table-size 500000 --output bench-results/rerank.json
+
+EXAMPLE OUTPUT:
+    {"commit": "5816193", "top_k": 50, "candidates": 150, "table_size": 100000,
+     "fusion_us_p50": 173.4, "rerank_us_p50": 78.3,
+     "search_ms_p50_rerank_off": 1.07, "search_ms_p50_rerank_on": 1.17, ...}
+============================================================================
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from api.feedback_quality import rerank_with_quality  # noqa: E402
+from api.schemas.search import SearchRequest  # noqa: E402
+from api.search_service import (  # noqa: E402
+    CANDIDATE_MULTIPLIER,
+    HYDRATE_CHUNKS_QUERY,
+    HybridSearchService,
+    fuse_weighted,
+)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_TOP_K = 50
+DEFAULT_TABLE_SIZE = 100_000
+DEFAULT_ITERATIONS = 2000
+RATED_FRACTION = 0.3  # Share of candidates that have feedback
+SEED = 1337
+
+
+# ============================================================================
+# DATA
+# ============================================================================
+
+
+def synthetic_candidates(top_k: int, table_size: int, seed: int = SEED):
+    """
+    Vector and fulltext hit lists plus a quality table covering some hits.
+
+    Returns:
+        (vector_hits, fulltext_hits, scores)
+    """
+    rng = random.Random(seed)
+    limit = top_k * CANDIDATE_MULTIPLIER
+    ids = [f"chunk_{i}" for i in range(limit * 2)]
+    vector_hits = sorted(
+        ((chunk_id, rng.uniform(0.5, 1.0)) for chunk_id in rng.sample(ids, limit)),
+        key=lambda hit: hit[1], reverse=True,
+    )
+    fulltext_hits = sorted(
+        ((chunk_id, rng.uniform(1.0, 20.0)) for chunk_id in rng.sample(ids, limit)),
+        key=lambda hit: hit[1], reverse=True,
+    )
+    scores = {f"other_{i}": rng.random() for i in range(table_size)}
+    for chunk_id in ids:
+        if rng.random() < RATED_FRACTION:
+            scores[chunk_id] = rng.random()
+    return vector_hits, fulltext_hits, scores
+
+
+class _StaticTable:
+    def __init__(self, scores):
+        self._scores = scores
+
+    def scores(self):
+        return self._scores
+
+
+class _StubEmbeddings:
+    def embed_query(self, query):
+        return [0.1] * 768
+
+
+class _StubGraphManager:
+    def __init__(self, vector_hits, fulltext_hits):
+        self.vector = [{"id": i, "score": s} for i, s in vector_hits]
+        self.fulltext = [{"id": i, "score": s} for i, s in fulltext_hits]
+
+    async def run_query(self, cypher, params=None):
+        if cypher == HYDRATE_CHUNKS_QUERY:
+            return [
+                {"id": i, "text": "", "module_id": None, "document": {"id": "d"},
+                 "parent_text": None, "entities": [], "entity_ids": []}
+                for i in params["ids"]
+            ]
+        return self.vector if "db.index.vector" in cypher else self.fulltext
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+
+def _percentiles(samples):
+    ordered = sorted(samples)
+    return (
+        round(statistics.median(ordered), 3),
+        round(ordered[int(len(ordered) * 0.95) - 1], 3),
+    )
+
+
+def bench_stage(vector_hits, fulltext_hits, scores, iterations: int) -> dict:
+    """Microbenchmark fusion and rerank on the same candidates (microseconds)."""
+    fusion_us, rerank_us = [], []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fused = fuse_weighted(vector_hits, fulltext_hits, 0.7, 0.3)
+        fusion_us.append((time.perf_counter() - start) * 1e6)
+
+        start = time.perf_counter()
+        rerank_with_quality(fused, scores)
+        rerank_us.append((time.perf_counter() - start) * 1e6)
+
+    fusion_p50, fusion_p95 = _percentiles(fusion_us)
+    rerank_p50, rerank_p95 = _percentiles(rerank_us)
+    return {
+        "fusion_us_p50": fusion_p50,
+        "fusion_us_p95": fusion_p95,
+        "rerank_us_p50": rerank_p50,
+        "rerank_us_p95": rerank_p95,
+    }
+
+
+def bench_search(vector_hits, fulltext_hits, scores, top_k: int, iterations: int) -> dict:
+    """End-to-end search latency against in-memory stubs (milliseconds)."""
+    service = HybridSearchService(
+        _StubGraphManager(vector_hits, fulltext_hits),
+        _StubEmbeddings(),
+        quality_table=_StaticTable(scores),
+    )
+
+    async def run(rerank: bool):
+        request = SearchRequest(query="q", top_k=top_k, min_score=0.0, feedback_rerank=rerank)
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await service.search(request)
+            samples.append((time.perf_counter() - start) * 1000)
+        return _percentiles(samples)
+
+    asyncio.run(run(True))  # Warm up
+    off = asyncio.run(run(False))
+    on = asyncio.run(run(True))
+    return {
+        "search_ms_p50_rerank_off": off[0],
+        "search_ms_p95_rerank_off": off[1],
+        "search_ms_p50_rerank_on": on[0],
+        "search_ms_p95_rerank_on": on[1],
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark feedback-aware reranking")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K)
+    parser.add_argument("--table-size", type=int, default=DEFAULT_TABLE_SIZE,
+                        help="Entries in the quality table")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args()
+
+    vector_hits, fulltext_hits, scores = synthetic_candidates(args.top_k, args.table_size)
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "top_k": args.top_k,
+        "candidates": args.top_k * CANDIDATE_MULTIPLIER,
+        "table_size": len(scores),
+        **bench_stage(vector_hits, fulltext_hits, scores, args.iterations),
+        **bench_search(vector_hits, fulltext_hits, scores, args.top_k, args.iterations // 10),
+    }
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(output)
+
+
+if __name__ == "__main__":
+    main()